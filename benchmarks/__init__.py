@@ -0,0 +1 @@
+"""Offline micro-benchmarks for SDK hot paths."""
@@ -0,0 +1,192 @@
+"""Run every benchmark module and write the results as JSON.
+
+Usage::
+
+    python -m benchmarks                          # all modules, table to stdout
+    python -m benchmarks --only signing,websocket --output run.json
+    python -m benchmarks --compare baseline.json --threshold 0.15
+
+With ``--compare`` each case is matched by name against a previous run,
+and the exit status is 1 if any case is slower by more than
+``--threshold`` (relative).
+"""
+import argparse
+import datetime
+import importlib
+import json
+import logging
+import math
+import pkgutil
+import platform
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import benchmarks
+from benchmarks._harness import report
+
+logger = logging.getLogger(__name__)
+
+# Lower is better for every metric; the first one present is compared.
+# The fastest repetition is the least noisy estimate for micro-benchmarks.
+METRICS = ("min_ns", "p50_ns", "bytes")
+
+
+def discover() -> List[str]:
+    """Names of the ``bench_*`` modules, without the prefix, sorted."""
+    return sorted(
+        info.name[len("bench_"):] for info in pkgutil.iter_modules(benchmarks.__path__)
+        if info.name.startswith("bench_")
+    )
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=Path(benchmarks.__file__).resolve().parent,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    """Metadata identifying where and on what code a run happened."""
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run_modules(names: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    Run the given benchmark modules.
+
+    A module that fails is recorded as one result with an ``error`` field
+    so the rest of the suite still runs.
+
+    Args:
+        names: Module names without the ``bench_`` prefix
+
+    Returns:
+        Results of every case, each tagged with its ``module``
+    """
+    results: List[Dict[str, Any]] = []
+    for name in names:
+        try:
+            module = importlib.import_module(f"benchmarks.bench_{name}")
+            cases = module.run()
+        except Exception as e:
+            logger.error("Benchmark module %s failed: %s", name, e)
+            results.append({"name": name, "module": name, "error": f"{type(e).__name__}: {e}"})
+            continue
+        for case in cases:
+            results.append(dict(case, module=name))
+    return results
+
+
+def _metric(result: Dict[str, Any]) -> Optional[Tuple[str, float]]:
+    for metric in METRICS:
+        value = result.get(metric)
+        if isinstance(value, (int, float)) and math.isfinite(value) and value > 0:
+            return metric, float(value)
+    return None
+
+
+def compare(
+    baseline: Sequence[Dict[str, Any]],
+    current: Sequence[Dict[str, Any]],
+    threshold: float = 0.10
+) -> List[Dict[str, Any]]:
+    """
+    Match cases by name and compute the change of their primary metric.
+
+    Args:
+        baseline: Results of the earlier run
+        current: Results of this run
+        threshold: Relative slow-down counted as a regression
+
+    Returns:
+        One row per case present in both runs: name, metric, baseline,
+        current, ratio (current / baseline) and regression flag
+    """
+    previous = {r["name"]: r for r in baseline}
+    rows = []
+    for result in current:
+        old = previous.get(result["name"])
+        new_metric = _metric(result)
+        old_metric = _metric(old) if old is not None else None
+        if new_metric is None or old_metric is None or new_metric[0] != old_metric[0]:
+            continue
+        ratio = new_metric[1] / old_metric[1]
+        rows.append({
+            "name": result["name"],
+            "metric": new_metric[0],
+            "baseline": old_metric[1],
+            "current": new_metric[1],
+            "ratio": ratio,
+            "regression": ratio > 1.0 + threshold,
+        })
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the SDK benchmark suite.")
+    parser.add_argument("--only", help="Comma-separated module names (e.g. signing,websocket)")
+    parser.add_argument("--list", action="store_true", help="List benchmark modules and exit")
+    parser.add_argument("--output", "-o", help="Write results JSON here ('-' for stdout)")
+    parser.add_argument("--compare", help="Results JSON of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slow-down flagged (default 0.10)")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Do not print the results table")
+    args = parser.parse_args(argv)
+    # Keep stdout parseable when the JSON goes there.
+    quiet = args.quiet or args.output == "-"
+
+    available = discover()
+    if args.list:
+        print("\n".join(available))
+        return 0
+    names = available
+    if args.only:
+        names = [n.strip() for n in args.only.split(",") if n.strip()]
+        unknown = sorted(set(names) - set(available))
+        if unknown:
+            parser.error(f"unknown benchmark module(s): {', '.join(unknown)}")
+
+    results = run_modules(names)
+    document = {"environment": environment(), "results": results}
+
+    if not quiet:
+        report([r for r in results if "error" not in r])
+        for r in results:
+            if "error" in r:
+                print(f"{r['name']:<48} ERROR {r['error']}")
+
+    if args.output == "-":
+        json.dump(document, sys.stdout, indent=2)
+        print()
+    elif args.output:
+        Path(args.output).write_text(json.dumps(document, indent=2) + "\n")
+
+    exit_code = 1 if any("error" in r for r in results) else 0
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        rows = compare(baseline.get("results", []), results, args.threshold)
+        if not quiet:
+            print(f"\nvs {args.compare} (commit {baseline.get('environment', {}).get('commit')}):")
+            for row in rows:
+                flag = "  REGRESSION" if row["regression"] else ""
+                print(f"{row['name']:<48} {row['ratio']:>7.2f}x {row['metric']}{flag}")
+        if any(row["regression"] for row in rows):
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
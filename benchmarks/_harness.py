@@ -0,0 +1,114 @@
+"""Minimal timing harness shared by the benchmark modules."""
+import gc
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+
+def bench(name: str, fn: Callable[[], Any], number: int = 1000, repeat: int = 5, **extra: Any) -> Dict[str, Any]:
+    """
+    Time ``fn`` and return a machine-readable result.
+
+    Args:
+        name: Benchmark case name
+        fn: Zero-argument callable to time
+        number: Calls per timed repetition
+        repeat: Number of timed repetitions
+        **extra: Additional fields copied into the result
+
+    Returns:
+        Dict with per-call timings in nanoseconds
+    """
+    fn()  # warm-up
+    per_call = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            fn()
+        per_call.append((time.perf_counter_ns() - start) / number)
+    result = {
+        "name": name,
+        "number": number,
+        "repeat": repeat,
+        "min_ns": min(per_call),
+        "median_ns": statistics.median(per_call),
+        "ops_per_sec": 1e9 / min(per_call) if min(per_call) else float("inf"),
+    }
+    result.update(extra)
+    return result
+
+
+def measure_memory(name: str, build: Callable[[], Any], **extra: Any) -> Dict[str, Any]:
+    """
+    Measure the memory retained by the object ``build`` returns.
+
+    Args:
+        name: Benchmark case name
+        build: Zero-argument callable constructing the object to measure
+        **extra: Additional fields copied into the result
+
+    Returns:
+        Dict with the retained size in bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        obj = build()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del obj
+    result = {"name": name, "bytes": retained, "peak_bytes": peak}
+    result.update(extra)
+    return result
+
+
+def measure_latency(name: str, fn: Callable[[], Any], calls: int = 500, **extra: Any) -> Dict[str, Any]:
+    """
+    Record the latency distribution of ``fn`` over sequential calls.
+
+    Args:
+        name: Benchmark case name
+        fn: Zero-argument callable to time
+        calls: Number of timed calls
+        **extra: Additional fields copied into the result
+
+    Returns:
+        Dict with latency percentiles in nanoseconds
+    """
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - start)
+    samples.sort()
+
+    def _pct(q: float) -> float:
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    result = {
+        "name": name,
+        "calls": calls,
+        "p50_ns": _pct(0.50),
+        "p95_ns": _pct(0.95),
+        "p99_ns": _pct(0.99),
+        "max_ns": samples[-1],
+    }
+    result.update(extra)
+    return result
+
+
+def report(results) -> None:
+    """Print results as an aligned table."""
+    for r in results:
+        if "p99_ns" in r:
+            print(
+                f"{r['name']:<48} {r['p50_ns'] / 1e6:>9.2f} ms p50  "
+                f"{r['p95_ns'] / 1e6:.2f} ms p95  {r['p99_ns'] / 1e6:.2f} ms p99"
+            )
+        elif "bytes" in r:
+            print(f"{r['name']:<48} {r['bytes'] / 1e6:>12.2f} MB     (peak {r['peak_bytes'] / 1e6:.2f})")
+        else:
+            print(f"{r['name']:<48} {r['median_ns'] / 1000:>12.2f} us/op  (min {r['min_ns'] / 1000:.2f})")
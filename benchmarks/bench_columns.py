@@ -0,0 +1,54 @@
+"""Benchmark: columnar export of a 100k-row fills history.
+
+Run with ``python -m benchmarks.bench_columns``.
+"""
+from benchmarks._harness import bench, report
+from benchmarks.bench_compact import FILL_COUNT, _fill_payloads
+from hotstuff.methods.compact import FillColumns
+
+
+def run():
+    """Run the columnar export benchmark cases."""
+    try:
+        import numpy as np
+    except ImportError:
+        return []
+
+    payloads = _fill_payloads(FILL_COUNT)
+    columns = FillColumns(payloads)
+    selected = ("price", "size", "fee", "order_id", "block_timestamp")
+
+    def row_by_row():
+        return {
+            "price": np.array([float(f["price"]) for f in payloads]),
+            "size": np.array([float(f["size"]) for f in payloads]),
+            "fee": np.array([float(f["fee"]) if f.get("fee") is not None else float("nan") for f in payloads]),
+            "order_id": np.array([f["order_id"] for f in payloads], dtype=np.int64),
+            "block_timestamp": np.array([int(f["block_timestamp"]) for f in payloads], dtype=np.int64),
+        }
+
+    results = [
+        bench("columns.fills100k.row_by_row", row_by_row, number=1, repeat=3, size=FILL_COUNT),
+        bench("columns.fills100k.as_columns", columns.as_columns, number=10, repeat=3, size=FILL_COUNT),
+        bench("columns.fills100k.to_numpy", lambda: columns.to_numpy(selected), number=1, repeat=3, size=FILL_COUNT),
+        bench("columns.fills100k.to_numpy_all", columns.to_numpy, number=1, repeat=3, size=FILL_COUNT),
+        bench(
+            "columns.fills100k.to_numpy_ticks",
+            lambda: columns.to_numpy(selected, tick_sizes={"price": 0.5, "size": 0.001}),
+            number=1,
+            repeat=3,
+            size=FILL_COUNT,
+        ),
+    ]
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return results
+    results.append(
+        bench("columns.fills100k.to_arrow", lambda: columns.to_arrow(selected), number=1, repeat=3, size=FILL_COUNT)
+    )
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,88 @@
+"""Benchmark: memory held by 100k fills and a deep orderbook.
+
+Run with ``python -m benchmarks.bench_compact``.
+"""
+import json
+import random
+
+from benchmarks._harness import bench, measure_memory, report
+from hotstuff.methods.compact import FillColumns, SlottedFill, SlottedOrderbookLevel
+from hotstuff.methods.info.account import Fill
+from hotstuff.methods.info.market import OrderbookLevel
+
+FILL_COUNT = 100_000
+BOOK_DEPTH = 50_000
+ACCOUNTS = [f"0x{i:040x}" for i in range(50)]
+
+
+def _fill_payloads(n):
+    rng = random.Random(3)
+    payloads = []
+    for i in range(n):
+        payloads.append({
+            "instrument_id": 1,
+            "instrument": "BTC-PERP",
+            "account": rng.choice(ACCOUNTS),
+            "order_id": 1_000_000 + i,
+            "trade_id": 5_000_000 + i,
+            "side": rng.choice("bs"),
+            "position_side": "BOTH",
+            "price": f"{50_000 + rng.randint(-500, 500) * 0.5:.1f}",
+            "size": f"{rng.randint(1, 2000) / 1000:.3f}",
+            "cloid": f"cloid-{i}",
+            "direction": rng.choice(["openLong", "closeLong", "openShort", "closeShort"]),
+            "closed_pnl": "0",
+            "fee": "0.01",
+            "fee_token_id": 1,
+            "crossed": bool(i % 2),
+            "tx_hash": f"0x{rng.getrandbits(256):064x}",
+            "fill_type": 0,
+            "block_timestamp": str(1_700_000_000_000 + i),
+        })
+    return payloads
+
+
+def run():
+    """Run the compact model benchmark cases."""
+    # Decode inside each case, as a client would, so retained strings are counted.
+    fills_text = json.dumps(_fill_payloads(FILL_COUNT))
+    book_text = json.dumps([[f"{50_000 - i * 0.5:.1f}", f"{(i % 97) / 10:.1f}"] for i in range(BOOK_DEPTH)])
+
+    return [
+        measure_memory("compact.fills100k.dicts", lambda: json.loads(fills_text), size=FILL_COUNT),
+        measure_memory(
+            "compact.fills100k.dataclass", lambda: [Fill(**p) for p in json.loads(fills_text)], size=FILL_COUNT
+        ),
+        measure_memory(
+            "compact.fills100k.slotted", lambda: [SlottedFill(**p) for p in json.loads(fills_text)], size=FILL_COUNT
+        ),
+        measure_memory("compact.fills100k.columns", lambda: FillColumns(json.loads(fills_text)), size=FILL_COUNT),
+        measure_memory(
+            "compact.book50k.dataclass",
+            lambda: [OrderbookLevel(p, s) for p, s in json.loads(book_text)],
+            size=BOOK_DEPTH,
+        ),
+        measure_memory(
+            "compact.book50k.slotted",
+            lambda: [SlottedOrderbookLevel(p, s) for p, s in json.loads(book_text)],
+            size=BOOK_DEPTH,
+        ),
+        bench(
+            "compact.fills100k.build_dataclass",
+            lambda: [Fill(**p) for p in json.loads(fills_text)],
+            number=1,
+            repeat=3,
+            size=FILL_COUNT,
+        ),
+        bench(
+            "compact.fills100k.build_columns",
+            lambda: FillColumns(json.loads(fills_text)),
+            number=1,
+            repeat=3,
+            size=FILL_COUNT,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,80 @@
+"""Benchmark: typed InfoClient decoding against raw dict access.
+
+Run with ``python -m benchmarks.bench_decode``.
+"""
+from dataclasses import fields
+
+from benchmarks._harness import bench, report
+from hotstuff.methods.decode import decode_response
+from hotstuff.methods.info.market import OrderbookLevel, OrderbookResponse, Ticker
+
+BOOK_DEPTH = 500
+
+TICKER = {
+    "symbol": "BTC-PERP",
+    "mark_price": "50000.5",
+    "mid_price": "50000.25",
+    "index_price": "50001",
+    "best_bid_price": "50000",
+    "best_ask_price": "50000.5",
+    "best_bid_size": "1.2",
+    "best_ask_size": "0.8",
+    "volume_24h": "123456",
+    "change_24h": "0.01",
+    "last_updated": 1_700_000_000_000,
+    "funding_rate": "0.0001",
+    "open_interest": "1000",
+    "max_trading_price": "55000",
+    "min_trading_price": "45000",
+    "last_price": "50000.5",
+    "server_only_field": True,
+}
+
+ORDERBOOK = {
+    "bids": [{"price": f"{50_000 - i * 0.5:.1f}", "size": "1.0"} for i in range(BOOK_DEPTH)],
+    "asks": [{"price": f"{50_000.5 + i * 0.5:.1f}", "size": "1.0"} for i in range(BOOK_DEPTH)],
+    "instrument_name": "BTC-PERP",
+    "timestamp": 1_700_000_000_000,
+    "sequence_number": 42,
+}
+
+
+def run():
+    """Run the typed decoding benchmark cases."""
+    ticker_fields = {f.name for f in fields(Ticker)}
+
+    def ticker_init():
+        return Ticker(**{k: v for k, v in TICKER.items() if k in ticker_fields}).best_bid_price
+
+    def book_eager():
+        return OrderbookResponse(
+            bids=[OrderbookLevel(**level) for level in ORDERBOOK["bids"]],
+            asks=[OrderbookLevel(**level) for level in ORDERBOOK["asks"]],
+            instrument_name=ORDERBOOK["instrument_name"],
+            timestamp=ORDERBOOK["timestamp"],
+            sequence_number=ORDERBOOK["sequence_number"],
+        ).bids[0].price
+
+    return [
+        bench("decode.ticker.raw_dict", lambda: TICKER["best_bid_price"], number=100_000),
+        bench("decode.ticker.dataclass_init", ticker_init, number=20_000),
+        bench("decode.ticker.typed", lambda: decode_response("ticker", TICKER).best_bid_price, number=20_000),
+        bench("decode.book500.raw_dict", lambda: ORDERBOOK["bids"][0]["price"], number=100_000),
+        bench("decode.book500.dataclass_eager", book_eager, number=200, size=BOOK_DEPTH),
+        bench(
+            "decode.book500.typed_scalar_only",
+            lambda: decode_response("orderbook", ORDERBOOK).sequence_number,
+            number=20_000,
+            size=BOOK_DEPTH,
+        ),
+        bench(
+            "decode.book500.typed_best_bid",
+            lambda: decode_response("orderbook", ORDERBOOK).bids[0].price,
+            number=200,
+            size=BOOK_DEPTH,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    report(run())
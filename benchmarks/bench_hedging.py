@@ -0,0 +1,58 @@
+"""Benchmark: tail latency of info requests with and without hedging.
+
+Simulates a server where most replies take ~2 ms but a few percent hit a
+slow connection (~40 ms). Hedging after the adaptive p95 should cut p99
+close to the fast path at a small extra-request cost.
+
+Run with ``python -m benchmarks.bench_hedging``.
+"""
+import random
+import time
+
+from benchmarks._harness import measure_latency, report
+from hotstuff.utils.hedging import HedgingPolicy
+
+CALLS = 600
+WARMUP = 300
+FAST = 0.002
+SLOW = 0.040
+SLOW_RATE = 0.02
+
+
+def _server(seed: int):
+    rng = random.Random(seed)
+
+    def send():
+        time.sleep(SLOW if rng.random() < SLOW_RATE else FAST)
+        return {"ok": True}
+
+    return send
+
+
+def run():
+    """Run the hedging benchmark cases."""
+    results = [measure_latency("info request (no hedging)", _server(1), calls=CALLS)]
+
+    policy = HedgingPolicy(budget=0.1, min_samples=50)
+    try:
+        send = _server(1)
+        # Let the latency window fill so the threshold reflects steady state.
+        for _ in range(WARMUP):
+            policy.call("info", send)
+        results.append(
+            measure_latency("info request (hedged at p95)", lambda: policy.call("info", send), calls=CALLS)
+        )
+        stats = policy.stats()["info"]
+        results[-1].update(hedge_rate=stats.hedge_rate, hedge_wins=stats.hedge_wins)
+    finally:
+        policy.close()
+
+    baseline, hedged = results
+    hedged["p99_improvement"] = 1 - hedged["p99_ns"] / baseline["p99_ns"]
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    report(results)
+    print(f"p99 improvement: {results[1]['p99_improvement']:.0%}, hedge rate {results[1]['hedge_rate']:.1%}")
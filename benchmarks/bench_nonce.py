@@ -0,0 +1,64 @@
+"""Benchmark: NonceManager throughput with 1/4/8 threads sharing one manager.
+
+Also reports how many nonces were handed out twice under contention.
+
+Run with ``python -m benchmarks.bench_nonce``.
+"""
+import threading
+import time
+
+from benchmarks._harness import bench, report
+from hotstuff.utils.nonce import NonceManager
+
+THREAD_COUNTS = (1, 4, 8)
+CALLS_PER_THREAD = 20_000
+
+
+def _contended(threads):
+    manager = NonceManager()
+    outputs = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def _worker(out):
+        get_nonce, append = manager.get_nonce, out.append
+        barrier.wait()
+        for _ in range(CALLS_PER_THREAD):
+            append(get_nonce())
+
+    workers = [threading.Thread(target=_worker, args=(out,)) for out in outputs]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter_ns()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter_ns() - start
+
+    total = threads * CALLS_PER_THREAD
+    unique = len({n for out in outputs for n in out})
+    per_call = elapsed / total
+    return {
+        "name": f"nonce.threads{threads}",
+        "number": total,
+        "repeat": 1,
+        "min_ns": per_call,
+        "median_ns": per_call,
+        "ops_per_sec": 1e9 / per_call if per_call else float("inf"),
+        "threads": threads,
+        "duplicates": total - unique,
+    }
+
+
+def run():
+    """Run the nonce generation benchmark cases."""
+    manager = NonceManager()
+    results = [bench("nonce.get_nonce", manager.get_nonce, number=50_000)]
+    results.extend(_contended(n) for n in THREAD_COUNTS)
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    report(results)
+    for r in results[1:]:
+        print(f"{r['name']}: {r['duplicates']} duplicate nonces")
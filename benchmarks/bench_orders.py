@@ -0,0 +1,65 @@
+"""Benchmark: building placeOrder payloads for 10/100/1000-order batches.
+
+Run with ``python -m benchmarks.bench_orders``.
+"""
+import random
+
+from benchmarks._harness import bench, report
+from hotstuff.apis.exchange import ExchangeClient
+from hotstuff.methods.exchange.trading import PlaceOrderParams, UnitOrder
+from hotstuff.utils.orders import build_orders
+from hotstuff.utils.quantize import get_quantizer
+
+BATCH_SIZES = (10, 100, 1000)
+TICK_SIZE = 0.1
+LOT_SIZE = 0.001
+
+
+def run():
+    """Run the bulk order construction benchmark cases."""
+    rng = random.Random(11)
+    client = ExchangeClient.__new__(ExchangeClient)
+    price_q = get_quantizer(TICK_SIZE)
+    size_q = get_quantizer(LOT_SIZE)
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    results = []
+    for n in BATCH_SIZES:
+        sides = [rng.choice("bs") for _ in range(n)]
+        prices = [50_000 + rng.uniform(-500, 500) for _ in range(n)]
+        sizes = [rng.uniform(0.001, 2.0) for _ in range(n)]
+        number = max(5, 20_000 // n)
+
+        def dataclasses():
+            orders = [
+                UnitOrder(
+                    instrumentId=1, side=side, positionSide="BOTH",
+                    price=price_q.format(price, "down" if side == "b" else "up"),
+                    size=size_q.format(size, "down"), tif="GTC", ro=False, po=True,
+                )
+                for side, price, size in zip(sides, prices, sizes)
+            ]
+            return client._to_api_dict(PlaceOrderParams(orders=orders, expiresAfter=0))
+
+        def lists():
+            return build_orders(1, sides, prices, sizes, po=True, tick_size=TICK_SIZE, lot_size=LOT_SIZE)
+
+        results.append(bench(f"orders.n{n}.unit_order_asdict", dataclasses, number=number, size=n))
+        results.append(bench(f"orders.n{n}.build_orders_lists", lists, number=number, size=n))
+
+        if np is not None:
+            side_arr, price_arr, size_arr = np.array(sides), np.array(prices), np.array(sizes)
+            results.append(bench(
+                f"orders.n{n}.build_orders_numpy",
+                lambda: build_orders(1, side_arr, price_arr, size_arr, po=True, tick_size=TICK_SIZE, lot_size=LOT_SIZE),
+                number=number,
+                size=n,
+            ))
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
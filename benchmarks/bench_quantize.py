@@ -0,0 +1,64 @@
+"""Benchmark: quantizing and formatting a 1k-level price grid.
+
+Run with ``python -m benchmarks.bench_quantize``.
+"""
+import math
+import random
+
+from benchmarks._harness import bench, report
+from hotstuff.utils.quantize import get_quantizer
+
+GRID_SIZE = 1000
+TICK_SIZE = 0.1
+
+
+def _legacy_decimals_from_step(step):
+    text = f"{step:.10f}".rstrip("0").rstrip(".")
+    return len(text.split(".")[1]) if "." in text else 0
+
+
+def _legacy_round_to_step(value, step, mode):
+    steps = value / step
+    rounded = math.ceil(steps) if mode == "up" else math.floor(steps)
+    return round(rounded * step, _legacy_decimals_from_step(step))
+
+
+def run():
+    """Run the quantization benchmark cases."""
+    rng = random.Random(7)
+    prices = [50_000 + rng.uniform(-500, 500) for _ in range(GRID_SIZE)]
+    quantizer = get_quantizer(TICK_SIZE)
+
+    def legacy():
+        decimals = _legacy_decimals_from_step(TICK_SIZE)
+        return [f"{_legacy_round_to_step(p, TICK_SIZE, 'down'):.{decimals}f}" for p in prices]
+
+    def scalar():
+        return [quantizer.format_steps(quantizer.ticks_from_float(p, "down")) for p in prices]
+
+    def decimal_exact():
+        return quantizer.format_many([str(p) for p in prices], "down")
+
+    results = [
+        bench("quantize.grid1k.legacy_float_round", legacy, number=50, size=GRID_SIZE),
+        bench("quantize.grid1k.integer_ticks", scalar, number=50, size=GRID_SIZE),
+        bench("quantize.grid1k.decimal_exact", decimal_exact, number=20, size=GRID_SIZE),
+    ]
+
+    try:
+        import numpy as np
+    except ImportError:
+        return results
+
+    array = np.asarray(prices)
+    results.append(
+        bench("quantize.grid1k.numpy_ticks", lambda: quantizer.ticks_array(array, "down"), number=200, size=GRID_SIZE)
+    )
+    results.append(
+        bench("quantize.grid1k.numpy_format", lambda: quantizer.format_array(array, "down"), number=50, size=GRID_SIZE)
+    )
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
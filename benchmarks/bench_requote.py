@@ -0,0 +1,69 @@
+"""Benchmark: a market maker's requote loop.
+
+Each iteration takes a BBO update, prices a two-sided quote of LEVELS
+levels, builds and signs a cancel and a placeOrder. The ``local`` case
+stops before the network; the ``mock`` case sends both actions to the
+local mock server over HTTP.
+
+Run with ``python -m benchmarks.bench_requote``.
+"""
+from eth_account import Account
+
+from benchmarks._harness import bench, measure_latency, report
+from hotstuff.apis.exchange import ExchangeClient
+from hotstuff.methods.exchange.trading import CancelAllParams, PlaceOrderParams, UnitOrder
+from hotstuff.testing import MarketDataGenerator, MockServer
+from hotstuff.transports import HttpTransport
+from hotstuff.utils.quantize import get_quantizer
+
+LEVELS = 5
+TICK_SIZE = 0.1
+LOT_SIZE = 0.001
+EXPIRES_AFTER = 1_700_000_060_000
+
+
+def _requote(client, market, price_q, size_q, execute):
+    bbo = market.channel_data("bbo", "BTC-PERP")
+    bid, ask = float(bbo["best_bid_price"]), float(bbo["best_ask_price"])
+    orders = []
+    for level in range(LEVELS):
+        offset = TICK_SIZE * (level + 1)
+        orders.append(UnitOrder(instrumentId=1, side="b", positionSide="BOTH", tif="GTC", ro=False, po=True,
+                                price=price_q.format(bid - offset, "down"), size=size_q.format(0.01, "down")))
+        orders.append(UnitOrder(instrumentId=1, side="s", positionSide="BOTH", tif="GTC", ro=False, po=True,
+                                price=price_q.format(ask + offset, "up"), size=size_q.format(0.01, "down")))
+    cancel = {"action": "cancelAll", "params": client._to_api_dict(CancelAllParams(expiresAfter=EXPIRES_AFTER))}
+    place = {
+        "action": "placeOrder",
+        "params": client._to_api_dict(PlaceOrderParams(orders=orders, expiresAfter=EXPIRES_AFTER), exclude={"nonce"}),
+    }
+    client._execute_action(cancel, execute=execute)
+    client._execute_action(place, execute=execute)
+
+
+def run():
+    """Run the requote loop benchmark cases."""
+    wallet = Account.from_key("0x" + "33" * 32)
+    price_q, size_q = get_quantizer(TICK_SIZE), get_quantizer(LOT_SIZE)
+    market = MarketDataGenerator(symbols=("BTC-PERP",), seed=9)
+
+    client = ExchangeClient(wallet=wallet)
+    results = [bench(
+        f"requote.local.levels{LEVELS}", lambda: _requote(client, market, price_q, size_q, False), number=50,
+        levels=LEVELS,
+    )]
+
+    with MockServer(market=MarketDataGenerator(rate=0)) as mock:
+        client.transport = HttpTransport(mock.http_options())
+        try:
+            loop = lambda: _requote(client, market, price_q, size_q, True)  # noqa: E731
+            for _ in range(20):
+                loop()
+            results.append(measure_latency(f"requote.mock.levels{LEVELS}", loop, calls=200, levels=LEVELS))
+        finally:
+            client.transport.close()
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
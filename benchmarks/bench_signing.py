@@ -0,0 +1,55 @@
+"""Benchmark: the local half of every exchange action.
+
+Covers dataclass-to-dict conversion, msgpack packing and EIP-712 signing
+for a single order and a 100-order batch.
+
+Run with ``python -m benchmarks.bench_signing``.
+"""
+from eth_account import Account
+
+from benchmarks._harness import bench, report
+from hotstuff.apis.exchange import ExchangeClient
+from hotstuff.methods.exchange.op_codes import EXCHANGE_OP_CODES
+from hotstuff.methods.exchange.trading import PlaceOrderParams, UnitOrder
+from hotstuff.utils.signing import pack_action, sign_action
+
+BATCH_SIZES = (1, 100)
+# A fixed key keeps runs comparable.
+WALLET = Account.from_key("0x" + "11" * 32)
+
+
+def _params(n):
+    orders = [
+        UnitOrder(instrumentId=1, side="b" if i % 2 else "s", positionSide="BOTH", price=f"{50_000 + i}.5",
+                  size="0.010", tif="GTC", ro=False, po=True, cloid=f"0x{i:032x}")
+        for i in range(n)
+    ]
+    return PlaceOrderParams(orders=orders, expiresAfter=1_700_000_060_000)
+
+
+def run():
+    """Run the conversion, packing and signing benchmark cases."""
+    client = ExchangeClient.__new__(ExchangeClient)
+    client.timing = False
+    client.tick_to_trade = None
+    tx_type = EXCHANGE_OP_CODES["placeOrder"]
+
+    results = []
+    for n in BATCH_SIZES:
+        params = _params(n)
+        action = client._to_api_dict(params, exclude={"nonce"})
+        action["nonce"] = 1_700_000_000_000
+        number = 2000 if n == 1 else 50
+        results.append(bench(
+            f"signing.n{n}.to_api_dict", lambda: client._to_api_dict(params, exclude={"nonce"}), number=number, size=n
+        ))
+        results.append(bench(f"signing.n{n}.msgpack_pack", lambda: pack_action(action), number=number * 5, size=n))
+        results.append(bench(
+            f"signing.n{n}.sign_action", lambda: sign_action(WALLET, action, tx_type), number=20,
+            size=n,
+        ))
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,52 @@
+"""Benchmark: request round trips against the local mock server.
+
+Measures HttpTransport and WebSocketTransport info requests and a signed
+placeOrder over HTTP, with no injected latency, so the numbers are SDK
+plus loopback overhead.
+
+Run with ``python -m benchmarks.bench_transport``.
+"""
+from eth_account import Account
+
+from benchmarks._harness import measure_latency, report
+from hotstuff.apis.exchange import ExchangeClient
+from hotstuff.testing import MarketDataGenerator, MockServer
+from hotstuff.transports import HttpTransport, WebSocketTransport
+
+CALLS = 500
+WARMUP = 50
+MIDS = {"method": "mids", "params": {"symbol": "BTC-PERP"}}
+
+
+def _timed(name, fn, **extra):
+    for _ in range(WARMUP):
+        fn()
+    return measure_latency(name, fn, calls=CALLS, **extra)
+
+
+def run():
+    """Run the transport round-trip benchmark cases."""
+    results = []
+    with MockServer(market=MarketDataGenerator(rate=0, seed=1)) as mock:
+        http = HttpTransport(mock.http_options())
+        ws = WebSocketTransport(mock.ws_options())
+        try:
+            results.append(_timed("transport.http.info_round_trip", lambda: http.request("info", MIDS)))
+            results.append(_timed("transport.ws.info_round_trip", lambda: ws.request("info", MIDS)))
+
+            client = ExchangeClient(wallet=Account.from_key("0x" + "22" * 32))
+            client.transport = http
+            action = {"action": "cancelAll", "params": {"expiresAfter": 1_700_000_060_000}}
+
+            def _cancel_all():
+                client._execute_action({"action": action["action"], "params": dict(action["params"])})
+
+            results.append(_timed("transport.http.signed_action", _cancel_all))
+        finally:
+            ws.disconnect()
+            http.close()
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
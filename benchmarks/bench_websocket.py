@@ -0,0 +1,78 @@
+"""Benchmark: WebSocket receive path, from frame text to callback.
+
+Decodes recorded market data frames and dispatches notifications to a
+transport holding 1/10/100 subscriptions, and measures the hot-path cost
+of handing a frame to a FrameRecorder.
+
+Run with ``python -m benchmarks.bench_websocket``.
+"""
+import json
+import tempfile
+import time
+
+from benchmarks._harness import bench, report
+from hotstuff.testing import MarketDataGenerator
+from hotstuff.transports import FrameRecorder, WebSocketTransport
+from hotstuff.types import Subscription, WebSocketTransportOptions
+
+SUBSCRIPTION_COUNTS = (1, 10, 100)
+
+
+def _frame(channel, data):
+    return json.dumps({"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}})
+
+
+def _recorded_frames():
+    """Deterministic frames shaped like the live feed."""
+    market = MarketDataGenerator(symbols=("BTC-PERP",), depth=50, seed=5)
+    return {
+        "bbo": _frame("bbo@BTC-PERP", market.channel_data("bbo", "BTC-PERP")),
+        "trades": _frame("trades@BTC-PERP", market.channel_data("trades", "BTC-PERP")),
+        "orderbook50": _frame("orderbook@BTC-PERP", market.channel_data("orderbook", "BTC-PERP")),
+    }
+
+
+def _transport(subscriptions):
+    transport = WebSocketTransport(WebSocketTransportOptions(auto_connect=False))
+    for i in range(subscriptions):
+        channel = "bbo@BTC-PERP" if i == 0 else f"bbo@SYM{i}-PERP"
+        transport.subscriptions[f"s{i}"] = Subscription(
+            id=f"s{i}", channel=channel, symbol=None, params={}, timestamp=0.0, base_channel="bbo"
+        )
+        transport.subscription_callbacks[f"s{i}"] = lambda event: None
+    return transport
+
+
+def run():
+    """Run the frame decoding and dispatch benchmark cases."""
+    frames = _recorded_frames()
+    results = []
+    for name, frame in frames.items():
+        results.append(bench(f"ws.decode.{name}", lambda: json.loads(frame), number=5000, frame_bytes=len(frame)))
+
+    message = json.loads(frames["bbo"])
+    for n in SUBSCRIPTION_COUNTS:
+        transport = _transport(n)
+        results.append(bench(
+            f"ws.dispatch.subs{n}", lambda: transport._handle_incoming_message(message, 1, 2), number=5000,
+            subscriptions=n,
+        ))
+        results.append(bench(
+            f"ws.decode_dispatch.subs{n}", lambda: transport._handle_incoming_message(json.loads(frames["bbo"]), 1, 2),
+            number=5000, subscriptions=n,
+        ))
+
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = FrameRecorder(directory)
+        frame = frames["bbo"]
+        try:
+            results.append(bench(
+                "ws.record_frame", lambda: recorder.record(frame, time.monotonic_ns()), number=20000,
+            ))
+        finally:
+            recorder.close()
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
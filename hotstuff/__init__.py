@@ -6,19 +6,49 @@ A Python SDK for interacting with Hotstuff L1.
 __version__ = "0.1.1-beta.4"
 
 # Transports
-from hotstuff.transports import HttpTransport, WebSocketTransport
+from hotstuff.transports import FrameRecorder, HttpTransport, WebSocketTransport, read_frames
 
 # Clients
 from hotstuff.apis import InfoClient, ExchangeClient, SubscriptionClient
 
+# Explorer helpers
+from hotstuff.apis.crawler import BlockCrawler
+
+# Concurrent queries
+from hotstuff.apis.fanout import FanOutResult
+
+# Instrument metadata
+from hotstuff.apis.registry import InstrumentRegistry, InstrumentSpec
+
+# Pre-trade validation
+from hotstuff.apis.pretrade import PreTradeChecker, PreTradeError, PreTradeResult
+
 # Transport Types
 from hotstuff.types import (
     HttpTransportOptions,
     WebSocketTransportOptions,
+    RequestTrace,
+    ActionTiming,
 )
 
 # Utils
-from hotstuff.utils import NonceManager, sign_action
+from hotstuff.utils import (
+    NonceManager,
+    sign_action,
+    ExplorerCache,
+    ResponseCache,
+    RateLimit,
+    RateLimiter,
+    HedgingPolicy,
+    EndpointRouter,
+    MetricsRegistry,
+    MetricsServer,
+    SingleFlight,
+    TickToTradeTracer,
+    triggered_by,
+    TransactionIndex,
+    build_orders,
+)
 
 # Exceptions
 from hotstuff.exceptions import (
@@ -33,6 +63,7 @@ from hotstuff.exceptions import (
     HotstuffRateLimitError,
     HotstuffWebSocketError,
     HotstuffSubscriptionError,
+    HotstuffPreTradeError,
 )
 
 # Exchange Method Types (for convenience)
@@ -167,13 +198,28 @@ __all__ = [
     # Transports
     "HttpTransport",
     "WebSocketTransport",
+    "FrameRecorder",
+    "read_frames",
     # Clients
     "InfoClient",
     "ExchangeClient",
     "SubscriptionClient",
+    # Explorer Helpers
+    "BlockCrawler",
+    # Concurrent Queries
+    "FanOutResult",
+    # Instrument Metadata
+    "InstrumentRegistry",
+    "InstrumentSpec",
+    # Pre-trade Validation
+    "PreTradeChecker",
+    "PreTradeError",
+    "PreTradeResult",
     # Transport Types
     "HttpTransportOptions",
     "WebSocketTransportOptions",
+    "RequestTrace",
+    "ActionTiming",
     # Exceptions
     "HotstuffError",
     "HotstuffAPIError",
@@ -186,6 +232,7 @@ __all__ = [
     "HotstuffRateLimitError",
     "HotstuffWebSocketError",
     "HotstuffSubscriptionError",
+    "HotstuffPreTradeError",
     # Exchange Method Types
     "AddAgentParams",
     "RevokeAgentParams",
@@ -288,6 +335,19 @@ __all__ = [
     # Utils
     "NonceManager",
     "sign_action",
+    "ExplorerCache",
+    "ResponseCache",
+    "RateLimit",
+    "RateLimiter",
+    "HedgingPolicy",
+    "EndpointRouter",
+    "MetricsRegistry",
+    "MetricsServer",
+    "SingleFlight",
+    "TickToTradeTracer",
+    "triggered_by",
+    "TransactionIndex",
+    "build_orders",
     "EXCHANGE_OP_CODES",
 ]
 
@@ -2,9 +2,20 @@
 from hotstuff.apis.info import InfoClient
 from hotstuff.apis.exchange import ExchangeClient
 from hotstuff.apis.subscription import SubscriptionClient
+from hotstuff.apis.crawler import BlockCrawler
+from hotstuff.apis.registry import InstrumentRegistry, InstrumentSpec
+from hotstuff.apis.fanout import FanOutResult
+from hotstuff.apis.pretrade import PreTradeChecker, PreTradeError, PreTradeResult
 
 __all__ = [
     "InfoClient",
     "ExchangeClient",
     "SubscriptionClient",
+    "BlockCrawler",
+    "InstrumentRegistry",
+    "InstrumentSpec",
+    "FanOutResult",
+    "PreTradeChecker",
+    "PreTradeError",
+    "PreTradeResult",
 ]
\ No newline at end of file
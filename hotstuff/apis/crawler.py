@@ -0,0 +1,361 @@
+"""Explorer block crawler."""
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import fields
+from typing import Any, Dict, Iterator, Optional
+
+from hotstuff.exceptions import (
+    HotstuffAPIError,
+    HotstuffConnectionError,
+    HotstuffRateLimitError,
+    HotstuffTimeoutError,
+)
+from hotstuff.methods.info.explorer import (
+    BlockDetailsParams,
+    BlockDetailsResponse,
+    BlocksParams,
+    BlockTransaction,
+)
+from hotstuff.methods.subscription.channels import BlocksSubscriptionParams
+
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying with a smaller window instead of aborting the crawl.
+RETRYABLE_ERRORS = (
+    HotstuffRateLimitError,
+    HotstuffTimeoutError,
+    HotstuffConnectionError,
+)
+
+
+def _unwrap(payload: Any) -> Any:
+    """Strip a top-level ``data`` wrapper if the server sent one."""
+    if isinstance(payload, dict) and "data" in payload and "block_hash" not in payload:
+        return payload["data"]
+    return payload
+
+
+def extract_block_height(payload: Any) -> Optional[int]:
+    """
+    Extract the highest block height from a blocks payload.
+
+    Accepts a ``blocks`` response, a ``blocks`` subscription notification or a
+    single block record.
+
+    Args:
+        payload: Raw block payload
+
+    Returns:
+        The block height, or None if the payload carries no height
+    """
+    payload = _unwrap(payload)
+    if isinstance(payload, list):
+        heights = [extract_block_height(item) for item in payload]
+        heights = [h for h in heights if h is not None]
+        return max(heights) if heights else None
+    if isinstance(payload, dict):
+        for key in ("block_height", "height"):
+            value = payload.get(key)
+            if value is not None:
+                try:
+                    return int(value)
+                except (TypeError, ValueError):
+                    return None
+        for key in ("blocks", "block"):
+            if key in payload:
+                return extract_block_height(payload[key])
+    return None
+
+
+def parse_block_details(payload: Any) -> BlockDetailsResponse:
+    """
+    Build a BlockDetailsResponse from a raw ``block_details`` payload.
+
+    Unknown fields are ignored so new server fields do not break decoding.
+
+    Args:
+        payload: Raw block details payload (returned as is if already typed)
+
+    Returns:
+        Parsed block details
+    """
+    if isinstance(payload, BlockDetailsResponse):
+        return payload
+    payload = _unwrap(payload)
+    if not isinstance(payload, dict):
+        raise HotstuffAPIError(f"Unexpected block details payload: {payload!r}")
+
+    tx_fields = {f.name for f in fields(BlockTransaction)}
+    block_fields = {f.name for f in fields(BlockDetailsResponse)}
+
+    transactions = [
+        BlockTransaction(**{k: v for k, v in tx.items() if k in tx_fields})
+        for tx in payload.get("transactions") or []
+        if isinstance(tx, dict)
+    ]
+    values = {k: v for k, v in payload.items() if k in block_fields}
+    values["transactions"] = transactions
+    return BlockDetailsResponse(**values)
+
+
+class _AdaptiveWindow:
+    """AIMD concurrency window: grow by one per window of successes, halve on failure."""
+
+    def __init__(self, initial: int, minimum: int, maximum: int):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self._value = float(min(max(initial, self.minimum), self.maximum))
+
+    @property
+    def size(self) -> int:
+        return int(self._value)
+
+    def on_success(self):
+        self._value = min(self.maximum, self._value + 1.0 / self._value)
+
+    def on_failure(self):
+        self._value = max(self.minimum, self._value / 2.0)
+
+
+class BlockCrawler:
+    """Walks the chain through InfoClient, yielding blocks in strict height order."""
+
+    def __init__(
+        self,
+        info: Any,
+        concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        max_retries: int = 5,
+        retry_delay: float = 0.5,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 100,
+    ):
+        """
+        Initialize BlockCrawler.
+
+        Args:
+            info: InfoClient used for ``blocks`` and ``block_details``
+            concurrency: Initial number of in-flight ``block_details`` requests
+            min_concurrency: Lower bound for the adaptive window
+            max_concurrency: Upper bound for the adaptive window
+            max_retries: Attempts per block before the crawl fails
+            retry_delay: Base delay (seconds) before retrying a block
+            checkpoint_path: Optional JSON file storing the last yielded height
+            checkpoint_every: Persist the checkpoint every N yielded blocks
+        """
+        self.info = info
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = max(1, checkpoint_every)
+        self._window = _AdaptiveWindow(concurrency, min_concurrency, max_concurrency)
+        self._since_checkpoint = 0
+
+    @property
+    def concurrency(self) -> int:
+        """Current adaptive concurrency window."""
+        return self._window.size
+
+    # Checkpoints
+
+    def load_checkpoint(self) -> Optional[int]:
+        """Return the last height persisted to the checkpoint file, if any."""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        try:
+            with open(self.checkpoint_path, "r") as f:
+                return int(json.load(f)["block_height"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable checkpoint %s: %s", self.checkpoint_path, e)
+            return None
+
+    def save_checkpoint(self, height: int):
+        """Atomically persist ``height`` as the last processed block."""
+        if not self.checkpoint_path:
+            return
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"block_height": height, "updated_at": int(time.time() * 1000)}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _mark_processed(self, height: int, force: bool = False):
+        self._since_checkpoint += 1
+        if force or self._since_checkpoint >= self.checkpoint_every:
+            self.save_checkpoint(height)
+            self._since_checkpoint = 0
+
+    def _resolve_start(self, start_height: Optional[int]) -> int:
+        checkpoint = self.load_checkpoint()
+        if checkpoint is not None:
+            return checkpoint + 1
+        return start_height if start_height is not None else 0
+
+    # Fetching
+
+    def head_height(self) -> int:
+        """Return the current chain head height."""
+        response = self.info.blocks(BlocksParams(offset=0, limit=1))
+        height = extract_block_height(response)
+        if height is None:
+            raise HotstuffAPIError(f"Could not determine chain head from blocks response: {response!r}")
+        return height
+
+    def _fetch_block(self, height: int, delay: float = 0.0) -> BlockDetailsResponse:
+        if delay > 0:
+            time.sleep(delay)
+        return parse_block_details(
+            self.info.block_details(BlockDetailsParams(block_height=height))
+        )
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after:
+            return float(retry_after)
+        return self.retry_delay * (2 ** (attempt - 1))
+
+    def fetch_range(self, start_height: int, end_height: int) -> Iterator[BlockDetailsResponse]:
+        """
+        Fetch blocks ``start_height..end_height`` (inclusive) concurrently.
+
+        Blocks are yielded in strict height order regardless of the order in
+        which requests complete.
+
+        Args:
+            start_height: First block height
+            end_height: Last block height
+
+        Yields:
+            BlockDetailsResponse for every height in the range
+        """
+        if end_height < start_height:
+            return
+
+        pending: Dict[Future, int] = {}
+        attempts: Dict[int, int] = {}
+        ready: Dict[int, BlockDetailsResponse] = {}
+        next_yield = start_height
+        next_submit = start_height
+        pool = ThreadPoolExecutor(
+            max_workers=self._window.maximum, thread_name_prefix="hotstuff-crawler"
+        )
+
+        try:
+            while next_yield <= end_height:
+                # Cap the reorder buffer so one stuck block cannot grow memory unbounded.
+                while (
+                    next_submit <= end_height
+                    and len(pending) < self._window.size
+                    and next_submit - next_yield < self._window.maximum * 4
+                ):
+                    pending[pool.submit(self._fetch_block, next_submit)] = next_submit
+                    next_submit += 1
+
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    height = pending.pop(future)
+                    try:
+                        ready[height] = future.result()
+                        self._window.on_success()
+                    except RETRYABLE_ERRORS as e:
+                        self._window.on_failure()
+                        attempt = attempts.get(height, 0) + 1
+                        attempts[height] = attempt
+                        if attempt > self.max_retries:
+                            raise
+                        logger.debug("Retrying block %s (attempt %s): %s", height, attempt, e)
+                        delay = self._retry_delay(e, attempt)
+                        pending[pool.submit(self._fetch_block, height, delay)] = height
+
+                while next_yield in ready:
+                    block = ready.pop(next_yield)
+                    attempts.pop(next_yield, None)
+                    yield block
+                    self._mark_processed(next_yield)
+                    next_yield += 1
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
+            if next_yield > start_height:
+                self._mark_processed(next_yield - 1, force=True)
+
+    def crawl(
+        self,
+        start_height: Optional[int] = None,
+        end_height: Optional[int] = None,
+    ) -> Iterator[BlockDetailsResponse]:
+        """
+        Backfill blocks in height order, resuming from the checkpoint if present.
+
+        Args:
+            start_height: First height when no checkpoint exists (default 0)
+            end_height: Last height to fetch (default: current chain head)
+
+        Yields:
+            BlockDetailsResponse in strict height order
+        """
+        start = self._resolve_start(start_height)
+        end = end_height if end_height is not None else self.head_height()
+        for block in self.fetch_range(start, end):
+            yield block
+
+    def follow(
+        self,
+        subscriptions: Any,
+        start_height: Optional[int] = None,
+        stop: Optional[threading.Event] = None,
+        poll_interval: float = 1.0,
+    ) -> Iterator[BlockDetailsResponse]:
+        """
+        Backfill to the chain head, then keep yielding new blocks live.
+
+        The ``blocks`` subscription is opened before the backfill starts, so
+        blocks produced while catching up are buffered rather than lost. Any
+        heights skipped between notifications are fetched explicitly, so the
+        output never has gaps.
+
+        Args:
+            subscriptions: SubscriptionClient used for the ``blocks`` channel
+            start_height: First height when no checkpoint exists (default 0)
+            stop: Optional event that ends the generator when set
+            poll_interval: Seconds to wait for a notification before re-checking ``stop``
+
+        Yields:
+            BlockDetailsResponse in strict height order
+        """
+        heads: "queue.Queue[int]" = queue.Queue()
+
+        def on_block(event: Any):
+            height = extract_block_height(getattr(event, "data", event))
+            if height is not None:
+                heads.put(height)
+
+        subscription = subscriptions.blocks(BlocksSubscriptionParams(), on_block)
+        try:
+            next_height = self._resolve_start(start_height)
+            target = self.head_height()
+            while stop is None or not stop.is_set():
+                if target >= next_height:
+                    for block in self.fetch_range(next_height, target):
+                        yield block
+                    next_height = target + 1
+                try:
+                    target = max(target, heads.get(timeout=poll_interval))
+                except queue.Empty:
+                    continue
+                # Drain everything that queued up while we were fetching.
+                while not heads.empty():
+                    target = max(target, heads.get_nowait())
+        finally:
+            unsubscribe = subscription.get("unsubscribe") if isinstance(subscription, dict) else None
+            if callable(unsubscribe):
+                try:
+                    unsubscribe()
+                except Exception as e:
+                    logger.warning("Failed to unsubscribe from blocks: %s", e)
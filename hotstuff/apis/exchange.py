@@ -1,9 +1,18 @@
 """Exchange API client for trading operations."""
 from typing import Optional, Any, Dict, Callable
-from dataclasses import asdict
+from dataclasses import asdict, replace
+import logging
+import threading
+import time
+
 from eth_account import Account
 
+from hotstuff.exceptions import HotstuffPreTradeError
 from hotstuff.utils import sign_action, NonceManager
+from hotstuff.utils.cache import ResponseCache
+from hotstuff.utils.metrics import MetricsRegistry
+from hotstuff.utils.signing import pack_action, sign_packed_action
+from hotstuff.utils.tick_to_trade import TickToTradeTracer, current_trigger
 from hotstuff.methods.exchange import (
     trading as TM,
     account as AM,
@@ -12,7 +21,10 @@ from hotstuff.methods.exchange import (
 )
 from hotstuff.methods.exchange.op_codes import EXCHANGE_OP_CODES
 from hotstuff.transports import HttpTransport, WebSocketTransport
-from hotstuff.types import HttpTransportOptions, WebSocketTransportOptions
+from hotstuff.transports.tracing import capture
+from hotstuff.types import ActionTiming, HttpTransportOptions, WebSocketTransportOptions
+
+logger = logging.getLogger(__name__)
 
 
 class ExchangeClient:
@@ -23,7 +35,13 @@ class ExchangeClient:
         wallet: Account,
         nonce: Optional[Callable[[], int]] = None,
         websocket: bool = False,
-        is_testnet: bool = False
+        is_testnet: bool = False,
+        pre_trade_checker: Optional[Any] = None,
+        timing: bool = False,
+        timing_sink: Optional[Callable[[ActionTiming], None]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        tick_to_trade: Optional[TickToTradeTracer] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Initialize ExchangeClient.
@@ -32,19 +50,79 @@ class ExchangeClient:
             transport: The transport layer to use
             wallet: The wallet/account for signing
             nonce: Optional nonce generator function
+            pre_trade_checker: Optional PreTradeChecker run by place_order
+                before signing
+            timing: Record a per-stage ActionTiming for every action, added to
+                dict responses under ``"timing"`` and kept in ``last_timing``
+            timing_sink: Callback receiving each ActionTiming (implies ``timing``)
+            metrics: Registry recording request latency per exchange action;
+                nothing is recorded when omitted (``default_registry()`` is
+                the one ``MetricsServer()`` serves)
+            tick_to_trade: Tracer linking actions sent from subscription
+                callbacks to the WebSocket frame that triggered them
+            response_cache: InfoClient cache whose entries made stale by an
+                action (see INVALIDATED_BY_ACTION) are dropped once it succeeds
         """
         self.websocket = websocket
         if websocket:
-            self.transport = WebSocketTransport(WebSocketTransportOptions(is_testnet=is_testnet))
+            self.transport = WebSocketTransport(WebSocketTransportOptions(is_testnet=is_testnet, metrics=metrics))
         else:
-            self.transport = HttpTransport(HttpTransportOptions(is_testnet=is_testnet))
+            self.transport = HttpTransport(HttpTransportOptions(is_testnet=is_testnet, metrics=metrics))
         self.wallet = wallet
         self.nonce = nonce or NonceManager().get_nonce
+        self.pre_trade_checker = pre_trade_checker
+        self.timing = timing or timing_sink is not None
+        self.timing_sink = timing_sink
+        self.last_timing: Optional[ActionTiming] = None
+        self._timing_local = threading.local()
+        self.tick_to_trade = tick_to_trade
+        self.response_cache = response_cache
     
     def _to_dict(self, obj) -> dict:
         """Convert dataclass to dict."""
         return asdict(obj)
     
+    # Warm-up
+    
+    def warm_up(self, connections: Optional[int] = None, keep_warm: Optional[float] = None) -> Dict[str, float]:
+        """
+        Prepare for a fast first action.
+        
+        Opens pooled connections to the exchange endpoint (HTTP) and runs one
+        throwaway signature so the first real action does not pay for lazy
+        imports and hashing setup.
+        
+        Args:
+            connections: Connections to pre-open; defaults to the transport's
+                ``warm_connections``
+            keep_warm: Refresh interval in seconds for background keep-warm
+            
+        Returns:
+            Seconds spent per warmed base URL, plus "signing"
+        """
+        timings: Dict[str, float] = {}
+        warm_up = getattr(self.transport, "warm_up", None)
+        if warm_up is not None:
+            timings.update(warm_up(connections, roles=("api",)))
+            if keep_warm:
+                self.transport.start_keep_warm(keep_warm, connections, roles=("api",))
+        
+        start = time.monotonic()
+        sign_action(
+            wallet=self.wallet,
+            action={"warmUp": True, "nonce": 0},
+            tx_type=EXCHANGE_OP_CODES["placeOrder"],
+            is_testnet=self.transport.is_testnet,
+        )
+        timings["signing"] = time.monotonic() - start
+        return timings
+    
+    def stop_keep_warm(self):
+        """Stop background keep-warm started by ``warm_up``."""
+        stop = getattr(self.transport, "stop_keep_warm", None)
+        if stop is not None:
+            stop()
+    
     # Account Actions
     
     def add_agent(
@@ -130,10 +208,14 @@ class ExchangeClient:
             Response from the server
         """
         params_dict = self._to_api_dict(params, exclude={"nonce"})
-        return self._execute_action(
+        response = self._execute_action(
             {"action": "updatePerpInstrumentLeverage", "params": params_dict},
             signal
         )
+        # Keep the pre-trade leverage check in step with the account.
+        if self.pre_trade_checker is not None and hasattr(self.pre_trade_checker, "set_leverage"):
+            self.pre_trade_checker.set_leverage(params.instrumentId, float(params.leverage))
+        return response
 
     def approve_broker_fee(
         self,
@@ -229,13 +311,39 @@ class ExchangeClient:
         """
         Place order(s).
         
+        When a ``pre_trade_checker`` is configured, orders are validated
+        locally before signing. Invalid orders are dropped from the batch and
+        reported under ``"preTradeErrors"`` in the returned dict; the rest
+        are sent as usual.
+        
         Args:
             params: Order parameters
             signal: Optional abort signal
             
         Returns:
             Response from the server
-        """
+        
+        Raises:
+            HotstuffPreTradeError: If no order in the batch passes the checks
+                (or any order fails and the checker does not split batches)
+        """
+        pre_trade_errors = None
+        if self.pre_trade_checker is not None:
+            checked = self.pre_trade_checker.check(params.orders)
+            if checked.errors:
+                if not checked.valid or not self.pre_trade_checker.split_batches:
+                    raise HotstuffPreTradeError(
+                        f"{len(checked.errors)} of {len(params.orders)} orders failed pre-trade checks: "
+                        f"{checked.errors[0].message}",
+                        errors=checked.errors,
+                    )
+                logger.warning(
+                    "Dropping %d of %d orders that failed pre-trade checks",
+                    len(checked.errors), len(params.orders),
+                )
+                pre_trade_errors = [error.to_dict() for error in checked.errors]
+                params = replace(params, orders=checked.valid)
+        
         params_dict = self._to_api_dict(params, exclude={"nonce"})
         ordered_params = {
             "orders": params_dict["orders"],
@@ -244,10 +352,13 @@ class ExchangeClient:
         }
         if ordered_params["brokerConfig"] is None:
             ordered_params.pop("brokerConfig")
-        return self._execute_action(
+        response = self._execute_action(
             {"action": "placeOrder", "params": ordered_params},
             signal
         )
+        if pre_trade_errors and isinstance(response, dict):
+            response = dict(response, preTradeErrors=pre_trade_errors)
+        return response
     
     def cancel_by_oid(
         self,
@@ -488,6 +599,9 @@ class ExchangeClient:
     
     def _to_api_dict(self, obj, exclude=None) -> Dict[str, Any]:
         """Convert dataclass to dict, excluding specified fields."""
+        timed = self.timing or self.tick_to_trade is not None
+        if timed:
+            start = time.monotonic_ns()
         exclude = exclude or set()
         result = {}
         for key, value in asdict(obj).items():
@@ -500,6 +614,9 @@ class ExchangeClient:
                     ]
                 else:
                     result[key] = value
+        if timed:
+            # Picked up by the _execute_action call that follows.
+            self._timing_local.convert = (start, time.monotonic_ns())
         return result
     
     def _execute_action(
@@ -521,6 +638,14 @@ class ExchangeClient:
         """
         action = request["action"]
         params = request["params"]
+        if self.timing:
+            return self._execute_timed(action, params, signal, execute)
+        if self.tick_to_trade is not None:
+            trigger = current_trigger()
+            if trigger is not None:
+                return self._execute_timed(action, params, signal, execute, trigger)
+            # Nothing will consume the stamp _to_api_dict just left.
+            self._timing_local.convert = None
         
         # Set nonce if not present
         if "nonce" not in params or params["nonce"] is None:
@@ -548,6 +673,113 @@ class ExchangeClient:
                 },
                 signal,
             )
+            if self.response_cache is not None:
+                self.response_cache.invalidate_for_action(action)
             return response
         
         return {"params": params, "signature": signature}
+    
+    def _execute_timed(
+        self,
+        action: str,
+        params: Dict[str, Any],
+        signal: Optional[Any],
+        execute: bool,
+        trigger: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        ``_execute_action`` recording an ActionTiming for each stage.
+
+        With a ``trigger`` event the stamps also go to the tick-to-trade tracer.
+        """
+        if trigger is None and self.tick_to_trade is not None:
+            trigger = current_trigger()
+        convert = getattr(self._timing_local, "convert", None)
+        self._timing_local.convert = None
+        start = convert[0] if convert is not None else time.monotonic_ns()
+        timing = ActionTiming(
+            action=action,
+            convert_ns=convert[1] - convert[0] if convert is not None else None,
+            expires_after=params.get("expiresAfter"),
+        )
+        try:
+            if "nonce" not in params or params["nonce"] is None:
+                params["nonce"] = self.nonce()
+            timing.nonce = params["nonce"]
+            
+            t0 = time.monotonic_ns()
+            action_bytes = pack_action(params)
+            t1 = time.monotonic_ns()
+            signature = sign_packed_action(
+                self.wallet, action_bytes, EXCHANGE_OP_CODES[action], self.transport.is_testnet
+            )
+            signed_ns = time.monotonic_ns()
+            timing.pack_ns = t1 - t0
+            timing.sign_ns = signed_ns - t1
+            
+            if not execute:
+                if trigger is not None:
+                    self._record_tick_to_trade(trigger, action, start, signed_ns, 0, 0)
+                return {"params": params, "signature": signature}
+            
+            wall_offset = time.time_ns() - time.monotonic_ns()
+            with capture() as traces:
+                try:
+                    response = self.transport.request(
+                        "exchange",
+                        {
+                            "action": {
+                                "data": params,
+                                "type": str(EXCHANGE_OP_CODES[action]),
+                            },
+                            "signature": signature,
+                            "nonce": params["nonce"],
+                        },
+                        signal,
+                    )
+                finally:
+                    trace = traces[-1] if traces else None
+                    if trace is not None:
+                        timing.encode_ns = trace.serialize_ns
+                        timing.parse_ns = trace.parse_ns
+                        if trace.sent_ns:
+                            timing.sent_at_ms = (trace.sent_ns + wall_offset) // 1_000_000
+                            if trace.received_ns:
+                                timing.network_ns = trace.received_ns - trace.sent_ns
+                    if trigger is not None:
+                        self._record_tick_to_trade(
+                            trigger, action, start, signed_ns,
+                            trace.sent_ns if trace is not None else 0,
+                            trace.received_ns if trace is not None else 0,
+                        )
+            timing.total_ns = time.monotonic_ns() - start
+            if self.response_cache is not None:
+                self.response_cache.invalidate_for_action(action)
+            if self.timing and isinstance(response, dict):
+                response = dict(response, timing=timing.to_dict())
+            return response
+        finally:
+            if timing.total_ns is None:
+                timing.total_ns = time.monotonic_ns() - start
+            if self.timing:
+                self.last_timing = timing
+                if self.timing_sink is not None:
+                    try:
+                        self.timing_sink(timing)
+                    except Exception as e:
+                        logger.warning("Action timing sink failed: %s", e)
+
+    def _record_tick_to_trade(
+        self,
+        trigger: Any,
+        action: str,
+        start_ns: int,
+        signed_ns: int,
+        sent_ns: int,
+        acked_ns: int
+    ):
+        """Hand one action's stamps to the tick-to-trade tracer; never fails the action."""
+        try:
+            self.tick_to_trade.record(trigger, action, start_ns, signed_ns, sent_ns, acked_ns)
+        except Exception as e:
+            logger.warning("Tick-to-trade tracer failed: %s", e)
@@ -0,0 +1,155 @@
+"""Concurrent fan-out of one InfoClient method over many parameter sets."""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Sequence
+
+from hotstuff.exceptions import HotstuffRateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FanOutResult:
+    """Outcome of one request in a fan-out batch."""
+    index: int
+    params: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+    attempts: int = 1
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _RateLimitGate:
+    """Shared pause: a 429 on any request holds back every request in the batch."""
+
+    def __init__(self, max_retries: int, backoff: float):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._lock = threading.Lock()
+        self._not_before = 0.0
+
+    def delay(self) -> float:
+        return max(0.0, self._not_before - time.monotonic())
+
+    def on_rate_limited(self, error: HotstuffRateLimitError, attempt: int) -> float:
+        delay = float(error.retry_after) if error.retry_after else self.backoff * (2 ** attempt)
+        with self._lock:
+            self._not_before = max(self._not_before, time.monotonic() + delay)
+        return delay
+
+
+def _call(fn: Callable[[Any], Any], index: int, params: Any, gate: _RateLimitGate) -> FanOutResult:
+    start = time.monotonic()
+    attempt = 0
+    while True:
+        pause = gate.delay()
+        if pause > 0:
+            time.sleep(pause)
+        try:
+            result = fn(params)
+        except HotstuffRateLimitError as e:
+            if attempt >= gate.max_retries:
+                return FanOutResult(index, params, error=e, attempts=attempt + 1, elapsed=time.monotonic() - start)
+            delay = gate.on_rate_limited(e, attempt)
+            logger.debug("Fan-out request %d rate limited, pausing %.2fs", index, delay)
+            attempt += 1
+            continue
+        except Exception as e:
+            return FanOutResult(index, params, error=e, attempts=attempt + 1, elapsed=time.monotonic() - start)
+        return FanOutResult(index, params, result=result, attempts=attempt + 1, elapsed=time.monotonic() - start)
+
+
+def fan_out(
+    fn: Callable[[Any], Any],
+    params_list: Sequence[Any],
+    concurrency: int = 8,
+    max_retries: int = 3,
+    backoff: float = 0.5,
+) -> Iterator[FanOutResult]:
+    """
+    Call ``fn`` for every params object on a thread pool.
+
+    At most ``concurrency`` requests are in flight. Results are yielded as
+    they complete. A failing request yields a result with ``error`` set and
+    never aborts the batch. Rate-limited requests are retried after the
+    server's Retry-After (or an exponential backoff), and the whole batch
+    pauses meanwhile.
+
+    Args:
+        fn: Single-argument callable (e.g. a bound InfoClient method)
+        params_list: Parameters, one per request
+        concurrency: Maximum requests in flight
+        max_retries: Retries per request after a rate-limit error
+        backoff: Base delay (seconds) when the server sends no Retry-After
+
+    Returns:
+        Iterator of FanOutResult in completion order
+    """
+    gate = _RateLimitGate(max_retries, backoff)
+    pending_params = iter(enumerate(params_list))
+    workers = max(1, concurrency)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hotstuff-fanout") as executor:
+        in_flight = set()
+
+        def _fill():
+            for index, params in pending_params:
+                in_flight.add(executor.submit(_call, fn, index, params, gate))
+                if len(in_flight) >= workers:
+                    return
+
+        _fill()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.discard(future)
+                yield future.result()
+            _fill()
+
+
+async def fan_out_async(
+    fn: Callable[[Any], Any],
+    params_list: Sequence[Any],
+    concurrency: int = 8,
+    max_retries: int = 3,
+    backoff: float = 0.5,
+) -> AsyncIterator[FanOutResult]:
+    """
+    Asyncio version of ``fan_out``.
+
+    The blocking calls run on a dedicated thread pool, so the event loop
+    is never blocked.
+
+    Args:
+        fn: Single-argument callable (e.g. a bound InfoClient method)
+        params_list: Parameters, one per request
+        concurrency: Maximum requests in flight
+        max_retries: Retries per request after a rate-limit error
+        backoff: Base delay (seconds) when the server sends no Retry-After
+
+    Returns:
+        Async iterator of FanOutResult in completion order
+    """
+    loop = asyncio.get_running_loop()
+    gate = _RateLimitGate(max_retries, backoff)
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="hotstuff-fanout")
+    futures = []
+    try:
+        futures = [
+            loop.run_in_executor(executor, _call, fn, index, params, gate)
+            for index, params in enumerate(params_list)
+        ]
+        for future in asyncio.as_completed(futures):
+            yield await future
+    finally:
+        # Drop queued requests if the consumer stopped early.
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
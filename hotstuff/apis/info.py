@@ -1,42 +1,173 @@
 """Info API client."""
-from typing import Optional, Any
+from typing import Optional, Any, AsyncIterator, Callable, Iterator, Sequence, Union
 from dataclasses import asdict
 
 from hotstuff.methods.info import market as GM
 from hotstuff.methods.info import account as AM
 from hotstuff.methods.info import vault as VM
 from hotstuff.methods.info import explorer as EM
+from hotstuff.methods.decode import decode_response
+from hotstuff.apis.fanout import FanOutResult, fan_out, fan_out_async
 
 from hotstuff.transports import HttpTransport, WebSocketTransport
 from hotstuff.types import HttpTransportOptions, WebSocketTransportOptions
+from hotstuff.utils.cache import ExplorerCache, ResponseCache
+from hotstuff.utils.metrics import MetricsRegistry
+from hotstuff.utils.single_flight import SingleFlight
 
 
 class InfoClient:
     """Client for querying market data and account information."""
     
-    def __init__(self, websocket: bool = False, is_testnet: bool = False):
+    def __init__(
+        self,
+        websocket: bool = False,
+        is_testnet: bool = False,
+        explorer_cache: Optional[ExplorerCache] = None,
+        cache: Optional[ResponseCache] = None,
+        typed: bool = False,
+        single_flight: Optional[SingleFlight] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
         """
         Initialize InfoClient.
         
         Args:
             transport: The transport layer to use
+            explorer_cache: Optional cache for finalized blocks and transactions
+            cache: Optional TTL cache for slow-changing info methods
+            typed: Decode responses into the ``hotstuff.methods.info``
+                dataclasses instead of returning raw JSON
+            single_flight: Optional coalescing of identical concurrent requests
+            metrics: Registry recording request latency per info method;
+                nothing is recorded when omitted (``default_registry()`` is
+                the one ``MetricsServer()`` serves)
         """
         self.websocket = websocket
+        self.explorer_cache = explorer_cache
+        self.cache = cache
+        self.typed = typed
+        self.single_flight = single_flight
         if websocket:
-            self.transport = WebSocketTransport(WebSocketTransportOptions(is_testnet=is_testnet))
+            self.transport = WebSocketTransport(WebSocketTransportOptions(is_testnet=is_testnet, metrics=metrics))
         else:
-            self.transport = HttpTransport(HttpTransportOptions(is_testnet=is_testnet))
+            self.transport = HttpTransport(HttpTransportOptions(is_testnet=is_testnet, metrics=metrics))
     
     def _to_dict(self, obj) -> dict:
         """Convert dataclass to dict."""
         return asdict(obj)
     
+    def _request(
+        self, name: str, endpoint: str, request: dict, signal: Optional[Any] = None, raw: bool = False
+    ) -> Any:
+        """Send a request, going through the response cache and single-flight layer when enabled."""
+        fetch = lambda: self.transport.request(endpoint, request, signal)
+        if self.single_flight is not None and self.single_flight.handles(name):
+            send = fetch
+            fetch = lambda: self.single_flight.do(name, request["params"], send)
+        if self.cache is not None and self.cache.handles(name):
+            response = self.cache.get_or_fetch(name, request["params"], fetch)
+        else:
+            response = fetch()
+        return response if raw else self._decode(name, response)
+    
+    def _decode(self, name: str, response: Any) -> Any:
+        """Decode a raw response into its typed model when typed mode is on."""
+        if self.typed:
+            return decode_response(name, response)
+        return response
+    
+    def invalidate_cache(self, method: Optional[str] = None, params: Optional[Any] = None) -> int:
+        """
+        Drop cached responses.
+        
+        Args:
+            method: InfoClient method name to invalidate; None drops everything
+            params: Only drop the entry for these params (a Params dataclass or dict)
+            
+        Returns:
+            Number of entries removed
+        """
+        if self.cache is None:
+            return 0
+        if params is not None and hasattr(params, "__dataclass_fields__"):
+            params = self._to_dict(params)
+        return self.cache.invalidate(method, params)
+    
+    # Fan-out
+    
+    def _fan_out_target(self, method: Union[str, Callable[[Any], Any]], concurrency: int) -> Callable[[Any], Any]:
+        if callable(method):
+            fn = method
+        else:
+            fn = getattr(self, method, None)
+            if method.startswith("_") or method.startswith("fan_out") or not callable(fn):
+                raise ValueError(f"Unknown InfoClient method: {method!r}")
+        ensure_pool_size = getattr(self.transport, "ensure_pool_size", None)
+        if ensure_pool_size is not None:
+            ensure_pool_size(concurrency)
+        return fn
+    
+    def fan_out(
+        self,
+        method: Union[str, Callable[[Any], Any]],
+        params_list: Sequence[Any],
+        concurrency: int = 8,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+    ) -> Iterator[FanOutResult]:
+        """
+        Run one info method for many parameter sets concurrently.
+        
+        Requests share this client's transport (and its connection pool,
+        grown to ``concurrency``). Results stream back as they complete;
+        per-request errors are reported on the result instead of failing
+        the batch, and rate-limited requests are retried after Retry-After.
+        
+        Args:
+            method: InfoClient method name (e.g. "account_summary") or a callable
+            params_list: Params dataclasses, one per request
+            concurrency: Maximum requests in flight
+            max_retries: Retries per request after a rate-limit error
+            backoff: Base delay (seconds) when the server sends no Retry-After
+            
+        Returns:
+            Iterator of FanOutResult in completion order (``index`` maps back
+            to ``params_list``)
+        """
+        fn = self._fan_out_target(method, concurrency)
+        return fan_out(fn, params_list, concurrency, max_retries, backoff)
+    
+    def fan_out_async(
+        self,
+        method: Union[str, Callable[[Any], Any]],
+        params_list: Sequence[Any],
+        concurrency: int = 8,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+    ) -> AsyncIterator[FanOutResult]:
+        """
+        Async version of ``fan_out``; use with ``async for``.
+        
+        Args:
+            method: InfoClient method name (e.g. "positions") or a callable
+            params_list: Params dataclasses, one per request
+            concurrency: Maximum requests in flight
+            max_retries: Retries per request after a rate-limit error
+            backoff: Base delay (seconds) when the server sends no Retry-After
+            
+        Returns:
+            Async iterator of FanOutResult in completion order
+        """
+        fn = self._fan_out_target(method, concurrency)
+        return fan_out_async(fn, params_list, concurrency, max_retries, backoff)
+    
     def oracle(
         self, params: GM.OracleParams, signal: Optional[Any] = None
     ) -> Any:
         """Get oracle prices."""
         request = {"method": "oracle", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("oracle", "info", request, signal)
         return response
     
     def supported_collateral(
@@ -44,7 +175,7 @@ class InfoClient:
     ) -> Any:
         """Get supported collateral."""
         request = {"method": "supported_collateral", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("supported_collateral", "info", request, signal)
         return response
     
     def instruments(
@@ -52,7 +183,7 @@ class InfoClient:
     ) -> Any:
         """Get all instruments."""
         request = {"method": "instruments", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("instruments", "info", request, signal)
         return response
     
     def ticker(
@@ -60,7 +191,7 @@ class InfoClient:
     ) -> Any:
         """Get ticker for a specific symbol."""
         request = {"method": "ticker", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("ticker", "info", request, signal)
         return response
     
     def orderbook(
@@ -68,7 +199,7 @@ class InfoClient:
     ) -> Any:
         """Get orderbook with depth."""
         request = {"method": "orderbook", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("orderbook", "info", request, signal)
         return response
     
     def trades(
@@ -76,7 +207,7 @@ class InfoClient:
     ) -> Any:
         """Get recent trades."""
         request = {"method": "trades", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("trades", "info", request, signal)
         return response
     
     def mids(
@@ -84,7 +215,7 @@ class InfoClient:
     ) -> Any:
         """Get mid prices for all instruments."""
         request = {"method": "mids", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("mids", "info", request, signal)
         return response
     
     def bbo(
@@ -92,7 +223,7 @@ class InfoClient:
     ) -> Any:
         """Get best bid/offer."""
         request = {"method": "bbo", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("bbo", "info", request, signal)
         return response
     
     def chart(
@@ -104,7 +235,7 @@ class InfoClient:
         if "from_" in params_dict:
             params_dict["from"] = params_dict.pop("from_")
         request = {"method": "chart", "params": params_dict}
-        response = self.transport.request("info", request, signal)
+        response = self._request("chart", "info", request, signal)
         return response
     
     # Account Info Endpoints
@@ -114,7 +245,7 @@ class InfoClient:
     ) -> Any:
         """Get open orders."""
         request = {"method": "open_orders", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("open_orders", "info", request, signal)
         return response
     
     def positions(
@@ -122,7 +253,7 @@ class InfoClient:
     ) -> Any:
         """Get current positions."""
         request = {"method": "positions", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("positions", "info", request, signal)
         # Returns a list of positions
         return response
     
@@ -131,7 +262,7 @@ class InfoClient:
     ) -> Any:
         """Get account summary."""
         request = {"method": "account_summary", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("account_summary", "info", request, signal)
         return response
     
     def referral_summary(
@@ -139,7 +270,7 @@ class InfoClient:
     ) -> Any:
         """Get referral summary."""
         request = {"method": "referral_summary", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("referral_summary", "info", request, signal)
         return response
     
     def user_fee_info(
@@ -147,7 +278,7 @@ class InfoClient:
     ) -> Any:
         """Get user fee information."""
         request = {"method": "user_fees", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("user_fee_info", "info", request, signal)
         return response
     
     def account_history(
@@ -155,7 +286,7 @@ class InfoClient:
     ) -> Any:
         """Get account history."""
         request = {"method": "account_history", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("account_history", "info", request, signal)
         return response
     
     def order_history(
@@ -163,7 +294,7 @@ class InfoClient:
     ) -> Any:
         """Get order history."""
         request = {"method": "order_history", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("order_history", "info", request, signal)
         return response
     
     def fills(
@@ -171,7 +302,7 @@ class InfoClient:
     ) -> Any:
         """Get trade history (fills)."""
         request = {"method": "fills", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("fills", "info", request, signal)
         return response
     
     def funding_history(
@@ -179,7 +310,7 @@ class InfoClient:
     ) -> Any:
         """Get funding history."""
         request = {"method": "funding_history", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("funding_history", "info", request, signal)
         return response
     
     def transfer_history(
@@ -187,7 +318,7 @@ class InfoClient:
     ) -> Any:
         """Get transfer history."""
         request = {"method": "transfer_history", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("transfer_history", "info", request, signal)
         return response
     
     def instrument_leverage(
@@ -195,7 +326,7 @@ class InfoClient:
     ) -> Any:
         """Get instrument leverage settings."""
         request = {"method": "instrument_leverage", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("instrument_leverage", "info", request, signal)
         return response
     
     def all_agents(
@@ -203,7 +334,7 @@ class InfoClient:
     ) -> Any:
         """Get all agents."""
         request = {"method": "all_agents", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("all_agents", "info", request, signal)
         return response
     
     def account_info(
@@ -211,7 +342,7 @@ class InfoClient:
     ) -> Any:
         """Get account info."""
         request = {"method": "account_info", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("account_info", "info", request, signal)
         return response
     
     def brokers_check(
@@ -219,7 +350,7 @@ class InfoClient:
     ) -> Any:
         """Get brokers check."""
         request = {"method": "brokers_check", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("brokers_check", "info", request, signal)
         return response
         
     # Vault Info Endpoints
@@ -229,7 +360,7 @@ class InfoClient:
     ) -> Any:
         """Get all vaults."""
         request = {"method": "vaults", "params": self._to_dict(params)}
-        response = self.transport.request("info", request, signal)
+        response = self._request("vaults", "info", request, signal)
         return response
     
     def sub_vaults(
@@ -239,7 +370,7 @@ class InfoClient:
         params_dict = self._to_dict(params)
         params_dict.pop("vaultAddress", None)
         request = {"method": "sub_vaults", "params": params_dict}
-        response = self.transport.request("info", request, signal)
+        response = self._request("sub_vaults", "info", request, signal)
         return response
     
     def vault_balances(
@@ -249,7 +380,7 @@ class InfoClient:
         params_dict = self._to_dict(params)
         params_dict.pop("vaultAddress", None)
         request = {"method": "vault_balance", "params": params_dict}
-        response = self.transport.request("info", request, signal)
+        response = self._request("vault_balances", "info", request, signal)
         return response
     
     # Explorer Info Endpoints
@@ -259,29 +390,41 @@ class InfoClient:
     ) -> Any:
         """Get recent blocks."""
         request = {"method": "blocks", "params": self._to_dict(params)}
-        response = self.transport.request("explorer", request, signal)
+        response = self._request("blocks", "explorer", request, signal)
         return response
     
     def block_details(
         self, params: EM.BlockDetailsParams, signal: Optional[Any] = None
     ) -> Any:
         """Get specific block details."""
+        if self.explorer_cache is not None:
+            cached = self.explorer_cache.get_block(params.block_hash, params.block_height)
+            if cached is not None:
+                return self._decode("block_details", cached)
         request = {"method": "block", "params": self._to_dict(params)}
-        response = self.transport.request("explorer", request, signal)
-        return response
+        response = self._request("block_details", "explorer", request, signal, raw=True)
+        if self.explorer_cache is not None:
+            self.explorer_cache.put_block(response)
+        return self._decode("block_details", response)
     
     def transactions(
         self, params: EM.TransactionsParams, signal: Optional[Any] = None
     ) -> Any:
         """Get recent transactions."""
         request = {"method": "transactions", "params": self._to_dict(params)}
-        response = self.transport.request("explorer", request, signal)
+        response = self._request("transactions", "explorer", request, signal)
         return response
     
     def transaction_details(
         self, params: EM.TransactionDetailsParams, signal: Optional[Any] = None
     ) -> Any:
         """Get specific transaction details."""
+        if self.explorer_cache is not None:
+            cached = self.explorer_cache.get_transaction(params.tx_hash)
+            if cached is not None:
+                return self._decode("transaction_details", cached)
         request = {"method": "transaction", "params": self._to_dict(params)}
-        response = self.transport.request("explorer", request, signal)
-        return response
+        response = self._request("transaction_details", "explorer", request, signal, raw=True)
+        if self.explorer_cache is not None:
+            self.explorer_cache.put_transaction(response)
+        return self._decode("transaction_details", response)
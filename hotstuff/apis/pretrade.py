@@ -0,0 +1,258 @@
+"""Local pre-trade validation against cached instrument and ticker limits."""
+import math
+import threading
+from dataclasses import asdict, dataclass, field, is_dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from hotstuff.apis.registry import InstrumentKind, InstrumentRegistry, InstrumentSpec
+
+# Error codes reported in PreTradeError.code
+UNKNOWN_INSTRUMENT = "unknown_instrument"
+AMBIGUOUS_INSTRUMENT = "ambiguous_instrument"
+INVALID_NUMBER = "invalid_number"
+TICK_SIZE = "tick_size"
+LOT_SIZE = "lot_size"
+MIN_NOTIONAL = "min_notional"
+MAX_LEVERAGE = "max_leverage"
+PRICE_BAND = "price_band"
+
+
+@dataclass
+class PreTradeError:
+    """Why a single order failed pre-trade checks."""
+    index: int
+    cloid: Optional[str]
+    instrument_id: Optional[int]
+    code: str
+    message: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class PreTradeResult:
+    """Outcome of checking a batch of orders."""
+    valid: List[Any] = field(default_factory=list)
+    errors: List[PreTradeError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class _TickerLimits:
+    mark_price: Optional[float] = None
+    max_trading_price: Optional[float] = None
+    min_trading_price: Optional[float] = None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+class PreTradeChecker:
+    """
+    Rejects orders that would fail exchange validation before they are signed.
+
+    Checks run entirely against the InstrumentRegistry and ticker limits
+    pushed in via ``update_ticker`` (or ``ticker_listener``), so a batch is
+    validated without any network round-trip:
+
+    - price is a multiple of the tick size and size a multiple of the lot size
+    - notional meets ``min_notional_usd`` (perps) or
+      ``min_size_in_quote_asset`` (spot)
+    - the configured leverage is allowed by the margin tier for the notional
+    - price lies within the ticker's ``min_trading_price``/``max_trading_price``
+
+    Orders carry only an instrument id, and perp and spot ids can collide.
+    Without ``kind`` an id listed as both is rejected as ambiguous rather
+    than checked against the wrong instrument; pass ``kind`` (one checker
+    per market) to resolve it.
+
+    The leverage check uses the leverage recorded per instrument.
+    ``ExchangeClient.update_perp_instrument_leverage`` records it on the
+    client's ``pre_trade_checker`` after a successful update; leverage set
+    elsewhere (another client, the web UI) must be fed in with
+    ``set_leverage``. Instruments without a recorded leverage skip the check.
+    """
+
+    def __init__(
+        self,
+        registry: InstrumentRegistry,
+        kind: Optional[InstrumentKind] = None,
+        split_batches: bool = True,
+    ):
+        """
+        Initialize PreTradeChecker.
+
+        Args:
+            registry: Loaded instrument registry
+            kind: Resolve order instrument ids as "perps" or "spot"; when
+                omitted, ids listed under both kinds are rejected
+            split_batches: Send the valid part of a partly invalid batch
+                instead of rejecting the whole batch
+        """
+        self.registry = registry
+        self.kind = kind
+        self.split_batches = split_batches
+        self._lock = threading.Lock()
+        self._tickers: Dict[str, _TickerLimits] = {}
+        self._leverage: Dict[int, float] = {}
+
+    # Limits
+
+    def update_ticker(self, ticker: Any):
+        """
+        Cache price limits from a ticker.
+
+        Args:
+            ticker: Ticker dataclass or raw ``ticker`` payload (dict)
+        """
+        data = asdict(ticker) if is_dataclass(ticker) else ticker
+        if not isinstance(data, dict) or not data.get("symbol"):
+            return
+        limits = _TickerLimits(
+            mark_price=_to_float(data.get("mark_price")),
+            max_trading_price=_to_float(data.get("max_trading_price")),
+            min_trading_price=_to_float(data.get("min_trading_price")),
+        )
+        with self._lock:
+            self._tickers[data["symbol"]] = limits
+
+    def ticker_listener(self) -> Callable[[Any], None]:
+        """
+        Build a ``SubscriptionClient.ticker`` listener that keeps limits fresh.
+
+        Returns:
+            Callback accepting SubscriptionData (or the raw notification data)
+        """
+        def _listener(event: Any) -> None:
+            data = getattr(event, "data", event)
+            for ticker in data if isinstance(data, list) else [data]:
+                self.update_ticker(ticker)
+
+        return _listener
+
+    def set_leverage(self, instrument_id: int, leverage: float):
+        """
+        Record the account's leverage for an instrument.
+
+        Args:
+            instrument_id: Instrument id
+            leverage: Leverage set via ``update_perp_instrument_leverage``
+        """
+        with self._lock:
+            self._leverage[int(instrument_id)] = float(leverage)
+
+    # Checks
+
+    def check(self, orders: Sequence[Any]) -> PreTradeResult:
+        """
+        Validate a batch of orders.
+
+        Args:
+            orders: UnitOrder instances or order dicts (e.g. from ``build_orders``)
+
+        Returns:
+            PreTradeResult with the valid orders (in input order) and one
+            error per rejected order
+        """
+        result = PreTradeResult()
+        for index, order in enumerate(orders):
+            error = self.check_order(order, index)
+            if error is None:
+                result.valid.append(order)
+            else:
+                result.errors.append(error)
+        return result
+
+    def check_order(self, order: Any, index: int = 0) -> Optional[PreTradeError]:
+        """
+        Validate a single order.
+
+        Args:
+            order: UnitOrder instance or order dict
+            index: Position of the order in its batch, used in the error
+
+        Returns:
+            The first failed check, or None if the order passes
+        """
+        get = order.get if isinstance(order, dict) else lambda key, default=None: getattr(order, key, default)
+        instrument_id = get("instrumentId")
+        cloid = get("cloid")
+
+        def _error(code: str, message: str) -> PreTradeError:
+            return PreTradeError(index, cloid, instrument_id, code, message)
+
+        spec = None
+        if instrument_id is not None:
+            spec = self.registry.find(instrument_id, self.kind)
+            if spec is not None and self.kind is None and self.registry.find(instrument_id, "spot") is not None \
+                    and self.registry.find(instrument_id, "perps") is not None:
+                return _error(
+                    AMBIGUOUS_INSTRUMENT,
+                    f"Instrument id {instrument_id!r} is both a perp and a spot market; set PreTradeChecker.kind",
+                )
+        if spec is None:
+            return _error(UNKNOWN_INSTRUMENT, f"Unknown instrument: {instrument_id!r}")
+
+        price_text = get("price")
+        size_text = get("size")
+        size = _to_float(size_text)
+        if size is None or size <= 0:
+            return _error(INVALID_NUMBER, f"Invalid size: {size_text!r}")
+        if not spec.size.is_aligned(size_text):
+            return _error(LOT_SIZE, f"Size {size_text} is not a multiple of lot size {spec.size.step_decimal}")
+
+        limits = self._tickers.get(spec.name)
+        price = _to_float(price_text)
+        if price is None and not (get("isMarket") and price_text in (None, "")):
+            return _error(INVALID_NUMBER, f"Invalid price: {price_text!r}")
+        if price is not None:
+            if price <= 0:
+                return _error(INVALID_NUMBER, f"Invalid price: {price_text!r}")
+            if not spec.price.is_aligned(price_text):
+                return _error(TICK_SIZE, f"Price {price_text} is not a multiple of tick size {spec.price.step_decimal}")
+            if limits is not None:
+                if limits.max_trading_price is not None and price > limits.max_trading_price:
+                    return _error(PRICE_BAND, f"Price {price_text} is above max trading price {limits.max_trading_price}")
+                if limits.min_trading_price is not None and price < limits.min_trading_price:
+                    return _error(PRICE_BAND, f"Price {price_text} is below min trading price {limits.min_trading_price}")
+
+        reference_price = price if price is not None else (limits.mark_price if limits is not None else None)
+        if reference_price is None:
+            return None
+        notional = reference_price * size
+        return self._check_notional(spec, notional, _error)
+
+    def _check_notional(
+        self,
+        spec: InstrumentSpec,
+        notional: float,
+        _error: Callable[[str, str], PreTradeError],
+    ) -> Optional[PreTradeError]:
+        instrument = spec.instrument
+        if spec.kind == "perps":
+            min_notional = _to_float(getattr(instrument, "min_notional_usd", None))
+        else:
+            min_notional = _to_float(getattr(instrument, "min_size_in_quote_asset", None))
+        if min_notional is not None and notional < min_notional:
+            return _error(MIN_NOTIONAL, f"Notional {notional:.8g} is below minimum {min_notional:.8g}")
+
+        leverage = self._leverage.get(spec.id)
+        if leverage is not None and spec.kind == "perps":
+            max_leverage = spec.max_leverage(notional)
+            if max_leverage is not None and leverage > max_leverage:
+                return _error(
+                    MAX_LEVERAGE,
+                    f"Leverage {leverage:g}x exceeds the {max_leverage}x allowed at notional {notional:.8g}",
+                )
+        return None
@@ -0,0 +1,343 @@
+"""Instrument registry with indexed lookups and an on-disk snapshot."""
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+from hotstuff.exceptions import HotstuffAPIError, HotstuffValidationError
+from hotstuff.methods.info.market import (
+    InstrumentsParams,
+    MarginTier,
+    PerpInstrument,
+    SpotInstrument,
+)
+from hotstuff.utils.quantize import StepQuantizer, get_quantizer
+
+logger = logging.getLogger(__name__)
+
+InstrumentKind = Literal["perps", "spot"]
+
+SNAPSHOT_VERSION = 1
+
+
+def _build(cls, payload: Dict[str, Any]):
+    """Build a dataclass from a payload, ignoring unknown fields."""
+    names = {f.name for f in fields(cls)}
+    return cls(**{k: v for k, v in payload.items() if k in names})
+
+
+@dataclass
+class InstrumentSpec:
+    """Instrument metadata with precomputed quantizers and margin tiers."""
+    id: int
+    name: str
+    kind: InstrumentKind
+    instrument: Union[PerpInstrument, SpotInstrument]
+    price: StepQuantizer
+    size: StepQuantizer
+    # Sorted by ascending notional threshold.
+    margin_tiers: Tuple[MarginTier, ...] = field(default_factory=tuple)
+    _tier_thresholds: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._tier_thresholds = tuple(float(t.notional_usd_threshold) for t in self.margin_tiers)
+
+    @property
+    def tick_size(self) -> float:
+        return self.price.step
+
+    @property
+    def lot_size(self) -> float:
+        return self.size.step
+
+    def margin_tier(self, notional_usd: float) -> Optional[MarginTier]:
+        """
+        Return the margin tier that applies to a position notional.
+
+        Args:
+            notional_usd: Absolute position notional in USD
+
+        Returns:
+            The first tier whose threshold covers ``notional_usd``, the last
+            tier when the notional exceeds every threshold, or None if the
+            instrument has no tiers
+        """
+        for tier, threshold in zip(self.margin_tiers, self._tier_thresholds):
+            if notional_usd <= threshold:
+                return tier
+        return self.margin_tiers[-1] if self.margin_tiers else None
+
+    def max_leverage(self, notional_usd: float = 0.0) -> Optional[int]:
+        """Maximum leverage allowed at ``notional_usd``."""
+        tier = self.margin_tier(notional_usd)
+        if tier is not None:
+            return int(tier.max_leverage)
+        return getattr(self.instrument, "max_leverage", None)
+
+
+def build_instrument_spec(kind: InstrumentKind, payload: Dict[str, Any]) -> InstrumentSpec:
+    """
+    Build an InstrumentSpec from a raw ``instruments`` entry.
+
+    Args:
+        kind: "perps" or "spot"
+        payload: One element of the ``perps`` or ``spot`` list
+
+    Returns:
+        The indexed instrument spec
+    """
+    if kind == "perps":
+        tiers_payload = payload.get("margin_tiers") or []
+        tiers = [t if isinstance(t, MarginTier) else _build(MarginTier, t) for t in tiers_payload]
+        instrument = _build(PerpInstrument, dict(payload, margin_tiers=tiers))
+    else:
+        tiers = []
+        instrument = _build(SpotInstrument, payload)
+
+    ordered = sorted(tiers, key=lambda t: float(t.notional_usd_threshold))
+    return InstrumentSpec(
+        id=int(instrument.id),
+        name=instrument.name,
+        kind=kind,
+        instrument=instrument,
+        price=get_quantizer(instrument.tick_size),
+        size=get_quantizer(instrument.lot_size),
+        margin_tiers=tuple(ordered),
+    )
+
+
+class InstrumentRegistry:
+    """
+    Instrument metadata indexed by id and name.
+
+    The registry loads ``instruments(type="all")`` once (or a snapshot from
+    disk), precomputes per-instrument tick/lot quantizers and margin tiers, and
+    can refresh itself in the background. Lookups never touch the network.
+    """
+
+    def __init__(
+        self,
+        info: Optional[Any] = None,
+        snapshot_path: Optional[str] = None,
+        on_change: Optional[Callable[["InstrumentRegistry"], None]] = None,
+    ):
+        """
+        Initialize InstrumentRegistry.
+
+        Args:
+            info: InfoClient used to fetch instruments (optional when only
+                a snapshot is used)
+            snapshot_path: Optional JSON file to persist and restore instruments
+            on_change: Called after the instrument set changes on refresh
+        """
+        self.info = info
+        self.snapshot_path = snapshot_path
+        self.on_change = on_change
+        self.loaded_at: Optional[float] = None
+        self.source: Optional[str] = None
+        self.validated = threading.Event()
+
+        self._payload: Optional[Dict[str, Any]] = None
+        self._by_name: Dict[str, InstrumentSpec] = {}
+        self._by_id: Dict[Tuple[str, int], InstrumentSpec] = {}
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # Lookups
+
+    def get(self, key: Union[int, str], kind: Optional[InstrumentKind] = None) -> InstrumentSpec:
+        """
+        Look up an instrument by id or name.
+
+        Args:
+            key: Instrument id or name (e.g. 1 or "BTC-PERP")
+            kind: Restrict id lookups to "perps" or "spot"; perps win when omitted
+
+        Returns:
+            The instrument spec
+
+        Raises:
+            HotstuffValidationError: If the instrument is unknown
+        """
+        spec = self.find(key, kind)
+        if spec is None:
+            raise HotstuffValidationError(f"Unknown instrument: {key!r}")
+        return spec
+
+    def find(self, key: Union[int, str], kind: Optional[InstrumentKind] = None) -> Optional[InstrumentSpec]:
+        """Like ``get`` but returns None for unknown instruments."""
+        if isinstance(key, str):
+            spec = self._by_name.get(key)
+            return spec if spec is None or kind is None or spec.kind == kind else None
+        by_id = self._by_id
+        if kind is not None:
+            return by_id.get((kind, int(key)))
+        return by_id.get(("perps", int(key))) or by_id.get(("spot", int(key)))
+
+    def __contains__(self, key: Union[int, str]) -> bool:
+        return self.find(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def perps(self) -> List[InstrumentSpec]:
+        """All perpetual instruments."""
+        return [s for s in self._by_name.values() if s.kind == "perps"]
+
+    def spot(self) -> List[InstrumentSpec]:
+        """All spot instruments."""
+        return [s for s in self._by_name.values() if s.kind == "spot"]
+
+    # Loading
+
+    def _index(self, payload: Dict[str, Any], source: str):
+        by_name: Dict[str, InstrumentSpec] = {}
+        by_id: Dict[Tuple[str, int], InstrumentSpec] = {}
+        for kind in ("perps", "spot"):
+            for entry in payload.get(kind) or []:
+                try:
+                    spec = build_instrument_spec(kind, entry)
+                except (TypeError, ValueError, ArithmeticError) as e:
+                    logger.warning("Skipping malformed %s instrument %r: %s", kind, entry, e)
+                    continue
+                by_name[spec.name] = spec
+                by_id[(kind, spec.id)] = spec
+        # Swap whole indexes so concurrent readers never see a partial update.
+        self._by_name, self._by_id = by_name, by_id
+        self._payload = payload
+        self.loaded_at = time.time()
+        self.source = source
+
+    def fetch(self) -> Dict[str, Any]:
+        """Fetch the raw instruments payload from the server."""
+        if self.info is None:
+            raise HotstuffValidationError("InstrumentRegistry needs an InfoClient to fetch instruments")
+        payload = self.info.instruments(InstrumentsParams(type="all"))
+        if is_dataclass(payload):
+            payload = asdict(payload)
+        if not isinstance(payload, dict):
+            raise HotstuffAPIError(f"Unexpected instruments response: {payload!r}")
+        return payload
+
+    def load(self, use_snapshot: bool = True, validate: bool = True) -> "InstrumentRegistry":
+        """
+        Populate the registry, preferring the on-disk snapshot.
+
+        When a snapshot is used and ``validate`` is set, the server copy is
+        fetched on a background thread and replaces the snapshot if it differs.
+
+        Args:
+            use_snapshot: Load from ``snapshot_path`` when it exists
+            validate: Validate a loaded snapshot against the server asynchronously
+
+        Returns:
+            The registry (for chaining)
+        """
+        payload = self.load_snapshot() if use_snapshot else None
+        if payload is not None:
+            self._index(payload, "snapshot")
+            if validate and self.info is not None:
+                threading.Thread(
+                    target=self._validate_snapshot, name="hotstuff-registry-validate", daemon=True
+                ).start()
+            else:
+                self.validated.set()
+            return self
+
+        self.refresh()
+        self.validated.set()
+        return self
+
+    def refresh(self) -> bool:
+        """
+        Reload instruments from the server and persist the snapshot.
+
+        Returns:
+            True if the instrument set changed
+        """
+        payload = self.fetch()
+        changed = self._canonical(payload) != self._canonical(self._payload)
+        if changed or self._payload is None:
+            self._index(payload, "server")
+            self.save_snapshot()
+            if changed and self.on_change is not None:
+                self.on_change(self)
+        return changed
+
+    def _validate_snapshot(self):
+        try:
+            if self.refresh():
+                logger.info("Instrument snapshot was stale and has been replaced")
+        except Exception as e:
+            logger.warning("Instrument snapshot validation failed: %s", e)
+        finally:
+            self.validated.set()
+
+    # Background refresh
+
+    def start_background_refresh(self, interval: float = 300.0):
+        """
+        Refresh instruments every ``interval`` seconds on a daemon thread.
+
+        Args:
+            interval: Seconds between refreshes
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._stop.clear()
+
+        def _loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logger.warning("Instrument refresh failed: %s", e)
+
+        self._refresh_thread = threading.Thread(target=_loop, name="hotstuff-registry-refresh", daemon=True)
+        self._refresh_thread.start()
+
+    def stop(self):
+        """Stop the background refresh thread."""
+        self._stop.set()
+        self._refresh_thread = None
+
+    # Snapshot
+
+    @staticmethod
+    def _canonical(payload: Optional[Dict[str, Any]]) -> Optional[str]:
+        if payload is None:
+            return None
+        return json.dumps(payload, sort_keys=True, default=str)
+
+    def load_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Read the instruments payload from ``snapshot_path``, if present and valid."""
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            with open(self.snapshot_path, "r") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable instrument snapshot %s: %s", self.snapshot_path, e)
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        return snapshot.get("instruments")
+
+    def save_snapshot(self):
+        """Atomically write the current instruments payload to ``snapshot_path``."""
+        if not self.snapshot_path or self._payload is None:
+            return
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "version": SNAPSHOT_VERSION,
+                    "saved_at": int(time.time() * 1000),
+                    "instruments": self._payload,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.snapshot_path)
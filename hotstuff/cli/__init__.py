@@ -0,0 +1 @@
+"""Command-line tools shipped with the SDK."""
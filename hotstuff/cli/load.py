@@ -0,0 +1,632 @@
+"""``hotstuff-load``: drive exchange and info traffic, report throughput and latency.
+
+Examples::
+
+    # Against the built-in mock server, 8 closed-loop threads for 10 s
+    hotstuff-load --mock --workers 8 --duration 10
+
+    # Open loop at 200 actions/s over WebSocket, 4 processes
+    hotstuff-load --mock --mode open --rate 200 --transport ws --engine processes --processes 4
+
+    # Against a real endpoint (key from HOTSTUFF_PRIVATE_KEY)
+    hotstuff-load --testnet --mix place_order=3,cancel_all=1,info=6 --rate 20 --mode open
+
+In open-loop mode requests start on a fixed schedule whatever the
+completion rate, and latency is measured from the scheduled start, so a
+backlog shows up as latency instead of being hidden (no coordinated
+omission). Closed-loop workers send back to back, or paced by ``--rate``.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from eth_account import Account
+
+from hotstuff.apis.exchange import ExchangeClient
+from hotstuff.apis.info import InfoClient
+from hotstuff.methods.exchange.trading import (
+    CancelAllParams,
+    CancelByOidParams,
+    PlaceOrderParams,
+    UnitCancelByOrderId,
+    UnitOrder,
+)
+from hotstuff.transports import HttpTransport, WebSocketTransport
+from hotstuff.types import HttpTransportOptions, WebSocketTransportOptions
+from hotstuff.utils.endpoints import ENDPOINTS_URLS
+from hotstuff.utils.metrics import Histogram, HistogramSnapshot
+
+logger = logging.getLogger(__name__)
+
+OPERATIONS = ("place_order", "cancel_by_oid", "cancel_all", "info")
+EXCHANGE_OPERATIONS = frozenset({"place_order", "cancel_by_oid", "cancel_all"})
+DEFAULT_MIX = "place_order=4,cancel_by_oid=2,cancel_all=1,info=3"
+# Requests scheduled this long before the deadline but not yet started are dropped.
+_DRAIN_GRACE_NS = 1_000_000_000
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    Parse ``"place_order=4,info=1"`` into operation weights.
+
+    Raises:
+        ValueError: On unknown operations or non-positive totals
+    """
+    mix: Dict[str, float] = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"unknown operation {name!r} (expected one of {', '.join(OPERATIONS)})")
+        mix[name] = float(weight) if weight.strip() else 1.0
+        if mix[name] < 0:
+            raise ValueError(f"negative weight for {name}")
+    mix = {name: w for name, w in mix.items() if w > 0}
+    if not mix:
+        raise ValueError("the mix has no operation with a positive weight")
+    return mix
+
+
+@dataclass
+class LoadConfig:
+    """Everything a load run needs; plain data so it can be sent to worker processes."""
+    mix: Dict[str, float] = field(default_factory=lambda: parse_mix(DEFAULT_MIX))
+    mode: str = "closed"
+    engine: str = "threads"
+    transport: str = "http"
+    workers: int = 4
+    processes: int = 2
+    rate: Optional[float] = None
+    arrival: str = "uniform"
+    duration: float = 10.0
+    api_url: Optional[str] = None
+    ws_url: Optional[str] = None
+    is_testnet: bool = False
+    private_key: Optional[str] = None
+    symbol: str = "BTC-PERP"
+    instrument_id: int = 1
+    price: str = "1"
+    size: str = "0.001"
+    info_method: str = "ticker"
+    timeout: float = 5.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class OperationStats:
+    """Outcome counts and latency distribution of one operation type."""
+    ok: int = 0
+    errors: int = 0
+    dropped: int = 0
+    error_types: Dict[str, int] = field(default_factory=dict)
+    latency: HistogramSnapshot = field(default_factory=HistogramSnapshot)
+
+    def merge(self, other: "OperationStats") -> "OperationStats":
+        self.ok += other.ok
+        self.errors += other.errors
+        self.dropped += other.dropped
+        for name, n in other.error_types.items():
+            self.error_types[name] = self.error_types.get(name, 0) + n
+        self.latency.merge(other.latency)
+        return self
+
+
+@dataclass
+class LoadReport:
+    """Result of a load run."""
+    mode: str
+    engine: str
+    transport: str
+    workers: int
+    rate: Optional[float]
+    elapsed: float
+    operations: Dict[str, OperationStats] = field(default_factory=dict)
+
+    def total(self) -> OperationStats:
+        """All operations combined."""
+        combined = OperationStats()
+        for stats in self.operations.values():
+            combined.merge(stats)
+        return combined
+
+    @property
+    def throughput(self) -> float:
+        """Successful operations per second."""
+        return self.total().ok / self.elapsed if self.elapsed else 0.0
+
+    def merge(self, other: "LoadReport") -> "LoadReport":
+        """Combine a concurrent run (e.g. another process) into this report."""
+        self.elapsed = max(self.elapsed, other.elapsed)
+        for name, stats in other.operations.items():
+            self.operations.setdefault(name, OperationStats()).merge(stats)
+        return self
+
+    def _row(self, stats: OperationStats) -> Dict[str, Any]:
+        snap = stats.latency
+        return {
+            "ok": stats.ok,
+            "errors": stats.errors,
+            "dropped": stats.dropped,
+            "throughput": stats.ok / self.elapsed if self.elapsed else 0.0,
+            "latency_ms": {
+                "mean": snap.mean / 1e6,
+                "p50": snap.percentile(0.5) / 1e6,
+                "p90": snap.percentile(0.9) / 1e6,
+                "p99": snap.percentile(0.99) / 1e6,
+                "p99.9": snap.percentile(0.999) / 1e6,
+                "max": (snap.max or 0) / 1e6,
+            },
+            "error_types": dict(stats.error_types),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Machine-readable summary."""
+        return {
+            "mode": self.mode,
+            "engine": self.engine,
+            "transport": self.transport,
+            "workers": self.workers,
+            "rate": self.rate,
+            "elapsed": self.elapsed,
+            "operations": {name: self._row(stats) for name, stats in sorted(self.operations.items())},
+            "total": self._row(self.total()),
+        }
+
+    def format(self) -> str:
+        """Human-readable table."""
+        rate = f", target {self.rate:g}/s" if self.rate else ""
+        lines = [
+            f"hotstuff-load: {self.mode} loop, {self.engine} x{self.workers}, {self.transport}{rate}, "
+            f"{self.elapsed:.1f} s",
+            f"{'operation':<14} {'ok':>8} {'errors':>7} {'rate/s':>9} {'p50 ms':>8} {'p90 ms':>8} "
+            f"{'p99 ms':>8} {'p99.9 ms':>9} {'max ms':>8}",
+        ]
+        rows = sorted(self.operations.items()) + [("total", self.total())]
+        for name, stats in rows:
+            row = self._row(stats)
+            ms = row["latency_ms"]
+            lines.append(
+                f"{name:<14} {row['ok']:>8} {row['errors']:>7} {row['throughput']:>9.1f} {ms['p50']:>8.2f} "
+                f"{ms['p90']:>8.2f} {ms['p99']:>8.2f} {ms['p99.9']:>9.2f} {ms['max']:>8.2f}"
+            )
+        total = self.total()
+        if total.dropped:
+            lines.append(f"dropped (never started before the deadline): {total.dropped}")
+        for name, n in sorted(total.error_types.items(), key=lambda item: -item[1]):
+            lines.append(f"error {name}: {n}")
+        return "\n".join(lines)
+
+
+class _NonceSource:
+    """
+    Strictly increasing millisecond nonces shared by every thread of a process.
+
+    Process ``index`` of ``stride`` only issues nonces ``n % stride == index``,
+    so processes signing with one key never collide.
+    """
+
+    def __init__(self, index: int = 0, stride: int = 1):
+        self.index = index
+        self.stride = stride
+        self._last = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> int:
+        with self._lock:
+            n = max(int(time.time() * 1000), self._last + 1)
+            n += (self.index - n) % self.stride
+            self._last = n
+            return n
+
+
+class _Schedule:
+    """Start times at ``rate`` per second, evenly spaced or Poisson, shared by threads."""
+
+    def __init__(self, rate: float, poisson: bool, start_ns: int, seed: Optional[int]):
+        self._interval_ns = 1e9 / rate
+        self._poisson = poisson
+        self._next = float(start_ns)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def next(self) -> int:
+        with self._lock:
+            slot = self._next
+            gap = self._rng.expovariate(1.0) if self._poisson else 1.0
+            self._next += gap * self._interval_ns
+        return int(slot)
+
+
+def _sleep_until(deadline_ns: int):
+    delay = (deadline_ns - time.monotonic_ns()) / 1e9
+    if delay > 0:
+        time.sleep(delay)
+
+
+class _Recorder:
+    """Thread-safe per-operation counters and latency histograms."""
+
+    def __init__(self, operations: Sequence[str]):
+        self._histograms = {op: Histogram() for op in operations}
+        self._stats = {op: OperationStats() for op in operations}
+        self._lock = threading.Lock()
+
+    def record(self, op: str, latency_ns: int, error: Optional[BaseException] = None):
+        if error is None:
+            self._histograms[op].record(latency_ns)
+            with self._lock:
+                self._stats[op].ok += 1
+            return
+        name = type(error).__name__
+        with self._lock:
+            stats = self._stats[op]
+            stats.errors += 1
+            stats.error_types[name] = stats.error_types.get(name, 0) + 1
+
+    def drop(self, op: str):
+        with self._lock:
+            self._stats[op].dropped += 1
+
+    def results(self) -> Dict[str, OperationStats]:
+        with self._lock:
+            return {
+                op: replace(stats, error_types=dict(stats.error_types), latency=self._histograms[op].snapshot())
+                for op, stats in self._stats.items()
+            }
+
+
+class _Clients:
+    """ExchangeClient/InfoClient pair sending through one transport."""
+
+    def __init__(self, config: LoadConfig, wallet: Any, nonce: Callable[[], int]):
+        network = "testnet" if config.is_testnet else "mainnet"
+        if config.transport == "ws":
+            url = config.ws_url or ENDPOINTS_URLS[network]["ws"]
+            transport: Any = WebSocketTransport(WebSocketTransportOptions(
+                is_testnet=config.is_testnet, timeout=config.timeout, server={network: url},
+                keep_alive={"interval": None, "timeout": None},
+            ))
+        else:
+            server = None
+            if config.api_url:
+                server = {network: {"api": config.api_url, "rpc": config.api_url}}
+            transport = HttpTransport(HttpTransportOptions(
+                is_testnet=config.is_testnet, timeout=config.timeout, server=server,
+                pool_size=max(10, config.workers),
+            ))
+        self.transport = transport
+        self.exchange = ExchangeClient(wallet=wallet, nonce=nonce, is_testnet=config.is_testnet)
+        self.exchange.transport = transport
+        self.info = InfoClient(is_testnet=config.is_testnet)
+        self.info.transport = transport
+
+    def close(self):
+        if isinstance(self.transport, WebSocketTransport):
+            self.transport.disconnect()
+        else:
+            self.transport.close()
+
+
+class _Runner:
+    """Runs one process's share of the load with the threads or asyncio engine."""
+
+    def __init__(self, config: LoadConfig, index: int = 0, stride: int = 1):
+        self.config = config
+        self.index = index
+        self.operations = list(config.mix)
+        self.weights = [config.mix[op] for op in self.operations]
+        self.recorder = _Recorder(self.operations)
+        self.wallet = Account.from_key(config.private_key) if config.private_key else None
+        self.nonce = _NonceSource(index, stride)
+        self._local = threading.local()
+        self._clients: List[_Clients] = []
+        self._clients_lock = threading.Lock()
+        self._shared: Optional[_Clients] = None
+        self._oid = random.Random(config.seed).randrange(1 << 40)
+
+    def clients(self) -> _Clients:
+        """HTTP shares one client and connection pool; WebSocket gets a connection per thread."""
+        if self.config.transport == "http":
+            with self._clients_lock:
+                if self._shared is None:
+                    self._shared = _Clients(self.config, self.wallet, self.nonce)
+                    self._clients.append(self._shared)
+                return self._shared
+        clients = getattr(self._local, "clients", None)
+        if clients is None:
+            clients = _Clients(self.config, self.wallet, self.nonce)
+            self._local.clients = clients
+            with self._clients_lock:
+                self._clients.append(clients)
+        return clients
+
+    def _call(self, op: str):
+        config = self.config
+        clients = self.clients()
+        expires = int(time.time() * 1000) + 60_000
+        if op == "place_order":
+            side = "b" if random.random() < 0.5 else "s"
+            order = UnitOrder(instrumentId=config.instrument_id, side=side, positionSide="BOTH", price=config.price,
+                              size=config.size, tif="GTC", ro=False, po=True)
+            return clients.exchange.place_order(PlaceOrderParams(orders=[order], expiresAfter=expires))
+        if op == "cancel_by_oid":
+            with self._clients_lock:
+                self._oid += 1
+                oid = self._oid
+            cancel = UnitCancelByOrderId(oid=oid, instrumentId=config.instrument_id)
+            return clients.exchange.cancel_by_oid(CancelByOidParams(cancels=[cancel], expiresAfter=expires))
+        if op == "cancel_all":
+            return clients.exchange.cancel_all(CancelAllParams(expiresAfter=expires))
+        return clients.transport.request("info", {"method": config.info_method, "params": {"symbol": config.symbol}})
+
+    def execute(self, op: str, start_ns: int, deadline_ns: int):
+        """Run one operation; latency counts from ``start_ns`` (the scheduled start in open loop)."""
+        if time.monotonic_ns() > deadline_ns + _DRAIN_GRACE_NS:
+            self.recorder.drop(op)
+            return
+        try:
+            self._call(op)
+        except Exception as e:
+            self.recorder.record(op, 0, e)
+            return
+        self.recorder.record(op, time.monotonic_ns() - start_ns)
+
+    def choose(self, rng: random.Random) -> str:
+        return rng.choices(self.operations, self.weights)[0] if len(self.operations) > 1 else self.operations[0]
+
+    def _schedule(self, start_ns: int) -> Optional[_Schedule]:
+        rate = self.config.rate
+        if not rate:
+            return None
+        seed = None if self.config.seed is None else self.config.seed + self.index
+        return _Schedule(rate, self.config.arrival == "poisson", start_ns, seed)
+
+    def _rng(self, worker: int) -> random.Random:
+        seed = self.config.seed
+        return random.Random(None if seed is None else seed * 1_000_003 + self.index * 1_009 + worker)
+
+    def run_threads(self, start_ns: int, deadline_ns: int):
+        config = self.config
+        schedule = self._schedule(start_ns)
+        if config.mode == "open":
+            rng = self._rng(0)
+            with ThreadPoolExecutor(max_workers=config.workers) as executor:
+                while True:
+                    slot = schedule.next()
+                    if slot >= deadline_ns:
+                        break
+                    _sleep_until(slot)
+                    executor.submit(self.execute, self.choose(rng), slot, deadline_ns)
+            return
+
+        def _worker(worker: int):
+            rng = self._rng(worker)
+            while True:
+                if schedule is not None:
+                    slot = schedule.next()
+                    if slot >= deadline_ns:
+                        return
+                    _sleep_until(slot)
+                elif time.monotonic_ns() >= deadline_ns:
+                    return
+                self.execute(self.choose(rng), time.monotonic_ns(), deadline_ns)
+
+        threads = [threading.Thread(target=_worker, args=(i,), daemon=True) for i in range(config.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    async def run_asyncio(self, start_ns: int, deadline_ns: int):
+        """Schedule on the event loop; the blocking SDK calls run on an executor."""
+        config = self.config
+        loop = asyncio.get_running_loop()
+        schedule = self._schedule(start_ns)
+        with ThreadPoolExecutor(max_workers=config.workers) as executor:
+            if config.mode == "open":
+                rng = self._rng(0)
+                pending = []
+                while True:
+                    slot = schedule.next()
+                    if slot >= deadline_ns:
+                        break
+                    delay = (slot - time.monotonic_ns()) / 1e9
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    pending.append(loop.run_in_executor(executor, self.execute, self.choose(rng), slot, deadline_ns))
+                await asyncio.gather(*pending)
+                return
+
+            async def _worker(worker: int):
+                rng = self._rng(worker)
+                while True:
+                    if schedule is not None:
+                        slot = schedule.next()
+                        if slot >= deadline_ns:
+                            return
+                        delay = (slot - time.monotonic_ns()) / 1e9
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                    elif time.monotonic_ns() >= deadline_ns:
+                        return
+                    await loop.run_in_executor(
+                        executor, self.execute, self.choose(rng), time.monotonic_ns(), deadline_ns
+                    )
+
+            await asyncio.gather(*(_worker(i) for i in range(config.workers)))
+
+    def run(self) -> LoadReport:
+        config = self.config
+        start_ns = time.monotonic_ns()
+        deadline_ns = start_ns + int(config.duration * 1e9)
+        try:
+            if config.engine == "asyncio":
+                asyncio.run(self.run_asyncio(start_ns, deadline_ns))
+            else:
+                self.run_threads(start_ns, deadline_ns)
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
+        finally:
+            for clients in self._clients:
+                try:
+                    clients.close()
+                except Exception as e:
+                    logger.debug("Closing load clients failed: %s", e)
+        return LoadReport(
+            mode=config.mode, engine=config.engine, transport=config.transport, workers=config.workers,
+            rate=config.rate, elapsed=elapsed, operations=self.recorder.results(),
+        )
+
+
+def _run_process(config: LoadConfig, index: int, stride: int) -> LoadReport:
+    return _Runner(config, index, stride).run()
+
+
+def run(config: LoadConfig) -> LoadReport:
+    """
+    Run a load test against the configured endpoints.
+
+    Args:
+        config: Load configuration; ``private_key`` is required when the mix
+            contains exchange actions
+
+    Returns:
+        Combined LoadReport
+    """
+    if config.mode == "open" and not config.rate:
+        raise ValueError("open-loop mode needs a target rate")
+    if config.private_key is None and EXCHANGE_OPERATIONS & set(config.mix):
+        raise ValueError("exchange operations need a private key")
+    if config.engine != "processes":
+        return _Runner(config).run()
+
+    processes = max(1, config.processes)
+    share = replace(
+        config, engine="threads", rate=config.rate / processes if config.rate else None,
+    )
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+        futures = [pool.submit(_run_process, share, i, processes) for i in range(processes)]
+        reports = [future.result() for future in futures]
+    report = reports[0]
+    for other in reports[1:]:
+        report.merge(other)
+    report.engine = "processes"
+    report.workers = config.workers * processes
+    report.rate = config.rate
+    return report
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="hotstuff-load", description="Load-test Hotstuff exchange and info endpoints.",
+    )
+    target = parser.add_argument_group("target")
+    target.add_argument("--mock", action="store_true", help="Start a local mock server and test against it")
+    target.add_argument("--api-url", help="HTTP base URL for info/exchange/explorer (default: public endpoint)")
+    target.add_argument("--ws-url", help="WebSocket URL (default: public endpoint)")
+    target.add_argument("--testnet", action="store_true", help="Use testnet endpoints and signing domain")
+    target.add_argument("--private-key", help="Signing key (default: $HOTSTUFF_PRIVATE_KEY; random with --mock)")
+
+    load = parser.add_argument_group("load")
+    load.add_argument("--mix", default=DEFAULT_MIX, help=f"Operation weights (default: {DEFAULT_MIX})")
+    load.add_argument("--mode", choices=("closed", "open"), default="closed")
+    load.add_argument("--engine", choices=("threads", "asyncio", "processes"), default="threads")
+    load.add_argument("--transport", choices=("http", "ws"), default="http")
+    load.add_argument("--workers", type=int, default=4, help="Threads (per process) / concurrent requests")
+    load.add_argument("--processes", type=int, default=max(1, min(4, os.cpu_count() or 1)))
+    load.add_argument("--rate", type=float, help="Target operations per second (total)")
+    load.add_argument("--arrival", choices=("uniform", "poisson"), default="uniform", help="Open-loop arrivals")
+    load.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    load.add_argument("--timeout", type=float, default=5.0, help="Per-request timeout in seconds")
+    load.add_argument("--seed", type=int, help="Seed for reproducible operation choice and arrivals")
+
+    orders = parser.add_argument_group("orders and queries")
+    orders.add_argument("--symbol", default="BTC-PERP")
+    orders.add_argument("--instrument-id", type=int, default=1)
+    orders.add_argument("--price", default="1", help="Limit price (post-only; keep it far from the market)")
+    orders.add_argument("--size", default="0.001")
+    orders.add_argument("--info-method", default="ticker")
+
+    mock = parser.add_argument_group("mock server faults")
+    mock.add_argument("--mock-latency", type=float, default=0.0, help="Added latency in ms")
+    mock.add_argument("--mock-jitter", type=float, default=0.0, help="Latency jitter in ms")
+    mock.add_argument("--mock-error-rate", type=float, default=0.0)
+    mock.add_argument("--mock-429-rate", type=float, default=0.0)
+
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--verbose", "-v", action="store_true")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Console entry point."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    private_key = args.private_key or os.environ.get("HOTSTUFF_PRIVATE_KEY")
+    if private_key is None and args.mock:
+        private_key = Account.create().key.hex()
+
+    config = LoadConfig(
+        mix=mix, mode=args.mode, engine=args.engine, transport=args.transport, workers=max(1, args.workers),
+        processes=args.processes, rate=args.rate, arrival=args.arrival, duration=args.duration,
+        api_url=args.api_url, ws_url=args.ws_url, is_testnet=args.testnet, private_key=private_key,
+        symbol=args.symbol, instrument_id=args.instrument_id, price=args.price, size=args.size,
+        info_method=args.info_method, timeout=args.timeout, seed=args.seed,
+    )
+
+    mock_server = None
+    if args.mock:
+        from hotstuff.testing import FaultInjection, MarketDataGenerator, MockServer
+
+        mock_server = MockServer(
+            faults=FaultInjection(
+                latency=args.mock_latency / 1000, jitter=args.mock_jitter / 1000,
+                error_rate=args.mock_error_rate, rate_limit_rate=args.mock_429_rate, seed=args.seed,
+            ),
+            market=MarketDataGenerator(symbols=(args.symbol,), rate=0, seed=args.seed),
+            is_testnet=args.testnet,
+        )
+        config = replace(config, api_url=mock_server.http_url, ws_url=mock_server.ws_url)
+
+    try:
+        report = run(config)
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        if mock_server is not None:
+            mock_server.close()
+
+    if args.json:
+        json.dump(dict(report.to_dict(), config=_public_config(config)), sys.stdout, indent=2)
+        print()
+    else:
+        print(report.format())
+    return 0 if report.total().ok else 1
+
+
+def _public_config(config: LoadConfig) -> Dict[str, Any]:
+    result = asdict(config)
+    result.pop("private_key", None)
+    return result
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -70,3 +70,11 @@ class HotstuffWebSocketError(HotstuffError):
 class HotstuffSubscriptionError(HotstuffWebSocketError):
     """Error subscribing to a channel."""
     pass
+
+
+class HotstuffPreTradeError(HotstuffValidationError):
+    """Orders rejected locally by pre-trade checks before signing."""
+    
+    def __init__(self, message: str, errors: list = None):
+        super().__init__(message)
+        self.errors = errors or []
@@ -0,0 +1,522 @@
+"""Compact model types for hot-path data.
+
+Slotted variants drop the per-instance ``__dict__`` of the regular
+dataclasses while keeping the same fields, defaults and methods.
+Struct-of-arrays containers hold list responses (fills, order history,
+trades, chart, orderbook levels) as one column per field, only build row
+objects on access, and export to NumPy or Arrow without per-row work.
+"""
+import itertools
+import typing
+from array import array
+from dataclasses import MISSING, asdict, fields, is_dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from hotstuff.methods.exchange.trading import UnitOrder
+from hotstuff.methods.info.account import Fill, FillsResponse, OpenOrder, OrderHistoryEntry, OrderHistoryResponse
+from hotstuff.methods.info.market import ChartPoint, OrderbookLevel, OrderbookResponse, Trade
+from hotstuff.methods.subscription.channels import OrderbookItem
+from hotstuff.utils.quantize import Number, get_quantizer
+
+
+def slotted(cls: Type) -> Type:
+    """
+    Build a ``__slots__`` copy of a dataclass.
+
+    The copy has the same fields, defaults, ``__post_init__`` and methods,
+    but no per-instance ``__dict__``. It is not a subclass of ``cls``.
+
+    Args:
+        cls: Dataclass to copy
+
+    Returns:
+        The slotted dataclass
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+    names = tuple(f.name for f in fields(cls))
+    # Class attributes holding field defaults would clash with the slots; the
+    # generated __init__ keeps its own reference to each default.
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    name = f"Slotted{cls.__name__}"
+    namespace["__qualname__"] = name
+    namespace["__module__"] = __name__
+    return type(cls)(name, cls.__bases__, namespace)
+
+
+SlottedUnitOrder = slotted(UnitOrder)
+SlottedOrderbookLevel = slotted(OrderbookLevel)
+SlottedOrderbookItem = slotted(OrderbookItem)
+SlottedTrade = slotted(Trade)
+SlottedFill = slotted(Fill)
+SlottedOpenOrder = slotted(OpenOrder)
+SlottedOrderHistoryEntry = slotted(OrderHistoryEntry)
+SlottedChartPoint = slotted(ChartPoint)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for columnar export; install it with "
+            "`pip install numpy` or `pip install hotstuff-python-sdk[numpy]`"
+        ) from e
+    return numpy
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Arrow export; install it with "
+            "`pip install pyarrow` or `pip install hotstuff-python-sdk[arrow]`"
+        ) from e
+    return pyarrow
+
+
+def _parse_float64(np: Any, values: List[Any]) -> Any:
+    """Parse decimal strings (or numbers) to float64 in one pass; None -> NaN."""
+    count = len(values)
+    if None in values:
+        values = ["nan" if v is None else v for v in values]
+    # float() over map() runs in C; much faster than going through a unicode array.
+    return np.fromiter(map(float, values), dtype=np.float64, count=count)
+
+
+def _parse_ticks(np: Any, values: List[Any], step: Number, name: str) -> Any:
+    """Parse decimal strings to int64 multiples of ``step``."""
+    if None in values:
+        raise ValueError(f"{name} has missing values and cannot be converted to ticks")
+    return get_quantizer(step).ticks_array(_parse_float64(np, values))
+
+
+def _array_typecode(tp: Any) -> Optional[str]:
+    args = [a for a in getattr(tp, "__args__", ()) if a is not type(None)]
+    if getattr(tp, "__origin__", None) is Union and len(args) == 1:
+        tp = args[0]
+    if tp is int:
+        return "q"
+    if tp is float:
+        return "d"
+    return None
+
+
+def _share_strings(values: List[Any]) -> List[Any]:
+    """Make equal values share one object when the column repeats a lot."""
+    try:
+        distinct = len(set(values))
+    except TypeError:
+        return values
+    if distinct * 2 > len(values):
+        return values
+    canonical = {v: v for v in values}
+    return [canonical[v] for v in values]
+
+
+class RecordColumns(Sequence):
+    """
+    Struct-of-arrays list of records.
+
+    Each field is stored once as a column: ``int``/``float`` fields in
+    compact ``array`` buffers while every value fits, columns that are all
+    None not at all, and everything else in plain lists where repeated
+    strings (sides, instruments, accounts, prices) share one object.
+    Indexing builds a slotted row on demand, so ``columns[i].price`` works
+    like it does on a list of dataclasses.
+    """
+
+    row_type: Type = None
+    # String fields holding decimal numbers, parsed by to_numpy/to_arrow.
+    decimal_fields: Tuple[str, ...] = ()
+    # String fields holding integers (e.g. millisecond timestamps).
+    integer_fields: Tuple[str, ...] = ()
+
+    def __init__(self, records: Iterable[Any] = (), row_type: Optional[Type] = None):
+        """
+        Initialize RecordColumns.
+
+        Args:
+            records: Dataclass instances or dicts; unknown keys are ignored
+            row_type: Dataclass used for rows (defaults to the class attribute)
+        """
+        if row_type is not None:
+            self.row_type = row_type
+        if self.row_type is None:
+            raise TypeError("RecordColumns needs a row_type")
+        row_fields = fields(self.row_type)
+        hints = typing.get_type_hints(self.row_type)
+        self._names: Tuple[str, ...] = tuple(f.name for f in row_fields)
+        self._defaults: Dict[str, Any] = {
+            f.name: f.default for f in row_fields if f.default is not MISSING
+        }
+        self._typecodes: Dict[str, Optional[str]] = {
+            name: _array_typecode(hints.get(name)) for name in self._names
+        }
+        # None marks a column whose values are all None so far.
+        self._columns: Dict[str, Union[array, List[Any], None]] = dict.fromkeys(self._names)
+        self._length = 0
+        self.extend(records)
+
+    # Building
+
+    def _extend_column(self, name: str, values: List[Any]):
+        column = self._columns[name]
+        if column is None:
+            if values.count(None) == len(values):
+                return
+            column = [None] * self._length
+        typecode = self._typecodes[name]
+        if typecode is not None and (isinstance(column, array) or not column):
+            try:
+                packed = array(typecode, values)
+            except (TypeError, OverflowError):
+                # Missing or out-of-range value: fall back to a generic column.
+                column = column.tolist() if isinstance(column, array) else column
+            else:
+                column = packed if not column else column + packed
+                self._columns[name] = column
+                return
+        elif isinstance(column, array):
+            column = column.tolist()
+        column.extend(_share_strings(values))
+        self._columns[name] = column
+
+    def extend(self, records: Iterable[Any]):
+        """
+        Append several records.
+
+        Args:
+            records: Dataclass instances, dicts or positional lists (e.g.
+                ``[price, size]`` levels); unknown keys are ignored
+        """
+        names = self._names
+        records = [
+            r if isinstance(r, dict) else dict(zip(names, r)) if isinstance(r, (list, tuple)) else asdict(r)
+            for r in records
+        ]
+        if not records:
+            return
+        for name in self._names:
+            default = self._defaults.get(name)
+            self._extend_column(name, [r.get(name, default) for r in records])
+        self._length += len(records)
+
+    def append(self, record: Any):
+        """Append one record (dataclass instance or dict)."""
+        self.extend([record])
+
+    # Access
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return type(self)((self[i] for i in range(*index.indices(self._length))), self.row_type)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RecordColumns index out of range")
+        return self.row_type(**{
+            name: column[index] if column is not None else None
+            for name, column in self._columns.items()
+        })
+
+    def __iter__(self) -> Iterator[Any]:
+        names = self._names
+        row_type = self.row_type
+        columns = [
+            column if column is not None else itertools.repeat(None, self._length)
+            for column in self._columns.values()
+        ]
+        for values in zip(*columns):
+            yield row_type(**dict(zip(names, values)))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={self._length}, row_type={self.row_type.__name__})"
+
+    @property
+    def field_names(self) -> Tuple[str, ...]:
+        return self._names
+
+    def column(self, name: str) -> Union[array, List[Any]]:
+        """
+        Return the storage for one field without building rows.
+
+        Args:
+            name: Field name (e.g. "price")
+
+        Returns:
+            The column (an ``array`` or a list); treat it as read-only
+        """
+        column = self._columns[name]
+        return column if column is not None else [None] * self._length
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize every row as a dict."""
+        return [asdict(row) for row in self]
+
+    # Columnar export
+
+    def _select(self, columns: Optional[Sequence[str]]) -> List[str]:
+        if columns is None:
+            return list(self._names)
+        unknown = [name for name in columns if name not in self._columns]
+        if unknown:
+            raise KeyError(f"Unknown columns: {unknown}")
+        return list(columns)
+
+    def as_columns(self) -> Dict[str, Union[memoryview, List[Any]]]:
+        """
+        Return every column without copying.
+
+        Packed numeric columns are returned as read-only ``memoryview``s over
+        the underlying buffers; other columns as the stored lists.
+
+        Returns:
+            Mapping of field name to column
+        """
+        return {
+            name: memoryview(column).toreadonly() if isinstance(column, array) else column
+            for name, column in ((name, self.column(name)) for name in self._names)
+        }
+
+    def to_numpy(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        tick_sizes: Optional[Dict[str, Number]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Convert to NumPy arrays, parsing decimal strings in one vectorized pass.
+
+        Packed numeric columns become zero-copy views of the column buffers.
+        ``decimal_fields`` are parsed to float64 (None -> NaN) or, when a tick
+        size is given for them, to int64 tick counts. ``integer_fields`` are
+        parsed to int64 (float64 if any value is missing). Everything else
+        becomes an object array.
+
+        Args:
+            columns: Fields to convert (all fields by default)
+            tick_sizes: Per-field step, e.g. ``{"price": 0.5, "size": 0.001}``,
+                for int64 tick output
+
+        Returns:
+            Mapping of field name to ``numpy.ndarray``
+        """
+        np = _numpy()
+        tick_sizes = tick_sizes or {}
+        result = {}
+        for name in self._select(columns):
+            column = self.column(name)
+            if isinstance(column, array):
+                result[name] = np.frombuffer(column, dtype=np.float64 if column.typecode == "d" else np.int64)
+            elif name in self.decimal_fields:
+                step = tick_sizes.get(name)
+                result[name] = _parse_ticks(np, column, step, name) if step is not None else _parse_float64(np, column)
+            elif name in self.integer_fields:
+                # Missing values force float64 so they can be NaN.
+                if None in column:
+                    result[name] = _parse_float64(np, column)
+                else:
+                    result[name] = np.fromiter(map(int, column), dtype=np.int64, count=len(column))
+            else:
+                result[name] = np.array(column, dtype=object)
+        return result
+
+    def to_arrow(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        tick_sizes: Optional[Dict[str, Number]] = None,
+    ) -> Any:
+        """
+        Convert to a ``pyarrow.Table``.
+
+        Numeric columns are wrapped without copying; decimal and integer
+        string columns are cast by Arrow's vectorized string parser.
+
+        Args:
+            columns: Fields to convert (all fields by default)
+            tick_sizes: Per-field step for int64 tick output (see ``to_numpy``)
+
+        Returns:
+            ``pyarrow.Table`` with one column per selected field
+        """
+        pa = _pyarrow()
+        np = _numpy()
+        tick_sizes = tick_sizes or {}
+        names = self._select(columns)
+        arrays = []
+        for name in names:
+            column = self.column(name)
+            if isinstance(column, array):
+                arrays.append(pa.array(np.frombuffer(column, dtype=np.float64 if column.typecode == "d" else np.int64)))
+            elif name in self.decimal_fields and name in tick_sizes:
+                arrays.append(pa.array(_parse_ticks(np, column, tick_sizes[name], name)))
+            elif name in self.decimal_fields:
+                arrays.append(pa.array(column).cast(pa.float64()))
+            elif name in self.integer_fields:
+                arrays.append(pa.array(column).cast(pa.int64()))
+            else:
+                arrays.append(pa.array(column))
+        return pa.Table.from_arrays(arrays, names=names)
+
+
+class FillColumns(RecordColumns):
+    """Struct-of-arrays fills."""
+    row_type = SlottedFill
+    decimal_fields = (
+        "price", "size", "closed_pnl", "start_size", "start_price", "fee", "broker_fee", "notional_value",
+    )
+    integer_fields = ("block_timestamp",)
+
+
+class TradeColumns(RecordColumns):
+    """Struct-of-arrays trades."""
+    row_type = SlottedTrade
+    decimal_fields = ("price", "size")
+    integer_fields = ("timestamp",)
+
+
+class OrderHistoryColumns(RecordColumns):
+    """Struct-of-arrays order history entries."""
+    row_type = SlottedOrderHistoryEntry
+    decimal_fields = ("price", "size", "filled", "unfilled")
+    integer_fields = ("created_at", "timestamp")
+
+
+class ChartColumns(RecordColumns):
+    """Struct-of-arrays chart candles."""
+    row_type = SlottedChartPoint
+
+
+class LevelColumns(RecordColumns):
+    """Struct-of-arrays orderbook levels."""
+    row_type = SlottedOrderbookLevel
+    decimal_fields = ("price", "size")
+
+
+_PAGINATION_FIELDS = ("page", "limit", "total_count", "total_pages", "has_next", "has_prev")
+
+
+def _records_and_meta(payload: Any, keys: Sequence[str]) -> Tuple[List[Any], Dict[str, Any]]:
+    if isinstance(payload, (list, RecordColumns)):
+        return payload, {}
+    if is_dataclass(payload):
+        payload = {f.name: getattr(payload, f.name) for f in fields(payload)}
+    for key in keys:
+        if isinstance(payload.get(key), (list, RecordColumns)):
+            return payload[key], {k: payload.get(k) for k in _PAGINATION_FIELDS}
+    return [], {k: payload.get(k) for k in _PAGINATION_FIELDS}
+
+
+def compact_fills(payload: Any) -> FillsResponse:
+    """
+    Build a FillsResponse whose ``entries`` are a FillColumns container.
+
+    Args:
+        payload: Raw ``fills`` response (list, or dict with "data"/"entries"),
+            or a FillsResponse
+
+    Returns:
+        FillsResponse with columnar entries and the original pagination fields
+    """
+    records, meta = _records_and_meta(payload, ("entries", "data"))
+    return FillsResponse(entries=FillColumns(records), **meta)
+
+
+def compact_order_history(payload: Any) -> OrderHistoryResponse:
+    """
+    Build an OrderHistoryResponse whose ``orders`` are an OrderHistoryColumns container.
+
+    Args:
+        payload: Raw ``order_history`` response (list, or dict with
+            "orders"/"data"), or an OrderHistoryResponse
+
+    Returns:
+        OrderHistoryResponse with columnar orders and the original pagination fields
+    """
+    records, meta = _records_and_meta(payload, ("orders", "data"))
+    return OrderHistoryResponse(orders=OrderHistoryColumns(records), **meta)
+
+
+def compact_trades(payload: Any) -> TradeColumns:
+    """
+    Build a TradeColumns container from a ``trades`` response.
+
+    Args:
+        payload: List of trades (dicts or Trade instances), or a dict with "data"
+
+    Returns:
+        Columnar trades
+    """
+    records, _ = _records_and_meta(payload, ("data", "trades"))
+    return TradeColumns(records)
+
+
+def compact_chart(payload: Any) -> ChartColumns:
+    """
+    Build a ChartColumns container from a ``chart`` response.
+
+    Args:
+        payload: List of candles (dicts or ChartPoint instances), or a dict with "data"
+
+    Returns:
+        Columnar candles
+    """
+    records, _ = _records_and_meta(payload, ("data", "chart"))
+    return ChartColumns(records)
+
+
+def compact_orderbook(payload: Any) -> OrderbookResponse:
+    """
+    Build an OrderbookResponse whose ``bids`` and ``asks`` are LevelColumns.
+
+    Args:
+        payload: Raw ``orderbook`` response (optionally wrapped in "data"),
+            or an OrderbookResponse
+
+    Returns:
+        OrderbookResponse with columnar levels
+    """
+    if is_dataclass(payload):
+        payload = {f.name: getattr(payload, f.name) for f in fields(payload)}
+    if "bids" not in payload and isinstance(payload.get("data"), dict):
+        payload = payload["data"]
+    return OrderbookResponse(
+        bids=LevelColumns(payload.get("bids") or []),
+        asks=LevelColumns(payload.get("asks") or []),
+        instrument_name=payload.get("instrument_name"),
+        timestamp=payload.get("timestamp"),
+        sequence_number=payload.get("sequence_number"),
+    )
+
+
+__all__ = [
+    "slotted",
+    "SlottedUnitOrder",
+    "SlottedOrderbookLevel",
+    "SlottedOrderbookItem",
+    "SlottedTrade",
+    "SlottedFill",
+    "SlottedOpenOrder",
+    "SlottedOrderHistoryEntry",
+    "SlottedChartPoint",
+    "RecordColumns",
+    "FillColumns",
+    "TradeColumns",
+    "OrderHistoryColumns",
+    "ChartColumns",
+    "LevelColumns",
+    "compact_fills",
+    "compact_order_history",
+    "compact_trades",
+    "compact_chart",
+    "compact_orderbook",
+]
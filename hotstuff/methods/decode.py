@@ -0,0 +1,244 @@
+"""Typed decoding of raw info responses into the method dataclasses.
+
+Each response type gets a decoder generated once and cached. Decoders
+write the instance ``__dict__`` directly, skipping ``__init__``, ignore
+unknown keys and leave missing fields at their default (or None).
+Fields holding lists of nested models stay raw until first read, so
+reading a scalar field never pays for the nested levels.
+"""
+import threading
+import typing
+from dataclasses import MISSING, fields, is_dataclass
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+from hotstuff.methods.info import account as AM
+from hotstuff.methods.info import explorer as EM
+from hotstuff.methods.info import market as GM
+from hotstuff.methods.info import vault as VM
+
+Decoder = Callable[[Any], Any]
+
+# InfoClient method name -> response type. Endpoints returning a list are
+# decoded element by element.
+RESPONSE_TYPES: Dict[str, Type] = {
+    "oracle": GM.OracleResponse,
+    "supported_collateral": GM.SupportedCollateral,
+    "instruments": GM.InstrumentsResponse,
+    "ticker": GM.Ticker,
+    "orderbook": GM.OrderbookResponse,
+    "trades": GM.Trade,
+    "mids": GM.Mid,
+    "bbo": GM.BBO,
+    "chart": GM.ChartPoint,
+    "open_orders": AM.OpenOrdersResponse,
+    "positions": AM.Position,
+    "account_summary": AM.AccountSummaryResponse,
+    "referral_summary": AM.ReferralSummaryResponse,
+    "user_fee_info": AM.UserFeeInfoResponse,
+    "account_history": AM.AccountHistory,
+    "order_history": AM.OrderHistoryResponse,
+    "fills": AM.FillsResponse,
+    "funding_history": AM.FundingHistoryResponse,
+    "transfer_history": AM.TransferHistory,
+    "instrument_leverage": AM.InstrumentLeverageResponse,
+    "account_info": AM.AccountInfoResponse,
+    "brokers_check": AM.BrokersCheckResponse,
+    "vaults": VM.VaultsResponse,
+    "sub_vaults": VM.SubVault,
+    "vault_balances": VM.VaultBalance,
+    "block_details": EM.BlockDetailsResponse,
+    "transaction_details": EM.TransactionDetailsResponse,
+}
+
+# Server keys that carry a field under another name.
+FIELD_ALIASES: Dict[Type, Dict[str, str]] = {
+    AM.FillsResponse: {"entries": "data"},
+    AM.FundingHistoryResponse: {"entries": "data"},
+    AM.OpenOrdersResponse: {"orders": "data"},
+    AM.OrderHistoryResponse: {"orders": "data"},
+}
+
+_decoders: Dict[Type, Decoder] = {}
+_lock = threading.RLock()
+
+
+def _unwrap_optional(tp: Any) -> Any:
+    args = [a for a in getattr(tp, "__args__", ()) if a is not type(None)]
+    if getattr(tp, "__origin__", None) is Union and len(args) == 1:
+        return args[0]
+    return tp
+
+
+def _list_item_type(tp: Any) -> Optional[Type]:
+    tp = _unwrap_optional(tp)
+    if getattr(tp, "__origin__", None) in (list, List):
+        args = getattr(tp, "__args__", ())
+        if args and is_dataclass(args[0]):
+            return args[0]
+    return None
+
+
+class _LazyList:
+    """Non-data descriptor decoding a raw nested list on first read."""
+
+    def __init__(self, name: str, item_type: Type, default: Callable[[], Any]):
+        self.name = name
+        self.raw_name = f"_raw_{name}"
+        self.item_type = item_type
+        self.default = default
+
+    def __get__(self, obj: Any, owner: Type) -> Any:
+        if obj is None:
+            return self
+        raw = obj.__dict__.pop(self.raw_name, None)
+        if isinstance(raw, list):
+            decode = decoder_for(self.item_type)
+            value = [decode(item) for item in raw]
+        elif raw is None:
+            value = self.default()
+        else:
+            value = raw
+        # Cached in the instance dict, which shadows this descriptor from now on.
+        obj.__dict__[self.name] = value
+        return value
+
+
+def _lazy_subclass(cls: Type, lazy: Dict[str, _LazyList]) -> Type:
+    namespace = dict(lazy)
+    namespace["__qualname__"] = cls.__qualname__
+    namespace["__module__"] = cls.__module__
+    namespace["__doc__"] = cls.__doc__
+    return type(cls.__name__, (cls,), namespace)
+
+
+def _build_decoder(cls: Type) -> Decoder:
+    hints = typing.get_type_hints(cls)
+    aliases = FIELD_ALIASES.get(cls, {})
+    names = [f.name for f in fields(cls)]
+    env: Dict[str, Any] = {"_new": object.__new__, "_dict": dict, "_names": tuple(names)}
+    lazy: Dict[str, _LazyList] = {}
+    items = []
+
+    for i, f in enumerate(fields(cls)):
+        key = repr(f.name)
+        alias = aliases.get(f.name)
+        # ``sentinel`` tells a missing key from an explicit null where a
+        # non-None default must be applied; ``optional`` maps both to None.
+        if alias is not None:
+            sentinel = f"(d[{key}] if {key} in d else d.get({alias!r}, _m))"
+            optional = f"(d[{key}] if {key} in d else d.get({alias!r}))"
+        else:
+            sentinel = f"d.get({key}, _m)"
+            optional = f"d.get({key})"
+
+        if f.default is not MISSING:
+            env[f"_dflt{i}"] = f.default
+            default_expr = f"_dflt{i}"
+            default_factory = lambda value=f.default: value
+        elif f.default_factory is not MISSING:
+            env[f"_fact{i}"] = f.default_factory
+            default_expr = f"_fact{i}()"
+            default_factory = f.default_factory
+        else:
+            default_expr = "None"
+            default_factory = lambda: None
+
+        item_type = _list_item_type(hints.get(f.name))
+        nested = _unwrap_optional(hints.get(f.name))
+        if item_type is not None:
+            lazy[f.name] = _LazyList(f.name, item_type, default_factory)
+            items.append(f"{lazy[f.name].raw_name!r}: {optional}")
+        elif is_dataclass(nested):
+            env[f"_dec{i}"] = nested
+            items.append(
+                f"{key}: (_decoder_for(_dec{i})(v) if (v := {optional}) is not None "
+                f"else {default_expr})"
+            )
+        elif default_expr == "None" or (f.default is None):
+            items.append(f"{key}: {optional}")
+        else:
+            items.append(f"{key}: (v if (v := {sentinel}) is not _m else {default_expr})")
+
+    target = _lazy_subclass(cls, lazy) if lazy else cls
+    env.update({"_cls": target, "_m": MISSING, "_decoder_for": decoder_for})
+    body = ",\n        ".join(items)
+    source = (
+        "def decode(d):\n"
+        "    if d.__class__ is not _dict:\n"
+        "        if isinstance(d, (list, tuple)):\n"
+        "            d = _dict(zip(_names, d))\n"
+        "        else:\n"
+        "            return d\n"
+        "    o = _new(_cls)\n"
+        f"    o.__dict__ = {{\n        {body}\n    }}\n"
+        "    return o\n"
+    )
+    exec(source, env)
+    return env["decode"]
+
+
+def decoder_for(cls: Type) -> Decoder:
+    """
+    Return the cached decoder for a response dataclass.
+
+    The decoder accepts a dict (or a positional list such as a
+    ``[price, size]`` level) and returns an instance of ``cls`` (a lazy
+    subclass of it when ``cls`` has nested list fields). Other values are
+    returned unchanged.
+
+    Args:
+        cls: Response dataclass
+
+    Returns:
+        Decoder function
+    """
+    decoder = _decoders.get(cls)
+    if decoder is None:
+        with _lock:
+            decoder = _decoders.get(cls)
+            if decoder is None:
+                decoder = _decoders[cls] = _build_decoder(cls)
+    return decoder
+
+
+def decode(cls: Type, payload: Any) -> Any:
+    """
+    Decode a raw payload into ``cls``.
+
+    A top-level ``data`` wrapper is stripped unless ``cls`` has a field (or
+    alias) by that name. Lists are decoded element by element.
+
+    Args:
+        cls: Response dataclass
+        payload: Raw JSON payload
+
+    Returns:
+        Instance of ``cls``, a list of instances, or the payload unchanged
+        when it is neither a dict nor a list
+    """
+    if isinstance(payload, dict) and "data" in payload:
+        takes_data = "data" in cls.__dataclass_fields__ or "data" in FIELD_ALIASES.get(cls, {}).values()
+        if not takes_data and isinstance(payload["data"], (dict, list)):
+            payload = payload["data"]
+    decoder = decoder_for(cls)
+    if isinstance(payload, list):
+        return [decoder(item) for item in payload]
+    return decoder(payload)
+
+
+def decode_response(method: str, payload: Any) -> Any:
+    """
+    Decode an InfoClient response by method name.
+
+    Args:
+        method: InfoClient method name (e.g. "orderbook")
+        payload: Raw JSON payload
+
+    Returns:
+        The typed response, or the payload unchanged for methods without a
+        response type
+    """
+    cls = RESPONSE_TYPES.get(method)
+    if cls is None:
+        return payload
+    return decode(cls, payload)
@@ -3,7 +3,7 @@ from hotstuff.methods.exchange import trading as TradingExchangeMethods
 from hotstuff.methods.exchange import account as AccountExchangeMethods
 from hotstuff.methods.exchange import collateral as CollateralExchangeMethods
 from hotstuff.methods.exchange import vault as VaultExchangeMethods
-from hotstuff.methods.exchange.op_codes import EXCHANGE_OP_CODES
+from hotstuff.methods.exchange.op_codes import EXCHANGE_OP_CODES, EXCHANGE_OP_NAMES
 
 __all__ = [
     "TradingExchangeMethods",
@@ -11,4 +11,5 @@ __all__ = [
     "CollateralExchangeMethods",
     "VaultExchangeMethods",
     "EXCHANGE_OP_CODES",
+    "EXCHANGE_OP_NAMES",
 ]
@@ -27,3 +27,6 @@ EXCHANGE_OP_CODES = {
     "depositToVault": 1401,
     "redeemFromVault": 1402,
 }
+
+# Reverse lookup: tx_type -> action name
+EXCHANGE_OP_NAMES = {code: name for name, code in EXCHANGE_OP_CODES.items()}
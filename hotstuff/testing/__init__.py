@@ -0,0 +1,14 @@
+"""Offline stand-in for the Hotstuff API, for tests and benchmarks."""
+from hotstuff.testing.faults import FaultInjection
+from hotstuff.testing.market import MARKET_CHANNELS, MarketDataGenerator
+from hotstuff.testing.server import MockAction, MockError, MockServer, MockServerStats
+
+__all__ = [
+    "FaultInjection",
+    "MARKET_CHANNELS",
+    "MarketDataGenerator",
+    "MockAction",
+    "MockError",
+    "MockServer",
+    "MockServerStats",
+]
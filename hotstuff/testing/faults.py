@@ -0,0 +1,58 @@
+"""Latency, jitter and error injection for the mock server."""
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import FrozenSet, Optional, Tuple
+
+
+@dataclass
+class FaultInjection:
+    """
+    What the mock server does to each request before answering it.
+
+    Every request waits ``latency`` seconds, plus or minus up to ``jitter``
+    seconds. After that, a ``rate_limit_rate`` fraction of requests is
+    answered with 429 and an ``error_rate`` fraction with ``error_status``.
+    Pass a ``seed`` to get a reproducible sequence.
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    rate_limit_rate: float = 0.0
+    retry_after: Optional[int] = 1
+    endpoints: Optional[FrozenSet[str]] = None
+    seed: Optional[int] = None
+    _rng: random.Random = field(init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    def applies_to(self, endpoint: str) -> bool:
+        """Whether faults are injected into ``endpoint`` requests."""
+        return self.endpoints is None or endpoint in self.endpoints
+
+    def sample(self, endpoint: str) -> Tuple[float, Optional[int]]:
+        """
+        Draw the fate of one request.
+
+        Args:
+            endpoint: 'info', 'exchange' or 'explorer'
+
+        Returns:
+            (delay in seconds, HTTP status to fail with or None)
+        """
+        if not self.applies_to(endpoint):
+            return 0.0, None
+        with self._lock:
+            delay = self.latency
+            if self.jitter:
+                delay += self._rng.uniform(-self.jitter, self.jitter)
+            roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            return max(0.0, delay), 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return max(0.0, delay), self.error_status
+        return max(0.0, delay), None
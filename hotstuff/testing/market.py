@@ -0,0 +1,158 @@
+"""Synthetic market data for the mock server."""
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+# Channels the mock server streams on its own; others only carry data
+# pushed with ``MockServer.publish``.
+MARKET_CHANNELS = ("ticker", "mids", "bbo", "orderbook", "trades")
+
+_DEFAULT_PRICES = {"BTC-PERP": 100_000.0, "ETH-PERP": 4_000.0, "SOL-PERP": 200.0}
+
+
+class MarketDataGenerator:
+    """
+    Random-walk prices and books shaped like the info/subscription responses.
+
+    With a ``seed`` the sequence of snapshots is reproducible, which keeps
+    benchmark runs comparable.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str] = ("BTC-PERP", "ETH-PERP"),
+        rate: float = 10.0,
+        depth: int = 10,
+        volatility: float = 1e-4,
+        seed: Optional[int] = None,
+        prices: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            symbols: Instruments to quote
+            rate: Notifications per second per subscribed market channel
+                (0 streams nothing)
+            depth: Levels per book side
+            volatility: Standard deviation of each mid-price step, relative
+            seed: Seed for a reproducible stream
+            prices: Starting mid prices (defaults for well-known symbols, else 100)
+        """
+        self.symbols = list(symbols)
+        self.rate = rate
+        self.depth = depth
+        self.volatility = volatility
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        prices = prices or {}
+        self._mids = {s: float(prices.get(s, _DEFAULT_PRICES.get(s, 100.0))) for s in self.symbols}
+        self._sequence = 0
+        self._trade_id = 0
+
+    def _mid(self, symbol: str) -> float:
+        if symbol not in self._mids:
+            self._mids[symbol] = _DEFAULT_PRICES.get(symbol, 100.0)
+        return self._mids[symbol]
+
+    def step(self, symbol: str) -> float:
+        """Advance ``symbol``'s mid price one random-walk step and return it."""
+        with self._lock:
+            mid = self._mid(symbol) * (1.0 + self._rng.gauss(0.0, self.volatility))
+            self._mids[symbol] = mid
+            return mid
+
+    def _spread(self, mid: float) -> float:
+        return max(mid * 1e-5, 0.01)
+
+    def bbo(self, symbol: str) -> Dict[str, Any]:
+        """Best bid/offer."""
+        with self._lock:
+            mid = self._mid(symbol)
+            bid_size, ask_size = self._rng.uniform(0.1, 5.0), self._rng.uniform(0.1, 5.0)
+        half = self._spread(mid) / 2
+        return {
+            "symbol": symbol,
+            "best_bid_price": f"{mid - half:.2f}",
+            "best_ask_price": f"{mid + half:.2f}",
+            "best_bid_size": f"{bid_size:.4f}",
+            "best_ask_size": f"{ask_size:.4f}",
+            "timestamp": int(time.time() * 1000),
+        }
+
+    def mids(self, symbol: str) -> Dict[str, Any]:
+        """Mid price."""
+        with self._lock:
+            mid = self._mid(symbol)
+        return {"symbol": symbol, "mid_price": f"{mid:.2f}", "timestamp": int(time.time() * 1000)}
+
+    def ticker(self, symbol: str) -> Dict[str, Any]:
+        """Ticker summary."""
+        bbo = self.bbo(symbol)
+        mid = (float(bbo["best_bid_price"]) + float(bbo["best_ask_price"])) / 2
+        return {
+            **bbo,
+            "type": "perp",
+            "mark_price": f"{mid:.2f}",
+            "mid_price": f"{mid:.2f}",
+            "index_price": f"{mid:.2f}",
+            "last_price": f"{mid:.2f}",
+            "volume_24h": "1000000",
+            "change_24h": "0",
+            "funding_rate": "0.0001",
+            "open_interest": "5000",
+            "last_updated": bbo["timestamp"],
+        }
+
+    def orderbook(self, symbol: str, depth: Optional[int] = None) -> Dict[str, Any]:
+        """Book snapshot with ``depth`` levels a side."""
+        depth = depth or self.depth
+        with self._lock:
+            mid = self._mid(symbol)
+            sizes = [self._rng.uniform(0.1, 5.0) for _ in range(2 * depth)]
+            self._sequence += 1
+            sequence = self._sequence
+        tick = self._spread(mid)
+        return {
+            "instrument_name": symbol,
+            "bids": [{"price": f"{mid - tick * (i + 0.5):.2f}", "size": f"{sizes[i]:.4f}"} for i in range(depth)],
+            "asks": [
+                {"price": f"{mid + tick * (i + 0.5):.2f}", "size": f"{sizes[depth + i]:.4f}"} for i in range(depth)
+            ],
+            "timestamp": int(time.time() * 1000),
+            "sequence_number": sequence,
+        }
+
+    def trades(self, symbol: str, limit: int = 1) -> List[Dict[str, Any]]:
+        """The ``limit`` most recent synthetic trades."""
+        result = []
+        with self._lock:
+            mid = self._mid(symbol)
+            for _ in range(limit):
+                self._trade_id += 1
+                result.append({
+                    "instrument": symbol,
+                    "trade_id": self._trade_id,
+                    "side": self._rng.choice(("b", "s")),
+                    "price": f"{mid:.2f}",
+                    "size": f"{self._rng.uniform(0.01, 2.0):.4f}",
+                    "timestamp": int(time.time() * 1000),
+                })
+        return result
+
+    def channel_data(self, channel: str, symbol: str) -> Any:
+        """
+        Next notification payload for a market channel, stepping the price.
+
+        Args:
+            channel: One of ``MARKET_CHANNELS``
+            symbol: Instrument symbol
+
+        Returns:
+            Data for the notification's ``params.data``
+        """
+        self.step(symbol)
+        if channel == "trades":
+            return self.trades(symbol)
+        return getattr(self, channel)(symbol)
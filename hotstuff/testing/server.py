@@ -0,0 +1,411 @@
+"""Local stand-in for the Hotstuff HTTP API and WebSocket feed."""
+import json
+import logging
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from hotstuff.methods.exchange.op_codes import EXCHANGE_OP_CODES
+from hotstuff.testing.faults import FaultInjection
+from hotstuff.testing.market import MARKET_CHANNELS, MarketDataGenerator
+from hotstuff.testing.websocket import MockWebSocketServer, WebSocketConnection
+from hotstuff.types import HttpTransportOptions, WebSocketTransportOptions
+from hotstuff.utils.signing import recover_signer
+
+logger = logging.getLogger(__name__)
+
+_ACTION_NAMES = {code: name for name, code in EXCHANGE_OP_CODES.items()}
+
+
+class MockError(Exception):
+    """Raised by handlers to answer with an error status and message."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class MockAction:
+    """An exchange action the mock server accepted."""
+    action: str
+    signer: str
+    nonce: Any
+    data: Dict[str, Any]
+    received_at: float
+
+
+@dataclass
+class MockServerStats:
+    """Counters of what the mock server saw and did."""
+    requests: Dict[str, int] = field(default_factory=dict)
+    rate_limited: int = 0
+    errors: int = 0
+    rejected: int = 0
+    notifications: int = 0
+
+
+class _HttpHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "ThreadingHTTPServer"
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this, delayed
+        # ACKs add ~40 ms to every loopback round trip.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _reply(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        # Warm-up and health probes hit the base URL.
+        self._reply(200, {"status": "ok"})
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        endpoint = self.path.strip("/").split("?", 1)[0].rsplit("/", 1)[-1]
+        try:
+            payload = json.loads(raw) if raw else None
+        except ValueError:
+            self._reply(400, {"type": "error", "message": "invalid JSON"})
+            return
+        status, body = self.server.app.handle(endpoint, payload)
+        headers = None
+        if status == 429 and self.server.app.faults.retry_after is not None:
+            headers = {"Retry-After": str(self.server.app.faults.retry_after)}
+        self._reply(status, body, headers)
+
+    def log_message(self, *args):
+        pass
+
+
+class MockServer:
+    """
+    Offline Hotstuff API: ``info``/``exchange``/``explorer`` over HTTP and
+    JSON-RPC (``subscribe``, ``unsubscribe``, ``ping``, ``post``) over
+    WebSocket, both started on construction.
+
+    Exchange actions are verified with the real EIP-712 signing scheme and
+    recorded in ``actions``. Info methods for market data are answered from
+    a ``MarketDataGenerator``, which also streams notifications to market
+    channel subscribers at its ``rate``; anything else can be canned with
+    ``set_response`` or pushed with ``publish``.
+
+    Example::
+
+        with MockServer(faults=FaultInjection(latency=0.001, jitter=0.0005)) as mock:
+            info = InfoClient()
+            info.transport = HttpTransport(mock.http_options())
+    """
+
+    def __init__(
+        self,
+        faults: Optional[FaultInjection] = None,
+        market: Optional[MarketDataGenerator] = None,
+        accounts: Optional[Set[str]] = None,
+        is_testnet: bool = False,
+        host: str = "127.0.0.1",
+        http_port: int = 0,
+        ws_port: int = 0
+    ):
+        """
+        Start the HTTP and WebSocket servers on background threads.
+
+        Args:
+            faults: Latency/error injection (none by default)
+            market: Synthetic market data source
+            accounts: Signer addresses allowed to trade; None accepts any
+                valid signature
+            is_testnet: Verify signatures for the testnet domain
+            host: Interface to bind
+            http_port: HTTP port (0 picks a free one)
+            ws_port: WebSocket port (0 picks a free one)
+        """
+        self.faults = faults or FaultInjection()
+        self.market = market or MarketDataGenerator()
+        self.accounts = {a.lower() for a in accounts} if accounts is not None else None
+        self.is_testnet = is_testnet
+        self.actions: List[MockAction] = []
+        self._stats = MockServerStats()
+        self._lock = threading.Lock()
+        self._nonces: Set[Tuple[str, Any]] = set()
+        self._responses: Dict[Tuple[str, str], Any] = {}
+        self._connections: Set[WebSocketConnection] = set()
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="hotstuff-mock")
+        self._stop = threading.Event()
+
+        self._http = ThreadingHTTPServer((host, http_port), _HttpHandler)
+        self._http.daemon_threads = True
+        self._http.app = self
+        self._ws = MockWebSocketServer((host, ws_port), self)
+        self._threads = [
+            threading.Thread(target=self._http.serve_forever, name="hotstuff-mock-http", daemon=True),
+            threading.Thread(target=self._ws.serve_forever, name="hotstuff-mock-ws", daemon=True),
+            threading.Thread(target=self._feed, name="hotstuff-mock-feed", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # Addresses
+
+    @property
+    def http_url(self) -> str:
+        host, port = self._http.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def ws_url(self) -> str:
+        host, port = self._ws.server_address[:2]
+        return f"ws://{host}:{port}/ws/"
+
+    def http_options(self, **kwargs: Any) -> HttpTransportOptions:
+        """HttpTransportOptions pointing both networks' api/rpc at this server."""
+        urls = {"api": self.http_url, "rpc": self.http_url}
+        return HttpTransportOptions(server={"mainnet": urls, "testnet": urls}, is_testnet=self.is_testnet, **kwargs)
+
+    def ws_options(self, **kwargs: Any) -> WebSocketTransportOptions:
+        """WebSocketTransportOptions pointing both networks at this server."""
+        kwargs.setdefault("keep_alive", {"interval": None, "timeout": None})
+        return WebSocketTransportOptions(
+            server={"mainnet": self.ws_url, "testnet": self.ws_url}, is_testnet=self.is_testnet, **kwargs
+        )
+
+    # Behaviour
+
+    def set_response(self, method: str, response: Any, endpoint: str = "info"):
+        """
+        Answer ``method`` with a fixed value, or a callable of the request params.
+
+        Args:
+            method: Info/explorer method name
+            response: Response body, or ``fn(params) -> body``
+            endpoint: 'info' or 'explorer'
+        """
+        self._responses[(endpoint, method)] = response
+
+    def publish(self, channel: str, data: Any) -> int:
+        """
+        Notify every connection subscribed to the server channel ``channel``.
+
+        Returns:
+            Number of connections notified
+        """
+        message = {"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}}
+        targets = [c for c in list(self._connections) if channel in c.subscriptions]
+        for connection in targets:
+            connection.send_json(message)
+        with self._lock:
+            self._stats.notifications += len(targets)
+        return len(targets)
+
+    def stats(self) -> MockServerStats:
+        """Snapshot of the request and notification counters."""
+        with self._lock:
+            return MockServerStats(
+                requests=dict(self._stats.requests),
+                rate_limited=self._stats.rate_limited,
+                errors=self._stats.errors,
+                rejected=self._stats.rejected,
+                notifications=self._stats.notifications,
+            )
+
+    # Request handling
+
+    def handle(self, endpoint: str, payload: Any) -> Tuple[int, Any]:
+        """
+        Answer one request, after injected latency and faults.
+
+        Args:
+            endpoint: 'info', 'exchange' or 'explorer'
+            payload: Decoded request body
+
+        Returns:
+            (HTTP status, response body)
+        """
+        with self._lock:
+            self._stats.requests[endpoint] = self._stats.requests.get(endpoint, 0) + 1
+        delay, status = self.faults.sample(endpoint)
+        if delay:
+            time.sleep(delay)
+        if status == 429:
+            with self._lock:
+                self._stats.rate_limited += 1
+            return 429, {"type": "error", "message": "Rate limit exceeded"}
+        if status is not None:
+            with self._lock:
+                self._stats.errors += 1
+            return status, {"type": "error", "message": "Injected error"}
+        try:
+            if endpoint == "exchange":
+                return 200, self._exchange(payload)
+            if endpoint in ("info", "explorer"):
+                return 200, self._query(endpoint, payload)
+            raise MockError(f"Unknown endpoint: {endpoint}", status=404)
+        except MockError as e:
+            with self._lock:
+                self._stats.rejected += 1
+            return e.status, {"type": "error", "message": str(e)}
+
+    def _query(self, endpoint: str, payload: Any) -> Any:
+        if not isinstance(payload, dict) or "method" not in payload:
+            raise MockError("Missing method")
+        method = payload["method"]
+        params = payload.get("params") or {}
+        if (endpoint, method) in self._responses:
+            canned = self._responses[(endpoint, method)]
+            return canned(params) if callable(canned) else canned
+        if endpoint == "info":
+            symbol = params.get("symbol") or (self.market.symbols[0] if self.market.symbols else "BTC-PERP")
+            if method in ("ticker", "bbo", "mids"):
+                return [getattr(self.market, method)(symbol)]
+            if method == "orderbook":
+                return self.market.orderbook(symbol, params.get("depth"))
+            if method == "trades":
+                return self.market.trades(symbol, params.get("limit") or 10)
+            if method == "instruments":
+                return {
+                    "perps": [
+                        {"id": i + 1, "name": s, "price_index": s.split("-")[0], "lot_size": 0.0001,
+                         "tick_size": 0.01, "max_leverage": 50, "delisted": False}
+                        for i, s in enumerate(self.market.symbols)
+                    ],
+                    "spot": [],
+                }
+        raise MockError(f"Unsupported {endpoint} method: {method}")
+
+    def _exchange(self, payload: Any) -> Dict[str, Any]:
+        try:
+            action = payload["action"]
+            code = int(action["type"])
+            data = action["data"]
+            signature = payload["signature"]
+        except (KeyError, TypeError, ValueError):
+            raise MockError("Malformed action")
+        name = _ACTION_NAMES.get(code)
+        if name is None:
+            raise MockError(f"Unknown action type: {code}")
+        try:
+            signer = recover_signer(data, signature, code, self.is_testnet)
+        except Exception:
+            raise MockError("Invalid signature", status=401)
+        if self.accounts is not None and signer.lower() not in self.accounts:
+            raise MockError(f"Unknown signer {signer}", status=401)
+        nonce = payload.get("nonce", data.get("nonce"))
+        with self._lock:
+            if (signer, nonce) in self._nonces:
+                raise MockError("Nonce already used")
+            self._nonces.add((signer, nonce))
+            self.actions.append(MockAction(action=name, signer=signer, nonce=nonce, data=data, received_at=time.time()))
+        return {"status": "ok", "action": name, "signer": signer, "nonce": nonce}
+
+    # WebSocket
+
+    def _add_connection(self, connection: WebSocketConnection):
+        with self._lock:
+            self._connections.add(connection)
+
+    def _remove_connection(self, connection: WebSocketConnection):
+        with self._lock:
+            self._connections.discard(connection)
+
+    def _handle_rpc(self, connection: WebSocketConnection, request: Any):
+        if not isinstance(request, dict):
+            return
+        msg_id = request.get("id")
+        method = request.get("method")
+        params = request.get("params")
+
+        def _result(result: Any):
+            connection.send_json({"jsonrpc": "2.0", "id": msg_id, "result": result})
+
+        def _error(code: int, message: str):
+            connection.send_json({"jsonrpc": "2.0", "id": msg_id, "error": {"code": code, "message": message}})
+
+        if method == "ping":
+            _result({"pong": True})
+        elif method == "subscribe":
+            if not isinstance(params, dict) or not params.get("channel"):
+                _error(-32602, "Missing channel")
+                return
+            base = params["channel"]
+            key = params.get("symbol") or params.get("instrumentId") or params.get("instrument_id") or params.get("user")
+            channel = f"{base}@{key}" if key else base
+            connection.subscriptions[channel] = (base, key)
+            _result({"status": "subscribed", "channels": [channel]})
+        elif method == "unsubscribe":
+            channels = [c for c in (params or []) if connection.subscriptions.pop(c, None) is not None]
+            _result({"status": "unsubscribed", "channels": channels})
+        elif method == "post":
+            if not isinstance(params, dict):
+                _error(-32602, "Missing params")
+                return
+            endpoint = "exchange" if params.get("type") == "action" else params.get("type")
+
+            def _post():
+                status, body = self.handle(endpoint, params.get("payload"))
+                if status == 200:
+                    _result({"data": body})
+                else:
+                    _error(status, body.get("message", "error") if isinstance(body, dict) else str(body))
+
+            # Answer off the read loop so injected latency does not serialize requests.
+            self._executor.submit(_post)
+        else:
+            _error(-32601, f"Method not found: {method}")
+
+    def _feed(self):
+        """Stream synthetic market data to market channel subscribers at ``market.rate``."""
+        next_at = time.monotonic()
+        while not self._stop.is_set():
+            rate = self.market.rate
+            if not rate:
+                self._stop.wait(0.05)
+                next_at = time.monotonic()
+                continue
+            channels = {}
+            for connection in list(self._connections):
+                for channel, (base, symbol) in list(connection.subscriptions.items()):
+                    if base in MARKET_CHANNELS and symbol:
+                        channels[channel] = (base, symbol)
+            for channel, (base, symbol) in channels.items():
+                self.publish(channel, self.market.channel_data(base, symbol))
+            next_at += 1.0 / rate
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)
+            elif delay < -1.0:
+                # Fell far behind (e.g. a paused process): do not burst to catch up.
+                next_at = time.monotonic()
+
+    # Lifecycle
+
+    def close(self):
+        """Stop both servers and the feed, closing open WebSocket connections."""
+        self._stop.set()
+        for connection in list(self._connections):
+            connection.close()
+        self._http.shutdown()
+        self._ws.shutdown()
+        self._http.server_close()
+        self._ws.server_close()
+        self._executor.shutdown(wait=False)
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,184 @@
+"""Minimal RFC 6455 WebSocket server speaking the Hotstuff JSON-RPC protocol."""
+import base64
+import hashlib
+import json
+import logging
+import socket
+import socketserver
+import struct
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from hotstuff.testing.server import MockServer
+
+logger = logging.getLogger(__name__)
+
+_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+def accept_key(key: str) -> str:
+    """``Sec-WebSocket-Accept`` value for a client's ``Sec-WebSocket-Key``."""
+    return base64.b64encode(hashlib.sha1((key + _GUID).encode()).digest()).decode()
+
+
+def encode_frame(opcode: int, payload: bytes) -> bytes:
+    """A single unmasked, final server frame."""
+    n = len(payload)
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 65536:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return header + payload
+
+
+def _read_exact(rfile, n: int) -> bytes:
+    data = rfile.read(n)
+    if len(data) < n:
+        raise EOFError("connection closed")
+    return data
+
+
+def read_frame(rfile) -> Tuple[bool, int, bytes]:
+    """
+    Read one frame, unmasking client payloads.
+
+    Returns:
+        (fin, opcode, payload)
+
+    Raises:
+        EOFError: If the peer closed the connection
+    """
+    b0, b1 = _read_exact(rfile, 2)
+    n = b1 & 0x7F
+    if n == 126:
+        n = struct.unpack("!H", _read_exact(rfile, 2))[0]
+    elif n == 127:
+        n = struct.unpack("!Q", _read_exact(rfile, 8))[0]
+    mask = _read_exact(rfile, 4) if b1 & 0x80 else None
+    payload = _read_exact(rfile, n) if n else b""
+    if mask is not None and n:
+        key = (mask * (n // 4 + 1))[:n]
+        payload = (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(n, "big")
+    return bool(b0 & 0x80), b0 & 0x0F, payload
+
+
+class WebSocketConnection:
+    """Server side of one client connection."""
+
+    def __init__(self, handler: "_WebSocketHandler"):
+        self._handler = handler
+        self._send_lock = threading.Lock()
+        # Server channel (e.g. "bbo@BTC-PERP") -> (base channel, symbol)
+        self.subscriptions: Dict[str, Tuple[str, Optional[str]]] = {}
+        self.closed = False
+
+    def send_frame(self, opcode: int, payload: bytes):
+        with self._send_lock:
+            if self.closed:
+                return
+            try:
+                self._handler.wfile.write(encode_frame(opcode, payload))
+            except OSError:
+                self.closed = True
+
+    def send_json(self, message: Any):
+        """Send one text frame holding ``message``."""
+        self.send_frame(OP_TEXT, json.dumps(message).encode())
+
+    def close(self):
+        """Send a close frame and shut the socket down."""
+        self.send_frame(OP_CLOSE, struct.pack("!H", 1000))
+        self.closed = True
+        try:
+            self._handler.request.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class _WebSocketHandler(socketserver.StreamRequestHandler):
+    server: "MockWebSocketServer"
+
+    def _handshake(self) -> bool:
+        request_line = self.rfile.readline()
+        if not request_line:
+            return False
+        headers = {}
+        while True:
+            line = self.rfile.readline().decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        key = headers.get("sec-websocket-key")
+        if headers.get("upgrade", "").lower() != "websocket" or not key:
+            self.wfile.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            return False
+        self.wfile.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+            ).encode()
+        )
+        return True
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        if not self._handshake():
+            return
+        connection = WebSocketConnection(self)
+        app = self.server.app
+        app._add_connection(connection)
+        fragments = []
+        try:
+            while not connection.closed:
+                fin, opcode, payload = read_frame(self.rfile)
+                if opcode == OP_CLOSE:
+                    connection.close()
+                    break
+                if opcode == OP_PING:
+                    connection.send_frame(OP_PONG, payload)
+                    continue
+                if opcode == OP_PONG:
+                    continue
+                fragments.append(payload)
+                if not fin:
+                    continue
+                message, fragments = b"".join(fragments), []
+                try:
+                    request = json.loads(message)
+                except ValueError:
+                    connection.send_json(
+                        {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+                    )
+                    continue
+                app._handle_rpc(connection, request)
+        except (EOFError, OSError):
+            pass
+        finally:
+            connection.closed = True
+            app._remove_connection(connection)
+
+
+class MockWebSocketServer(socketserver.ThreadingTCPServer):
+    """TCP server handing each upgraded connection to a ``MockServer``."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: Tuple[str, int], app: "MockServer"):
+        self.app = app
+        super().__init__(address, _WebSocketHandler)
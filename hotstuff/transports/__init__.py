@@ -1,9 +1,13 @@
 """Transports package."""
 from hotstuff.transports.http import HttpTransport
+from hotstuff.transports.recorder import FrameRecorder, RecordedFrame, read_frames
 from hotstuff.transports.websocket import WebSocketTransport
 
 __all__ = [
     "HttpTransport",
     "WebSocketTransport",
+    "FrameRecorder",
+    "RecordedFrame",
+    "read_frames",
 ]
 
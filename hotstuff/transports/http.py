@@ -1,9 +1,20 @@
 """HTTP transport implementation."""
-from typing import Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Sequence
+from urllib.parse import urlparse
+import json
+import logging
+import socket
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 
-from hotstuff.types import HttpTransportOptions
+from hotstuff.types import HttpTransportOptions, RequestTrace
+from hotstuff.transports.tracing import capturing, request_kind, run_hook
 from hotstuff.utils import ENDPOINTS_URLS
+from hotstuff.utils.metrics import record_request
+from hotstuff.utils.routing import FAILOVER_ENDPOINTS
 from hotstuff.exceptions import (
     HotstuffAPIError,
     HotstuffConnectionError,
@@ -12,6 +23,8 @@ from hotstuff.exceptions import (
     HotstuffAuthenticationError,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class HttpTransport:
     """HTTP transport for making API requests."""
@@ -49,16 +62,169 @@ class HttpTransport:
         self.headers = options.headers or {}
         self.on_request = options.on_request
         self.on_response = options.on_response
+        self.rate_limiter = options.rate_limiter
+        self.hedging = options.hedging
+        self.router = options.router
+        self.metrics = options.metrics
+        if self.metrics is not None and self.rate_limiter is not None:
+            # Keyed by limiter, so one shared by several transports counts once.
+            self.metrics.gauge_sum(
+                "hotstuff_rate_limit_queue_depth", "Requests waiting for a rate-limit token",
+                self.rate_limiter, lambda limiter: limiter.queue_depth(),
+            )
         
         # Session for connection pooling
+        self.pool_size = options.pool_size
         self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        
+        # Warm-up
+        self.warm_connections = options.warm_connections
+        self.keep_warm_interval = options.keep_warm_interval
+        self._keep_warm_stop = threading.Event()
+        self._keep_warm_thread: Optional[threading.Thread] = None
+    
+    def _mount_adapters(self, session: requests.Session):
+        """Size the connection pool for concurrent callers."""
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
     
     def _get_session(self) -> requests.Session:
         """Get or create requests session."""
         if self._session is None:
-            self._session = requests.Session()
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    self._mount_adapters(session)
+                    self._session = session
         return self._session
     
+    def ensure_pool_size(self, size: int):
+        """
+        Grow the connection pool so ``size`` concurrent requests can reuse connections.
+        
+        Args:
+            size: Number of concurrent requests expected
+        """
+        with self._session_lock:
+            if size <= self.pool_size:
+                return
+            self.pool_size = size
+            if self._session is not None:
+                self._mount_adapters(self._session)
+    
+    # Warm-up
+    
+    def _base_urls(self, roles: Sequence[str]) -> List[str]:
+        """Base URLs of every host serving ``roles`` (all router endpoints when routing)."""
+        if self.router is not None:
+            urls = [h.url for role in roles if role in self.router.roles() for h in self.router.health(role)]
+        else:
+            network = "testnet" if self.is_testnet else "mainnet"
+            urls = [self.server[network][role] for role in roles]
+        return list(dict.fromkeys(urls))
+    
+    def _open_connections(self, base_url: str, connections: int):
+        """Leave ``connections`` established keep-alive connections in the pool for ``base_url``."""
+        session = self._get_session()
+        
+        def _open(_):
+            # A streamed response holds its connection until the body is read,
+            # so concurrent opens cannot share a connection.
+            return session.get(base_url, headers=self.headers, timeout=self.timeout, stream=True)
+        
+        with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="hotstuff-warm") as executor:
+            futures = [executor.submit(_open, i) for i in range(connections)]
+        # Release every response that did open, even if another one failed,
+        # so no connection is left checked out of the pool.
+        error: Optional[BaseException] = None
+        for future in futures:
+            try:
+                response = future.result()
+            except Exception as e:
+                error = error or e
+                continue
+            try:
+                # Reading the body returns the connection to the pool.
+                response.content
+            except Exception as e:
+                error = error or e
+            finally:
+                response.close()
+        if error is not None:
+            raise error
+    
+    def warm_up(self, connections: Optional[int] = None, roles: Sequence[str] = ("api", "rpc")) -> Dict[str, float]:
+        """
+        Establish connections ahead of the first real request.
+        
+        Resolves each host, then opens ``connections`` pooled keep-alive
+        connections to it (TCP and TLS handshakes included) so the first
+        request pays no setup cost. Starts keep-warm when
+        ``keep_warm_interval`` is configured. Failures are logged, not raised.
+        
+        Args:
+            connections: Connections per host; defaults to ``warm_connections``
+            roles: Server roles to warm ("api", "rpc")
+            
+        Returns:
+            Seconds spent warming each base URL
+        """
+        connections = max(1, connections or self.warm_connections)
+        self.ensure_pool_size(connections)
+        timings = {}
+        for base_url in self._base_urls(roles):
+            start = time.monotonic()
+            parsed = urlparse(base_url)
+            try:
+                socket.getaddrinfo(parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80))
+                self._open_connections(base_url, connections)
+            except (OSError, requests.RequestException) as e:
+                logger.warning("Warm-up of %s failed: %s", base_url, e)
+            timings[base_url] = time.monotonic() - start
+        if self.keep_warm_interval:
+            self.start_keep_warm(self.keep_warm_interval, connections, roles)
+        return timings
+    
+    def start_keep_warm(
+        self,
+        interval: float = 30.0,
+        connections: Optional[int] = None,
+        roles: Sequence[str] = ("api", "rpc"),
+    ):
+        """
+        Periodically refresh pooled connections so they never go idle.
+        
+        Args:
+            interval: Seconds between refreshes; keep it below the server's
+                idle keep-alive timeout
+            connections: Connections per host; defaults to ``warm_connections``
+            roles: Server roles to keep warm
+        """
+        if self._keep_warm_thread is not None:
+            return
+        connections = max(1, connections or self.warm_connections)
+        self._keep_warm_stop.clear()
+        
+        def _loop():
+            while not self._keep_warm_stop.wait(interval):
+                for base_url in self._base_urls(roles):
+                    try:
+                        self._open_connections(base_url, connections)
+                    except requests.RequestException as e:
+                        logger.debug("Keep-warm of %s failed: %s", base_url, e)
+        
+        self._keep_warm_thread = threading.Thread(target=_loop, name="hotstuff-keep-warm", daemon=True)
+        self._keep_warm_thread.start()
+    
+    def stop_keep_warm(self):
+        """Stop the keep-warm thread."""
+        self._keep_warm_stop.set()
+        if self._keep_warm_thread is not None:
+            self._keep_warm_thread.join(timeout=1.0)
+            self._keep_warm_thread = None
+    
     def request(
         self,
         endpoint: str,
@@ -82,14 +248,106 @@ class HttpTransport:
             HotstuffAPIError: If the API returns an error
             HotstuffConnectionError: If connection fails
             HotstuffTimeoutError: If request times out
-            HotstuffRateLimitError: If rate limit is exceeded
+            HotstuffRateLimitError: If rate limit is exceeded (after retries,
+                for info requests sent through a rate limiter)
         """
-        try:
-            # Determine the base URL
+        limiter = self.rate_limiter
+        if limiter is None:
+            return self._dispatch(endpoint, payload, method)
+        
+        kind = request_kind(payload)
+        attempt = 0
+        while True:
+            limiter.acquire(endpoint, kind)
+            try:
+                body = self._dispatch(endpoint, payload, method, kind)
+            except HotstuffRateLimitError as e:
+                limiter.on_rate_limited(endpoint, kind, e.retry_after)
+                if not limiter.should_retry(endpoint, attempt):
+                    raise
+                limiter.retry_delay(endpoint, attempt, kind)
+                attempt += 1
+                continue
+            limiter.on_success(endpoint, kind)
+            return body
+    
+    def _dispatch(self, endpoint: str, payload: Any, method: str, kind: Optional[str] = None) -> Any:
+        """Send once, or through the hedging policy for idempotent endpoints."""
+        hedging = self.hedging
+        if hedging is not None and hedging.handles(endpoint):
+            limiter = self.rate_limiter
+            # A hedge is extra load: it needs a free rate-limit token or is skipped.
+            admit = None if limiter is None else (lambda: limiter.try_acquire(endpoint, kind))
+            if self.router is None:
+                return hedging.call(endpoint, lambda: self._send(endpoint, payload, method), admit)
+            # Attempts share the URLs already chosen, so a hedge goes to another host.
+            in_use: List[str] = []
+            return hedging.call(endpoint, lambda: self._send(endpoint, payload, method, in_use), admit)
+        return self._send(endpoint, payload, method)
+    
+    def _send(self, endpoint: str, payload: Any, method: str = "POST", in_use: Optional[List[str]] = None) -> Any:
+        """
+        Send to the configured server, or the best endpoint chosen by the router.
+
+        ``in_use`` lists URLs taken by concurrent attempts of the same request;
+        the router avoids them while another endpoint is available.
+        """
+        role = "rpc" if endpoint == "explorer" else "api"
+        router = self.router
+        if router is None:
             network = "testnet" if self.is_testnet else "mainnet"
-            base_url = self.server[network]["rpc" if endpoint == "explorer" else "api"]
-            url = f"{base_url}{endpoint}"
-            
+            return self._send_to(self.server[network][role], endpoint, payload, method)
+        
+        tried = []
+        while True:
+            base_url = router.select(role, exclude=tried + in_use if in_use else tried)
+            if in_use is not None:
+                in_use.append(base_url)
+            start = time.monotonic()
+            try:
+                body = self._send_to(base_url, endpoint, payload, method)
+            except (HotstuffConnectionError, HotstuffTimeoutError):
+                router.record_failure(base_url)
+                tried.append(base_url)
+                # Fail over to the next endpoint for idempotent requests only.
+                if endpoint in FAILOVER_ENDPOINTS and router.select(role, exclude=tried) not in tried:
+                    continue
+                raise
+            except HotstuffAPIError as e:
+                if e.status_code is not None and e.status_code >= 500:
+                    router.record_failure(base_url)
+                raise
+            router.record_success(base_url, time.monotonic() - start)
+            return body
+    
+    def _send_to(self, base_url: str, endpoint: str, payload: Any, method: str = "POST") -> Any:
+        """Perform a single HTTP round-trip, traced when hooks are set."""
+        url = f"{base_url}{endpoint}"
+        sink = capturing()
+        if self.on_request is None and self.on_response is None and sink is None and self.metrics is None:
+            return self._round_trip(url, endpoint, payload, method, None)
+        
+        trace = RequestTrace(
+            transport="http", endpoint=endpoint, name=request_kind(payload), url=url, start_ns=time.monotonic_ns()
+        )
+        try:
+            return self._round_trip(url, endpoint, payload, method, trace)
+        except Exception as e:
+            trace.error = e
+            raise
+        finally:
+            trace.end_ns = time.monotonic_ns()
+            run_hook(self.on_response, trace)
+            if sink is not None:
+                sink.append(trace)
+            if self.metrics is not None:
+                record_request(self.metrics, trace)
+    
+    def _round_trip(
+        self, url: str, endpoint: str, payload: Any, method: str, trace: Optional[RequestTrace]
+    ) -> Any:
+        """Send one request and map errors to Hotstuff exceptions."""
+        try:
             # Prepare headers
             headers = {
                 "Accept-Encoding": "gzip, deflate, br",
@@ -101,7 +359,9 @@ class HttpTransport:
             session = self._get_session()
             
             # Make request
-            if method == "POST":
+            if trace is not None:
+                response = self._traced_round_trip(session, url, payload, headers, method, trace)
+            elif method == "POST":
                 response = session.post(
                     url,
                     json=payload,
@@ -144,6 +404,8 @@ class HttpTransport:
             
             # Parse response
             body = response.json()
+            if trace is not None:
+                trace.parsed_ns = time.monotonic_ns()
             
             # Check for error in response
             if isinstance(body, dict) and body.get("type") == "error":
@@ -162,8 +424,33 @@ class HttpTransport:
         except Exception as e:
             raise HotstuffAPIError(str(e))
     
+    def _traced_round_trip(
+        self,
+        session: requests.Session,
+        url: str,
+        payload: Any,
+        headers: Dict[str, str],
+        method: str,
+        trace: RequestTrace,
+    ) -> requests.Response:
+        """Send with per-stage timestamps; the body is read eagerly so receive time is measured."""
+        data = json.dumps(payload).encode() if method == "POST" else None
+        trace.serialized_ns = time.monotonic_ns()
+        trace.request_bytes = len(data) if data else 0
+        run_hook(self.on_request, trace)
+        
+        trace.sent_ns = time.monotonic_ns()
+        # stream=True returns once the headers are in, i.e. at first byte.
+        response = session.request(method, url, data=data, headers=headers, timeout=self.timeout, stream=True)
+        trace.first_byte_ns = time.monotonic_ns()
+        trace.status_code = response.status_code
+        trace.response_bytes = len(response.content)
+        trace.received_ns = time.monotonic_ns()
+        return response
+    
     def close(self):
         """Close the HTTP session."""
+        self.stop_keep_warm()
         if self._session:
             self._session.close()
             self._session = None
@@ -0,0 +1,307 @@
+"""Append-only capture of received WebSocket frames for debugging and backtests.
+
+A recording is a directory of rotated ``.hsf`` files. Each file starts with
+a header pairing a wall-clock and a monotonic timestamp, followed by
+independently compressed chunks::
+
+    file header   8s magic "HSFRAMES", Q wall_ns, Q monotonic_ns
+    chunk header  4s magic "HSFC", B codec, I records, I raw_len, I data_len, Q first_ns, Q last_ns
+    chunk data    data_len bytes; decompressed: records of
+                  Q recv_ns, B kind (0 text, 1 binary), I length, payload
+
+A crash loses at most the chunk being written; readers stop at a
+truncated tail.
+"""
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import BinaryIO, Deque, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+FILE_MAGIC = b"HSFRAMES"
+CHUNK_MAGIC = b"HSFC"
+SUFFIX = ".hsf"
+
+_FILE_HEADER = struct.Struct("!8sQQ")
+_CHUNK_HEADER = struct.Struct("!4sBIIIQQ")
+_RECORD_HEADER = struct.Struct("!QBI")
+
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+_CODECS = {"none": CODEC_NONE, "zlib": CODEC_ZLIB}
+
+
+@dataclass
+class RecordedFrame:
+    """One captured frame; ``recv_ns`` is ``time.monotonic_ns()`` at receipt."""
+    recv_ns: int
+    data: Union[str, bytes]
+    wall_ns: int = 0
+
+
+@dataclass
+class RecorderStats:
+    """Frame counts of a FrameRecorder."""
+    recorded: int = 0
+    written: int = 0
+    dropped: int = 0
+    chunks: int = 0
+    files: int = 0
+    bytes_written: int = 0
+
+
+class FrameRecorder:
+    """
+    Capture frames to disk from a background writer thread.
+
+    ``record`` only appends to an in-memory deque, so the receive thread
+    never waits on compression or I/O. If the writer falls more than
+    ``max_pending`` frames behind, the oldest pending frames are dropped
+    and counted in ``stats().dropped``.
+
+    Pass it as ``WebSocketTransportOptions(recorder=...)``; the recorder
+    outlives reconnects and must be closed by its owner.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "frames",
+        max_bytes: int = 64 * 1024 * 1024,
+        max_age: Optional[float] = 3600.0,
+        chunk_frames: int = 4096,
+        flush_interval: float = 0.2,
+        compression: str = "zlib",
+        level: int = 1,
+        max_pending: int = 1_000_000
+    ):
+        """
+        Initialize the recorder and start its writer thread.
+
+        Args:
+            directory: Directory receiving the ``.hsf`` files (created if missing)
+            prefix: File name prefix
+            max_bytes: Rotate once a file reaches this size
+            max_age: Rotate files older than this many seconds (None: size only)
+            chunk_frames: Frames per compressed chunk, at most
+            flush_interval: Seconds between writer wake-ups
+            compression: 'zlib' or 'none'
+            level: zlib compression level (1 favours speed)
+            max_pending: Frames buffered in memory before the oldest are dropped
+        """
+        if compression not in _CODECS:
+            raise ValueError(f"Unknown compression {compression!r}; expected one of {sorted(_CODECS)}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.chunk_frames = chunk_frames
+        self.flush_interval = flush_interval
+        self.codec = _CODECS[compression]
+        self.level = level
+
+        self._pending: Deque[Tuple[int, Union[str, bytes]]] = deque(maxlen=max_pending)
+        self._append = self._pending.append
+        # Only the receive thread increments _recorded; only the writer
+        # increments _taken and _failed. Drops are whatever is left over.
+        self._recorded = 0
+        self._taken = 0
+        self._failed = 0
+        self._stats = RecorderStats()
+        self._file: Optional[BinaryIO] = None
+        self._file_opened = 0.0
+        self._file_size = 0
+        self._sequence = 0
+        self._token = os.urandom(4).hex()
+        self.files: List[str] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="hotstuff-frame-recorder", daemon=True)
+        self._thread.start()
+
+    def record(self, frame: Union[str, bytes], recv_ns: int):
+        """
+        Queue one frame for writing. Never blocks.
+
+        Args:
+            frame: Frame payload as returned by ``websocket.recv()``
+            recv_ns: ``time.monotonic_ns()`` at receipt
+        """
+        self._append((recv_ns, frame))
+        self._recorded += 1
+
+    # Writer thread
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self._drain()
+        self._drain()
+        self._close_file()
+
+    def _drain(self):
+        pending = self._pending
+        while pending:
+            batch = []
+            try:
+                for _ in range(self.chunk_frames):
+                    batch.append(pending.popleft())
+            except IndexError:
+                pass
+            self._taken += len(batch)
+            try:
+                self._write_chunk(batch)
+            except Exception as e:
+                self._failed += len(batch)
+                logger.error("Frame recorder failed to write %d frames: %s", len(batch), e)
+
+    def _write_chunk(self, batch: List[Tuple[int, Union[str, bytes]]]):
+        parts = []
+        pack = _RECORD_HEADER.pack
+        for recv_ns, frame in batch:
+            if isinstance(frame, str):
+                payload, kind = frame.encode("utf-8"), 0
+            else:
+                payload, kind = bytes(frame), 1
+            parts.append(pack(recv_ns, kind, len(payload)))
+            parts.append(payload)
+        raw = b"".join(parts)
+        data = zlib.compress(raw, self.level) if self.codec == CODEC_ZLIB else raw
+        header = _CHUNK_HEADER.pack(CHUNK_MAGIC, self.codec, len(batch), len(raw), len(data), batch[0][0], batch[-1][0])
+
+        self._maybe_rotate()
+        self._file.write(header)
+        self._file.write(data)
+        self._file.flush()
+        self._file_size += len(header) + len(data)
+        stats = self._stats
+        stats.written += len(batch)
+        stats.chunks += 1
+        stats.bytes_written += len(header) + len(data)
+
+    def _maybe_rotate(self):
+        if self._file is not None:
+            too_big = self._file_size >= self.max_bytes
+            too_old = self.max_age is not None and time.monotonic() - self._file_opened >= self.max_age
+            if not (too_big or too_old):
+                return
+            self._close_file()
+        self._sequence += 1
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        while True:
+            # Other recorders (or a restart of this process) may share the
+            # directory and prefix within the same second: the pid and a
+            # per-recorder token keep names apart, and "xb" never appends
+            # to someone else's file.
+            name = f"{self.prefix}-{stamp}-{os.getpid()}-{self._token}-{self._sequence:04d}{SUFFIX}"
+            path = os.path.join(self.directory, name)
+            try:
+                self._file = open(path, "xb")
+                break
+            except FileExistsError:
+                self._token = os.urandom(4).hex()
+        header = _FILE_HEADER.pack(FILE_MAGIC, time.time_ns(), time.monotonic_ns())
+        self._file.write(header)
+        self._file_size = len(header)
+        self._file_opened = time.monotonic()
+        self.files.append(path)
+        self._stats.files += 1
+        self._stats.bytes_written += len(header)
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                logger.warning("Frame recorder failed to close %s: %s", self.files[-1], e)
+            self._file = None
+
+    # Control
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every frame recorded so far is written.
+
+        Returns:
+            True if the writer caught up within ``timeout``
+        """
+        deadline = time.monotonic() + timeout
+        # The last batch is still in flight for a moment after the deque empties.
+        while self._pending or self._stats.written + self._failed < self._taken:
+            if time.monotonic() >= deadline or not self._thread.is_alive():
+                return False
+            time.sleep(0.001)
+        return True
+
+    def stats(self) -> RecorderStats:
+        """Snapshot of recorded, written and dropped frame counts."""
+        s = self._stats
+        recorded = self._recorded
+        dropped = max(0, recorded - self._taken - len(self._pending))
+        return RecorderStats(
+            recorded=recorded, written=s.written, dropped=dropped, chunks=s.chunks, files=s.files,
+            bytes_written=s.bytes_written,
+        )
+
+    def close(self):
+        """Write everything pending and stop the writer thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def read_frames(path: str) -> Iterator[RecordedFrame]:
+    """
+    Iterate the frames of one ``.hsf`` file, or of every file in a directory in name order.
+
+    A truncated final chunk (e.g. after a crash) ends the iteration quietly.
+
+    Args:
+        path: Recording file or directory
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(SUFFIX):
+                yield from read_frames(os.path.join(path, name))
+        return
+
+    with open(path, "rb") as f:
+        head = f.read(_FILE_HEADER.size)
+        if len(head) < _FILE_HEADER.size:
+            return
+        magic, wall_ns, mono_ns = _FILE_HEADER.unpack(head)
+        if magic != FILE_MAGIC:
+            raise ValueError(f"{path} is not a frame recording")
+        offset = wall_ns - mono_ns
+        while True:
+            head = f.read(_CHUNK_HEADER.size)
+            if len(head) < _CHUNK_HEADER.size:
+                return
+            magic, codec, count, raw_len, data_len, _, _ = _CHUNK_HEADER.unpack(head)
+            if magic != CHUNK_MAGIC:
+                raise ValueError(f"Corrupt chunk header in {path}")
+            data = f.read(data_len)
+            if len(data) < data_len:
+                logger.warning("Truncated final chunk in %s", path)
+                return
+            raw = zlib.decompress(data) if codec == CODEC_ZLIB else data
+            pos = 0
+            for _ in range(count):
+                recv_ns, kind, length = _RECORD_HEADER.unpack_from(raw, pos)
+                pos += _RECORD_HEADER.size
+                payload = raw[pos:pos + length]
+                pos += length
+                yield RecordedFrame(
+                    recv_ns=recv_ns, data=payload.decode("utf-8") if kind == 0 else payload,
+                    wall_ns=recv_ns + offset,
+                )
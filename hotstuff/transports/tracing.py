@@ -0,0 +1,55 @@
+"""Helpers shared by the transports' request instrumentation."""
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional
+
+from hotstuff.types import RequestTrace
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+def request_kind(payload: Any) -> Optional[str]:
+    """Info method name or exchange action type of a request payload."""
+    if not isinstance(payload, dict):
+        return None
+    if "method" in payload:
+        return payload["method"]
+    action = payload.get("action")
+    if isinstance(action, dict):
+        return action.get("type")
+    return None
+
+
+def run_hook(hook: Optional[Callable[[RequestTrace], Any]], trace: RequestTrace):
+    """Call an instrumentation hook; a failing hook never fails the request."""
+    if hook is None:
+        return
+    try:
+        hook(trace)
+    except Exception as e:
+        logger.warning("Request hook %r failed: %s", hook, e)
+
+
+def capturing() -> Optional[List[RequestTrace]]:
+    """Trace list of the enclosing ``capture()`` block on this thread, if any."""
+    return getattr(_local, "traces", None)
+
+
+@contextmanager
+def capture() -> Iterator[List[RequestTrace]]:
+    """
+    Trace every request sent by this thread inside the block, hooks or not.
+
+    Yields:
+        List receiving each completed RequestTrace
+    """
+    previous = capturing()
+    traces: List[RequestTrace] = []
+    _local.traces = traces
+    try:
+        yield traces
+    finally:
+        _local.traces = previous
@@ -5,7 +5,7 @@ import logging
 import threading
 import socket
 import ssl
-from typing import Optional, Dict, Any, Callable, List
+from typing import Optional, Dict, Any, Callable, Iterable, List
 from urllib.parse import urlparse
 import websocket
 
@@ -20,8 +20,12 @@ from hotstuff.types import (
     SubscribeResult,
     UnsubscribeResult,
     PongResult,
+    RequestTrace,
 )
+from hotstuff.transports.tracing import capturing, request_kind, run_hook
 from hotstuff.utils import ENDPOINTS_URLS
+from hotstuff.utils.metrics import record_request
+from hotstuff.utils.tick_to_trade import set_trigger
 
 logger = logging.getLogger(__name__)
 
@@ -58,12 +62,27 @@ class WebSocketTransport:
             "timeout": 10.0,
         }
         
+        self.router = options.router
+        self.on_request = options.on_request
+        self.on_response = options.on_response
+        # Receive timestamps of traced responses, keyed by JSON-RPC id.
+        self._traced_ids: Dict[str, Optional[tuple]] = {}
+        self._url: Optional[str] = None
+        self.metrics = options.metrics
+        # Owned by the caller: survives reconnects and is not closed here.
+        self.recorder = options.recorder
+        
         self.ws: Optional[websocket.WebSocket] = None
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 5
         self.reconnect_delay = 1.0
         
         self.message_queue: Dict[str, dict] = {}
+        if self.metrics is not None:
+            self.metrics.gauge_sum(
+                "hotstuff_ws_pending_requests", "WebSocket requests awaiting a response",
+                self, lambda transport: len(transport.message_queue),
+            )
         self.message_id_counter = 0
         self._lock = threading.Lock()
         
@@ -107,7 +126,7 @@ class WebSocketTransport:
                 logger.warning("Keep-alive error: %s", e)
                 break
     
-    def _handle_incoming_message(self, message: dict):
+    def _handle_incoming_message(self, message: dict, recv_ns: int = 0, decoded_ns: int = 0):
         """Handle incoming WebSocket message."""
         # Check if it's a JSON-RPC response
         if "id" in message and ("result" in message or "error" in message):
@@ -116,7 +135,7 @@ class WebSocketTransport:
         
         # Check if it's a notification
         if "method" in message and "params" in message and "id" not in message:
-            self._handle_jsonrpc_notification(message)
+            self._handle_jsonrpc_notification(message, recv_ns, decoded_ns)
             return
     
     def _handle_jsonrpc_response(self, response: dict):
@@ -126,7 +145,7 @@ class WebSocketTransport:
             if msg_id in self.message_queue:
                 self.message_queue[msg_id] = response
     
-    def _handle_jsonrpc_notification(self, notification: dict):
+    def _handle_jsonrpc_notification(self, notification: dict, recv_ns: int = 0, decoded_ns: int = 0):
         """Handle JSON-RPC notification."""
         method = notification.get("method")
         params = notification.get("params")
@@ -134,6 +153,11 @@ class WebSocketTransport:
         if method in ("subscription", "event") and params:
             channel = params.get("channel")
             data = params.get("data")
+            metrics = self.metrics
+            if metrics is not None:
+                # Label by the base channel ("fills", not "fills@0x..") to bound cardinality.
+                base = str(channel).split("@", 1)[0]
+                metrics.counter("hotstuff_ws_messages_total", "WebSocket notifications by channel", channel=base).inc()
             
             # Find matching subscriptions
             for sub_id, subscription in self.subscriptions.items():
@@ -143,21 +167,42 @@ class WebSocketTransport:
                         subscription_data = SubscriptionData(
                             channel=channel,
                             data=data,
-                            timestamp=time.time()
+                            timestamp=time.time(),
+                            recv_ns=recv_ns,
+                            decoded_ns=decoded_ns,
                         )
+                        # Actions sent from the callback are linked to this event.
+                        previous = set_trigger(subscription_data)
+                        subscription_data.dispatched_ns = start = time.monotonic_ns()
                         try:
                             callback(subscription_data)
                         except Exception as e:
                             logger.error("Callback error: %s", e)
+                        finally:
+                            set_trigger(previous)
+                        if metrics is not None:
+                            metrics.histogram(
+                                "hotstuff_ws_callback_duration_seconds", "Subscription callback run time",
+                                channel=base,
+                            ).record(time.monotonic_ns() - start)
     
     def _receive_messages(self):
         """Receive messages from WebSocket."""
+        recorder = self.recorder
         while self._running and self.ws:
             try:
                 message = self.ws.recv()
                 if message:
+                    received_ns = time.monotonic_ns()
+                    if recorder is not None:
+                        recorder.record(message, received_ns)
                     data = json.loads(message)
-                    self._handle_incoming_message(data)
+                    decoded_ns = time.monotonic_ns()
+                    if self._traced_ids:
+                        msg_id = str(data.get("id")) if isinstance(data, dict) else None
+                        if msg_id in self._traced_ids:
+                            self._traced_ids[msg_id] = (received_ns, decoded_ns, len(message))
+                    self._handle_incoming_message(data, received_ns, decoded_ns)
             except websocket.WebSocketTimeoutException:
                 # An idle recv timeout is normal for sparse channels (e.g. a
                 # maker's fills): the socket is healthy, just no frame arrived.
@@ -177,10 +222,17 @@ class WebSocketTransport:
     
     def _reconnect(self):
         """Reconnect to WebSocket and replay subscriptions."""
+        dropped = self._url
         self._cleanup()
+        # The session died under us: count it against the host and prefer
+        # another one, instead of waiting for connect failures to pile up.
+        if self.router is not None and dropped is not None:
+            self.router.record_failure(dropped)
         time.sleep(self.reconnect_delay * self.reconnect_attempts)
         self.reconnect_attempts += 1
-        self.connect()
+        if self.metrics is not None:
+            self.metrics.counter("hotstuff_ws_reconnects_total", "WebSocket reconnect attempts").inc()
+        self.connect(exclude=(dropped,) if dropped is not None else ())
         self._resubscribe_all()
 
     def _resubscribe_all(self):
@@ -212,7 +264,7 @@ class WebSocketTransport:
             except Exception as e:
                 logger.error("Failed to resubscribe %s (%s): %s", sub_id, base, e)
     
-    def _send_jsonrpc_message(self, message: dict) -> Any:
+    def _send_jsonrpc_message(self, message: dict, trace: Optional[RequestTrace] = None) -> Any:
         """Send a JSON-RPC message and wait for response."""
         if not self.is_connected():
             self.connect()
@@ -229,7 +281,14 @@ class WebSocketTransport:
             self.message_queue[msg_id] = None
         
         # Send message
-        self.ws.send(json.dumps(message))
+        data = json.dumps(message)
+        if trace is not None:
+            trace.serialized_ns = time.monotonic_ns()
+            trace.request_bytes = len(data)
+            self._traced_ids[msg_id] = None
+            run_hook(self.on_request, trace)
+            trace.sent_ns = time.monotonic_ns()
+        self.ws.send(data)
         
         # Wait for response with timeout
         start_time = time.time()
@@ -240,6 +299,12 @@ class WebSocketTransport:
                 response = self.message_queue.get(msg_id)
                 if response is not None:
                     del self.message_queue[msg_id]
+                    if trace is not None:
+                        stamps = self._traced_ids.pop(msg_id, None)
+                        if stamps is not None:
+                            # A frame arrives whole: first byte and receive coincide.
+                            trace.first_byte_ns = trace.received_ns = stamps[0]
+                            trace.parsed_ns, trace.response_bytes = stamps[1], stamps[2]
                     if "error" in response:
                         error = response["error"]
                         raise Exception(f"JSON-RPC Error {error.get('code')}: {error.get('message')}")
@@ -248,6 +313,7 @@ class WebSocketTransport:
             if time.time() - start_time > timeout:
                 with self._lock:
                     self.message_queue.pop(msg_id, None)
+                self._traced_ids.pop(msg_id, None)
                 raise Exception("Request timeout")
             
             time.sleep(0.01)
@@ -333,16 +399,33 @@ class WebSocketTransport:
             raise last_error
         return None
     
-    def connect(self):
-        """Connect to WebSocket server."""
-        url = self.server["testnet" if self.is_testnet else "mainnet"]
+    def connect(self, exclude: Iterable[str] = ()):
+        """
+        Connect to WebSocket server.
+
+        Args:
+            exclude: Router URLs to avoid while another one is available
+        """
+        if self.router is not None:
+            url = self.router.select("ws", exclude=exclude)
+        else:
+            url = self.server["testnet" if self.is_testnet else "mainnet"]
         
         try:
-            ipv4_socket = self._create_ipv4_socket(url)
-            if ipv4_socket is not None:
-                self.ws = websocket.create_connection(url, timeout=self.timeout, socket=ipv4_socket)
-            else:
-                self.ws = websocket.create_connection(url, timeout=self.timeout)
+            start = time.monotonic()
+            try:
+                ipv4_socket = self._create_ipv4_socket(url)
+                if ipv4_socket is not None:
+                    self.ws = websocket.create_connection(url, timeout=self.timeout, socket=ipv4_socket)
+                else:
+                    self.ws = websocket.create_connection(url, timeout=self.timeout)
+            except Exception:
+                if self.router is not None:
+                    self.router.record_failure(url)
+                raise
+            if self.router is not None:
+                self.router.record_success(url, time.monotonic() - start)
+            self._url = url
 
             # Enable TCP keepalive so a dead peer is detected even on idle
             # channels, independent of the application-level ping loop.
@@ -447,7 +530,29 @@ class WebSocketTransport:
             "id": str(self.message_id_counter),
         }
 
-        result = self._send_jsonrpc_message(message)
+        sink = capturing()
+        if self.on_request is None and self.on_response is None and sink is None and self.metrics is None:
+            result = self._send_jsonrpc_message(message)
+        else:
+            trace = RequestTrace(
+                transport="ws",
+                endpoint=endpoint,
+                name=request_kind(payload),
+                url=self._url,
+                start_ns=time.monotonic_ns(),
+            )
+            try:
+                result = self._send_jsonrpc_message(message, trace)
+            except Exception as e:
+                trace.error = e
+                raise
+            finally:
+                trace.end_ns = time.monotonic_ns()
+                run_hook(self.on_response, trace)
+                if sink is not None:
+                    sink.append(trace)
+                if self.metrics is not None:
+                    record_request(self.metrics, trace)
 
         if self._is_signal_aborted(signal):
             raise self._create_abort_error()
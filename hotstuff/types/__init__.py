@@ -11,12 +11,14 @@ from hotstuff.types.transports import (
     SubscribeResult,
     UnsubscribeResult,
     PongResult,
+    RequestTrace,
 )
 from hotstuff.types.clients import (
     InfoClientParameters,
     ExchangeClientParameters,
     SubscriptionClientParameters,
     ActionRequest,
+    ActionTiming,
 )
 
 __all__ = [
@@ -32,10 +34,12 @@ __all__ = [
     "SubscribeResult",
     "UnsubscribeResult",
     "PongResult",
+    "RequestTrace",
     # Client types
     "InfoClientParameters",
     "ExchangeClientParameters",
     "SubscriptionClientParameters",
-    "ActionRequest"
+    "ActionRequest",
+    "ActionTiming",
 ]
 
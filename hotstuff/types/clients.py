@@ -1,6 +1,6 @@
 """Type definitions for client parameters."""
-from typing import TypeVar, Generic, Optional, Callable, Awaitable, Any
-from dataclasses import dataclass
+from typing import TypeVar, Generic, Optional, Callable, Awaitable, Any, Dict
+from dataclasses import dataclass, asdict
 
 # Type variable for transport
 T = TypeVar('T')
@@ -32,3 +32,37 @@ class ActionRequest:
     action: str
     params: dict
 
+
+
+@dataclass
+class ActionTiming:
+    """
+    Where the time of one exchange action went, in nanoseconds.
+
+    Stages that did not run (e.g. network for ``execute=False``) are None.
+    ``sent_at_ms`` is the wall-clock send time, comparable with
+    ``expires_after``.
+    """
+    action: str
+    nonce: Optional[int] = None
+    convert_ns: Optional[int] = None
+    pack_ns: Optional[int] = None
+    sign_ns: Optional[int] = None
+    encode_ns: Optional[int] = None
+    network_ns: Optional[int] = None
+    parse_ns: Optional[int] = None
+    total_ns: Optional[int] = None
+    expires_after: Optional[int] = None
+    sent_at_ms: Optional[int] = None
+
+    @property
+    def expiry_margin_ms(self) -> Optional[int]:
+        """Milliseconds left before ``expiresAfter`` when the action was sent."""
+        if self.expires_after is None or self.sent_at_ms is None:
+            return None
+        return self.expires_after - self.sent_at_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        result["expiry_margin_ms"] = self.expiry_margin_ms
+        return result
@@ -1,7 +1,14 @@
 """Type definitions for transports."""
-from typing import Optional, Dict, Any, Callable, Awaitable, Union
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Awaitable, Union
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from hotstuff.utils.hedging import HedgingPolicy
+    from hotstuff.utils.metrics import MetricsRegistry
+    from hotstuff.utils.ratelimit import RateLimiter
+    from hotstuff.transports.recorder import FrameRecorder
+    from hotstuff.utils.routing import EndpointRouter
+
 
 @dataclass
 class HttpTransportOptions:
@@ -12,6 +19,13 @@ class HttpTransportOptions:
     headers: Optional[Dict[str, str]] = None
     on_request: Optional[Callable] = None
     on_response: Optional[Callable] = None
+    pool_size: int = 10
+    rate_limiter: Optional["RateLimiter"] = None
+    hedging: Optional["HedgingPolicy"] = None
+    router: Optional["EndpointRouter"] = None
+    warm_connections: int = 2
+    keep_warm_interval: Optional[float] = None
+    metrics: Optional["MetricsRegistry"] = None
 
 
 @dataclass
@@ -22,6 +36,72 @@ class WebSocketTransportOptions:
     server: Optional[Dict[str, str]] = None
     keep_alive: Optional[Dict[str, Optional[float]]] = None
     auto_connect: bool = True
+    router: Optional["EndpointRouter"] = None
+    on_request: Optional[Callable] = None
+    on_response: Optional[Callable] = None
+    metrics: Optional["MetricsRegistry"] = None
+    recorder: Optional["FrameRecorder"] = None
+
+
+@dataclass
+class RequestTrace:
+    """
+    Per-stage timing of one request, passed to on_request/on_response hooks.
+
+    Timestamps are ``time.monotonic_ns()`` values; a stage that was not
+    reached is left at 0. ``on_request`` sees the trace after serialization,
+    ``on_response`` after parsing (or with ``error`` set on failure).
+    """
+    transport: str
+    endpoint: str
+    name: Optional[str] = None
+    url: Optional[str] = None
+    start_ns: int = 0
+    serialized_ns: int = 0
+    sent_ns: int = 0
+    first_byte_ns: int = 0
+    received_ns: int = 0
+    parsed_ns: int = 0
+    end_ns: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    status_code: Optional[int] = None
+    error: Optional[BaseException] = None
+
+    @staticmethod
+    def _span(start: int, end: int) -> Optional[int]:
+        return end - start if start and end else None
+
+    @property
+    def serialize_ns(self) -> Optional[int]:
+        return self._span(self.start_ns, self.serialized_ns)
+
+    @property
+    def wait_ns(self) -> Optional[int]:
+        """Time from sending until the first response byte."""
+        return self._span(self.sent_ns, self.first_byte_ns)
+
+    @property
+    def receive_ns(self) -> Optional[int]:
+        return self._span(self.first_byte_ns, self.received_ns)
+
+    @property
+    def parse_ns(self) -> Optional[int]:
+        return self._span(self.received_ns, self.parsed_ns)
+
+    @property
+    def total_ns(self) -> Optional[int]:
+        return self._span(self.start_ns, self.end_ns)
+
+    def stages(self) -> Dict[str, Optional[int]]:
+        """Stage durations in nanoseconds, keyed by stage name."""
+        return {
+            "serialize": self.serialize_ns,
+            "wait": self.wait_ns,
+            "receive": self.receive_ns,
+            "parse": self.parse_ns,
+            "total": self.total_ns,
+        }
 
 
 @dataclass
@@ -54,10 +134,19 @@ class JSONRPCNotification:
 
 @dataclass
 class SubscriptionData:
-    """Subscription data."""
+    """
+    Subscription data.
+
+    ``recv_ns``, ``decoded_ns`` and ``dispatched_ns`` are ``time.monotonic_ns()``
+    stamps taken when the frame was read, parsed and handed to the callback
+    (0 when not stamped); see ``TickToTradeTracer``.
+    """
     channel: str
     data: Any
     timestamp: float
+    recv_ns: int = 0
+    decoded_ns: int = 0
+    dispatched_ns: int = 0
 
 
 @dataclass
@@ -3,11 +3,46 @@ from hotstuff.utils.endpoints import ENDPOINTS_URLS
 from hotstuff.utils.nonce import NonceManager
 from hotstuff.utils.signing import sign_action
 from hotstuff.utils.address import validate_ethereum_address
+from hotstuff.utils.cache import LRUCache, CacheStats, ExplorerCache, ResponseCache
+from hotstuff.utils.hedging import HedgingPolicy, HedgingStats
+from hotstuff.utils.metrics import Histogram, MetricsRegistry, MetricsServer, default_registry
+from hotstuff.utils.ratelimit import RateLimit, RateLimiter, RateLimitStats
+from hotstuff.utils.routing import EndpointHealth, EndpointRouter
+from hotstuff.utils.single_flight import SingleFlight, SingleFlightStats
+from hotstuff.utils.tick_to_trade import TickToTradeSample, TickToTradeTracer, triggered_by
+from hotstuff.utils.tx_index import TransactionIndex, tx_type_name
+from hotstuff.utils.quantize import StepQuantizer, get_quantizer
+from hotstuff.utils.orders import build_orders
 
 __all__ = [
     "ENDPOINTS_URLS",
     "NonceManager",
     "sign_action",
-    "validate_ethereum_address"
+    "validate_ethereum_address",
+    "LRUCache",
+    "CacheStats",
+    "ExplorerCache",
+    "ResponseCache",
+    "HedgingPolicy",
+    "HedgingStats",
+    "Histogram",
+    "MetricsRegistry",
+    "MetricsServer",
+    "default_registry",
+    "RateLimit",
+    "RateLimiter",
+    "RateLimitStats",
+    "EndpointHealth",
+    "EndpointRouter",
+    "SingleFlight",
+    "SingleFlightStats",
+    "TickToTradeSample",
+    "TickToTradeTracer",
+    "triggered_by",
+    "TransactionIndex",
+    "tx_type_name",
+    "StepQuantizer",
+    "get_quantizer",
+    "build_orders",
 ]
 
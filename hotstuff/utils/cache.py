@@ -0,0 +1,571 @@
+"""Client-side response caches."""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe, size-bounded least-recently-used mapping."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize LRUCache.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting the oldest
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` and mark it most recently used."""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Insert or replace ``key``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove ``key`` and return its value."""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def keys(self):
+        """Snapshot of the current keys, least recently used first."""
+        with self._lock:
+            return list(self._data.keys())
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+@dataclass
+class CacheStats:
+    """Cache hit/miss counters."""
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    stale_hits: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    discarded: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class ExplorerCache:
+    """
+    Content-addressed cache for finalized explorer blocks and transactions.
+
+    Blocks are stored under their ``block_hash``; a height index maps
+    ``block_height`` to that hash, so lookups by height and by hash resolve to
+    the same entry. Transactions embedded in a cached block are indexed by
+    ``tx_hash`` as well. Finalized entries never expire: the in-memory LRU only
+    bounds memory, and the optional SQLite tier keeps everything on disk.
+    """
+
+    def __init__(self, max_entries: int = 4096, path: Optional[str] = None):
+        """
+        Initialize ExplorerCache.
+
+        Args:
+            max_entries: Size of the in-memory LRU tier
+            path: Optional SQLite database file for the on-disk tier
+        """
+        self._blocks = LRUCache(max_entries)
+        self._heights = LRUCache(max_entries)
+        self._transactions = LRUCache(max_entries)
+        self._stats_lock = threading.Lock()
+        self._block_stats = CacheStats()
+        self._tx_stats = CacheStats()
+
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS blocks ("
+                    "block_hash TEXT PRIMARY KEY, block_height INTEGER, payload TEXT NOT NULL)"
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS blocks_by_height ON blocks (block_height)"
+                )
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS transactions ("
+                    "tx_hash TEXT PRIMARY KEY, payload TEXT NOT NULL)"
+                )
+
+    # Stats
+
+    def _record(self, stats: CacheStats, tier: Optional[str]):
+        with self._stats_lock:
+            if tier is None:
+                stats.misses += 1
+                return
+            stats.hits += 1
+            if tier == "memory":
+                stats.memory_hits += 1
+            else:
+                stats.disk_hits += 1
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """Return a snapshot of block and transaction hit/miss counters."""
+        with self._stats_lock:
+            return {
+                "blocks": CacheStats(**vars(self._block_stats)),
+                "transactions": CacheStats(**vars(self._tx_stats)),
+            }
+
+    # Disk tier
+
+    def _db_fetch(self, query: str, args: tuple) -> Optional[str]:
+        if self._db is None:
+            return None
+        with self._db_lock:
+            row = self._db.execute(query, args).fetchone()
+        return row[0] if row else None
+
+    def _db_write(self, query: str, args: tuple):
+        if self._db is None:
+            return
+        with self._db_lock, self._db:
+            self._db.execute(query, args)
+
+    # Blocks
+
+    @staticmethod
+    def is_finalized_block(payload: Any) -> bool:
+        """Whether ``payload`` is a complete block record that can be cached forever."""
+        return (
+            isinstance(payload, dict)
+            and bool(payload.get("block_hash"))
+            and payload.get("block_height") is not None
+        )
+
+    def _resolve_hash(self, block_hash: Optional[str], block_height: Optional[int]) -> Optional[str]:
+        if block_hash:
+            return block_hash
+        if block_height is None:
+            return None
+        cached = self._heights.get(int(block_height))
+        if cached is not None:
+            return cached
+        return self._db_fetch(
+            "SELECT block_hash FROM blocks WHERE block_height = ?", (int(block_height),)
+        )
+
+    def get_block(
+        self, block_hash: Optional[str] = None, block_height: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a block by hash or height.
+
+        Args:
+            block_hash: Block hash
+            block_height: Block height (used when no hash is given)
+
+        Returns:
+            The cached block payload, or None on a miss
+        """
+        resolved = self._resolve_hash(block_hash, block_height)
+        if resolved is None:
+            self._record(self._block_stats, None)
+            return None
+
+        payload = self._blocks.get(resolved)
+        if payload is not None:
+            self._record(self._block_stats, "memory")
+            return payload
+
+        raw = self._db_fetch("SELECT payload FROM blocks WHERE block_hash = ?", (resolved,))
+        if raw is None:
+            self._record(self._block_stats, None)
+            return None
+        payload = json.loads(raw)
+        self._remember_block(payload)
+        self._record(self._block_stats, "disk")
+        return payload
+
+    def _remember_block(self, payload: Dict[str, Any]):
+        block_hash = payload["block_hash"]
+        self._blocks.put(block_hash, payload)
+        self._heights.put(int(payload["block_height"]), block_hash)
+
+    def put_block(self, payload: Any) -> bool:
+        """
+        Store a finalized block and index its transactions.
+
+        Args:
+            payload: Raw ``block_details`` payload
+
+        Returns:
+            True if the payload was cached
+        """
+        if not self.is_finalized_block(payload):
+            return False
+        self._remember_block(payload)
+        self._db_write(
+            "INSERT OR REPLACE INTO blocks (block_hash, block_height, payload) VALUES (?, ?, ?)",
+            (payload["block_hash"], int(payload["block_height"]), json.dumps(payload)),
+        )
+        for tx in payload.get("transactions") or []:
+            self.put_transaction(tx)
+        return True
+
+    # Transactions
+
+    def get_transaction(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a transaction by hash.
+
+        Args:
+            tx_hash: Transaction hash
+
+        Returns:
+            The cached transaction payload, or None on a miss
+        """
+        payload = self._transactions.get(tx_hash)
+        if payload is not None:
+            self._record(self._tx_stats, "memory")
+            return payload
+
+        raw = self._db_fetch("SELECT payload FROM transactions WHERE tx_hash = ?", (tx_hash,))
+        if raw is None:
+            self._record(self._tx_stats, None)
+            return None
+        payload = json.loads(raw)
+        self._transactions.put(tx_hash, payload)
+        self._record(self._tx_stats, "disk")
+        return payload
+
+    def put_transaction(self, payload: Any) -> bool:
+        """
+        Store a finalized transaction.
+
+        Args:
+            payload: Raw ``transaction_details`` payload
+
+        Returns:
+            True if the payload was cached
+        """
+        if not isinstance(payload, dict) or not payload.get("tx_hash"):
+            return False
+        if payload.get("block_hash") is None and payload.get("block_height") is None:
+            # Not yet included in a block, so the record may still change.
+            return False
+        self._transactions.put(payload["tx_hash"], payload)
+        self._db_write(
+            "INSERT OR REPLACE INTO transactions (tx_hash, payload) VALUES (?, ?)",
+            (payload["tx_hash"], json.dumps(payload)),
+        )
+        return True
+
+    def clear_memory(self):
+        """Drop the in-memory tier; the on-disk tier is kept."""
+        self._blocks.clear()
+        self._heights.clear()
+        self._transactions.clear()
+
+    def close(self):
+        """Close the on-disk tier."""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
+
+
+# Default time-to-live (seconds) for slow-changing info methods, keyed by
+# InfoClient method name.
+DEFAULT_RESPONSE_TTLS: Dict[str, float] = {
+    "instruments": 300.0,
+    "supported_collateral": 300.0,
+    "vaults": 60.0,
+    "sub_vaults": 60.0,
+    "user_fee_info": 60.0,
+    "instrument_leverage": 30.0,
+}
+
+# Account state read by info methods; only cached when given a TTL.
+_ORDER_STATE = ("open_orders", "order_history")
+_BALANCE_STATE = ("account_summary", "positions", "vault_balances")
+
+# Exchange actions that change the result of cached info methods.
+# ExchangeClient(response_cache=...) applies these after each successful action.
+INVALIDATED_BY_ACTION: Dict[str, Tuple[str, ...]] = {
+    "updatePerpInstrumentLeverage": ("instrument_leverage", "positions", "account_summary"),
+    "placeOrder": _ORDER_STATE + _BALANCE_STATE,
+    "cancelByOid": _ORDER_STATE + _BALANCE_STATE,
+    "cancelAll": _ORDER_STATE + _BALANCE_STATE,
+    "cancelByCloid": _ORDER_STATE + _BALANCE_STATE,
+    "cancelByInstrument": _ORDER_STATE + _BALANCE_STATE,
+    "accountSpotWithdrawRequest": _BALANCE_STATE,
+    "accountDerivativeWithdrawRequest": _BALANCE_STATE,
+    "accountSpotBalanceTransferRequest": _BALANCE_STATE,
+    "accountDerivativeBalanceTransferRequest": _BALANCE_STATE,
+    "accountInternalBalanceTransferRequest": _BALANCE_STATE,
+    "depositToVault": ("vaults", "sub_vaults") + _BALANCE_STATE,
+    "redeemFromVault": ("vaults", "sub_vaults") + _BALANCE_STATE,
+}
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    fresh_until: float
+    stale_until: float
+    refreshing: bool = False
+
+
+class ResponseCache:
+    """
+    TTL cache with stale-while-revalidate for slow-changing info methods.
+
+    A fresh entry is served directly. Once its TTL has passed, the entry is
+    still served for up to ``stale_ttl`` seconds while a background refresh
+    replaces it; after that the next call fetches synchronously.
+
+    Each invalidation bumps a generation counter for the keys it covers, and
+    a fetch or refresh of such a key started before it is returned to its
+    caller but not stored.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        stale_ttl: float = 60.0,
+        refresh_workers: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize ResponseCache.
+
+        Args:
+            ttls: Per-method TTLs in seconds, merged over DEFAULT_RESPONSE_TTLS.
+                A TTL of 0 (or None) disables caching for that method.
+            max_entries: LRU bound across all methods and parameter sets
+            stale_ttl: Seconds an expired entry may be served while refreshing
+            refresh_workers: Background threads used for revalidation
+            clock: Monotonic clock, injectable for tests
+        """
+        self.ttls = dict(DEFAULT_RESPONSE_TTLS)
+        self.ttls.update(ttls or {})
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries = LRUCache(max_entries)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, CacheStats] = {}
+        self._refresh_workers = refresh_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._invalidation_listeners = []
+        # Bumped by invalidate(): globally for a full clear, per method, or
+        # per key when parameters are given.
+        self._generation = 0
+        self._method_generations: Dict[str, int] = {}
+        self._key_generations: Dict[Tuple[str, str], int] = {}
+
+    def handles(self, method: str) -> bool:
+        """Whether ``method`` is cached."""
+        return bool(self.ttls.get(method))
+
+    @staticmethod
+    def make_key(method: str, params: Any) -> Tuple[str, str]:
+        """Canonical cache key for a method and its parameters."""
+        return method, json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+    def _stat(self, method: str) -> CacheStats:
+        stats = self._stats.get(method)
+        if stats is None:
+            stats = self._stats[method] = CacheStats()
+        return stats
+
+    def _generation_of(self, key: Tuple[str, str]) -> Tuple[int, int, int]:
+        return self._generation, self._method_generations.get(key[0], 0), self._key_generations.get(key, 0)
+
+    def _store(self, key: Tuple[str, str], value: Any, generation: Tuple[int, int, int]) -> bool:
+        now = self._clock()
+        ttl = float(self.ttls.get(key[0]) or 0)
+        with self._lock:
+            if self._generation_of(key) != generation:
+                self._stat(key[0]).discarded += 1
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+                return False
+            self._entries.put(key, _CacheEntry(value, now + ttl, now + ttl + self.stale_ttl))
+            return True
+
+    def _refresh(self, key: Tuple[str, str], fetch: Callable[[], Any], generation: Tuple[int, int, int]):
+        try:
+            value = fetch()
+        except Exception as e:
+            logger.warning("Background refresh of %s failed: %s", key[0], e)
+            with self._lock:
+                self._stat(key[0]).refresh_errors += 1
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+            return
+        if self._store(key, value, generation):
+            with self._lock:
+                self._stat(key[0]).refreshes += 1
+
+    def _schedule_refresh(self, key: Tuple[str, str], fetch: Callable[[], Any], generation: Tuple[int, int, int]):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._refresh_workers, thread_name_prefix="hotstuff-cache"
+            )
+        self._executor.submit(self._refresh, key, fetch, generation)
+
+    def get_or_fetch(self, method: str, params: Any, fetch: Callable[[], Any]) -> Any:
+        """
+        Return a cached response, fetching or revalidating it as needed.
+
+        Args:
+            method: InfoClient method name
+            params: Request parameters (used for the cache key)
+            fetch: Zero-argument callable performing the real request
+
+        Returns:
+            The response
+        """
+        if not self.handles(method):
+            return fetch()
+
+        key = self.make_key(method, params)
+        now = self._clock()
+        with self._lock:
+            stats = self._stat(method)
+            entry = self._entries.get(key)
+            if entry is not None and now < entry.fresh_until:
+                stats.hits += 1
+                return entry.value
+            if entry is not None and now < entry.stale_until:
+                stats.hits += 1
+                stats.stale_hits += 1
+                if not entry.refreshing:
+                    entry.refreshing = True
+                    self._schedule_refresh(key, fetch, self._generation_of(key))
+                return entry.value
+            stats.misses += 1
+            generation = self._generation_of(key)
+
+        value = fetch()
+        self._store(key, value, generation)
+        return value
+
+    # Invalidation
+
+    def add_invalidation_listener(self, listener: Callable[[Optional[str], Any], None]):
+        """Register ``listener(method, params)`` to be called on every invalidation."""
+        self._invalidation_listeners.append(listener)
+
+    def invalidate(self, method: Optional[str] = None, params: Any = None) -> int:
+        """
+        Drop cached responses.
+
+        Args:
+            method: Method to invalidate; None drops everything
+            params: Only drop the entry for these parameters
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if method is None:
+                self._generation += 1
+                self._key_generations.clear()
+            elif params is None:
+                self._method_generations[method] = self._method_generations.get(method, 0) + 1
+                # The method bump already outdates them; keep the dict bounded.
+                for key in [k for k in self._key_generations if k[0] == method]:
+                    del self._key_generations[key]
+            else:
+                key = self.make_key(method, params)
+                self._key_generations[key] = self._key_generations.get(key, 0) + 1
+        if method is not None and params is not None:
+            keys = [self.make_key(method, params)]
+        else:
+            keys = [k for k in self._entries.keys() if method is None or k[0] == method]
+        removed = sum(1 for key in keys if self._entries.pop(key) is not None)
+        for listener in self._invalidation_listeners:
+            listener(method, params)
+        return removed
+
+    def invalidate_for_action(self, action: str) -> int:
+        """
+        Drop cached responses made stale by an exchange action.
+
+        Args:
+            action: Exchange action name (e.g. "updatePerpInstrumentLeverage")
+
+        Returns:
+            Number of entries removed
+        """
+        return sum(
+            self.invalidate(method) for method in INVALIDATED_BY_ACTION.get(action, ()) if self.handles(method)
+        )
+
+    def clear(self):
+        """Drop every cached response."""
+        self.invalidate()
+
+    # Metrics
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """Return a snapshot of hit/miss counters per method."""
+        with self._lock:
+            return {method: CacheStats(**vars(s)) for method, s in self._stats.items()}
+
+    def close(self, wait: bool = True):
+        """
+        Stop background refresh threads.
+
+        Args:
+            wait: Block until in-flight refreshes have finished
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
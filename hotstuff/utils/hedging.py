@@ -0,0 +1,277 @@
+"""Hedged requests for tail-latency reduction on idempotent calls."""
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Read-only endpoints; exchange actions are never duplicated.
+HEDGEABLE_ENDPOINTS = frozenset({"info", "explorer"})
+
+
+@dataclass
+class HedgingStats:
+    """Hedging counters for one endpoint."""
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+    admission_denied: int = 0
+    threshold: float = 0.0
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.requests if self.requests else 0.0
+
+
+class _LatencyWindow:
+    """Recent latencies of one endpoint, used to derive the hedge threshold."""
+
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self._sorted = None
+
+    def add(self, latency: float):
+        self.samples.append(latency)
+        self._sorted = None
+
+    def quantile(self, q: float) -> float:
+        if self._sorted is None:
+            self._sorted = sorted(self.samples)
+        values = self._sorted
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class _ElasticPool:
+    """
+    Runs each task on an idle worker, starting a new worker when none is idle.
+
+    Unlike a fixed-size pool it never queues a task behind busy workers, so
+    it adds no concurrency cap of its own. Idle workers exit after
+    ``idle_timeout`` seconds or on ``shutdown``.
+    """
+
+    def __init__(self, name: str, idle_timeout: float = 30.0):
+        self.name = name
+        self.idle_timeout = idle_timeout
+        self._tasks: "queue.SimpleQueue[Optional[Tuple[Future, Callable[[], Any]]]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0
+        self._shutdown = False
+
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new attempts after shutdown")
+            # Each queued task is matched by one idle or new worker.
+            spawn = self._idle == 0
+            if not spawn:
+                self._idle -= 1
+        self._tasks.put((future, fn))
+        if spawn:
+            threading.Thread(target=self._work, name=self.name, daemon=True).start()
+        return future
+
+    def _work(self):
+        while True:
+            try:
+                task = self._tasks.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self._idle > 0:
+                        self._idle -= 1
+                        return
+                # A submit claimed this worker just as it timed out.
+                continue
+            if task is None:
+                return
+            future, fn = task
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn())
+                except BaseException as e:
+                    future.set_exception(e)
+            with self._lock:
+                if self._shutdown:
+                    return
+                self._idle += 1
+
+    def shutdown(self):
+        with self._lock:
+            self._shutdown = True
+            idle, self._idle = self._idle, 0
+        for _ in range(idle):
+            self._tasks.put(None)
+
+
+class HedgingPolicy:
+    """
+    Sends a duplicate of a slow idempotent request and keeps the first reply.
+
+    The hedge delay adapts to the observed latency quantile (p95 by
+    default) of each endpoint. A token budget bounds the extra load: each
+    request earns ``budget`` tokens (e.g. 0.05 allows hedging up to 5% of
+    requests over time) and each hedge spends one. The slower attempt is
+    left to finish in the background and its result is discarded.
+
+    Primary attempts each get a thread of their own, so hedging never caps
+    the caller's concurrency; only hedges share the ``max_workers`` pool.
+    Latencies are measured from when ``send`` starts running.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        min_delay: float = 0.005,
+        initial_delay: float = 0.05,
+        min_samples: int = 20,
+        window: int = 500,
+        budget: float = 0.05,
+        max_budget: float = 10.0,
+        max_workers: int = 16,
+    ):
+        """
+        Initialize HedgingPolicy.
+
+        Args:
+            quantile: Latency quantile after which a request is hedged
+            min_delay: Lower bound on the hedge delay in seconds
+            initial_delay: Hedge delay used until ``min_samples`` latencies
+                have been observed
+            min_samples: Samples needed before the quantile is trusted
+            window: Number of recent latencies kept per endpoint
+            budget: Hedge tokens earned per request
+            max_budget: Cap on saved tokens, bounding a burst of hedges
+            max_workers: Threads running hedged (duplicate) attempts
+        """
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.budget = budget
+        self.max_budget = max_budget
+        self._tokens = max_budget
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, _LatencyWindow] = {}
+        self._stats: Dict[str, HedgingStats] = {}
+        self._primaries = _ElasticPool("hotstuff-hedge-primary")
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hotstuff-hedge")
+
+    def handles(self, endpoint: str) -> bool:
+        """Whether requests to ``endpoint`` may be hedged."""
+        return endpoint in HEDGEABLE_ENDPOINTS
+
+    def _stat(self, endpoint: str) -> HedgingStats:
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            stats = self._stats[endpoint] = HedgingStats()
+        return stats
+
+    def threshold(self, endpoint: str) -> float:
+        """Current hedge delay for ``endpoint`` in seconds."""
+        with self._lock:
+            return self._threshold(endpoint)
+
+    def _threshold(self, endpoint: str) -> float:
+        latencies = self._latencies.get(endpoint)
+        if latencies is None or len(latencies.samples) < self.min_samples:
+            return max(self.min_delay, self.initial_delay)
+        return max(self.min_delay, latencies.quantile(self.quantile))
+
+    def _record(self, endpoint: str, latency: float):
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = _LatencyWindow(self.window)
+            latencies.add(latency)
+
+    def _timed(self, endpoint: str, send: Callable[[], Any]) -> Any:
+        # Started here rather than at submit, so pool queueing is not
+        # mistaken for server latency. Late losers are recorded too, so the
+        # quantile is not biased low.
+        start = time.monotonic()
+        result = send()
+        self._record(endpoint, time.monotonic() - start)
+        return result
+
+    def call(self, endpoint: str, send: Callable[[], Any], admit: Optional[Callable[[], bool]] = None) -> Any:
+        """
+        Run ``send``, hedging it if it is slower than the current threshold.
+
+        Args:
+            endpoint: Endpoint name, used for latency tracking
+            send: Zero-argument callable performing one request attempt
+            admit: Asked before sending a hedge (e.g. for a rate-limit
+                token); the hedge is skipped when it returns False
+
+        Returns:
+            The first successful response
+        """
+        if not self.handles(endpoint):
+            return send()
+
+        with self._lock:
+            stats = self._stat(endpoint)
+            stats.requests += 1
+            self._tokens = min(self.max_budget, self._tokens + self.budget)
+            delay = stats.threshold = self._threshold(endpoint)
+
+        primary = self._primaries.submit(lambda: self._timed(endpoint, send))
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        with self._lock:
+            allowed = self._tokens >= 1
+            if allowed:
+                self._tokens -= 1
+            else:
+                stats.budget_denied += 1
+        if allowed and admit is not None and not admit():
+            with self._lock:
+                # Hand the budget token back; the hedge was never sent.
+                self._tokens += 1
+                stats.admission_denied += 1
+            allowed = False
+        if not allowed:
+            return primary.result()
+        with self._lock:
+            stats.hedged += 1
+
+        logger.debug("Hedging %s request after %.1f ms", endpoint, delay * 1000)
+        secondary = self._executor.submit(self._timed, endpoint, send)
+        pending = {primary, secondary}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is secondary:
+                        with self._lock:
+                            stats.hedge_wins += 1
+                    return future.result()
+        # Both attempts failed; surface the original request's error.
+        return primary.result()
+
+    # Metrics
+
+    def stats(self) -> Dict[str, HedgingStats]:
+        """Return a snapshot of hedging counters per endpoint."""
+        with self._lock:
+            return {endpoint: HedgingStats(**vars(s)) for endpoint, s in self._stats.items()}
+
+    def close(self, wait: bool = True):
+        """
+        Stop the attempt threads.
+
+        Args:
+            wait: Block until in-flight attempts have finished
+        """
+        self._primaries.shutdown()
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,455 @@
+"""In-process metrics: HDR-style latency histograms and a Prometheus exporter.
+
+Recording is opt-in: clients and transports only record into a registry
+passed as ``metrics=``, so the request path pays nothing otherwise. Pass
+``metrics=default_registry()`` to record into the registry that
+``MetricsServer()`` exposes by default.
+"""
+import logging
+import math
+import threading
+import weakref
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from hotstuff.methods.exchange.op_codes import EXCHANGE_OP_CODES
+
+logger = logging.getLogger(__name__)
+
+# Log-linear bucketing: values below 128 are exact, above that each power
+# of two is split into 64 sub-buckets (<1.6% relative error).
+_SUB_BITS = 7
+_SUB_COUNT = 1 << _SUB_BITS
+_HALF = _SUB_COUNT >> 1
+_MAX_VALUE = (1 << 44) - 1  # ~4.9 hours in nanoseconds
+
+# Prometheus "le" boundaries (seconds) for exported latency histograms.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+_ACTION_NAMES = {str(code): name for name, code in EXCHANGE_OP_CODES.items()}
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_COUNT:
+        return value if value > 0 else 0
+    value = min(value, _MAX_VALUE)
+    shift = value.bit_length() - _SUB_BITS
+    return _SUB_COUNT + (shift - 1) * _HALF + ((value >> shift) - _HALF)
+
+
+def _bucket_lower(index: int) -> int:
+    if index < _SUB_COUNT:
+        return index
+    offset = index - _SUB_COUNT
+    return ((offset % _HALF) + _HALF) << (offset // _HALF + 1)
+
+
+@dataclass
+class HistogramSnapshot:
+    """Merged, point-in-time view of a Histogram (values in nanoseconds)."""
+    counts: Dict[int, int] = field(default_factory=dict)
+    count: int = 0
+    sum: int = 0
+    min: Optional[int] = None
+    max: Optional[int] = None
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> int:
+        """
+        Value at quantile ``q`` (0..1), accurate to the bucket resolution.
+
+        Args:
+            q: Quantile, e.g. 0.99
+
+        Returns:
+            Value in nanoseconds (0 when empty)
+        """
+        if not self.count:
+            return 0
+        rank = max(1, int(round(q * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lower, upper = _bucket_lower(index), _bucket_lower(index + 1)
+                value = (lower + upper - 1) // 2
+                return max(self.min, min(self.max, value))
+        return self.max
+
+    def merge(self, other: Any) -> "HistogramSnapshot":
+        """
+        Add another snapshot's values into this one, e.g. from another process.
+
+        Args:
+            other: HistogramSnapshot (or histogram shard) to add
+
+        Returns:
+            This snapshot
+        """
+        for index, n in list(other.counts.items()):
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.sum += other.sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def cumulative(self, bounds_ns: Sequence[int]) -> List[int]:
+        """Counts of values at or below each bound, for exposition."""
+        result = []
+        ordered = sorted(self.counts.items())
+        seen, i = 0, 0
+        for bound in bounds_ns:
+            while i < len(ordered) and _bucket_lower(ordered[i][0]) <= bound:
+                seen += ordered[i][1]
+                i += 1
+            result.append(seen)
+        return result
+
+
+class _Shard:
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+
+class Histogram:
+    """
+    Latency histogram with log-linear (HDR-style) buckets.
+
+    Each recording thread writes to its own shard, so ``record`` takes no
+    lock; shards are merged when a snapshot is read.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard = _Shard()
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def record(self, value_ns: int):
+        """Record one value in nanoseconds."""
+        shard = getattr(self._local, "shard", None) or self._shard()
+        index = _bucket_index(value_ns)
+        counts = shard.counts
+        counts[index] = counts.get(index, 0) + 1
+        shard.count += 1
+        shard.sum += value_ns
+        if shard.min is None or value_ns < shard.min:
+            shard.min = value_ns
+        if shard.max is None or value_ns > shard.max:
+            shard.max = value_ns
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Merge all shards into a HistogramSnapshot."""
+        merged = HistogramSnapshot()
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            merged.merge(shard)
+        return merged
+
+
+class Counter:
+    """Monotonically increasing count."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class Gauge:
+    """Value that goes up and down, or is read from a callback at scrape time."""
+
+    def __init__(self, fn: Optional[Callable[[], float]] = None):
+        self.fn = fn
+        self._value = 0.0
+
+    def set(self, value: float):
+        self._value = value
+
+    def inc(self, amount: float = 1.0):
+        self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        self._value -= amount
+
+    @property
+    def value(self) -> float:
+        if self.fn is not None:
+            try:
+                return float(self.fn())
+            except Exception as e:
+                logger.debug("Gauge callback failed: %s", e)
+                return float("nan")
+        return self._value
+
+
+class _WeakSum:
+    """Gauge callback summing ``fn(owner)`` over owners that are still alive."""
+
+    def __init__(self, fn: Callable[[Any], float]):
+        self.fn = fn
+        self._owners: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def add(self, owner: Any):
+        with self._lock:
+            self._owners.add(owner)
+
+    def __call__(self) -> float:
+        with self._lock:
+            owners = list(self._owners)
+        return float(sum(self.fn(owner) for owner in owners))
+
+
+@dataclass
+class _Family:
+    kind: str
+    help: str
+    children: Dict[Tuple[Tuple[str, str], ...], Any] = field(default_factory=dict)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(pairs: Sequence[Tuple[str, str]], extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(pairs) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in items) + "}"
+
+
+def _format(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """
+    Named metric families with labelled children.
+
+    ``counter``/``gauge``/``histogram`` return the child for the given
+    labels, creating it on first use; keep the returned object on hot paths
+    to skip the lookup. Histograms record nanoseconds and are exported in
+    seconds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize MetricsRegistry.
+
+        Args:
+            buckets: Exported histogram boundaries in seconds
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._families: Dict[str, _Family] = {}
+
+    def _child(self, kind: str, name: str, help: str, labels: Dict[str, Any], factory: Callable[[], Any]) -> Any:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        family = self._families.get(name)
+        if family is not None:
+            child = family.children.get(key)
+            if child is not None:
+                return child
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = _Family(kind, help)
+            elif family.kind != kind:
+                raise ValueError(f"Metric {name} is already registered as a {family.kind}")
+            child = family.children.get(key)
+            if child is None:
+                child = family.children[key] = factory()
+            return child
+
+    def counter(self, name: str, help: str = "", **labels: Any) -> Counter:
+        """Get or create a counter child."""
+        return self._child("counter", name, help, labels, Counter)
+
+    def gauge(self, name: str, help: str = "", fn: Optional[Callable[[], float]] = None, **labels: Any) -> Gauge:
+        """
+        Get or create a gauge child.
+
+        Args:
+            name: Metric name
+            help: Help text
+            fn: Read the value from this callback at scrape time
+            **labels: Label values
+        """
+        gauge = self._child("gauge", name, help, labels, lambda: Gauge(fn))
+        if fn is not None:
+            gauge.fn = fn
+        return gauge
+
+    def gauge_sum(self, name: str, help: str, owner: Any, fn: Callable[[Any], float], **labels: Any) -> Gauge:
+        """
+        Get or create a gauge reporting ``fn(owner)`` summed over every registered owner.
+
+        Owners are held weakly, so several transports can share a registry
+        without overwriting each other's value or being kept alive by it.
+
+        Args:
+            name: Metric name
+            help: Help text
+            owner: Object contributing to the gauge (e.g. a transport)
+            fn: Reads one owner's value; must not close over ``owner``
+            **labels: Label values
+        """
+        gauge = self._child("gauge", name, help, labels, lambda: Gauge(_WeakSum(fn)))
+        with self._lock:
+            if not isinstance(gauge.fn, _WeakSum):
+                gauge.fn = _WeakSum(fn)
+        gauge.fn.add(owner)
+        return gauge
+
+    def histogram(self, name: str, help: str = "", **labels: Any) -> Histogram:
+        """Get or create a histogram child (values in nanoseconds)."""
+        return self._child("histogram", name, help, labels, Histogram)
+
+    def get(self, name: str, **labels: Any) -> Optional[Any]:
+        """Return an existing child, or None."""
+        family = self._families.get(name)
+        if family is None:
+            return None
+        return family.children.get(tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+    def exposition(self) -> str:
+        """Render every metric in the Prometheus text format (0.0.4)."""
+        bounds_ns = [int(b * 1e9) for b in self.buckets]
+        lines: List[str] = []
+        with self._lock:
+            families = [(name, f.kind, f.help, list(f.children.items())) for name, f in sorted(self._families.items())]
+        for name, kind, help, children in families:
+            if help:
+                lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, child in children:
+                if kind == "histogram":
+                    snap = child.snapshot()
+                    for bound, n in zip(self.buckets, snap.cumulative(bounds_ns)):
+                        lines.append(f"{name}_bucket{_labels(key, ('le', _format(bound)))} {n}")
+                    lines.append(f"{name}_bucket{_labels(key, ('le', '+Inf'))} {snap.count}")
+                    lines.append(f"{name}_sum{_labels(key)} {_format(snap.sum / 1e9)}")
+                    lines.append(f"{name}_count{_labels(key)} {snap.count}")
+                else:
+                    lines.append(f"{name}{_labels(key)} {_format(child.value)}")
+        return "\n".join(lines) + "\n"
+
+
+_default_registry = MetricsRegistry()
+
+
+def default_registry() -> MetricsRegistry:
+    """
+    Process-wide registry exposed by ``MetricsServer()`` by default.
+
+    Nothing records into it unless it is passed as ``metrics=`` to a client
+    or transport.
+    """
+    return _default_registry
+
+
+def record_request(registry: MetricsRegistry, trace: Any):
+    """
+    Record a completed RequestTrace.
+
+    Args:
+        registry: Target registry
+        trace: RequestTrace from a transport
+    """
+    method = trace.name or ""
+    if trace.endpoint == "exchange":
+        method = _ACTION_NAMES.get(method, method)
+    labels = {"transport": trace.transport, "endpoint": trace.endpoint, "method": method}
+    if trace.total_ns is not None:
+        registry.histogram(
+            "hotstuff_request_duration_seconds", "Request latency by endpoint and method", **labels
+        ).record(trace.total_ns)
+    if trace.error is not None:
+        registry.counter(
+            "hotstuff_request_errors_total", "Failed requests by endpoint and method",
+            error=type(trace.error).__name__, **labels
+        ).inc()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.server.registry.exposition().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MetricsServer:
+    """Serves ``/metrics`` for a registry from a background thread."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Start the exporter.
+
+        Args:
+            registry: Registry to expose; defaults to ``default_registry()``,
+                which clients only record into when given it as ``metrics=``
+            host: Bind address
+            port: Bind port; 0 picks a free port (see ``url``)
+        """
+        self._server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        self._server.daemon_threads = True
+        self._server.registry = registry or default_registry()
+        self._thread = threading.Thread(target=self._server.serve_forever, name="hotstuff-metrics", daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def close(self):
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,204 @@
+"""Bulk order construction without per-order dataclass instances."""
+import math
+import numbers
+from decimal import Decimal
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union
+
+from hotstuff.methods.exchange.trading import generate_cloid
+from hotstuff.utils.quantize import Number, RoundingMode, get_quantizer
+
+PriceRounding = Literal["passive", "aggressive", "nearest", "down", "up"]
+
+VALID_SIDES = ("b", "s")
+VALID_TIFS = ("GTC", "IOC", "FOK")
+VALID_POSITION_SIDES = ("LONG", "SHORT", "BOTH")
+
+
+def _numpy_or_none():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _plain(value: Any) -> str:
+    """Exact decimal string for a price or size, never in scientific notation."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, Decimal):
+        return format(value, "f")
+    if isinstance(value, numbers.Integral) and not isinstance(value, bool):
+        return str(value)
+    # Floats (including numpy scalars): shortest round-tripping digits.
+    return format(Decimal(repr(float(value))), "f")
+
+
+def _price_mode(rounding: PriceRounding, side: str) -> RoundingMode:
+    if rounding == "passive":
+        return "down" if side == "b" else "up"
+    if rounding == "aggressive":
+        return "up" if side == "b" else "down"
+    return rounding
+
+
+def _broadcast(value: Any, n: int, name: str) -> List[Any]:
+    if isinstance(value, (str, bytes)) or not hasattr(value, "__len__"):
+        return [value] * n
+    values = value.tolist() if hasattr(value, "tolist") else list(value)
+    if len(values) != n:
+        raise ValueError(f"{name} has {len(values)} entries, expected {n}")
+    return values
+
+
+def _is_float_array(np: Any, values: Any) -> bool:
+    return np is not None and isinstance(values, np.ndarray) and values.dtype.kind in "fiu"
+
+
+def _validate_positive(np: Any, values: Any, name: str):
+    if _is_float_array(np, values):
+        if not np.all(np.isfinite(values)) or not np.all(values > 0):
+            bad = int(np.argmax(~np.isfinite(values) | (values <= 0)))
+            raise ValueError(f"{name}[{bad}] must be a positive finite number")
+        return
+    for i, value in enumerate(values):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{name}[{i}] is not a number: {value!r}")
+        if not math.isfinite(number) or number <= 0:
+            raise ValueError(f"{name}[{i}] must be a positive finite number")
+
+
+def _format_prices(
+    np: Any,
+    prices: Any,
+    sides: List[str],
+    tick_size: Optional[Number],
+    rounding: PriceRounding,
+) -> List[str]:
+    if tick_size is None:
+        return [_plain(p) for p in _broadcast(prices, len(sides), "prices")]
+
+    quantizer = get_quantizer(tick_size)
+    if _is_float_array(np, prices) and rounding in ("passive", "aggressive"):
+        is_bid = np.asarray(sides) == "b"
+        down = quantizer.ticks_array(prices, "down")
+        up = quantizer.ticks_array(prices, "up")
+        ticks = np.where(is_bid == (rounding == "passive"), down, up)
+        return quantizer.format_ticks_array(ticks)
+    if _is_float_array(np, prices):
+        return quantizer.format_array(prices, rounding)
+    return [
+        quantizer.format(price, _price_mode(rounding, side))
+        for price, side in zip(_broadcast(prices, len(sides), "prices"), sides)
+    ]
+
+
+def _format_sizes(np: Any, sizes: Any, n: int, lot_size: Optional[Number]) -> List[str]:
+    if lot_size is None:
+        return [_plain(s) for s in _broadcast(sizes, n, "sizes")]
+    quantizer = get_quantizer(lot_size)
+    if _is_float_array(np, sizes):
+        return quantizer.format_array(sizes, "down")
+    return [quantizer.format(size, "down") for size in _broadcast(sizes, n, "sizes")]
+
+
+def build_orders(
+    instrument_id: int,
+    sides: Union[str, Sequence[str]],
+    prices: Union[Number, Sequence[Number], Any],
+    sizes: Union[Number, Sequence[Number], Any],
+    tif: Literal["GTC", "IOC", "FOK"] = "GTC",
+    po: bool = False,
+    ro: bool = False,
+    position_side: Literal["LONG", "SHORT", "BOTH"] = "BOTH",
+    tick_size: Optional[Number] = None,
+    lot_size: Optional[Number] = None,
+    price_rounding: PriceRounding = "passive",
+    cloids: Optional[Sequence[str]] = None,
+    cloid_prefix: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build wire-ready ``placeOrder`` order dicts from arrays in one call.
+
+    The result is identical to ``[asdict(UnitOrder(...)) for ...]`` for the
+    same inputs and can be passed directly as ``PlaceOrderParams.orders``.
+    Float prices and sizes are validated and quantized in a single
+    vectorized pass when NumPy arrays are given.
+
+    Args:
+        instrument_id: Instrument id shared by every order
+        sides: "b"/"s" per order, or a single side for all orders
+        prices: Prices (floats, Decimals, strings or a NumPy array); a scalar
+            is broadcast
+        sizes: Sizes, same forms as ``prices``
+        tif: Time in force
+        po: Post-only flag
+        ro: Reduce-only flag
+        position_side: Position side
+        tick_size: Snap prices to this tick size; strings are passed through
+            unchanged when omitted
+        lot_size: Snap sizes down to this lot size
+        price_rounding: "passive" (bids down, asks up), "aggressive" (bids up,
+            asks down), "nearest", "down" or "up"
+        cloids: Explicit client order ids, one per order
+        cloid_prefix: Generate ``{prefix}-{i}`` client order ids
+
+    Returns:
+        List of order dicts in wire field order
+
+    Raises:
+        ValueError: If any input is invalid
+    """
+    if instrument_id <= 0:
+        raise ValueError("instrumentId must be greater than 0")
+    if tif not in VALID_TIFS:
+        raise ValueError(f"tif must be one of {VALID_TIFS}, got {tif!r}")
+    if position_side not in VALID_POSITION_SIDES:
+        raise ValueError(f"position_side must be one of {VALID_POSITION_SIDES}, got {position_side!r}")
+
+    np = _numpy_or_none()
+    n = None
+    for value in (sides, prices, sizes):
+        if not isinstance(value, str) and hasattr(value, "__len__"):
+            n = len(value)
+            break
+    if n is None:
+        n = 1
+    side_list = _broadcast(sides, n, "sides")
+    for i, side in enumerate(side_list):
+        if side not in VALID_SIDES:
+            raise ValueError(f"sides[{i}] must be 'b' or 's', got {side!r}")
+
+    _validate_positive(np, prices if _is_float_array(np, prices) else _broadcast(prices, n, "prices"), "prices")
+    _validate_positive(np, sizes if _is_float_array(np, sizes) else _broadcast(sizes, n, "sizes"), "sizes")
+
+    price_strings = _format_prices(np, prices, side_list, tick_size, price_rounding)
+    size_strings = _format_sizes(np, sizes, n, lot_size)
+
+    if cloids is not None:
+        cloid_list = _broadcast(cloids, n, "cloids")
+    elif cloid_prefix is not None:
+        cloid_list = [f"{cloid_prefix}-{i}" for i in range(n)]
+    else:
+        cloid_list = [generate_cloid()] * n
+
+    return [
+        {
+            "instrumentId": instrument_id,
+            "side": side,
+            "positionSide": position_side,
+            "price": price,
+            "size": size,
+            "tif": tif,
+            "ro": ro,
+            "po": po,
+            "cloid": cloid,
+            "triggerPx": "",
+            "isMarket": False,
+            "tpsl": "",
+            "grouping": "",
+        }
+        for side, price, size, cloid in zip(side_list, price_strings, size_strings, cloid_list)
+    ]
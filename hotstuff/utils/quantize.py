@@ -0,0 +1,246 @@
+"""Price/size quantization to instrument tick and lot sizes.
+
+Values are snapped to integer tick counts, which are exact, and only turned
+back into strings at the edge. Floats take a fast path with a small relative
+tolerance so values like ``0.3 / 0.1 == 2.9999999999999996`` still land on the
+intended tick; strings and Decimals go through exact Decimal arithmetic.
+"""
+import math
+from decimal import ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_EVEN, Decimal
+from functools import lru_cache
+from typing import Any, List, Literal, Sequence, Union
+
+RoundingMode = Literal["down", "up", "nearest"]
+Number = Union[int, float, str, Decimal]
+
+_DECIMAL_ROUNDING = {
+    "down": ROUND_FLOOR,
+    "up": ROUND_CEILING,
+    "nearest": ROUND_HALF_EVEN,
+}
+
+# Relative tolerance absorbing binary floating point error in value / step.
+FLOAT_EPSILON = 1e-9
+
+
+def _to_decimal(value: Number) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, float):
+        # repr() gives the shortest string that round-trips, e.g. 0.1 -> "0.1"
+        return Decimal(repr(value))
+    return Decimal(str(value))
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for vectorized quantization; install it with "
+            "`pip install numpy` or `pip install hotstuff-python-sdk[numpy]`"
+        ) from e
+    return numpy
+
+
+def step_decimals(step: Number) -> int:
+    """
+    Number of decimal places needed to represent multiples of ``step``.
+
+    Args:
+        step: Tick or lot size (e.g. 0.5, "0.001")
+
+    Returns:
+        Decimal places (e.g. 0.5 -> 1, 0.001 -> 3, 5 -> 0)
+    """
+    exponent = _to_decimal(step).normalize().as_tuple().exponent
+    return max(0, -int(exponent))
+
+
+class StepQuantizer:
+    """Snaps values to integer multiples of a fixed step (tick size or lot size)."""
+
+    def __init__(self, step: Number):
+        """
+        Initialize StepQuantizer.
+
+        Args:
+            step: Tick or lot size; must be positive
+        """
+        self.step_decimal = _to_decimal(step)
+        if not self.step_decimal.is_finite() or self.step_decimal <= 0:
+            raise ValueError(f"step must be a positive number, got {step!r}")
+        self.step = float(self.step_decimal)
+        self.decimals = step_decimals(self.step_decimal)
+        self._exponent = Decimal(1).scaleb(-self.decimals)
+        # A value of n ticks is exactly n * step_units / scale.
+        self.scale = 10 ** self.decimals
+        self.step_units = int(self.step_decimal * self.scale)
+        self._inv_step = 1.0 / self.step
+
+    def __repr__(self) -> str:
+        return f"StepQuantizer(step={self.step_decimal})"
+
+    # Conversions to ticks
+
+    def ticks_from_float(self, value: float, mode: RoundingMode = "nearest") -> int:
+        """
+        Convert a float to an integer tick count.
+
+        Args:
+            value: Price or size
+            mode: Rounding direction ("down", "up" or "nearest")
+
+        Returns:
+            Integer tick count
+        """
+        steps = value * self._inv_step
+        if mode == "down":
+            return math.floor(steps + abs(steps) * FLOAT_EPSILON)
+        if mode == "up":
+            return math.ceil(steps - abs(steps) * FLOAT_EPSILON)
+        return round(steps)
+
+    def to_steps(self, value: Number, mode: RoundingMode = "nearest") -> int:
+        """
+        Convert a value to an integer number of steps.
+
+        Floats use the fast tolerant path; ints, strings and Decimals are
+        converted exactly.
+
+        Args:
+            value: Price or size
+            mode: Rounding direction ("down", "up" or "nearest")
+
+        Returns:
+            Integer step count
+        """
+        if isinstance(value, float):
+            return self.ticks_from_float(value, mode)
+        steps = _to_decimal(value) / self.step_decimal
+        return int(steps.to_integral_value(rounding=_DECIMAL_ROUNDING[mode]))
+
+    # Conversions from ticks
+
+    def from_steps(self, steps: int) -> Decimal:
+        """Convert an integer step count back to an exact Decimal value."""
+        return (self.step_decimal * int(steps)).quantize(self._exponent)
+
+    def steps_to_float(self, steps: int) -> float:
+        """Convert an integer step count to the closest float."""
+        return steps * self.step_units / self.scale
+
+    def quantize(self, value: Number, mode: RoundingMode = "nearest") -> Decimal:
+        """Round ``value`` to the nearest valid multiple of the step."""
+        return self.from_steps(self.to_steps(value, mode))
+
+    def quantize_float(self, value: float, mode: RoundingMode = "nearest") -> float:
+        """Round a float to the step, returning a float."""
+        return self.steps_to_float(self.ticks_from_float(value, mode))
+
+    # Formatting
+
+    def format_steps(self, steps: int) -> str:
+        """
+        Format an integer step count as the exact wire string.
+
+        Uses integer arithmetic only, e.g. 500001 ticks of 0.1 -> "50000.1".
+        """
+        units = int(steps) * self.step_units
+        if not self.decimals:
+            return str(units)
+        sign = "-" if units < 0 else ""
+        whole, frac = divmod(abs(units), self.scale)
+        return f"{sign}{whole}.{frac:0{self.decimals}d}"
+
+    def format(self, value: Number, mode: RoundingMode = "nearest") -> str:
+        """Round ``value`` to the step and format it as the exact wire string."""
+        return self.format_steps(self.to_steps(value, mode))
+
+    def is_aligned(self, value: Number) -> bool:
+        """Whether ``value`` is already an exact multiple of the step."""
+        try:
+            return (_to_decimal(value) % self.step_decimal) == 0
+        except ArithmeticError:
+            return False
+
+    # Vectorized (NumPy)
+
+    def ticks_array(self, values: Any, mode: RoundingMode = "nearest") -> Any:
+        """
+        Vectorized ``ticks_from_float``.
+
+        Args:
+            values: Array-like of floats
+            mode: Rounding direction ("down", "up" or "nearest")
+
+        Returns:
+            ``numpy.ndarray`` of int64 tick counts
+        """
+        np = _numpy()
+        steps = np.asarray(values, dtype=np.float64) * self._inv_step
+        if mode == "down":
+            steps = np.floor(steps + np.abs(steps) * FLOAT_EPSILON)
+        elif mode == "up":
+            steps = np.ceil(steps - np.abs(steps) * FLOAT_EPSILON)
+        else:
+            steps = np.rint(steps)
+        return steps.astype(np.int64)
+
+    def ticks_to_float_array(self, ticks: Any) -> Any:
+        """Vectorized ``steps_to_float``."""
+        np = _numpy()
+        return np.asarray(ticks, dtype=np.int64) * self.step_units / self.scale
+
+    def format_ticks_array(self, ticks: Any) -> List[str]:
+        """
+        Format an array of tick counts as wire strings.
+
+        The integer/fraction split is vectorized; only the final string join
+        runs per element.
+
+        Args:
+            ticks: Array-like of integer tick counts
+
+        Returns:
+            List of wire strings
+        """
+        np = _numpy()
+        units = np.asarray(ticks, dtype=np.int64) * self.step_units
+        if not self.decimals:
+            return [str(u) for u in units.tolist()]
+        whole, frac = np.divmod(np.abs(units), self.scale)
+        fmt = f"{{}}{{}}.{{:0{self.decimals}d}}"
+        return [
+            fmt.format("-" if neg else "", w, f)
+            for neg, w, f in zip((units < 0).tolist(), whole.tolist(), frac.tolist())
+        ]
+
+    def format_array(self, values: Any, mode: RoundingMode = "nearest") -> List[str]:
+        """Quantize and format an array of floats in one pass."""
+        return self.format_ticks_array(self.ticks_array(values, mode))
+
+    def format_many(self, values: Sequence[Number], mode: RoundingMode = "nearest") -> List[str]:
+        """Scalar fallback for ``format_array`` that does not need NumPy."""
+        return [self.format_steps(self.to_steps(v, mode)) for v in values]
+
+
+@lru_cache(maxsize=1024)
+def _cached_quantizer(step: str) -> StepQuantizer:
+    return StepQuantizer(step)
+
+
+def get_quantizer(step: Number) -> StepQuantizer:
+    """
+    Return a shared StepQuantizer for ``step``.
+
+    Instruments with the same tick or lot size reuse one precomputed
+    quantizer.
+
+    Args:
+        step: Tick or lot size
+
+    Returns:
+        The cached quantizer
+    """
+    return _cached_quantizer(str(_to_decimal(step).normalize()))
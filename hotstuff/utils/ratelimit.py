@@ -0,0 +1,371 @@
+"""Client-side token-bucket rate limiting."""
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from hotstuff.exceptions import HotstuffRateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RateLimit:
+    """Sustained rate (requests per second) and burst size of one bucket."""
+    rate: float
+    burst: float
+
+
+# Buckets keyed by endpoint ("info") or endpoint and weight class ("info:heavy").
+DEFAULT_RATE_LIMITS: Dict[str, RateLimit] = {
+    "info": RateLimit(rate=20, burst=40),
+    "info:heavy": RateLimit(rate=4, burst=8),
+    "exchange": RateLimit(rate=10, burst=20),
+    "explorer": RateLimit(rate=10, burst=20),
+}
+
+# Request kind (info method name or exchange action type) -> weight class.
+DEFAULT_WEIGHT_CLASSES: Dict[str, str] = {
+    "instruments": "heavy",
+    "trades": "heavy",
+    "chart": "heavy",
+    "account_history": "heavy",
+    "order_history": "heavy",
+    "fills": "heavy",
+    "funding_history": "heavy",
+    "transfer_history": "heavy",
+}
+
+# Only these endpoints are retried after a 429; exchange actions are not
+# idempotent and are always surfaced to the caller.
+RETRYABLE_ENDPOINTS = frozenset({"info"})
+
+
+@dataclass
+class RateLimitStats:
+    """Queueing counters for one bucket."""
+    acquired: int = 0
+    queued: int = 0
+    rejected: int = 0
+    rate_limited: int = 0
+    retries: int = 0
+    hedges: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    rate: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+class _Reservation:
+    """A queued caller's slot in one bucket; ``due`` may be pushed back by a 429."""
+    __slots__ = ("due",)
+
+    def __init__(self, due: float):
+        self.due = due
+
+
+class _Bucket:
+    """Token bucket with reservations: tokens may go negative, queuing callers in order."""
+
+    def __init__(self, limit: RateLimit, now: float):
+        self.base_rate = float(limit.rate)
+        self.rate = float(limit.rate)
+        self.burst = float(limit.burst)
+        self.tokens = float(limit.burst)
+        self.updated = now
+        self.blocked_until = 0.0
+        # Reservations of callers still sleeping, re-slotted by block().
+        self.queued: List[_Reservation] = []
+
+    def reserve(self, now: float) -> _Reservation:
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        self.tokens -= 1
+        deficit = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        reservation = _Reservation(max(now, self.updated) + deficit)
+        if reservation.due > now:
+            self.queued.append(reservation)
+        return reservation
+
+    def release(self, reservation: _Reservation):
+        try:
+            self.queued.remove(reservation)
+        except ValueError:
+            pass
+
+    def available(self, now: float) -> bool:
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        return self.tokens >= 1 and now >= self.blocked_until
+
+    def cancel(self, reservation: _Reservation):
+        self.release(reservation)
+        self.tokens += 1
+
+    def block(self, now: float, retry_after: Optional[float], decrease: float, min_rate: float):
+        self.rate = max(min_rate, self.rate * decrease)
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            # Queued callers keep their order but are re-spaced behind the
+            # block at the reduced rate, so they do not all wake together.
+            queued = sorted(self.queued, key=lambda r: r.due)
+            for i, reservation in enumerate(queued, 1):
+                reservation.due = max(reservation.due, self.blocked_until + i / self.rate)
+            # Refill restarts once the block lifts; new callers line up behind.
+            self.tokens = min(self.tokens, -float(len(queued)))
+            self.updated = max(self.updated, self.blocked_until)
+
+    def recover(self, increase: float):
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * increase)
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter shared by every request through an HttpTransport.
+
+    Each request takes one token from its endpoint bucket and, when its
+    kind maps to a weight class with its own limit, one from that bucket
+    too. Callers over the limit are queued (they sleep until their token
+    is due) rather than failed. A 429 blocks the bucket for Retry-After
+    seconds and multiplicatively lowers its rate; successful responses
+    raise it back additively. Info requests that hit a 429 are retried
+    with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, RateLimit]] = None,
+        weight_classes: Optional[Dict[str, str]] = None,
+        max_queue_wait: Optional[float] = None,
+        max_retries: int = 3,
+        backoff: float = 0.25,
+        max_backoff: float = 8.0,
+        decrease: float = 0.5,
+        increase: float = 0.05,
+        min_rate: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize RateLimiter.
+
+        Args:
+            limits: Bucket limits merged over DEFAULT_RATE_LIMITS, keyed by
+                endpoint or ``"<endpoint>:<weight class>"``; a value of None
+                removes that bucket
+            weight_classes: Request kind to weight class, merged over
+                DEFAULT_WEIGHT_CLASSES
+            max_queue_wait: Fail instead of queueing when the wait would
+                exceed this many seconds; None queues indefinitely
+            max_retries: Retries of a rate-limited info request
+            backoff: Base of the exponential retry backoff in seconds
+            max_backoff: Cap on a single backoff delay
+            decrease: Factor applied to a bucket's rate on a 429
+            increase: Fraction of the configured rate restored per success
+            min_rate: Floor for the adapted rate
+            clock: Monotonic clock, injectable for tests
+            sleep: Sleep function, injectable for tests
+        """
+        merged = dict(DEFAULT_RATE_LIMITS)
+        merged.update(limits or {})
+        self.limits = {key: limit for key, limit in merged.items() if limit is not None}
+        self.weight_classes = dict(DEFAULT_WEIGHT_CLASSES)
+        self.weight_classes.update(weight_classes or {})
+        self.max_queue_wait = max_queue_wait
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.decrease = decrease
+        self.increase = increase
+        self.min_rate = min_rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, _Bucket] = {}
+        self._stats: Dict[str, RateLimitStats] = {}
+        self._waiting = 0
+
+    def bucket_keys(self, endpoint: str, kind: Optional[str] = None) -> List[str]:
+        """
+        Return the buckets a request draws from.
+
+        Args:
+            endpoint: "info", "exchange" or "explorer"
+            kind: Info method name or exchange action type
+
+        Returns:
+            Configured bucket keys, endpoint first
+        """
+        keys = [endpoint] if endpoint in self.limits else []
+        weight_class = self.weight_classes.get(kind) if kind is not None else None
+        if weight_class is not None and f"{endpoint}:{weight_class}" in self.limits:
+            keys.append(f"{endpoint}:{weight_class}")
+        return keys
+
+    def _bucket(self, key: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.limits[key], now)
+        return bucket
+
+    def _stat(self, key: str) -> RateLimitStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = RateLimitStats()
+        return stats
+
+    def acquire(self, endpoint: str, kind: Optional[str] = None) -> float:
+        """
+        Block until the request may be sent.
+
+        Args:
+            endpoint: "info", "exchange" or "explorer"
+            kind: Info method name or exchange action type
+
+        Returns:
+            Seconds spent queued
+
+        Raises:
+            HotstuffRateLimitError: If the wait would exceed ``max_queue_wait``
+        """
+        keys = self.bucket_keys(endpoint, kind)
+        if not keys:
+            return 0.0
+        start = self._clock()
+        with self._lock:
+            buckets = [self._bucket(key, start) for key in keys]
+            reservations = [bucket.reserve(start) for bucket in buckets]
+            wait = max(r.due for r in reservations) - start
+            if self.max_queue_wait is not None and wait > self.max_queue_wait:
+                for key, bucket, reservation in zip(keys, buckets, reservations):
+                    bucket.cancel(reservation)
+                    self._stat(key).rejected += 1
+                raise HotstuffRateLimitError(
+                    f"Client-side rate limit queue for {endpoint} is full",
+                    retry_after=math.ceil(wait),
+                )
+            self._waiting += 1
+
+        try:
+            while wait > 0:
+                self._sleep(wait)
+                # A 429 seen meanwhile may have pushed our slot back.
+                now = self._clock()
+                with self._lock:
+                    wait = max(r.due for r in reservations) - now
+        finally:
+            with self._lock:
+                self._waiting -= 1
+                for bucket, reservation in zip(buckets, reservations):
+                    bucket.release(reservation)
+
+        waited = self._clock() - start
+        with self._lock:
+            for key, bucket in zip(keys, buckets):
+                stats = self._stat(key)
+                stats.acquired += 1
+                stats.total_wait += waited
+                if waited > 0:
+                    stats.queued += 1
+                    stats.max_wait = max(stats.max_wait, waited)
+        return waited
+
+    def try_acquire(self, endpoint: str, kind: Optional[str] = None) -> bool:
+        """
+        Take a token only if one is available now, without queueing.
+
+        Used for hedged duplicates, which are optional: when the buckets
+        are empty the duplicate is skipped rather than delayed.
+
+        Args:
+            endpoint: "info", "exchange" or "explorer"
+            kind: Info method name or exchange action type
+
+        Returns:
+            True if a token was taken from every bucket
+        """
+        keys = self.bucket_keys(endpoint, kind)
+        now = self._clock()
+        with self._lock:
+            buckets = [self._bucket(key, now) for key in keys]
+            if not all([bucket.available(now) for bucket in buckets]):
+                return False
+            for key, bucket in zip(keys, buckets):
+                bucket.tokens -= 1
+                self._stat(key).hedges += 1
+        return True
+
+    def on_success(self, endpoint: str, kind: Optional[str] = None):
+        """Record a successful response, letting adapted rates recover."""
+        keys = self.bucket_keys(endpoint, kind)
+        with self._lock:
+            for key in keys:
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.recover(self.increase)
+
+    def on_rate_limited(self, endpoint: str, kind: Optional[str] = None, retry_after: Optional[float] = None):
+        """
+        Record a 429 from the server.
+
+        Args:
+            endpoint: Endpoint that returned the 429
+            kind: Info method name or exchange action type
+            retry_after: Server's Retry-After in seconds, if sent
+        """
+        keys = self.bucket_keys(endpoint, kind)
+        now = self._clock()
+        with self._lock:
+            for key in keys:
+                self._bucket(key, now).block(now, retry_after, self.decrease, self.min_rate)
+                self._stat(key).rate_limited += 1
+        logger.debug("Rate limited on %s (retry after %s), slowing %s", endpoint, retry_after, keys)
+
+    def should_retry(self, endpoint: str, attempt: int) -> bool:
+        """Whether a rate-limited request on ``endpoint`` gets another attempt."""
+        return endpoint in RETRYABLE_ENDPOINTS and attempt < self.max_retries
+
+    def retry_delay(self, endpoint: str, attempt: int, kind: Optional[str] = None) -> float:
+        """
+        Sleep before a retry and return the delay used.
+
+        Uses "full jitter": a uniform delay up to ``backoff * 2**attempt``,
+        so clients that were limited together do not retry together.
+
+        Args:
+            endpoint: Endpoint being retried
+            attempt: Zero-based retry number
+            kind: Info method name or exchange action type
+        """
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+        with self._lock:
+            for key in self.bucket_keys(endpoint, kind):
+                self._stat(key).retries += 1
+        self._sleep(delay)
+        return delay
+
+    # Metrics
+
+    def queue_depth(self) -> int:
+        """Number of callers currently waiting for a token."""
+        with self._lock:
+            return self._waiting
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """Return a snapshot of queueing counters per bucket."""
+        with self._lock:
+            snapshot = {}
+            for key, s in self._stats.items():
+                snapshot[key] = RateLimitStats(**vars(s))
+                bucket = self._buckets.get(key)
+                snapshot[key].rate = bucket.rate if bucket is not None else self.limits[key].rate
+            return snapshot
@@ -0,0 +1,270 @@
+"""Latency-scored routing and failover across redundant endpoints."""
+import logging
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+
+# Endpoints whose requests may be replayed on another host after a
+# connection failure; an exchange action may already have been received.
+FAILOVER_ENDPOINTS = frozenset({"info", "explorer"})
+
+
+@dataclass
+class EndpointHealth:
+    """Routing state of one endpoint URL."""
+    url: str
+    role: str
+    state: str = CLOSED
+    score: Optional[float] = None
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ejections: int = 0
+    retry_at: float = 0.0
+
+    @property
+    def available(self) -> bool:
+        return self.state == CLOSED
+
+
+def tcp_probe(url: str, timeout: float = 2.0) -> None:
+    """
+    Health check that opens (and closes) a TCP connection to the URL's host.
+
+    Args:
+        url: http(s) or ws(s) URL
+        timeout: Connect timeout in seconds
+
+    Raises:
+        OSError: If the host cannot be reached
+    """
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme in ("https", "wss") else 80)
+    socket.create_connection((parsed.hostname, port), timeout=timeout).close()
+
+
+class EndpointRouter:
+    """
+    Routes each request to the healthy endpoint with the lowest latency score.
+
+    Every endpoint keeps an EWMA of observed latencies. After
+    ``failure_threshold`` consecutive failures its circuit opens and it is
+    ejected from routing. A background thread probes ejected endpoints and
+    closes the circuit once a probe succeeds, backing off between failed
+    probes. If every endpoint of a role is ejected, the one due to be
+    probed soonest is still used rather than failing outright.
+    """
+
+    def __init__(
+        self,
+        endpoints: Dict[str, Sequence[str]],
+        alpha: float = 0.2,
+        failure_threshold: int = 3,
+        probe: Callable[[str], None] = tcp_probe,
+        probe_interval: float = 5.0,
+        max_probe_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize EndpointRouter.
+
+        Args:
+            endpoints: URLs per role, e.g. ``{"api": [...], "rpc": [...]}`` for
+                HttpTransport or ``{"ws": [...]}`` for WebSocketTransport
+            alpha: EWMA weight of the newest latency sample
+            failure_threshold: Consecutive failures that open the circuit
+            probe: Health check raising on failure (default: TCP connect)
+            probe_interval: Seconds before the first probe of an ejected endpoint
+            max_probe_interval: Cap on the doubling interval between failed probes
+            clock: Monotonic clock, injectable for tests
+        """
+        if not any(endpoints.values()):
+            raise ValueError("EndpointRouter needs at least one endpoint URL")
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.probe = probe
+        self.probe_interval = probe_interval
+        self.max_probe_interval = max_probe_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._roles: Dict[str, List[EndpointHealth]] = {
+            role: [EndpointHealth(url=url, role=role) for url in urls] for role, urls in endpoints.items()
+        }
+        self._by_url: Dict[str, EndpointHealth] = {h.url: h for hs in self._roles.values() for h in hs}
+        self._backoff: Dict[str, float] = {}
+        self._wake = threading.Event()
+        self._stopped = False
+        self._prober: Optional[threading.Thread] = None
+
+    def roles(self) -> List[str]:
+        """Configured roles."""
+        return list(self._roles)
+
+    def select(self, role: str, exclude: Iterable[str] = ()) -> str:
+        """
+        Pick the endpoint for the next request.
+
+        Unscored endpoints go first so that each gets measured.
+
+        Args:
+            role: Endpoint role ("api", "rpc" or "ws")
+            exclude: URLs to skip (e.g. one that just failed)
+
+        Returns:
+            Endpoint URL
+
+        Raises:
+            KeyError: If no endpoint is configured for ``role``
+        """
+        excluded = set(exclude)
+        with self._lock:
+            entries = self._roles[role]
+            candidates = [h for h in entries if h.url not in excluded] or entries
+            available = [h for h in candidates if h.available]
+            if available:
+                best = min(available, key=lambda h: -1.0 if h.score is None else h.score)
+            else:
+                best = min(candidates, key=lambda h: h.retry_at)
+            return best.url
+
+    def record_success(self, url: str, latency: float):
+        """
+        Feed a successful request's latency into the endpoint's score.
+
+        Args:
+            url: Endpoint URL returned by ``select``
+            latency: Round-trip time in seconds
+        """
+        with self._lock:
+            health = self._by_url.get(url)
+            if health is None:
+                return
+            health.successes += 1
+            health.consecutive_failures = 0
+            health.score = latency if health.score is None else self.alpha * latency + (1 - self.alpha) * health.score
+            if health.state == OPEN:
+                self._close(health)
+
+    def record_failure(self, url: str):
+        """
+        Count a failed request, ejecting the endpoint at the failure threshold.
+
+        Args:
+            url: Endpoint URL returned by ``select``
+        """
+        with self._lock:
+            health = self._by_url.get(url)
+            if health is None:
+                return
+            health.failures += 1
+            health.consecutive_failures += 1
+            if health.state == CLOSED and health.consecutive_failures >= self.failure_threshold:
+                self._open(health)
+
+    def _open(self, health: EndpointHealth):
+        health.state = OPEN
+        health.ejections += 1
+        self._backoff[health.url] = self.probe_interval
+        health.retry_at = self._clock() + self.probe_interval
+        logger.warning("Ejecting endpoint %s after %d consecutive failures", health.url, health.consecutive_failures)
+        self._ensure_prober()
+        self._wake.set()
+
+    def _close(self, health: EndpointHealth):
+        health.state = CLOSED
+        health.consecutive_failures = 0
+        self._backoff.pop(health.url, None)
+        logger.info("Endpoint %s is healthy again", health.url)
+
+    # Health checks
+
+    def check(self, url: str) -> bool:
+        """
+        Probe one endpoint now and update its circuit.
+
+        Args:
+            url: Endpoint URL
+
+        Returns:
+            True if the probe succeeded
+        """
+        start = self._clock()
+        try:
+            self.probe(url)
+        except Exception as e:
+            logger.debug("Probe of %s failed: %s", url, e)
+            with self._lock:
+                health = self._by_url[url]
+                if health.state == OPEN:
+                    backoff = min(self.max_probe_interval, self._backoff.get(url, self.probe_interval) * 2)
+                    self._backoff[url] = backoff
+                    health.retry_at = self._clock() + backoff
+            return False
+        with self._lock:
+            health = self._by_url[url]
+            if health.state == OPEN:
+                self._close(health)
+                # Probe time is a connect time, not a request time; only seed a missing score.
+                if health.score is None:
+                    health.score = self._clock() - start
+        return True
+
+    def check_all(self) -> Dict[str, bool]:
+        """Probe every endpoint now, returning the outcome per URL."""
+        return {url: self.check(url) for url in list(self._by_url)}
+
+    def _ensure_prober(self):
+        if self._prober is None and not self._stopped:
+            self._prober = threading.Thread(target=self._probe_loop, name="hotstuff-endpoint-probe", daemon=True)
+            self._prober.start()
+
+    def _probe_loop(self):
+        while not self._stopped:
+            now = self._clock()
+            with self._lock:
+                ejected = [h for h in self._by_url.values() if h.state == OPEN]
+                due = [h.url for h in ejected if h.retry_at <= now]
+                next_at = min((h.retry_at for h in ejected), default=None)
+            for url in due:
+                self.check(url)
+            if due:
+                continue
+            self._wake.wait(None if next_at is None else max(0.01, next_at - now))
+            self._wake.clear()
+
+    # Metrics
+
+    def health(self, role: Optional[str] = None) -> List[EndpointHealth]:
+        """
+        Return a snapshot of endpoint health.
+
+        Args:
+            role: Only report endpoints of this role
+
+        Returns:
+            EndpointHealth copies, best score first within each role
+        """
+        with self._lock:
+            roles = [role] if role is not None else list(self._roles)
+            return [
+                EndpointHealth(**vars(h))
+                for r in roles
+                for h in sorted(self._roles[r], key=lambda h: float("inf") if h.score is None else h.score)
+            ]
+
+    def close(self):
+        """Stop the background prober."""
+        self._stopped = True
+        self._wake.set()
+        if self._prober is not None:
+            self._prober.join(timeout=1.0)
+            self._prober = None
@@ -23,9 +23,62 @@ def sign_action(
     Returns:
         str: The signature
     """
-    # Encode action to msgpack
-    action_bytes = msgpack.packb(action)
+    return sign_packed_action(wallet, pack_action(action), tx_type, is_testnet)
+
+
+def pack_action(action: dict) -> bytes:
+    """Encode action data to msgpack, the form that is hashed and signed."""
+    return msgpack.packb(action)
+
+
+def sign_packed_action(
+    wallet: Account,
+    action_bytes: bytes,
+    tx_type: int,
+    is_testnet: bool = False
+) -> str:
+    """
+    Sign msgpack-encoded action data using EIP-712.
     
+    Args:
+        wallet: The account to sign with
+        action_bytes: Output of ``pack_action``
+        tx_type: The transaction type code
+        is_testnet: Whether this is for testnet
+        
+    Returns:
+        str: The signature
+    """
+    encoded_data = encode_structured_data(_typed_data(action_bytes, tx_type, is_testnet))
+    signed_message = wallet.sign_message(encoded_data)
+    
+    return signed_message.signature.hex()
+
+
+def recover_signer(
+    action: dict,
+    signature: str,
+    tx_type: int,
+    is_testnet: bool = False
+) -> str:
+    """
+    Recover the address that signed an action, as the exchange does.
+    
+    Args:
+        action: The action data
+        signature: Signature from ``sign_action``
+        tx_type: The transaction type code
+        is_testnet: Whether this is for testnet
+        
+    Returns:
+        str: Checksummed signer address
+    """
+    encoded_data = encode_structured_data(_typed_data(pack_action(action), tx_type, is_testnet))
+    return Account.recover_message(encoded_data, signature=signature)
+
+
+def _typed_data(action_bytes: bytes, tx_type: int, is_testnet: bool) -> dict:
+    """EIP-712 structured data signed for an action."""
     # Hash the payload
     payload_hash = keccak(action_bytes)
     
@@ -59,16 +112,9 @@ def sign_action(
         "txType": tx_type,
     }
     
-    # Create structured data
-    structured_data = {
+    return {
         "types": types,
         "primaryType": "Action",
         "domain": domain,
         "message": message,
     }
-    
-    # Encode and sign
-    encoded_data = encode_structured_data(structured_data)
-    signed_message = wallet.sign_message(encoded_data)
-    
-    return signed_message.signature.hex()
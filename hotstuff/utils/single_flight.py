@@ -0,0 +1,135 @@
+"""Single-flight coalescing of identical concurrent requests."""
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from hotstuff.utils.cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SingleFlightStats:
+    """Coalescing counters."""
+    requests: int = 0
+    coalesced: int = 0
+    errors: int = 0
+
+    @property
+    def sent(self) -> int:
+        return self.requests - self.coalesced
+
+    @property
+    def coalesce_rate(self) -> float:
+        return self.coalesced / self.requests if self.requests else 0.0
+
+
+class _Call:
+    __slots__ = ("done", "value", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces identical requests that are in flight at the same time.
+
+    The first caller for a key (method plus canonicalized params) performs
+    the fetch; callers arriving before it completes wait and receive the
+    same result, or the same exception. Nothing is kept once the fetch
+    returns, so this never serves stale data. Callers share the response
+    object and must not mutate it.
+    """
+
+    def __init__(self, methods: Optional[Iterable[str]] = None):
+        """
+        Initialize SingleFlight.
+
+        Args:
+            methods: InfoClient method names to coalesce; None coalesces all
+        """
+        self.methods = frozenset(methods) if methods is not None else None
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats: Dict[str, SingleFlightStats] = {}
+
+    def handles(self, method: str) -> bool:
+        """Whether requests for ``method`` are coalesced."""
+        return self.methods is None or method in self.methods
+
+    def _stat(self, method: str) -> SingleFlightStats:
+        stats = self._stats.get(method)
+        if stats is None:
+            stats = self._stats[method] = SingleFlightStats()
+        return stats
+
+    def do(self, method: str, params: Any, fetch: Callable[[], Any]) -> Any:
+        """
+        Run ``fetch`` once for all concurrent callers with the same key.
+
+        Args:
+            method: InfoClient method name
+            params: Request parameters (used for the key)
+            fetch: Zero-argument callable performing the real request
+
+        Returns:
+            The response
+        """
+        if not self.handles(method):
+            return fetch()
+
+        key = ResponseCache.make_key(method, params)
+        with self._lock:
+            stats = self._stat(method)
+            stats.requests += 1
+            call = self._calls.get(key)
+            if call is not None:
+                stats.coalesced += 1
+                call.waiters += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fetch()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                stats.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+                if call.waiters:
+                    logger.debug("Coalesced %d duplicate %s request(s)", call.waiters, method)
+            call.done.set()
+        return call.value
+
+    # Metrics
+
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, SingleFlightStats]:
+        """Return a snapshot of coalescing counters per method."""
+        with self._lock:
+            return {method: SingleFlightStats(**vars(s)) for method, s in self._stats.items()}
+
+    def reset_stats(self):
+        """Zero every counter."""
+        with self._lock:
+            self._stats.clear()
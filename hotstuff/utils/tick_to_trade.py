@@ -0,0 +1,186 @@
+"""Tick-to-trade tracing: from WebSocket frame receipt to order acknowledgement."""
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence
+
+from hotstuff.utils.metrics import Histogram, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# Hops in the order they happen. ``recv`` (exchange timestamp -> frame
+# receipt) is only known when the event carries a millisecond timestamp and
+# is subject to clock skew; the others are measured on one monotonic clock.
+HOPS = ("recv", "decode", "dispatch", "strategy", "sign", "send", "ack")
+
+_local = threading.local()
+
+
+def current_trigger() -> Optional[Any]:
+    """The event whose handling is in progress on this thread, if any."""
+    return getattr(_local, "trigger", None)
+
+
+def set_trigger(event: Optional[Any]) -> Optional[Any]:
+    """
+    Make ``event`` the current trigger on this thread.
+
+    Args:
+        event: SubscriptionData being handled, or None to clear
+
+    Returns:
+        The previous trigger, to restore afterwards
+    """
+    previous = getattr(_local, "trigger", None)
+    _local.trigger = event
+    return previous
+
+
+@contextmanager
+def triggered_by(event: Any) -> Iterator[Any]:
+    """
+    Attribute actions sent inside the block to ``event``.
+
+    The WebSocket transport does this automatically while a subscription
+    callback runs; use it when the strategy hands events to another thread.
+
+    Args:
+        event: SubscriptionData that triggered the actions
+    """
+    previous = set_trigger(event)
+    try:
+        yield event
+    finally:
+        set_trigger(previous)
+
+
+def _event_time_ms(data: Any) -> Optional[int]:
+    """Exchange-side millisecond timestamp carried by a notification, if any."""
+    if isinstance(data, dict):
+        for key in ("timestamp", "time"):
+            value = data.get(key)
+            if isinstance(value, int) and value > 0:
+                return value
+    return None
+
+
+@dataclass
+class TickToTradeSample:
+    """Per-hop latency of one triggering event and the action it caused, in nanoseconds."""
+    channel: str
+    action: str
+    hops: Dict[str, int] = field(default_factory=dict)
+    total_ns: Optional[int] = None
+
+
+class TickToTradeTracer:
+    """
+    Link WebSocket events to the exchange actions sent while handling them.
+
+    Pass the tracer to ``ExchangeClient(tick_to_trade=...)``; every action
+    sent from a subscription callback (or inside ``triggered_by``) records
+    one sample with a histogram per hop in ``HOPS`` plus ``total``, from
+    frame receipt to acknowledgement.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, keep: int = 1024):
+        """
+        Initialize the tracer.
+
+        Args:
+            registry: Export the hop histograms as
+                ``hotstuff_tick_to_trade_seconds{hop=...}``
+            keep: Number of recent samples retained in ``samples``
+        """
+        self.registry = registry
+        if registry is not None:
+            self.histograms: Dict[str, Histogram] = {
+                hop: registry.histogram(
+                    "hotstuff_tick_to_trade_seconds", "Tick-to-trade latency by hop", hop=hop
+                )
+                for hop in HOPS + ("total",)
+            }
+        else:
+            self.histograms = {hop: Histogram() for hop in HOPS + ("total",)}
+        self.samples: Deque[TickToTradeSample] = deque(maxlen=keep)
+
+    def record(
+        self,
+        event: Any,
+        action: str,
+        start_ns: int,
+        signed_ns: int,
+        sent_ns: int = 0,
+        acked_ns: int = 0
+    ) -> TickToTradeSample:
+        """
+        Record the hops between ``event`` and one action it triggered.
+
+        Args:
+            event: Triggering SubscriptionData (with ``recv_ns`` etc. stamped)
+            action: Exchange action name
+            start_ns: When the SDK started building the action
+            signed_ns: When signing finished
+            sent_ns: When the request was written (0 if never sent)
+            acked_ns: When the response arrived (0 if none)
+
+        Returns:
+            The recorded sample
+        """
+        recv_ns = getattr(event, "recv_ns", 0)
+        decoded_ns = getattr(event, "decoded_ns", 0)
+        dispatched_ns = getattr(event, "dispatched_ns", 0)
+        hops: Dict[str, int] = {}
+        event_ms = _event_time_ms(getattr(event, "data", None))
+        if recv_ns and event_ms is not None:
+            wall_recv_ns = recv_ns + time.time_ns() - time.monotonic_ns()
+            if wall_recv_ns >= event_ms * 1_000_000:
+                hops["recv"] = wall_recv_ns - event_ms * 1_000_000
+        if recv_ns and decoded_ns:
+            hops["decode"] = decoded_ns - recv_ns
+        if decoded_ns and dispatched_ns:
+            hops["dispatch"] = dispatched_ns - decoded_ns
+        if dispatched_ns:
+            hops["strategy"] = max(0, start_ns - dispatched_ns)
+        hops["sign"] = signed_ns - start_ns
+        if sent_ns:
+            hops["send"] = sent_ns - signed_ns
+            if acked_ns:
+                hops["ack"] = acked_ns - sent_ns
+        sample = TickToTradeSample(channel=getattr(event, "channel", ""), action=action, hops=hops)
+        if acked_ns and recv_ns:
+            sample.total_ns = acked_ns - recv_ns
+            self.histograms["total"].record(sample.total_ns)
+        for hop, value in hops.items():
+            self.histograms[hop].record(value)
+        self.samples.append(sample)
+        return sample
+
+    def summary(self, quantiles: Sequence[float] = (0.5, 0.99)) -> Dict[str, Dict[str, int]]:
+        """
+        Latency quantiles per hop.
+
+        Args:
+            quantiles: Quantiles to report, e.g. (0.5, 0.99)
+
+        Returns:
+            ``{hop: {"count": n, "p50": ns, ...}}`` for hops with samples
+        """
+        result: Dict[str, Dict[str, int]] = {}
+        for hop, histogram in self.histograms.items():
+            snap = histogram.snapshot()
+            if not snap.count:
+                continue
+            row = {"count": snap.count}
+            for q in quantiles:
+                row[f"p{q * 100:g}"] = snap.percentile(q)
+            result[hop] = row
+        return result
+
+    def recent(self, n: Optional[int] = None) -> List[TickToTradeSample]:
+        """The last ``n`` samples (all retained samples by default)."""
+        samples = list(self.samples)
+        return samples if n is None else samples[-n:]
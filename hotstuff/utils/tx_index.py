@@ -0,0 +1,299 @@
+"""Local explorer transaction index."""
+import threading
+from array import array
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from hotstuff.methods.exchange.op_codes import EXCHANGE_OP_CODES, EXCHANGE_OP_NAMES
+from hotstuff.methods.info.explorer import TransactionDetailsResponse
+
+
+def tx_type_name(tx_type: int) -> Optional[str]:
+    """
+    Decode a numeric ``tx_type`` to its exchange action name.
+
+    Args:
+        tx_type: Transaction type code (e.g. 1301)
+
+    Returns:
+        The action name (e.g. "placeOrder"), or None for unknown codes
+    """
+    return EXCHANGE_OP_NAMES.get(int(tx_type))
+
+
+def _resolve_tx_type(tx_type: Union[int, str]) -> int:
+    if isinstance(tx_type, str) and not tx_type.isdigit():
+        if tx_type not in EXCHANGE_OP_CODES:
+            raise ValueError(f"Unknown tx_type: {tx_type}")
+        return EXCHANGE_OP_CODES[tx_type]
+    return int(tx_type)
+
+
+class TransactionIndex:
+    """
+    In-memory index of explorer transactions by account and ``tx_type``.
+
+    Rows live in a column store of compact ``array`` buffers; each account and
+    each ``tx_type`` keeps a posting list of row ids. When rows arrive in
+    height order (as they do from ``BlockCrawler``), height-range queries
+    binary-search the posting list instead of scanning it.
+    """
+
+    def __init__(self):
+        """Initialize an empty TransactionIndex."""
+        self._lock = threading.Lock()
+        # Column store
+        self._heights = array("q")
+        self._timestamps = array("q")
+        self._created_at = array("q")
+        self._tx_types = array("l")
+        self._success = array("b")
+        self._account_ids = array("l")
+        self._block_hash_ids = array("l")
+        self._tx_hashes: List[str] = []
+        # Interned strings
+        self._accounts: List[str] = []
+        self._account_lookup: Dict[str, int] = {}
+        self._block_hashes: List[str] = []
+        self._block_hash_lookup: Dict[str, int] = {}
+        # Posting lists
+        self._by_account: Dict[int, array] = {}
+        self._by_type: Dict[int, array] = {}
+        self._by_hash: Dict[str, int] = {}
+        self._height_ordered = True
+
+    def __len__(self) -> int:
+        return len(self._tx_hashes)
+
+    def __contains__(self, tx_hash: str) -> bool:
+        return tx_hash in self._by_hash
+
+    @staticmethod
+    def _intern(value: str, values: List[str], lookup: Dict[str, int]) -> int:
+        idx = lookup.get(value)
+        if idx is None:
+            idx = len(values)
+            values.append(value)
+            lookup[value] = idx
+        return idx
+
+    # Ingestion
+
+    def add(self, tx: Any) -> bool:
+        """
+        Add a single transaction.
+
+        Args:
+            tx: BlockTransaction/TransactionDetailsResponse or an equivalent dict
+
+        Returns:
+            False if the transaction was already indexed or is incomplete
+        """
+        if is_dataclass(tx):
+            tx = asdict(tx)
+        if not isinstance(tx, dict) or not tx.get("tx_hash") or tx.get("tx_type") is None:
+            return False
+
+        with self._lock:
+            tx_hash = tx["tx_hash"]
+            if tx_hash in self._by_hash:
+                return False
+
+            row = len(self._tx_hashes)
+            height = int(tx.get("block_height") or 0)
+            if self._heights and height < self._heights[-1]:
+                self._height_ordered = False
+
+            account_id = self._intern(str(tx.get("account") or "").lower(), self._accounts, self._account_lookup)
+            block_hash_id = self._intern(str(tx.get("block_hash") or ""), self._block_hashes, self._block_hash_lookup)
+            tx_type = int(tx["tx_type"])
+
+            self._tx_hashes.append(tx_hash)
+            self._heights.append(height)
+            self._timestamps.append(int(tx.get("timestamp") or 0))
+            self._created_at.append(int(tx.get("created_at") or 0))
+            self._tx_types.append(tx_type)
+            self._success.append(1 if tx.get("success") else 0)
+            self._account_ids.append(account_id)
+            self._block_hash_ids.append(block_hash_id)
+
+            self._by_hash[tx_hash] = row
+            self._by_account.setdefault(account_id, array("l")).append(row)
+            self._by_type.setdefault(tx_type, array("l")).append(row)
+            return True
+
+    def add_block(self, block: Any) -> int:
+        """
+        Index every transaction in a block.
+
+        Args:
+            block: BlockDetailsResponse or raw ``block_details`` payload
+
+        Returns:
+            Number of newly indexed transactions
+        """
+        transactions = block.get("transactions") if isinstance(block, dict) else getattr(block, "transactions", None)
+        return sum(1 for tx in transactions or [] if self.add(tx))
+
+    def add_blocks(self, blocks: Iterable[Any]) -> int:
+        """Index every transaction from an iterable of blocks (e.g. ``BlockCrawler.crawl()``)."""
+        return sum(self.add_block(block) for block in blocks)
+
+    def listener(self) -> Callable[[Any], None]:
+        """
+        Build a ``SubscriptionClient.transactions`` listener feeding this index.
+
+        Returns:
+            Callback accepting SubscriptionData (or the raw notification data)
+        """
+        def _listener(event: Any) -> None:
+            data = getattr(event, "data", event)
+            if isinstance(data, dict) and "transactions" in data:
+                self.add_block(data)
+                return
+            for tx in data if isinstance(data, list) else [data]:
+                self.add(tx)
+
+        return _listener
+
+    # Queries
+
+    def _row(self, row: int) -> TransactionDetailsResponse:
+        return TransactionDetailsResponse(
+            tx_hash=self._tx_hashes[row],
+            account=self._accounts[self._account_ids[row]],
+            block_height=self._heights[row],
+            block_hash=self._block_hashes[self._block_hash_ids[row]],
+            tx_type=self._tx_types[row],
+            success=bool(self._success[row]),
+            timestamp=self._timestamps[row],
+            created_at=self._created_at[row],
+        )
+
+    def _lower_bound(self, rows: Any, height: int) -> int:
+        lo, hi = 0, len(rows)
+        heights = self._heights
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if heights[rows[mid]] < height:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _select(
+        self,
+        account: Optional[str],
+        tx_type: Optional[Union[int, str]],
+        start_height: Optional[int],
+        end_height: Optional[int],
+        success: Optional[bool],
+    ) -> List[int]:
+        candidates = []
+        account_id = None
+        type_code = None
+        if account is not None:
+            account_id = self._account_lookup.get(account.lower())
+            if account_id is None:
+                return []
+            candidates.append(self._by_account.get(account_id, array("l")))
+        if tx_type is not None:
+            type_code = _resolve_tx_type(tx_type)
+            candidates.append(self._by_type.get(type_code, array("l")))
+        if not candidates:
+            candidates.append(range(len(self._tx_hashes)))
+
+        # Walk the shortest posting list and check the other predicates per row.
+        rows = min(candidates, key=len)
+        lo, hi = 0, len(rows)
+        if self._height_ordered:
+            if start_height is not None:
+                lo = self._lower_bound(rows, start_height)
+            if end_height is not None:
+                hi = self._lower_bound(rows, end_height + 1)
+            start_height = end_height = None
+
+        selected = []
+        for i in range(lo, hi):
+            row = rows[i]
+            if account_id is not None and self._account_ids[row] != account_id:
+                continue
+            if type_code is not None and self._tx_types[row] != type_code:
+                continue
+            height = self._heights[row]
+            if start_height is not None and height < start_height:
+                continue
+            if end_height is not None and height > end_height:
+                continue
+            if success is not None and bool(self._success[row]) != success:
+                continue
+            selected.append(row)
+        return selected
+
+    def query(
+        self,
+        account: Optional[str] = None,
+        tx_type: Optional[Union[int, str]] = None,
+        start_height: Optional[int] = None,
+        end_height: Optional[int] = None,
+        success: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> List[TransactionDetailsResponse]:
+        """
+        Query indexed transactions.
+
+        Args:
+            account: Account address (case-insensitive)
+            tx_type: Numeric code (1301) or action name ("placeOrder")
+            start_height: Inclusive lower block height
+            end_height: Inclusive upper block height
+            success: Only successful (True) or failed (False) transactions
+            limit: Maximum number of results
+
+        Returns:
+            Matching transactions in insertion order
+        """
+        with self._lock:
+            rows = self._select(account, tx_type, start_height, end_height, success)
+            if limit is not None:
+                rows = rows[:limit]
+            return [self._row(row) for row in rows]
+
+    def count(
+        self,
+        account: Optional[str] = None,
+        tx_type: Optional[Union[int, str]] = None,
+        start_height: Optional[int] = None,
+        end_height: Optional[int] = None,
+        success: Optional[bool] = None,
+    ) -> int:
+        """Count indexed transactions matching the same filters as ``query``."""
+        with self._lock:
+            return len(self._select(account, tx_type, start_height, end_height, success))
+
+    def get(self, tx_hash: str) -> Optional[TransactionDetailsResponse]:
+        """Return a transaction by hash, or None if it is not indexed."""
+        with self._lock:
+            row = self._by_hash.get(tx_hash)
+            return self._row(row) if row is not None else None
+
+    def tx_type_counts(self, account: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count transactions per action name.
+
+        Args:
+            account: Optional account to restrict the breakdown to
+
+        Returns:
+            Mapping of action name (or the numeric code for unknown types) to count
+        """
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for code, rows in self._by_type.items():
+                if account is not None:
+                    n = len(self._select(account, code, None, None, None))
+                else:
+                    n = len(rows)
+                if n:
+                    counts[tx_type_name(code) or str(code)] = n
+            return counts
@@ -0,0 +1,110 @@
+"""Unit tests for the ExchangeClient per-action timing breakdown."""
+import time
+import timeit
+
+import pytest
+from eth_account import Account
+
+from hotstuff import ActionTiming, ExchangeClient, HttpTransportOptions, PlaceOrderParams, UnitOrder
+from hotstuff.apis import exchange
+from hotstuff.methods.exchange.op_codes import EXCHANGE_OP_CODES
+from hotstuff.transports import HttpTransport
+
+
+def _order_params(expires_in_ms=10_000):
+    return PlaceOrderParams(
+        orders=[UnitOrder(instrumentId=1, side="b", positionSide="BOTH", price="100", size="1", tif="GTC",
+                          ro=False, po=False, cloid="c1", triggerPx=None, isMarket=False, tpsl="", grouping="")],
+        expiresAfter=int(time.time() * 1000) + expires_in_ms,
+    )
+
+
+def _client(http_server, **kwargs):
+    client = ExchangeClient(wallet=Account.create(), **kwargs)
+    base = f"http://127.0.0.1:{http_server.server_address[1]}/"
+    client.transport = HttpTransport(HttpTransportOptions(server={"mainnet": {"api": base}}))
+    return client
+
+
+def test_breakdown_is_attached_to_the_response(http_server):
+    """Every stage from conversion to parsing is timed."""
+    client = _client(http_server, timing=True)
+    try:
+        response = client.place_order(_order_params())
+    finally:
+        client.transport.close()
+
+    timing = response["timing"]
+    assert response["ok"] is True
+    assert timing["action"] == "placeOrder"
+    for stage in ("convert_ns", "pack_ns", "sign_ns", "encode_ns", "network_ns", "parse_ns", "total_ns"):
+        assert timing[stage] is not None and timing[stage] >= 0, stage
+    parts = sum(timing[s] for s in ("convert_ns", "pack_ns", "sign_ns", "encode_ns", "network_ns", "parse_ns"))
+    assert parts <= timing["total_ns"]
+    assert 9_000 < timing["expiry_margin_ms"] <= 10_000
+    assert client.last_timing.to_dict() == timing
+
+
+def test_sink_receives_timing_even_on_failure():
+    """A failed send still reports the local stages to the sink."""
+    timings = []
+    client = ExchangeClient(wallet=Account.create(), timing_sink=timings.append)
+    client.transport = HttpTransport(HttpTransportOptions(server={"mainnet": {"api": "http://127.0.0.1:1/"}}))
+
+    with pytest.raises(Exception):
+        client.place_order(_order_params())
+
+    assert isinstance(timings[0], ActionTiming)
+    assert timings[0].sign_ns is not None
+    assert timings[0].network_ns is None
+    assert timings[0].total_ns is not None
+
+
+def test_unexecuted_actions_have_no_network_stages():
+    """Signing-only calls stop the breakdown after signing."""
+    client = ExchangeClient(wallet=Account.create(), timing=True)
+
+    result = client._execute_action(
+        {"action": "placeOrder", "params": {"orders": [], "expiresAfter": 0}}, execute=False
+    )
+
+    assert "signature" in result
+    assert client.last_timing.pack_ns is not None
+    assert client.last_timing.sent_at_ms is None
+
+
+def test_timing_bookkeeping_is_cheap():
+    """Stamping adds microseconds at most; disabled, it is a single attribute check."""
+    client = ExchangeClient(wallet=Account.create())
+    params = _order_params()
+    untimed = min(timeit.repeat(lambda: client._to_api_dict(params, exclude={"nonce"}), number=2000, repeat=5))
+    client.timing = True
+    timed = min(timeit.repeat(lambda: client._to_api_dict(params, exclude={"nonce"}), number=2000, repeat=5))
+
+    assert client.last_timing is None
+    assert (timed - untimed) / 2000 < 5e-6  # generous bound for noisy CI
+    assert untimed > 0
+
+
+def test_disabled_timing_adds_no_per_action_work(monkeypatch):
+    """With timing off, _execute_action costs under a microsecond over the bare path."""
+    monkeypatch.setattr(exchange, "sign_action", lambda wallet, action, tx_type, is_testnet: "0x")
+    client = ExchangeClient(wallet=Account.create())
+    request = {"action": "placeOrder", "params": {"orders": [], "expiresAfter": 0, "nonce": 1}}
+
+    def _bare(request):
+        params = request["params"]
+        if "nonce" not in params or params["nonce"] is None:
+            params["nonce"] = client.nonce()
+        signature = exchange.sign_action(
+            wallet=client.wallet, action=params, tx_type=EXCHANGE_OP_CODES[request["action"]],
+            is_testnet=client.transport.is_testnet,
+        )
+        return {"params": params, "signature": signature}
+
+    bare = min(timeit.repeat(lambda: _bare(request), number=20_000, repeat=5))
+    disabled = min(timeit.repeat(lambda: client._execute_action(request, execute=False), number=20_000, repeat=5))
+
+    assert not hasattr(client._timing_local, "convert")
+    assert client.last_timing is None
+    assert (disabled - bare) / 20_000 < 1e-6
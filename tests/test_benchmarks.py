@@ -0,0 +1,39 @@
+"""Unit tests for the benchmark suite runner."""
+import json
+
+from benchmarks.__main__ import compare, discover, main
+
+
+def test_discover_lists_bench_modules():
+    """Every bench_* module is found, without the prefix."""
+    names = discover()
+    assert {"signing", "websocket", "nonce", "transport", "requote"} <= set(names)
+    assert "_harness" not in names
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    """Cases are matched by name and compared on their primary metric."""
+    baseline = [{"name": "a", "min_ns": 100}, {"name": "b", "p50_ns": 1000}, {"name": "gone", "min_ns": 1}]
+    current = [{"name": "a", "min_ns": 125}, {"name": "b", "p50_ns": 900}, {"name": "new", "min_ns": 5}]
+
+    rows = {row["name"]: row for row in compare(baseline, current, threshold=0.2)}
+
+    assert set(rows) == {"a", "b"}
+    assert rows["a"]["regression"] and rows["a"]["ratio"] == 1.25
+    assert not rows["b"]["regression"] and rows["b"]["metric"] == "p50_ns"
+
+
+def test_main_writes_json_and_fails_on_regression(tmp_path):
+    """A run writes a comparable JSON document; a slower case exits non-zero."""
+    output = tmp_path / "run.json"
+    assert main(["--only", "nonce", "--output", str(output), "--quiet"]) == 0
+
+    document = json.loads(output.read_text())
+    assert "python" in document["environment"]
+    assert {r["module"] for r in document["results"]} == {"nonce"}
+
+    for result in document["results"]:
+        result["min_ns"] /= 100
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(document))
+    assert main(["--only", "nonce", "--compare", str(baseline), "--quiet"]) == 1
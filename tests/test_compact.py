@@ -0,0 +1,159 @@
+"""Unit tests for slotted and columnar model types."""
+from array import array
+from dataclasses import asdict, fields
+
+import pytest
+
+from hotstuff.methods.compact import (
+    FillColumns,
+    SlottedFill,
+    SlottedUnitOrder,
+    TradeColumns,
+    compact_fills,
+    compact_order_history,
+    slotted,
+)
+from hotstuff.methods.exchange.trading import UnitOrder
+from hotstuff.methods.info.account import Fill
+
+
+def _fill(i, **overrides):
+    payload = {
+        "instrument_id": 1,
+        "instrument": "BTC-PERP",
+        "account": "0xabc",
+        "order_id": 100 + i,
+        "trade_id": 200 + i,
+        "side": "b" if i % 2 else "s",
+        "position_side": "BOTH",
+        "price": "50000.5",
+        "size": "0.01",
+        "tx_hash": f"0x{i:064x}",
+        "liquidation_info": {"ignored": True},
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_slotted_variant_keeps_fields_defaults_and_methods():
+    """Slotted copies have no __dict__ but behave like the original dataclass."""
+    order = SlottedUnitOrder(
+        instrumentId=1, side="b", positionSide="BOTH", price="1", size="2", tif="GTC", ro=False, po=False, cloid="x"
+    )
+    regular = UnitOrder(
+        instrumentId=1, side="b", positionSide="BOTH", price="1", size="2", tif="GTC", ro=False, po=False, cloid="x"
+    )
+
+    assert not hasattr(order, "__dict__")
+    assert [f.name for f in fields(order)] == [f.name for f in fields(regular)]
+    assert asdict(order) == asdict(regular) == order.to_api_dict()
+    assert order.triggerPx == "" and order.isMarket is False
+    with pytest.raises(ValueError):
+        SlottedUnitOrder(instrumentId=0, side="b", positionSide="BOTH", price="1", size="2", tif="GTC", ro=False, po=False)
+    with pytest.raises(AttributeError):
+        order.extra = 1
+    with pytest.raises(TypeError):
+        slotted(dict)
+
+
+def test_columns_round_trip_rows():
+    """Rows read back from columns equal the dataclasses built from the same payloads."""
+    payloads = [_fill(i) for i in range(5)]
+    columns = FillColumns(payloads)
+
+    assert len(columns) == 5
+    assert columns[1].side == "b" and columns[-1].order_id == 104
+    assert [asdict(row) for row in columns] == [
+        asdict(Fill(**{k: v for k, v in p.items() if k != "liquidation_info"})) for p in payloads
+    ]
+    assert isinstance(columns[0], SlottedFill)
+    assert [row.trade_id for row in columns[1:3]] == [201, 202]
+    with pytest.raises(IndexError):
+        columns[5]
+
+
+def test_columns_storage_is_compact():
+    """Ints pack into arrays, repeated strings are shared and all-None columns are free."""
+    columns = FillColumns(_fill(i, price=str(50000 + i % 2)) for i in range(10))
+
+    assert isinstance(columns.column("order_id"), array)
+    assert isinstance(columns.column("fee_token_id"), list) and columns._columns["fee_token_id"] is None
+    prices = columns.column("price")
+    assert prices[0] is prices[2]
+
+    # A later None in a packed column falls back to a generic list.
+    columns.append(_fill(10, order_id=None))
+    assert columns.column("order_id")[-1] is None
+    assert columns[3].order_id == 103
+
+
+def test_compact_responses_keep_pagination():
+    """Response builders keep pagination fields and accept list or dict payloads."""
+    response = compact_fills({"data": [_fill(0), _fill(1)], "page": 2, "has_next": True})
+
+    assert isinstance(response.entries, FillColumns)
+    assert response.page == 2 and response.has_next is True
+    assert response.entries[1].trade_id == 201
+
+    history = compact_order_history([{"order_id": 1, "state": "filled"}])
+    assert history.orders[0].state == "filled" and history.page is None
+
+    trades = TradeColumns([
+        {"instrument_id": 1, "instrument": "BTC-PERP", "trade_id": 9, "tx_hash": "0x1", "side": "b",
+         "price": "1", "size": "2", "maker": "0xm", "taker": "0xt", "timestamp": "1"},
+    ])
+    assert trades.to_dicts()[0]["maker"] == "0xm"
+
+
+def test_to_numpy_parses_decimal_columns():
+    """Decimal strings become float64 or int64 ticks; packed ints are zero-copy views."""
+    np = pytest.importorskip("numpy")
+    columns = FillColumns([
+        _fill(0, price="50000.5", fee=None, block_timestamp="1700000000000"),
+        _fill(1, price="50001", fee="0.25", block_timestamp="1700000000001"),
+    ])
+
+    arrays = columns.to_numpy(["price", "fee", "order_id", "block_timestamp", "side"])
+    assert arrays["price"].dtype == np.float64 and arrays["price"].tolist() == [50000.5, 50001.0]
+    assert np.isnan(arrays["fee"][0]) and arrays["fee"][1] == 0.25
+    assert arrays["block_timestamp"].dtype == np.int64 and arrays["block_timestamp"][1] == 1700000000001
+    assert arrays["side"].tolist() == ["s", "b"]
+    assert np.shares_memory(arrays["order_id"], columns.to_numpy(["order_id"])["order_id"])
+
+    ticks = columns.to_numpy(["price"], tick_sizes={"price": 0.5})["price"]
+    assert ticks.dtype == np.int64 and ticks.tolist() == [100001, 100002]
+    with pytest.raises(ValueError):
+        columns.to_numpy(["fee"], tick_sizes={"fee": 0.01})
+    with pytest.raises(KeyError):
+        columns.to_numpy(["nope"])
+
+
+def test_as_columns_and_chart_orderbook_adapters():
+    """as_columns returns views without copying; chart and orderbook payloads gain adapters."""
+    from hotstuff.methods.compact import compact_chart, compact_orderbook
+
+    columns = FillColumns([_fill(0), _fill(1)])
+    views = columns.as_columns()
+    assert views["order_id"].tolist() == [100, 101] and views["order_id"].readonly
+    assert views["price"] is columns.column("price")
+
+    chart = compact_chart({"data": [{"open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10, "time": 7}]})
+    assert chart[0].close == 1.5 and chart.as_columns()["time"].tolist() == [7]
+
+    book = compact_orderbook({"bids": [["100", "1"], {"price": "99.5", "size": "2"}], "asks": [], "timestamp": 1})
+    assert book.bids[1].price == "99.5" and len(book.asks) == 0
+    np = pytest.importorskip("numpy")
+    assert book.bids.to_numpy()["size"].tolist() == [1.0, 2.0]
+
+
+def test_to_arrow_builds_typed_table():
+    """Arrow export casts decimal and integer strings in Arrow and keeps numeric columns."""
+    pa = pytest.importorskip("pyarrow")
+    columns = FillColumns([_fill(0, block_timestamp="5"), _fill(1, price="1.5", block_timestamp="6")])
+
+    table = columns.to_arrow(["price", "order_id", "block_timestamp"], tick_sizes=None)
+    assert table.schema.field("price").type == pa.float64()
+    assert table.column("price").to_pylist() == [50000.5, 1.5]
+    assert table.column("order_id").to_pylist() == [100, 101]
+    assert table.column("block_timestamp").type == pa.int64()
+    assert columns.to_arrow(["price"], tick_sizes={"price": 0.5}).column("price").to_pylist() == [100001, 3]
@@ -0,0 +1,140 @@
+"""Unit tests for the explorer block crawler."""
+import random
+import threading
+import time
+
+import pytest
+
+from hotstuff import BlockCrawler
+from hotstuff.exceptions import HotstuffAPIError, HotstuffRateLimitError
+
+
+def _block(height):
+    return {
+        "block_height": height,
+        "block_hash": f"0x{height:064x}",
+        "parent_hash": f"0x{height - 1:064x}",
+        "change_log_hash": "0x0",
+        "timestamp": height,
+        "tx_count": 1,
+        "created_at": height,
+        "transactions": [
+            {
+                "tx_hash": f"0xtx{height}",
+                "account": "0xabc",
+                "block_height": height,
+                "block_hash": f"0x{height:064x}",
+                "tx_type": 1301,
+                "success": True,
+                "timestamp": height,
+                "created_at": height,
+                "new_server_field": "ignored",
+            }
+        ],
+    }
+
+
+class _StubInfo:
+    """Stub InfoClient answering blocks/block_details with jittered latency."""
+
+    def __init__(self, head, fail_once=()):
+        self.head = head
+        self.fail_once = set(fail_once)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def blocks(self, params, signal=None):
+        return {"data": [{"block_height": self.head}]}
+
+    def block_details(self, params, signal=None):
+        height = params.block_height
+        with self._lock:
+            self.calls.append(height)
+            if height in self.fail_once:
+                self.fail_once.discard(height)
+                raise HotstuffRateLimitError(retry_after=None)
+        time.sleep(random.uniform(0, 0.003))
+        return _block(height)
+
+
+class _StubSubscriptions:
+    def __init__(self):
+        self.listener = None
+        self.unsubscribed = False
+
+    def blocks(self, params, listener):
+        self.listener = listener
+        return {"unsubscribe": self._unsubscribe}
+
+    def _unsubscribe(self):
+        self.unsubscribed = True
+
+
+def test_crawl_yields_blocks_in_strict_height_order():
+    """Concurrent fetches must still come out ordered and complete."""
+    info = _StubInfo(head=60, fail_once={5, 17})
+    crawler = BlockCrawler(info, concurrency=8, retry_delay=0)
+
+    heights = [block.block_height for block in crawler.crawl(start_height=1)]
+
+    assert heights == list(range(1, 61))
+    first = next(iter(BlockCrawler(info).fetch_range(3, 3)))
+    assert first.transactions[0].tx_type == 1301
+
+
+def test_crawl_resumes_from_checkpoint(tmp_path):
+    """A restarted crawler continues after the last checkpointed height."""
+    checkpoint = str(tmp_path / "crawler.json")
+    info = _StubInfo(head=30)
+
+    crawler = BlockCrawler(info, checkpoint_path=checkpoint, checkpoint_every=5)
+    for block in crawler.crawl(start_height=1):
+        if block.block_height == 12:
+            break
+
+    resumed = BlockCrawler(info, checkpoint_path=checkpoint)
+    heights = [block.block_height for block in resumed.crawl(start_height=1)]
+
+    # Block 12 was handed out but not acknowledged, so it is delivered again.
+    assert heights == list(range(12, 31))
+    assert resumed.load_checkpoint() == 30
+
+
+def test_rate_limit_shrinks_concurrency_window():
+    """Retryable failures halve the adaptive window."""
+    info = _StubInfo(head=4, fail_once={1})
+    crawler = BlockCrawler(info, concurrency=16, max_concurrency=16, retry_delay=0)
+
+    list(crawler.fetch_range(1, 1))
+
+    assert crawler.concurrency < 16
+
+
+def test_follow_switches_to_live_blocks_without_gaps():
+    """Live mode backfills skipped heights between notifications."""
+    info = _StubInfo(head=5)
+    subs = _StubSubscriptions()
+    stop = threading.Event()
+    crawler = BlockCrawler(info)
+
+    seen = []
+    for block in crawler.follow(subs, start_height=1, stop=stop, poll_interval=0.01):
+        seen.append(block.block_height)
+        if block.block_height == 5:
+            # Head jumps by three blocks, but only one notification arrives.
+            info.head = 8
+            subs.listener(type("Event", (), {"data": {"block_height": 8}})())
+        if block.block_height == 8:
+            stop.set()
+
+    assert seen == list(range(1, 9))
+    assert subs.unsubscribed is True
+
+
+def test_head_height_requires_height_in_response():
+    """An unexpected blocks payload is reported, not silently treated as 0."""
+    info = _StubInfo(head=1)
+    info.blocks = lambda params, signal=None: {"data": []}
+
+    with pytest.raises(HotstuffAPIError):
+        BlockCrawler(info).head_height()
@@ -0,0 +1,117 @@
+"""Unit tests for typed InfoClient responses."""
+from dataclasses import asdict
+
+from hotstuff import (
+    BlockDetailsParams,
+    ExplorerCache,
+    FillsParams,
+    InfoClient,
+    InstrumentRegistry,
+    OrderbookParams,
+    OrderbookResponse,
+    Ticker,
+    TickerParams,
+)
+from hotstuff.methods.decode import decode, decode_response
+from hotstuff.methods.info.account import AccountInfoResponse, Fill, UserFeeInfoResponse
+from hotstuff.methods.info.market import OrderbookLevel
+
+USER = "0x" + "ab" * 20
+
+
+class _Transport:
+    def __init__(self, responses):
+        self.responses = responses
+
+    def request(self, endpoint, payload, signal=None):
+        return self.responses[payload["method"]]
+
+
+def _client(responses, **kwargs):
+    client = InfoClient(typed=True, **kwargs)
+    client.transport = _Transport(responses)
+    return client
+
+
+ORDERBOOK = {
+    "bids": [{"price": "100", "size": "1"}, ["99.5", "2"]],
+    "asks": [{"price": "100.5", "size": "3", "extra": 1}],
+    "instrument_name": "BTC-PERP",
+    "timestamp": 1,
+    "sequence_number": 7,
+}
+
+
+def test_typed_mode_decodes_into_models():
+    """Responses become the method dataclasses; unknown keys are ignored and missing ones default."""
+    client = _client({
+        "ticker": {"data": {"symbol": "BTC-PERP", "best_bid_price": "100", "new_field": 1}},
+        "fills": {"data": [{"trade_id": 1, "price": "100"}], "page": 2},
+    })
+
+    ticker = client.ticker(TickerParams(symbol="BTC-PERP"))
+    assert isinstance(ticker, Ticker)
+    assert ticker.best_bid_price == "100" and ticker.funding_rate is None
+
+    fills = client.fills(FillsParams(user=USER))
+    assert fills.page == 2
+    assert fills.entries == [Fill(**{**{f: None for f in Fill.__dataclass_fields__}, "trade_id": 1, "price": "100"})]
+
+
+def test_nested_lists_decode_on_first_access():
+    """Scalar reads leave nested levels raw; the first read of a level list decodes and caches it."""
+    book = _client({"orderbook": ORDERBOOK}).orderbook(OrderbookParams(symbol="BTC-PERP"))
+
+    assert isinstance(book, OrderbookResponse)
+    assert book.sequence_number == 7
+    assert "bids" not in vars(book)
+
+    bids = book.bids
+    assert bids == [OrderbookLevel("100", "1"), OrderbookLevel("99.5", "2")]
+    assert book.bids is bids
+    assert asdict(book)["asks"] == [{"price": "100.5", "size": "3"}]
+
+
+def test_raw_mode_is_unchanged():
+    """Without typed=True the raw payload is returned as is."""
+    client = InfoClient()
+    client.transport = _Transport({"orderbook": ORDERBOOK})
+
+    assert client.orderbook(OrderbookParams(symbol="BTC-PERP")) is ORDERBOOK
+    assert decode_response("blocks", [1, 2]) == [1, 2]
+    assert decode(OrderbookLevel, "not a record") == "not a record"
+
+
+def test_typed_mode_works_with_caches_and_registry():
+    """Explorer cache hits are decoded too, and the registry accepts typed instruments."""
+    block = {
+        "block_height": 5, "block_hash": "0xb", "parent_hash": "0xp", "change_log_hash": "0xc",
+        "timestamp": 1, "tx_count": 0, "created_at": 1, "transactions": [],
+    }
+    perp = {
+        "id": 1, "name": "BTC-PERP", "price_index": "BTC", "lot_size": 0.001, "tick_size": 0.5,
+        "settlement_currency": 1, "only_isolated": False, "max_leverage": 50, "delisted": False,
+        "min_notional_usd": 10, "margin_tiers": [], "listed_at_block_timestamp": 1,
+    }
+    client = _client({"block": block, "instruments": {"perps": [perp], "spot": []}}, explorer_cache=ExplorerCache())
+
+    first = client.block_details(BlockDetailsParams(block_hash="0xb"))
+    cached = client.block_details(BlockDetailsParams(block_hash="0xb"))
+    assert first.block_height == cached.block_height == 5
+
+    registry = InstrumentRegistry(client).load(use_snapshot=False)
+    assert registry.get("BTC-PERP").tick_size == 0.5
+
+
+def test_field_names_containing_sentinel_text_decode():
+    """Keys such as ``margin_mode`` decode to the same values as the constructor gives."""
+    info = {
+        "address": USER, "role": 1, "margin_mode": "cross", "multi_asset_mode": True, "hedge_mode": False,
+        "referrer": "", "referral_codes": ["a"], "referral_timestamp": 2, "created_at_block_timestamp": 3,
+    }
+    fees = {f: 0.5 for f in UserFeeInfoResponse.__dataclass_fields__ if f.endswith("_fee_rate")}
+    fees["account"] = USER
+    for cls, payload in ((AccountInfoResponse, info), (UserFeeInfoResponse, fees)):
+        decoded = decode(cls, payload)
+        expected = cls(**payload)
+        assert {f: getattr(decoded, f) for f in cls.__dataclass_fields__} == asdict(expected)
@@ -0,0 +1,99 @@
+"""Unit tests for the explorer block/transaction cache."""
+from hotstuff import BlockDetailsParams, ExplorerCache, InfoClient, TransactionDetailsParams
+
+
+BLOCK = {
+    "block_height": 162778,
+    "block_hash": "0xblock",
+    "parent_hash": "0xparent",
+    "change_log_hash": "0xlog",
+    "timestamp": 1700000000,
+    "tx_count": 1,
+    "created_at": 1700000000,
+    "transactions": [
+        {
+            "tx_hash": "0xtx",
+            "account": "0xabc",
+            "block_height": 162778,
+            "block_hash": "0xblock",
+            "tx_type": 1301,
+            "success": True,
+            "timestamp": 1700000000,
+            "created_at": 1700000000,
+        }
+    ],
+}
+
+
+class _CountingTransport:
+    """Stub transport counting explorer requests."""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.requests = []
+
+    def request(self, endpoint, payload, signal=None):
+        self.requests.append((endpoint, payload))
+        return self.payload
+
+
+def _client(payload, cache):
+    client = InfoClient(explorer_cache=cache)
+    client.transport = _CountingTransport(payload)
+    return client
+
+
+def test_height_and_hash_lookups_share_one_entry():
+    """A block fetched by height is served by hash (and vice versa) from cache."""
+    cache = ExplorerCache(max_entries=16)
+    client = _client(BLOCK, cache)
+
+    first = client.block_details(BlockDetailsParams(block_height=162778))
+    by_hash = client.block_details(BlockDetailsParams(block_hash="0xblock"))
+    by_height = client.block_details(BlockDetailsParams(block_height=162778))
+
+    assert first == by_hash == by_height == BLOCK
+    assert len(client.transport.requests) == 1
+    stats = cache.stats()["blocks"]
+    assert (stats.hits, stats.misses) == (2, 1)
+    assert abs(stats.hit_rate - 2 / 3) < 1e-9
+
+
+def test_block_transactions_are_indexed_by_tx_hash():
+    """Transactions embedded in a cached block answer transaction_details."""
+    cache = ExplorerCache()
+    client = _client(BLOCK, cache)
+    client.block_details(BlockDetailsParams(block_hash="0xblock"))
+
+    tx = client.transaction_details(TransactionDetailsParams(tx_hash="0xtx"))
+
+    assert tx["tx_type"] == 1301
+    assert len(client.transport.requests) == 1
+
+
+def test_disk_tier_survives_memory_eviction_and_restart(tmp_path):
+    """Entries evicted from the LRU, or from a previous process, come back from SQLite."""
+    path = str(tmp_path / "explorer.sqlite")
+    cache = ExplorerCache(max_entries=1, path=path)
+    cache.put_block(BLOCK)
+    cache.put_block(dict(BLOCK, block_height=1, block_hash="0xother", transactions=[]))
+    cache.close()
+
+    reopened = ExplorerCache(max_entries=1, path=path)
+    client = _client({"unexpected": True}, reopened)
+
+    assert client.block_details(BlockDetailsParams(block_height=162778)) == BLOCK
+    assert client.transport.requests == []
+    assert reopened.stats()["blocks"].disk_hits == 1
+
+
+def test_incomplete_payloads_are_not_cached():
+    """Errors and partial records are passed through but never stored."""
+    cache = ExplorerCache()
+    client = _client({"type": "pending"}, cache)
+
+    client.block_details(BlockDetailsParams(block_height=5))
+    client.block_details(BlockDetailsParams(block_height=5))
+
+    assert len(client.transport.requests) == 2
+    assert cache.get_block(block_height=5) is None
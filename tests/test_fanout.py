@@ -0,0 +1,101 @@
+"""Unit tests for InfoClient.fan_out."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from hotstuff import AccountSummaryParams, InfoClient
+from hotstuff.exceptions import HotstuffAPIError, HotstuffRateLimitError
+from hotstuff.transports import HttpTransport
+
+USERS = ["0x" + f"{i:040x}" for i in range(1, 13)]
+
+
+class _Transport:
+    """Stub transport tracking concurrency, failing and rate limiting selected users."""
+
+    def __init__(self, fail=(), rate_limit_once=()):
+        self.fail = {u.lower() for u in fail}
+        self.rate_limit_once = {u.lower() for u in rate_limit_once}
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+
+    def request(self, endpoint, payload, signal=None):
+        user = payload["params"]["user"].lower()
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(0.01)
+            if user in self.rate_limit_once:
+                self.rate_limit_once.discard(user)
+                raise HotstuffRateLimitError(retry_after=0)
+            if user in self.fail:
+                raise HotstuffAPIError("boom")
+            return {"user": user}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def _client(transport):
+    client = InfoClient()
+    client.transport = transport
+    return client
+
+
+def test_fan_out_streams_results_and_isolates_errors():
+    """Every request yields a result; failures carry the error without aborting the batch."""
+    transport = _Transport(fail=[USERS[3]])
+    params = [AccountSummaryParams(user=u) for u in USERS]
+
+    results = list(_client(transport).fan_out("account_summary", params, concurrency=4))
+
+    assert sorted(r.index for r in results) == list(range(len(USERS)))
+    failed = [r for r in results if not r.ok]
+    assert [r.index for r in failed] == [3] and isinstance(failed[0].error, HotstuffAPIError)
+    assert all(r.result == {"user": r.params.user.lower()} for r in results if r.ok)
+    assert 1 < transport.max_active <= 4
+
+
+def test_fan_out_retries_rate_limited_requests():
+    """A 429 is retried after Retry-After instead of surfacing as an error."""
+    transport = _Transport(rate_limit_once=[USERS[0]])
+    params = [AccountSummaryParams(user=u) for u in USERS[:3]]
+
+    results = {r.index: r for r in _client(transport).fan_out("account_summary", params, backoff=0.01)}
+
+    assert all(r.ok for r in results.values())
+    assert results[0].attempts == 2 and transport.calls == 4
+
+
+def test_fan_out_async():
+    """The async variant yields the same results without blocking the loop."""
+    transport = _Transport(fail=[USERS[1]])
+    params = [AccountSummaryParams(user=u) for u in USERS[:6]]
+    client = _client(transport)
+
+    async def _collect():
+        return [r async for r in client.fan_out_async("account_summary", params, concurrency=3)]
+
+    results = asyncio.run(_collect())
+    assert sorted(r.index for r in results) == list(range(6))
+    assert [r.index for r in results if not r.ok] == [1]
+    assert transport.max_active <= 3
+
+
+def test_fan_out_rejects_unknown_methods_and_grows_pool():
+    """Method names are validated and the HTTP pool is sized for the concurrency."""
+    client = InfoClient()
+    with pytest.raises(ValueError):
+        client.fan_out("_request", [])
+    with pytest.raises(ValueError):
+        client.fan_out("no_such_method", [])
+
+    assert isinstance(client.transport, HttpTransport)
+    list(client.fan_out("account_summary", [], concurrency=32))
+    assert client.transport.pool_size == 32
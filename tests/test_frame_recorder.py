@@ -0,0 +1,143 @@
+"""Unit tests for the WebSocket frame recorder."""
+import json
+import os
+import queue
+import threading
+import time
+
+import pytest
+
+from hotstuff import FrameRecorder, WebSocketTransport, WebSocketTransportOptions, read_frames
+
+
+class _FrameSocket:
+    """Fake socket yielding queued frames."""
+    connected = True
+
+    def __init__(self):
+        self.frames = queue.Queue()
+
+    def recv(self):
+        try:
+            return self.frames.get(timeout=0.05)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.connected = False
+
+
+@pytest.mark.parametrize("compression", ["zlib", "none"])
+def test_round_trip_preserves_frames_and_timestamps(tmp_path, compression):
+    """Text and binary frames come back in order with their receive stamps."""
+    frames = [(1_000 + i, json.dumps({"i": i})) for i in range(100)] + [(5_000, b"\x00\xffbinary")]
+    with FrameRecorder(str(tmp_path), compression=compression, chunk_frames=16, flush_interval=0.01) as recorder:
+        for recv_ns, frame in frames:
+            recorder.record(frame, recv_ns)
+    stats = recorder.stats()
+    assert (stats.recorded, stats.written, stats.dropped) == (101, 101, 0)
+    assert stats.chunks == 7 and stats.files == 1
+
+    recorded = list(read_frames(str(tmp_path)))
+    assert [(f.recv_ns, f.data) for f in recorded] == frames
+    assert all(f.wall_ns > f.recv_ns for f in recorded)
+
+
+def test_rotates_by_size_and_by_age(tmp_path):
+    """A full file or an old file is closed and a new one started."""
+    by_size = FrameRecorder(str(tmp_path / "size"), max_bytes=100, chunk_frames=1, flush_interval=0.01)
+    for i in range(5):
+        by_size.record(os.urandom(100), i)
+    by_size.close()
+    assert len(by_size.files) == 5
+    assert [f.recv_ns for f in read_frames(str(tmp_path / "size"))] == list(range(5))
+
+    by_age = FrameRecorder(str(tmp_path / "age"), max_age=0.02, flush_interval=0.01)
+    by_age.record("a", 1)
+    assert by_age.flush()
+    time.sleep(0.05)
+    by_age.record("b", 2)
+    by_age.close()
+    assert len(by_age.files) == 2
+    assert [f.data for f in read_frames(str(tmp_path / "age"))] == ["a", "b"]
+
+
+def test_truncated_tail_is_skipped(tmp_path):
+    """A chunk cut short by a crash ends the read without an error."""
+    with FrameRecorder(str(tmp_path), chunk_frames=2, flush_interval=0.01) as recorder:
+        for i in range(4):
+            recorder.record(f"frame{i}", i)
+    path = recorder.files[0]
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 3)
+    assert [f.data for f in read_frames(path)] == ["frame0", "frame1"]
+
+
+def test_record_never_blocks_and_counts_drops(tmp_path):
+    """With the writer behind, the oldest frames are dropped instead of waiting."""
+    recorder = FrameRecorder(str(tmp_path), max_pending=10, flush_interval=60.0)
+    try:
+        frame = "x" * 200
+        start = time.perf_counter()
+        for i in range(20_000):
+            recorder.record(frame, i)
+        per_frame = (time.perf_counter() - start) / 20_000
+        # Well under a microsecond in practice; the bound leaves room for slow CI.
+        assert per_frame < 5e-6
+        assert recorder.stats().dropped == 20_000 - 10
+    finally:
+        recorder.close()
+    assert [f.recv_ns for f in read_frames(str(tmp_path))] == list(range(19_990, 20_000))
+
+
+def test_rejects_unknown_compression(tmp_path):
+    with pytest.raises(ValueError, match="compression"):
+        FrameRecorder(str(tmp_path), compression="lz4")
+
+
+def test_transport_records_received_frames(tmp_path):
+    """Every frame the receive loop reads is captured, even unparseable ones."""
+    recorder = FrameRecorder(str(tmp_path), flush_interval=0.01)
+    transport = WebSocketTransport(WebSocketTransportOptions(auto_connect=False, recorder=recorder))
+    transport.ws = _FrameSocket()
+    transport._running = True
+    receiver = threading.Thread(target=transport._receive_messages, daemon=True)
+    receiver.start()
+    sent = [
+        json.dumps({"jsonrpc": "2.0", "method": "subscription", "params": {"channel": "bbo@BTC-PERP", "data": {}}}),
+        "not json",
+    ]
+    before = time.monotonic_ns()
+    try:
+        for frame in sent:
+            transport.ws.frames.put(frame)
+        for _ in range(200):
+            if recorder.stats().recorded == len(sent):
+                break
+            time.sleep(0.01)
+    finally:
+        transport._running = False
+        receiver.join(1.0)
+        recorder.close()
+
+    recorded = list(read_frames(str(tmp_path)))
+    assert [f.data for f in recorded] == sent
+    assert all(f.recv_ns >= before for f in recorded)
+
+
+def test_recorders_sharing_a_directory_keep_separate_files(tmp_path):
+    """Two recorders with the same prefix, started in the same second, never share a file."""
+    first = FrameRecorder(str(tmp_path), flush_interval=0.01)
+    second = FrameRecorder(str(tmp_path), flush_interval=0.01)
+    # Force the same per-recorder token to exercise the collision retry.
+    second._token = first._token
+    for i in range(50):
+        first.record(f"a{i}", i)
+        second.record(f"b{i}", i)
+    first.close()
+    second.close()
+
+    assert len(set(first.files + second.files)) == 2
+    assert [f.data for f in read_frames(first.files[0])] == [f"a{i}" for i in range(50)]
+    assert [f.data for f in read_frames(second.files[0])] == [f"b{i}" for i in range(50)]
+    assert len(list(read_frames(str(tmp_path)))) == 100
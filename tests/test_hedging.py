@@ -0,0 +1,158 @@
+"""Unit tests for hedged info/explorer requests."""
+import threading
+import time
+
+import pytest
+
+from hotstuff import HedgingPolicy, HttpTransportOptions, RateLimit, RateLimiter
+from hotstuff.transports import HttpTransport
+
+
+class _Attempts:
+    """Send function whose n-th attempt sleeps for delays[n]."""
+
+    def __init__(self, *delays, errors=()):
+        self.delays = list(delays)
+        self.errors = set(errors)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            n = self.count
+            self.count += 1
+        time.sleep(self.delays[n])
+        if n in self.errors:
+            raise RuntimeError(f"attempt {n} failed")
+        return n
+
+
+@pytest.fixture
+def policy():
+    policy = HedgingPolicy(initial_delay=0.02, min_delay=0.001)
+    yield policy
+    policy.close(wait=False)
+
+
+def test_fast_requests_are_not_hedged(policy):
+    """A reply within the threshold never triggers a duplicate."""
+    send = _Attempts(0.0)
+
+    assert policy.call("info", send) == 0
+    assert send.count == 1
+    assert policy.stats()["info"].hedged == 0
+
+
+def test_slow_request_is_hedged_and_first_reply_wins(policy):
+    """After the threshold a duplicate is sent and the faster reply returned."""
+    send = _Attempts(0.5, 0.0)
+
+    start = time.monotonic()
+    assert policy.call("info", send) == 1
+    assert time.monotonic() - start < 0.3
+    stats = policy.stats()["info"]
+    assert (stats.hedged, stats.hedge_wins) == (1, 1)
+
+
+def test_failed_attempt_falls_back_to_the_other(policy):
+    """A fast failure of the hedge does not hide the primary's success."""
+    send = _Attempts(0.06, 0.0, errors={1})
+
+    assert policy.call("info", send) == 0
+    assert policy.stats()["info"].hedge_wins == 0
+
+
+def test_budget_caps_extra_load():
+    """Once the token budget is spent, slow requests are not hedged."""
+    policy = HedgingPolicy(initial_delay=0.005, min_delay=0.001, budget=0.0, max_budget=1.0)
+    try:
+        for _ in range(3):
+            policy.call("info", _Attempts(0.02, 0.02))
+        stats = policy.stats()["info"]
+        assert (stats.hedged, stats.budget_denied) == (1, 2)
+    finally:
+        policy.close(wait=False)
+
+
+def test_threshold_adapts_to_observed_quantile():
+    """The hedge delay tracks the configured latency quantile."""
+    policy = HedgingPolicy(min_samples=10, min_delay=0.0001, quantile=0.9)
+    try:
+        for latency in [0.001] * 9 + [0.1]:
+            policy._record("info", latency)
+        assert policy.threshold("info") == pytest.approx(0.1)
+        assert policy.threshold("explorer") == policy.initial_delay
+    finally:
+        policy.close(wait=False)
+
+
+def test_transport_never_hedges_exchange_actions(policy):
+    """Only info and explorer requests go through the policy."""
+    transport = HttpTransport(HttpTransportOptions(hedging=policy))
+    calls = []
+
+    def _send(endpoint, payload, method="POST"):
+        calls.append(endpoint)
+        time.sleep(0.05)
+        return {"ok": True}
+
+    transport._send = _send
+    transport.request("exchange", {"action": {"type": "1301", "data": {}}})
+    transport.request("info", {"method": "ticker", "params": {}})
+
+    assert calls == ["exchange", "info", "info"]
+    assert "exchange" not in policy.stats()
+    assert policy.stats()["info"].hedged == 1
+
+
+def test_hedges_draw_from_the_rate_limiter(policy):
+    """A hedge takes a spare rate-limit token, and is skipped when none is left."""
+    limiter = RateLimiter(limits={"info": RateLimit(rate=0.001, burst=3)})
+    transport = HttpTransport(HttpTransportOptions(hedging=policy, rate_limiter=limiter))
+    calls = []
+
+    def _send(endpoint, payload, method="POST"):
+        calls.append(endpoint)
+        time.sleep(0.05)
+        return {"ok": True}
+
+    transport._send = _send
+    transport.request("info", {"method": "ticker", "params": {}})
+    assert len(calls) == 2
+    assert limiter.stats()["info"].hedges == 1
+
+    # The last token goes to the second request itself, none to its hedge.
+    transport.request("info", {"method": "ticker", "params": {}})
+    assert len(calls) == 3
+    stats = policy.stats()["info"]
+    assert (stats.hedged, stats.admission_denied) == (1, 1)
+    assert limiter.stats()["info"].hedges == 1
+
+
+def test_callers_beyond_max_workers_are_not_queued():
+    """Primaries do not share the hedge pool, so its size caps neither throughput nor latency."""
+    # min_samples keeps the threshold at initial_delay, so nothing is hedged.
+    policy = HedgingPolicy(initial_delay=0.2, min_delay=0.001, min_samples=1000, max_workers=4)
+    start = threading.Barrier(32)
+
+    def _caller():
+        start.wait()
+        for _ in range(3):
+            policy.call("info", lambda: time.sleep(0.02))
+
+    try:
+        threads = [threading.Thread(target=_caller) for _ in range(32)]
+        began = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.monotonic() - began
+        # Three sequential 20 ms calls each; a 4-thread pool would need ~0.5 s.
+        assert elapsed < 0.3
+        stats = policy.stats()["info"]
+        assert (stats.requests, stats.hedged) == (96, 0)
+        # Measured from when send starts, so the p95 stays near 20 ms.
+        assert policy._latencies["info"].quantile(0.95) < 0.06
+    finally:
+        policy.close(wait=False)
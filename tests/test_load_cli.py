@@ -0,0 +1,84 @@
+"""Unit tests for the hotstuff-load CLI."""
+import json
+import threading
+
+import pytest
+from eth_account import Account
+
+from hotstuff.cli.load import LoadConfig, _NonceSource, main, parse_mix, run
+from hotstuff.testing import MarketDataGenerator, MockServer
+
+
+@pytest.fixture
+def mock():
+    server = MockServer(market=MarketDataGenerator(rate=0))
+    yield server
+    server.close()
+
+
+def test_parse_mix():
+    """Weights parse per operation; unknown names and empty mixes are rejected."""
+    assert parse_mix("place_order=3, info=1,cancel_all=0") == {"place_order": 3.0, "info": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("transfer=1")
+    with pytest.raises(ValueError):
+        parse_mix("info=0")
+
+
+def test_nonce_source_is_unique_across_threads_and_processes():
+    """Each process index owns a residue class; threads never share a nonce."""
+    sources = [_NonceSource(i, 3) for i in range(3)]
+    issued = []
+
+    def _draw(source):
+        issued.extend(source() for _ in range(500))
+
+    threads = [threading.Thread(target=_draw, args=(s,)) for s in sources for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(set(issued)) == len(issued) == 3000
+    assert all(sources[0]() % 3 == 0 for _ in range(10))
+
+
+def test_closed_loop_against_mock(mock):
+    """Every operation type succeeds and is timed; the mock accepts every nonce."""
+    config = LoadConfig(
+        mix=parse_mix("place_order=1,cancel_by_oid=1,cancel_all=1,info=1"), workers=3, duration=0.5,
+        api_url=mock.http_url, private_key=Account.create().key.hex(), seed=1,
+    )
+    report = run(config)
+
+    total = report.total()
+    assert total.ok > 0 and total.errors == 0
+    assert set(report.operations) == {"place_order", "cancel_by_oid", "cancel_all", "info"}
+    assert total.latency.count == total.ok
+    assert len(mock.actions) == sum(report.operations[op].ok for op in ("place_order", "cancel_by_oid", "cancel_all"))
+
+
+def test_open_loop_asyncio_follows_the_target_rate(mock):
+    """Open-loop arrivals follow the schedule, not the completion rate."""
+    config = LoadConfig(
+        mix={"info": 1.0}, mode="open", engine="asyncio", rate=100, duration=0.5, api_url=mock.http_url,
+    )
+    report = run(config)
+    assert 40 <= report.total().ok <= 55
+
+
+def test_open_loop_requires_a_rate():
+    """Open loop without --rate is a configuration error."""
+    with pytest.raises(ValueError):
+        run(LoadConfig(mix={"info": 1.0}, mode="open"))
+    with pytest.raises(ValueError):
+        run(LoadConfig(mix={"cancel_all": 1.0}))
+
+
+def test_main_prints_json_report(capsys):
+    """--mock starts its own server; --json gives a parseable report without the key."""
+    assert main(["--mock", "--duration", "0.3", "--workers", "2", "--mix", "info=1,cancel_all=1", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["total"]["ok"] > 0 and report["total"]["errors"] == 0
+    assert "private_key" not in report["config"]
+    assert set(report["total"]["latency_ms"]) >= {"p50", "p99", "p99.9"}
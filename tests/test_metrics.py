@@ -0,0 +1,151 @@
+"""Unit tests for the metrics registry, histograms and Prometheus exporter."""
+import gc
+import random
+import re
+import threading
+
+import pytest
+import requests
+
+from hotstuff import (
+    HttpTransportOptions,
+    InfoClient,
+    MetricsRegistry,
+    MetricsServer,
+    TickerParams,
+    WebSocketTransport,
+    WebSocketTransportOptions,
+)
+from hotstuff.transports import HttpTransport
+from hotstuff.utils.metrics import Histogram
+
+
+def _sample(text, name, **labels):
+    """Return the value of one exposition line."""
+    for line in text.splitlines():
+        if not line.startswith(name + "{") and not line.startswith(name + " "):
+            continue
+        found = dict(re.findall(r'(\w+)="([^"]*)"', line))
+        if all(found.get(k) == v for k, v in labels.items()):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{name} {labels} not in exposition")
+
+
+def test_histogram_percentiles_within_bucket_resolution():
+    """Quantiles are accurate to the log-linear bucket width (<2%)."""
+    rng = random.Random(7)
+    values = sorted(rng.randint(1_000, 50_000_000) for _ in range(20_000))
+    histogram = Histogram()
+    for v in values:
+        histogram.record(v)
+
+    snap = histogram.snapshot()
+    assert (snap.count, snap.min, snap.max, snap.sum) == (len(values), values[0], values[-1], sum(values))
+    for q in (0.5, 0.9, 0.99, 0.999):
+        exact = values[int(q * len(values)) - 1]
+        assert snap.percentile(q) == pytest.approx(exact, rel=0.02)
+
+
+def test_histogram_records_from_many_threads_without_loss():
+    """Per-thread shards merge to the exact total."""
+    histogram = Histogram()
+
+    def _worker():
+        for i in range(5_000):
+            histogram.record(i)
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert histogram.snapshot().count == 40_000
+
+
+def test_exposition_format():
+    """Counters, gauges and histograms render in the Prometheus text format."""
+    registry = MetricsRegistry(buckets=(0.001, 0.01))
+    registry.counter("jobs_total", "Jobs", kind='a"b').inc(3)
+    registry.gauge("depth", "Queue depth", fn=lambda: 7)
+    h = registry.histogram("latency_seconds", "Latency", method="ticker")
+    h.record(500_000)
+    h.record(5_000_000)
+    h.record(50_000_000)
+
+    text = registry.exposition()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{kind="a\\"b"} 3' in text
+    assert "depth 7" in text
+    assert 'latency_seconds_bucket{method="ticker",le="0.001"} 1' in text
+    assert 'latency_seconds_bucket{method="ticker",le="0.01"} 2' in text
+    assert 'latency_seconds_bucket{method="ticker",le="+Inf"} 3' in text
+    assert _sample(text, "latency_seconds_sum") == pytest.approx(0.0555)
+    with pytest.raises(ValueError):
+        registry.counter("latency_seconds")
+
+
+def test_scrape_request_metrics_from_local_server(http_server):
+    """InfoClient requests against a mock API show up in a live scrape."""
+    registry = MetricsRegistry()
+    base = f"http://127.0.0.1:{http_server.server_address[1]}/"
+    client = InfoClient(metrics=registry)
+    client.transport = HttpTransport(HttpTransportOptions(server={"mainnet": {"api": base}}, metrics=registry))
+    for _ in range(5):
+        client.ticker(TickerParams(symbol="BTC-PERP"))
+    client.transport.close()
+
+    with MetricsServer(registry) as server:
+        response = requests.get(server.url, timeout=2)
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    labels = {"transport": "http", "endpoint": "info", "method": "ticker"}
+    assert _sample(response.text, "hotstuff_request_duration_seconds_count", **labels) == 5
+    assert _sample(response.text, "hotstuff_request_duration_seconds_bucket", le="+Inf", **labels) == 5
+
+
+def test_exchange_errors_are_labelled_by_action_name():
+    """Exchange op codes are exported as readable action names."""
+    registry = MetricsRegistry()
+    transport = HttpTransport(
+        HttpTransportOptions(server={"mainnet": {"api": "http://127.0.0.1:1/"}}, metrics=registry)
+    )
+    with pytest.raises(Exception):
+        transport.request("exchange", {"action": {"type": "1301", "data": {}}})
+
+    text = registry.exposition()
+    assert _sample(text, "hotstuff_request_errors_total", method="placeOrder", error="HotstuffConnectionError") == 1
+
+
+def test_websocket_message_and_callback_metrics():
+    """Notifications count per base channel and time their callbacks."""
+    registry = MetricsRegistry()
+    transport = WebSocketTransport(WebSocketTransportOptions(auto_connect=False, metrics=registry))
+    transport.subscriptions["s1"] = type("Sub", (), {"channel": "fills@0xabc"})()
+    transport.subscription_callbacks["s1"] = lambda data: None
+
+    for _ in range(3):
+        transport._handle_jsonrpc_notification(
+            {"method": "subscription", "params": {"channel": "fills@0xabc", "data": {}}}
+        )
+
+    text = registry.exposition()
+    assert _sample(text, "hotstuff_ws_messages_total", channel="fills") == 3
+    assert _sample(text, "hotstuff_ws_callback_duration_seconds_count", channel="fills") == 3
+    assert _sample(text, "hotstuff_ws_pending_requests") == 0
+
+
+def test_queue_gauges_sum_over_transports_sharing_a_registry():
+    """Each transport contributes to the gauge; dropped transports stop counting."""
+    registry = MetricsRegistry()
+    a = WebSocketTransport(WebSocketTransportOptions(auto_connect=False, metrics=registry))
+    b = WebSocketTransport(WebSocketTransportOptions(auto_connect=False, metrics=registry))
+    a.message_queue.update({"1": {}, "2": {}})
+    b.message_queue["3"] = {}
+    assert _sample(registry.exposition(), "hotstuff_ws_pending_requests") == 3
+
+    del a
+    gc.collect()
+    assert _sample(registry.exposition(), "hotstuff_ws_pending_requests") == 1
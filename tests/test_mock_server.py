@@ -0,0 +1,142 @@
+"""Unit tests for the offline mock server in hotstuff.testing."""
+import io
+import os
+import threading
+import time
+
+import pytest
+from eth_account import Account
+
+from hotstuff import ExchangeClient, InfoClient, TickerParams, WebSocketTransport
+from hotstuff.exceptions import HotstuffAPIError, HotstuffAuthenticationError, HotstuffRateLimitError
+from hotstuff.methods.exchange.op_codes import EXCHANGE_OP_CODES
+from hotstuff.testing import FaultInjection, MarketDataGenerator, MockServer
+from hotstuff.testing.websocket import OP_TEXT, encode_frame, read_frame
+from hotstuff.transports import HttpTransport
+from hotstuff.utils import sign_action
+
+
+@pytest.fixture
+def mock():
+    server = MockServer(market=MarketDataGenerator(rate=200.0, seed=1))
+    yield server
+    server.close()
+
+
+def _cancel_all(nonce):
+    return {"action": "cancelAll", "params": {"expiresAfter": 0, "nonce": nonce}}
+
+
+def test_http_info_and_canned_responses(mock):
+    """Market methods come from the generator; others can be canned."""
+    client = InfoClient()
+    client.transport = HttpTransport(mock.http_options())
+    mock.set_response("account_summary", lambda params: {"user": params["user"]})
+    try:
+        ticker = client.ticker(TickerParams(symbol="ETH-PERP"))[0]
+        assert ticker["symbol"] == "ETH-PERP" and float(ticker["mid_price"]) > 0
+        assert client.transport.request("info", {"method": "account_summary", "params": {"user": "0x1"}}) == {
+            "user": "0x1"
+        }
+        with pytest.raises(HotstuffAPIError):
+            client.transport.request("explorer", {"method": "blocks", "params": {}})
+    finally:
+        client.transport.close()
+    assert mock.stats().requests == {"info": 2, "explorer": 1}
+
+
+def test_exchange_actions_are_verified_with_the_real_signing_scheme(mock):
+    """Signers are recovered from the signature; replays and unknown signers are rejected."""
+    wallet = Account.create()
+    client = ExchangeClient(wallet=wallet)
+    client.transport = HttpTransport(mock.http_options())
+    try:
+        response = client._execute_action(_cancel_all(1))
+        assert (response["status"], response["signer"]) == ("ok", wallet.address)
+        with pytest.raises(HotstuffAPIError, match="Nonce already used"):
+            client._execute_action(_cancel_all(1))
+
+        code = EXCHANGE_OP_CODES["cancelAll"]
+        signature = sign_action(wallet, {"expiresAfter": 0, "nonce": 2}, code)
+        tampered = {"action": {"data": {"expiresAfter": 1, "nonce": 2}, "type": str(code)},
+                    "signature": signature, "nonce": 2}
+        # Recovery over altered data yields some other address, never the wallet's.
+        assert client.transport.request("exchange", tampered)["signer"] != wallet.address
+    finally:
+        client.transport.close()
+
+    allowlisted = MockServer(accounts={wallet.address})
+    try:
+        stranger = ExchangeClient(wallet=Account.create())
+        stranger.transport = HttpTransport(allowlisted.http_options())
+        with pytest.raises(HotstuffAuthenticationError):
+            stranger._execute_action(_cancel_all(3))
+        stranger.transport.close()
+    finally:
+        allowlisted.close()
+    assert [a.action for a in mock.actions] == ["cancelAll", "cancelAll"]
+
+
+def test_fault_injection_latency_and_rate_limits():
+    """Injected 429s carry Retry-After; injected latency delays the answer."""
+    with MockServer(faults=FaultInjection(rate_limit_rate=1.0, retry_after=2, endpoints=frozenset({"info"}))) as mock:
+        transport = HttpTransport(mock.http_options())
+        with pytest.raises(HotstuffRateLimitError) as info:
+            transport.request("info", {"method": "ticker", "params": {}})
+        assert info.value.retry_after == 2
+        transport.close()
+        assert mock.stats().rate_limited == 1
+
+    with MockServer(faults=FaultInjection(latency=0.05, jitter=0.01, seed=3)) as mock:
+        transport = HttpTransport(mock.http_options())
+        start = time.monotonic()
+        transport.request("info", {"method": "mids", "params": {}})
+        assert time.monotonic() - start >= 0.04
+        transport.close()
+
+
+def test_fault_sequence_is_reproducible_with_a_seed():
+    """The same seed draws the same delays and failures."""
+    def draws():
+        faults = FaultInjection(latency=0.01, jitter=0.005, error_rate=0.3, seed=11)
+        return [faults.sample("info") for _ in range(50)]
+
+    first = draws()
+    assert first == draws()
+    assert any(status == 500 for _, status in first) and any(status is None for _, status in first)
+
+
+def test_websocket_subscribe_stream_publish_and_post(mock):
+    """The SDK's WebSocketTransport works end to end against the mock."""
+    transport = WebSocketTransport(mock.ws_options())
+    bbo, fills = [], []
+    got_bbo = threading.Event()
+    try:
+        sub = transport.subscribe("bbo", {"symbol": "BTC-PERP"}, lambda e: (bbo.append(e), got_bbo.set()))
+        assert sub["channels"] == ["bbo@BTC-PERP"]
+        wallet = Account.create()
+        transport.subscribe("fills", {"user": wallet.address}, fills.append)
+        assert got_bbo.wait(2.0)
+        assert bbo[0].data["symbol"] == "BTC-PERP" and bbo[0].recv_ns > 0
+
+        assert mock.publish(f"fills@{wallet.address}", {"oid": 1}) == 1
+        client = ExchangeClient(wallet=wallet)
+        client.transport = transport
+        assert client._execute_action(_cancel_all(7))["signer"] == wallet.address
+        assert transport.request("info", {"method": "mids", "params": {"symbol": "BTC-PERP"}})[0]["symbol"] == "BTC-PERP"
+        transport.unsubscribe(sub["subscriptionId"])
+        for _ in range(100):
+            if fills:
+                break
+            time.sleep(0.01)
+        assert fills[0].data == {"oid": 1}
+    finally:
+        transport.disconnect()
+
+
+def test_frame_codec_round_trips_all_length_encodings():
+    """Short, 16-bit and 64-bit length frames decode to the original payload."""
+    for size in (5, 300, 70_000):
+        payload = os.urandom(size)
+        fin, opcode, data = read_frame(io.BytesIO(encode_frame(OP_TEXT, payload)))
+        assert (fin, opcode, data) == (True, OP_TEXT, payload)
@@ -0,0 +1,119 @@
+"""Unit tests for vectorized bulk order construction."""
+from dataclasses import asdict
+from decimal import Decimal
+
+import pytest
+
+from hotstuff.methods.exchange.trading import UnitOrder
+from hotstuff.utils.orders import build_orders
+
+
+def _unit_orders(sides, prices, sizes, cloids, **kwargs):
+    return [
+        asdict(UnitOrder(
+            instrumentId=1, side=side, positionSide="BOTH", price=price, size=size,
+            tif=kwargs.get("tif", "GTC"), ro=kwargs.get("ro", False), po=kwargs.get("po", False), cloid=cloid,
+        ))
+        for side, price, size, cloid in zip(sides, prices, sizes, cloids)
+    ]
+
+
+def test_matches_unit_order_dicts():
+    """String inputs produce exactly the UnitOrder wire dicts, in field order."""
+    sides = ["b", "s", "b"]
+    prices = ["50000.1", "50001.5", "49999"]
+    sizes = ["0.01", "0.02", "1"]
+    cloids = ["c-0", "c-1", "c-2"]
+
+    built = build_orders(1, sides, prices, sizes, po=True, cloids=cloids)
+    expected = _unit_orders(sides, prices, sizes, cloids, po=True)
+
+    assert built == expected
+    assert [list(o) for o in built] == [list(o) for o in expected]
+
+
+def test_scalars_broadcast_and_default_cloid_is_shared():
+    """Scalar side/size broadcast across prices; the default cloid matches UnitOrder's."""
+    built = build_orders(1, "s", ["10", "11"], "2")
+
+    assert [o["side"] for o in built] == ["s", "s"]
+    assert [o["size"] for o in built] == ["2", "2"]
+    assert built[0]["cloid"].startswith("cloid-")
+    assert built[0]["cloid"] == built[1]["cloid"]
+    assert [o["cloid"] for o in build_orders(1, "b", ["1", "2"], "1", cloid_prefix="q")] == ["q-0", "q-1"]
+
+
+def test_unquantized_floats_never_use_scientific_notation():
+    """Without tick/lot sizes, tiny and huge floats are sent as plain decimals."""
+    built = build_orders(1, "b", [1e-05, 2.5e-7], [1e-05, 3e21])
+    assert [o["price"] for o in built] == ["0.00001", "0.00000025"]
+    assert [o["size"] for o in built] == ["0.00001", "3000000000000000000000"]
+    assert build_orders(1, "b", 100.5, 2)[0]["size"] == "2"
+
+
+def test_unquantized_decimals_and_ints_are_sent_exactly():
+    """Decimal inputs keep every digit and ints get no trailing '.0'."""
+    built = build_orders(1, "b", [Decimal("12345678.123456789012"), 50000], [Decimal("1E-8"), 3])
+    assert [o["price"] for o in built] == ["12345678.123456789012", "50000"]
+    assert [o["size"] for o in built] == ["0.00000001", "3"]
+
+    np = pytest.importorskip("numpy")
+    assert [o["price"] for o in build_orders(1, "b", np.array([1e-05]), 1)] == ["0.00001"]
+
+
+def test_passive_rounding_with_tick_and_lot_size():
+    """Bids round down, asks round up, sizes round down to the lot."""
+    built = build_orders(
+        1, ["b", "s"], [100.07, 100.03], [0.0199, 0.0301],
+        tick_size=0.05, lot_size=0.01, cloids=["a", "b"],
+    )
+
+    assert [o["price"] for o in built] == ["100.05", "100.05"]
+    assert [o["size"] for o in built] == ["0.01", "0.03"]
+
+
+def test_numpy_path_matches_scalar_path():
+    """NumPy arrays give the same strings as plain lists."""
+    np = pytest.importorskip("numpy")
+    prices = [50000.06, 50000.01, 49999.99, 50000.3]
+    sides = ["b", "s", "s", "b"]
+    sizes = [0.123, 0.5, 1.0, 0.3]
+
+    for rounding in ("passive", "aggressive", "nearest"):
+        from_lists = build_orders(
+            1, sides, prices, sizes, tick_size=0.1, lot_size=0.001, price_rounding=rounding, cloid_prefix="x"
+        )
+        from_arrays = build_orders(
+            1, np.array(sides), np.array(prices), np.array(sizes),
+            tick_size=0.1, lot_size=0.001, price_rounding=rounding, cloid_prefix="x",
+        )
+        assert from_arrays == from_lists
+
+    assert [o["price"] for o in from_lists] == ["50000.1", "50000.0", "50000.0", "50000.3"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"instrument_id": 0},
+        {"sides": ["b", "x"]},
+        {"prices": ["1", "-1"]},
+        {"sizes": ["1", "nan"]},
+        {"prices": ["1"]},
+        {"tif": "DAY"},
+        {"position_side": "NET"},
+    ],
+)
+def test_rejects_invalid_inputs(kwargs):
+    """Invalid inputs raise ValueError before any order is built."""
+    args = dict(instrument_id=1, sides=["b", "s"], prices=["1", "2"], sizes=["1", "1"])
+    args.update(kwargs)
+    with pytest.raises(ValueError):
+        build_orders(**args)
+
+
+def test_rejects_invalid_numpy_values():
+    """Vectorized validation reports the first bad index."""
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match=r"prices\[2\]"):
+        build_orders(1, "b", np.array([1.0, 2.0, np.inf]), 1.0)
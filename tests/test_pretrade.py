@@ -0,0 +1,169 @@
+"""Unit tests for local pre-trade validation."""
+import pytest
+from eth_account import Account
+
+from hotstuff import (
+    ExchangeClient,
+    InstrumentRegistry,
+    PlaceOrderParams,
+    PreTradeChecker,
+    UnitOrder,
+    UpdatePerpInstrumentLeverageParams,
+)
+from hotstuff.exceptions import HotstuffPreTradeError
+from hotstuff.utils.orders import build_orders
+
+PERP = {
+    "id": 1,
+    "name": "BTC-PERP",
+    "price_index": "BTC",
+    "lot_size": 0.001,
+    "tick_size": 0.5,
+    "settlement_currency": 1,
+    "only_isolated": False,
+    "max_leverage": 50,
+    "delisted": False,
+    "min_notional_usd": 100,
+    "margin_tiers": [
+        {"notional_usd_threshold": "100000", "max_leverage": 50, "mmr": 0.01, "mmd": 0},
+        {"notional_usd_threshold": "1000000", "max_leverage": 20, "mmr": 0.025, "mmd": 0},
+    ],
+    "listed_at_block_timestamp": 1,
+}
+
+
+# Shares id 1 with PERP.
+SPOT = {
+    "id": 1,
+    "name": "HYPE/USDC",
+    "price_index": "HYPE",
+    "lot_size": 1,
+    "tick_size": 0.0001,
+    "base_asset": 2,
+    "quote_asset": 1,
+    "stable_pair": False,
+    "min_size_in_quote_asset": 10,
+    "listed_at_block_timestamp": 1,
+}
+
+
+class _StubInfo:
+    def __init__(self, spot=()):
+        self.spot = list(spot)
+
+    def instruments(self, params, signal=None):
+        return {"perps": [PERP], "spot": self.spot}
+
+
+class _StubTransport:
+    is_testnet = True
+
+    def __init__(self):
+        self.payloads = []
+
+    def request(self, endpoint, payload, signal=None):
+        self.payloads.append(payload)
+        return {"status": "ok"}
+
+
+def _order(price, size, cloid, instrument_id=1):
+    return UnitOrder(
+        instrumentId=instrument_id, side="b", positionSide="BOTH",
+        price=price, size=size, tif="GTC", ro=False, po=False, cloid=cloid,
+    )
+
+
+@pytest.fixture
+def checker():
+    checker = PreTradeChecker(InstrumentRegistry(_StubInfo()).load())
+    checker.update_ticker({"symbol": "BTC-PERP", "mark_price": "50000", "max_trading_price": "55000",
+                           "min_trading_price": "45000"})
+    return checker
+
+
+def test_reports_one_structured_error_per_order(checker):
+    """Each failing rule maps to its own error code and keeps the batch index."""
+    checker.set_leverage(1, 40)
+    orders = [
+        _order("50000.5", "0.01", "ok"),
+        _order("50000.3", "0.01", "tick"),
+        _order("50000", "0.0105", "lot"),
+        _order("50000", "0.001", "notional"),
+        _order("60000", "0.01", "band"),
+        _order("50000", "3", "leverage"),
+        _order("50000", "0.01", "unknown", instrument_id=9),
+    ]
+
+    result = checker.check(orders)
+
+    assert [o.cloid for o in result.valid] == ["ok"]
+    assert [(e.index, e.cloid, e.code) for e in result.errors] == [
+        (1, "tick", "tick_size"),
+        (2, "lot", "lot_size"),
+        (3, "notional", "min_notional"),
+        (4, "band", "price_band"),
+        (5, "leverage", "max_leverage"),
+        (6, "unknown", "unknown_instrument"),
+    ]
+
+
+def test_accepts_order_dicts_and_ticker_listener(checker):
+    """Dict orders are checked like UnitOrders; the listener refreshes price bands."""
+    orders = build_orders(1, "b", ["50000", "56000"], "0.01", cloid_prefix="d")
+    assert [e.cloid for e in checker.check(orders).errors] == ["d-1"]
+
+    checker.ticker_listener()({"symbol": "BTC-PERP", "max_trading_price": "60000"})
+    assert checker.check(orders).ok
+
+
+def test_place_order_splits_partly_invalid_batch(checker):
+    """Valid orders are signed and sent; rejected ones come back as preTradeErrors."""
+    client = ExchangeClient(Account.create(), pre_trade_checker=checker)
+    client.transport = _StubTransport()
+
+    response = client.place_order(
+        PlaceOrderParams(orders=[_order("50000", "0.01", "a"), _order("50000.3", "0.01", "b")], expiresAfter=0)
+    )
+
+    sent = client.transport.payloads[0]["action"]["data"]["orders"]
+    assert [o["cloid"] for o in sent] == ["a"]
+    assert response["status"] == "ok"
+    assert [e["cloid"] for e in response["preTradeErrors"]] == ["b"]
+
+
+def test_place_order_raises_without_round_trip_when_nothing_is_valid(checker):
+    """A fully invalid batch (or any error without splitting) never reaches the transport."""
+    client = ExchangeClient(Account.create(), pre_trade_checker=checker)
+    client.transport = _StubTransport()
+
+    with pytest.raises(HotstuffPreTradeError) as exc_info:
+        client.place_order(PlaceOrderParams(orders=[_order("50000.3", "0.01", "b")], expiresAfter=0))
+    assert exc_info.value.errors[0].code == "tick_size"
+
+    checker.split_batches = False
+    with pytest.raises(HotstuffPreTradeError):
+        client.place_order(
+            PlaceOrderParams(orders=[_order("50000", "0.01", "a"), _order("50000.3", "0.01", "b")], expiresAfter=0)
+        )
+    assert client.transport.payloads == []
+
+
+def test_colliding_perp_and_spot_ids_are_not_guessed():
+    """Without a kind an id listed as both is rejected; with one, that market's rules apply."""
+    registry = InstrumentRegistry(_StubInfo(spot=[SPOT])).load()
+    spot_order = _order("1.2345", "20", "s")
+
+    assert PreTradeChecker(registry).check_order(spot_order).code == "ambiguous_instrument"
+    assert PreTradeChecker(registry, kind="spot").check_order(spot_order) is None
+    assert PreTradeChecker(registry, kind="perps").check_order(spot_order).code == "tick_size"
+
+
+def test_leverage_update_feeds_the_checker(checker):
+    """update_perp_instrument_leverage records the new leverage for the max-leverage check."""
+    client = ExchangeClient(Account.create(), pre_trade_checker=checker)
+    client.transport = _StubTransport()
+    order = _order("50000", "3", "big")
+    assert checker.check_order(order) is None
+
+    client.update_perp_instrument_leverage(UpdatePerpInstrumentLeverageParams(instrumentId=1, leverage="40"))
+    assert checker.check_order(order).code == "max_leverage"
@@ -0,0 +1,62 @@
+"""Unit tests for tick/lot quantization."""
+from decimal import Decimal
+
+import pytest
+
+from hotstuff.utils.quantize import StepQuantizer, get_quantizer, step_decimals
+
+
+def test_step_decimals():
+    """Decimal places follow the step's precision."""
+    assert step_decimals(0.5) == 1
+    assert step_decimals("0.001") == 3
+    assert step_decimals(5) == 0
+    assert step_decimals(1e-5) == 5
+
+
+def test_float_drift_lands_on_intended_tick():
+    """Floating point error in value / step does not drop a tick."""
+    q = StepQuantizer(0.1)
+
+    assert q.ticks_from_float(0.3, "down") == 3
+    assert q.ticks_from_float(0.3, "up") == 3
+    assert q.format(0.3, "down") == "0.3"
+    assert q.format(50000.06, "down") == "50000.0"
+    assert q.format(50000.01, "up") == "50000.1"
+
+
+def test_exact_paths_for_strings_and_decimals():
+    """Strings and Decimals are quantized exactly."""
+    q = StepQuantizer("0.25")
+
+    assert q.to_steps("1.37", "down") == 5
+    assert q.quantize(Decimal("1.37"), "up") == Decimal("1.50")
+    assert q.format_steps(-3) == "-0.75"
+    assert q.is_aligned("1.75") and not q.is_aligned("1.8")
+    assert StepQuantizer(5).format(12, "down") == "10"
+
+
+def test_rejects_invalid_steps():
+    """Zero, negative and non-finite steps are rejected."""
+    for step in (0, -0.1, "nan"):
+        with pytest.raises(ValueError):
+            StepQuantizer(step)
+
+
+def test_quantizers_are_shared_per_step():
+    """Equal steps reuse one precomputed quantizer."""
+    assert get_quantizer(0.1) is get_quantizer("0.10")
+
+
+def test_vectorized_matches_scalar():
+    """NumPy variants agree with the scalar path on a 1k grid."""
+    np = pytest.importorskip("numpy")
+    q = get_quantizer(0.5)
+    prices = np.linspace(99.0, 151.0, 1000)
+
+    for mode in ("down", "up", "nearest"):
+        ticks = q.ticks_array(prices, mode)
+        assert ticks.dtype == np.int64
+        assert ticks.tolist() == [q.ticks_from_float(float(p), mode) for p in prices]
+        assert q.format_array(prices, mode) == q.format_many(prices.tolist(), mode)
+    assert np.allclose(q.ticks_to_float_array(q.ticks_array(prices)), prices, atol=0.25)
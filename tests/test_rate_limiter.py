@@ -0,0 +1,197 @@
+"""Unit tests for the client-side token-bucket rate limiter."""
+import threading
+import time
+
+import pytest
+
+from hotstuff import HttpTransportOptions, RateLimit, RateLimiter
+from hotstuff.exceptions import HotstuffRateLimitError
+from hotstuff.transports import HttpTransport
+
+
+class _FakeTime:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(fake, **kwargs):
+    kwargs.setdefault("limits", {"info": RateLimit(rate=10, burst=2)})
+    return RateLimiter(clock=fake.clock, sleep=fake.sleep, **kwargs)
+
+
+def test_burst_then_requests_queue_at_the_sustained_rate():
+    """Requests beyond the burst wait for their token instead of failing."""
+    fake = _FakeTime()
+    limiter = _limiter(fake)
+
+    waits = [limiter.acquire("info", "ticker") for _ in range(4)]
+
+    assert waits == pytest.approx([0.0, 0.0, 0.1, 0.1])
+    stats = limiter.stats()["info"]
+    assert (stats.acquired, stats.queued) == (4, 2)
+    assert stats.total_wait == pytest.approx(0.2)
+    assert stats.max_wait == pytest.approx(0.1)
+
+
+def test_weight_class_bucket_applies_on_top_of_endpoint():
+    """Heavy methods also draw from their weight-class bucket."""
+    fake = _FakeTime()
+    limiter = _limiter(fake, limits={"info": RateLimit(100, 100), "info:heavy": RateLimit(1, 1)})
+
+    assert limiter.bucket_keys("info", "fills") == ["info", "info:heavy"]
+    assert limiter.bucket_keys("info", "ticker") == ["info"]
+    limiter.acquire("info", "fills")
+    assert limiter.acquire("info", "fills") == pytest.approx(1.0)
+    assert limiter.acquire("info", "ticker") == 0.0
+
+
+def test_try_acquire_takes_a_free_token_or_none():
+    """Non-blocking acquisition never queues and is counted as a hedge."""
+    fake = _FakeTime()
+    limiter = _limiter(fake)
+
+    assert limiter.try_acquire("info", "ticker")
+    assert limiter.try_acquire("info", "ticker")
+    assert not limiter.try_acquire("info", "ticker")
+    assert fake.sleeps == []
+    assert limiter.stats()["info"].hedges == 2
+    # The queued caller is not pushed back by the refused attempt.
+    assert limiter.acquire("info", "ticker") == pytest.approx(0.1)
+
+
+def test_queue_limit_rejects_instead_of_waiting():
+    """A wait beyond max_queue_wait raises and gives the token back."""
+    fake = _FakeTime()
+    limiter = _limiter(fake, limits={"info": RateLimit(rate=1, burst=1)}, max_queue_wait=0.5)
+
+    limiter.acquire("info")
+    with pytest.raises(HotstuffRateLimitError) as exc_info:
+        limiter.acquire("info")
+
+    assert exc_info.value.retry_after == 1
+    assert limiter.stats()["info"].rejected == 1
+    fake.now += 1.0
+    assert limiter.acquire("info") == 0.0
+
+
+def test_retry_after_blocks_and_slows_the_bucket():
+    """A 429 holds every queued request for Retry-After and halves the rate."""
+    fake = _FakeTime()
+    limiter = _limiter(fake)
+
+    limiter.on_rate_limited("info", "ticker", retry_after=2)
+
+    assert limiter.acquire("info") == pytest.approx(2.0 + 1 / 5)
+    assert limiter.stats()["info"].rate == pytest.approx(5.0)
+    for _ in range(20):
+        limiter.on_success("info")
+    assert limiter.stats()["info"].rate == pytest.approx(10.0)
+
+
+def test_concurrent_callers_are_serialized():
+    """Real threads draining an empty bucket are spaced by the refill rate."""
+    limiter = RateLimiter(limits={"info": RateLimit(rate=200, burst=1)})
+    waits = []
+    lock = threading.Lock()
+
+    def _worker():
+        waited = limiter.acquire("info")
+        with lock:
+            waits.append(waited)
+
+    threads = [threading.Thread(target=_worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert max(waits) >= 0.015
+    assert limiter.queue_depth() == 0
+    assert limiter.stats()["info"].acquired == 5
+
+
+def test_callers_queued_before_a_429_are_released_at_the_reduced_rate():
+    """Waiters re-slot behind Retry-After one by one instead of waking together."""
+    limiter = RateLimiter(limits={"info": RateLimit(rate=20, burst=1)})
+    released = []
+    lock = threading.Lock()
+
+    def _worker():
+        limiter.acquire("info")
+        with lock:
+            released.append(time.monotonic())
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=_worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    time.sleep(0.02)
+    limiter.on_rate_limited("info", retry_after=0.2)
+    for t in threads:
+        t.join()
+
+    queued = sorted(released)[1:]
+    assert queued[0] - start >= 0.2
+    # Halved to 10/s: one release every 100 ms after the block lifts.
+    assert all(later - earlier >= 0.08 for earlier, later in zip(queued, queued[1:]))
+
+
+def _transport(limiter, responses):
+    transport = HttpTransport(HttpTransportOptions(rate_limiter=limiter))
+    calls = []
+
+    def _send(endpoint, payload, method="POST"):
+        calls.append(endpoint)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    transport._send = _send
+    return transport, calls
+
+
+def test_transport_retries_rate_limited_info_requests():
+    """Info calls are retried after a 429 with jittered backoff."""
+    fake = _FakeTime()
+    limiter = _limiter(fake, limits={"info": RateLimit(100, 100)})
+    transport, calls = _transport(limiter, [HotstuffRateLimitError(retry_after=1), {"ok": True}])
+
+    assert transport.request("info", {"method": "ticker", "params": {}}) == {"ok": True}
+    assert calls == ["info", "info"]
+    assert fake.now >= 1.0
+    stats = limiter.stats()["info"]
+    assert (stats.rate_limited, stats.retries) == (1, 1)
+
+
+def test_transport_never_retries_exchange_actions():
+    """Exchange actions are not idempotent, so a 429 is surfaced immediately."""
+    fake = _FakeTime()
+    limiter = _limiter(fake)
+    transport, calls = _transport(limiter, [HotstuffRateLimitError(retry_after=1), {"ok": True}])
+
+    with pytest.raises(HotstuffRateLimitError):
+        transport.request("exchange", {"action": {"type": "1301", "data": {}}})
+    assert calls == ["exchange"]
+    assert limiter.stats()["exchange"].rate_limited == 1
+
+
+def test_transport_gives_up_after_max_retries():
+    """Persistent 429s are raised once the retry budget is spent."""
+    fake = _FakeTime()
+    limiter = _limiter(fake, max_retries=2)
+    transport, calls = _transport(limiter, [HotstuffRateLimitError()] * 3)
+
+    with pytest.raises(HotstuffRateLimitError):
+        transport.request("info", {"method": "ticker", "params": {}})
+    assert len(calls) == 3
@@ -0,0 +1,101 @@
+"""Unit tests for the instrument registry."""
+from dataclasses import replace
+from decimal import Decimal
+
+import pytest
+
+from hotstuff import InstrumentRegistry
+from hotstuff.exceptions import HotstuffValidationError
+
+
+def _perp(instrument_id, name, tick_size, lot_size):
+    return {
+        "id": instrument_id,
+        "name": name,
+        "price_index": name,
+        "lot_size": lot_size,
+        "tick_size": tick_size,
+        "settlement_currency": 1,
+        "only_isolated": False,
+        "max_leverage": 50,
+        "delisted": False,
+        "min_notional_usd": 10,
+        "margin_tiers": [
+            {"notional_usd_threshold": "1000000", "max_leverage": 20, "mmr": 0.025, "mmd": 0},
+            {"notional_usd_threshold": "100000", "max_leverage": 50, "mmr": 0.01, "mmd": 0},
+        ],
+        "listed_at_block_timestamp": 1,
+        "new_server_field": True,
+    }
+
+
+SPOT = {
+    "id": 1,
+    "name": "HYPE/USDC",
+    "price_index": "HYPE",
+    "lot_size": 1,
+    "tick_size": 0.0001,
+    "base_asset": 2,
+    "quote_asset": 1,
+    "stable_pair": False,
+    "min_size_in_quote_asset": 10,
+    "listed_at_block_timestamp": 1,
+}
+
+
+class _StubInfo:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = 0
+
+    def instruments(self, params, signal=None):
+        self.calls += 1
+        return self.payload
+
+
+def test_indexes_by_id_and_name_with_quantizers():
+    """Instruments are indexed once and carry tick/lot quantizers and tiers."""
+    info = _StubInfo({"perps": [_perp(1, "BTC-PERP", 0.1, 0.001)], "spot": [SPOT]})
+    registry = InstrumentRegistry(info).load()
+
+    btc = registry.get("BTC-PERP")
+    assert registry.get(1) is btc
+    assert registry.get(1, kind="spot").name == "HYPE/USDC"
+    assert btc.tick_size == 0.1 and btc.lot_size == 0.001
+    assert btc.price.format(50000.06, "down") == "50000.0"
+    assert btc.size.quantize("0.0126") == Decimal("0.013")
+    assert [t.max_leverage for t in btc.margin_tiers] == [50, 20]
+    assert btc.max_leverage(50_000) == 50 and btc.max_leverage(500_000) == 20
+    assert replace(btc, margin_tiers=btc.margin_tiers[1:]).max_leverage(50_000) == 20
+    with pytest.raises(HotstuffValidationError):
+        registry.get("ETH-PERP")
+
+
+def test_snapshot_makes_cold_start_network_free(tmp_path):
+    """A second process loads from the snapshot and validates it asynchronously."""
+    path = str(tmp_path / "instruments.json")
+    InstrumentRegistry(_StubInfo({"perps": [_perp(1, "BTC-PERP", 0.1, 0.001)]}), snapshot_path=path).load()
+
+    changed = []
+    server = _StubInfo({"perps": [_perp(1, "BTC-PERP", 0.5, 0.001), _perp(2, "ETH-PERP", 0.01, 0.01)]})
+    registry = InstrumentRegistry(server, snapshot_path=path, on_change=changed.append).load()
+
+    # Served from the snapshot before validation completes.
+    assert registry.source in ("snapshot", "server")
+    assert registry.validated.wait(2)
+    assert server.calls == 1
+    assert registry.get("BTC-PERP").tick_size == 0.5
+    assert "ETH-PERP" in registry
+    assert changed == [registry]
+
+    offline = InstrumentRegistry(snapshot_path=path).load()
+    assert len(offline) == 2 and offline.source == "snapshot"
+
+
+def test_refresh_reports_unchanged_payload():
+    """Refreshing an identical instrument set is a no-op."""
+    info = _StubInfo({"perps": [_perp(1, "BTC-PERP", 0.1, 0.001)]})
+    registry = InstrumentRegistry(info).load()
+
+    assert registry.refresh() is False
+    assert info.calls == 2
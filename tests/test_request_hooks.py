@@ -0,0 +1,121 @@
+"""Unit tests for on_request/on_response instrumentation hooks."""
+import json
+import queue
+import threading
+
+import pytest
+
+from hotstuff import HttpTransportOptions, WebSocketTransport, WebSocketTransportOptions
+from hotstuff.exceptions import HotstuffConnectionError
+from hotstuff.transports import HttpTransport
+from hotstuff.types import RequestTrace
+
+
+def _http_transport(server, **options):
+    base = f"http://127.0.0.1:{server.server_address[1]}/"
+    return HttpTransport(HttpTransportOptions(server={"mainnet": {"api": base, "rpc": base}}, **options))
+
+
+def test_http_hooks_receive_ordered_stage_timestamps(http_server):
+    """Both hooks run once per request with monotonically ordered stages."""
+    seen = []
+    transport = _http_transport(
+        http_server,
+        on_request=lambda trace: seen.append(("request", trace.sent_ns)),
+        on_response=lambda trace: seen.append(("response", trace)),
+    )
+    payload = {"method": "ticker", "params": {"symbol": "BTC-PERP"}}
+    try:
+        assert transport.request("info", payload) == {"ok": True}
+    finally:
+        transport.close()
+
+    assert [kind for kind, _ in seen] == ["request", "response"]
+    assert seen[0][1] == 0  # on_request runs before the send stage starts
+    trace = seen[1][1]
+    assert (trace.transport, trace.endpoint, trace.name, trace.status_code) == ("http", "info", "ticker", 200)
+    assert trace.request_bytes == len(json.dumps(payload))
+    assert trace.response_bytes == len(b'{"ok": true}')
+    stamps = [trace.start_ns, trace.serialized_ns, trace.sent_ns, trace.first_byte_ns,
+              trace.received_ns, trace.parsed_ns, trace.end_ns]
+    assert all(stamps) and stamps == sorted(stamps)
+    assert all(v is not None and v >= 0 for v in trace.stages().values())
+
+
+def test_http_errors_are_reported_to_on_response():
+    """A failed request still reaches on_response, with the error attached."""
+    traces = []
+    transport = HttpTransport(
+        HttpTransportOptions(server={"mainnet": {"api": "http://127.0.0.1:1/"}}, on_response=traces.append)
+    )
+    with pytest.raises(HotstuffConnectionError):
+        transport.request("exchange", {"action": {"type": "1301", "data": {}}})
+
+    assert traces[0].name == "1301"
+    assert isinstance(traces[0].error, HotstuffConnectionError)
+    assert traces[0].first_byte_ns == 0
+
+
+def test_failing_hook_does_not_fail_the_request(http_server):
+    """Hook exceptions are logged and swallowed."""
+    def _boom(trace):
+        raise RuntimeError("hook bug")
+
+    transport = _http_transport(http_server, on_request=_boom, on_response=_boom)
+    try:
+        assert transport.request("info", {"method": "ticker", "params": {}}) == {"ok": True}
+    finally:
+        transport.close()
+
+
+def test_no_hooks_skips_tracing(http_server, monkeypatch):
+    """Without hooks no trace is built at all."""
+    monkeypatch.setattr(RequestTrace, "__init__", lambda *a, **k: pytest.fail("trace built"))
+    transport = _http_transport(http_server)
+    try:
+        assert transport.request("info", {"method": "ticker", "params": {}}) == {"ok": True}
+    finally:
+        transport.close()
+
+
+class _EchoWebSocket:
+    """Fake socket replying to each JSON-RPC request with a result frame."""
+    connected = True
+
+    def __init__(self):
+        self.frames = queue.Queue()
+
+    def send(self, data):
+        message = json.loads(data)
+        self.frames.put(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": {"data": {"ok": True}}}))
+
+    def recv(self):
+        try:
+            return self.frames.get(timeout=0.05)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.connected = False
+
+
+def test_websocket_hooks_time_request_round_trip():
+    """WebSocket requests report the same stages, stamped at frame receipt."""
+    traces = []
+    transport = WebSocketTransport(WebSocketTransportOptions(auto_connect=False, on_response=traces.append))
+    transport.ws = _EchoWebSocket()
+    transport._running = True
+    receiver = threading.Thread(target=transport._receive_messages, daemon=True)
+    receiver.start()
+    try:
+        assert transport.request("info", {"method": "bbo", "params": {}}) == {"ok": True}
+    finally:
+        transport._running = False
+        receiver.join(1.0)
+
+    trace = traces[0]
+    assert (trace.transport, trace.name, trace.error) == ("ws", "bbo", None)
+    stamps = [trace.start_ns, trace.serialized_ns, trace.sent_ns, trace.received_ns, trace.parsed_ns, trace.end_ns]
+    assert all(stamps) and stamps == sorted(stamps)
+    assert trace.response_bytes > 0
+    assert transport._traced_ids == {}
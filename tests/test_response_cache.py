@@ -0,0 +1,187 @@
+"""Unit tests for the TTL / stale-while-revalidate response cache."""
+import threading
+
+from eth_account import Account
+
+from hotstuff import (
+    AccountSummaryParams,
+    ExchangeClient,
+    InfoClient,
+    InstrumentsParams,
+    ResponseCache,
+    TickerParams,
+    UserFeeInfoParams,
+)
+
+USER = "0x1234567890123456789012345678901234567890"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _CountingTransport:
+    """Stub transport returning a new payload version per request."""
+    is_testnet = False
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, endpoint, payload, signal=None):
+        self.requests.append(payload)
+        return {"version": len(self.requests)}
+
+
+def _client(**cache_kwargs):
+    clock = _Clock()
+    client = InfoClient(cache=ResponseCache(clock=clock, **cache_kwargs))
+    client.transport = _CountingTransport()
+    return client, clock
+
+
+def test_fresh_entries_are_served_from_cache():
+    """Repeated slow-changing calls within the TTL hit the cache."""
+    client, _ = _client()
+
+    for _ in range(3):
+        assert client.instruments(InstrumentsParams(type="perps")) == {"version": 1}
+    client.instruments(InstrumentsParams(type="spot"))
+
+    assert len(client.transport.requests) == 2
+    stats = client.cache.stats()["instruments"]
+    assert (stats.hits, stats.misses) == (2, 2)
+
+
+def test_uncached_methods_always_hit_the_transport():
+    """Fast-moving data such as ticker is never cached."""
+    client, _ = _client()
+
+    client.ticker(TickerParams(symbol="BTC-PERP"))
+    client.ticker(TickerParams(symbol="BTC-PERP"))
+
+    assert len(client.transport.requests) == 2
+    assert "ticker" not in client.cache.stats()
+
+
+def test_stale_entry_is_served_while_revalidating():
+    """After the TTL the old value is returned and refreshed in the background."""
+    client, clock = _client(ttls={"instruments": 10}, stale_ttl=5)
+    params = InstrumentsParams(type="perps")
+    client.instruments(params)
+
+    clock.now = 12
+    assert client.instruments(params) == {"version": 1}
+    client.cache.close()
+
+    assert client.instruments(params) == {"version": 2}
+    stats = client.cache.stats()["instruments"]
+    assert stats.stale_hits == 1 and stats.refreshes == 1
+
+    clock.now = 100
+    assert client.instruments(params) == {"version": 3}
+
+
+def test_explicit_invalidation():
+    """invalidate_cache and action-based invalidation drop entries."""
+    client, _ = _client()
+    client.user_fee_info(UserFeeInfoParams(user=USER))
+    client.instruments(InstrumentsParams(type="perps"))
+
+    assert client.invalidate_cache("user_fee_info", UserFeeInfoParams(user=USER)) == 1
+    assert client.cache.invalidate_for_action("updatePerpInstrumentLeverage") == 0
+    client.user_fee_info(UserFeeInfoParams(user=USER))
+    client.instruments(InstrumentsParams(type="perps"))
+
+    assert len(client.transport.requests) == 3
+
+
+def test_successful_exchange_action_invalidates_account_state():
+    """ExchangeClient(response_cache=...) drops balances cached before a trade."""
+    client, _ = _client(ttls={"account_summary": 60})
+    client.account_summary(AccountSummaryParams(user=USER))
+    exchange = ExchangeClient(wallet=Account.create(), response_cache=client.cache)
+    exchange.transport = _CountingTransport()
+
+    exchange._execute_action({"action": "cancelAll", "params": {"expiresAfter": 0}})
+    assert client.account_summary(AccountSummaryParams(user=USER)) == {"version": 2}
+
+    exchange._execute_action({"action": "cancelAll", "params": {"expiresAfter": 0}}, execute=False)
+    assert client.account_summary(AccountSummaryParams(user=USER)) == {"version": 2}
+
+
+def test_refresh_finishing_after_invalidation_is_not_stored():
+    """A fetch started before invalidate() cannot bring the old value back."""
+    cache = ResponseCache(ttls={"instruments": 60})
+    started, release = threading.Event(), threading.Event()
+
+    def slow_fetch():
+        started.set()
+        release.wait(2.0)
+        return "old"
+
+    worker = threading.Thread(target=cache.get_or_fetch, args=("instruments", {}, slow_fetch))
+    worker.start()
+    assert started.wait(2.0)
+    cache.invalidate("instruments")
+    release.set()
+    worker.join(2.0)
+
+    assert cache.get_or_fetch("instruments", {}, lambda: "new") == "new"
+    assert cache.stats()["instruments"].discarded == 1
+
+
+def test_params_scoped_invalidation_keeps_other_keys_refreshing():
+    """Dropping one parameter set does not discard a refresh of another."""
+    clock = _Clock()
+    cache = ResponseCache(ttls={"instruments": 10}, stale_ttl=5, clock=clock)
+    cache.get_or_fetch("instruments", {"type": "perps"}, lambda: "v1")
+    cache.get_or_fetch("instruments", {"type": "spot"}, lambda: "s1")
+    started, release = threading.Event(), threading.Event()
+
+    def slow_fetch():
+        started.set()
+        release.wait(2.0)
+        return "v2"
+
+    clock.now = 12
+    assert cache.get_or_fetch("instruments", {"type": "perps"}, slow_fetch) == "v1"
+    assert started.wait(2.0)
+    cache.invalidate("instruments", {"type": "spot"})
+    release.set()
+    cache.close()
+
+    assert cache.get_or_fetch("instruments", {"type": "perps"}, lambda: "miss") == "v2"
+    stats = cache.stats()["instruments"]
+    assert (stats.refreshes, stats.discarded) == (1, 0)
+
+
+def test_discarded_refresh_is_not_counted_and_allows_another():
+    """A refresh overtaken by invalidation is not a refresh, and the key can refresh again."""
+    clock = _Clock()
+    cache = ResponseCache(ttls={"instruments": 10}, stale_ttl=5, clock=clock)
+    cache.get_or_fetch("instruments", {}, lambda: "v1")
+    started, release = threading.Event(), threading.Event()
+
+    def slow_fetch():
+        started.set()
+        release.wait(2.0)
+        return "old"
+
+    clock.now = 12
+    cache.get_or_fetch("instruments", {}, slow_fetch)
+    assert started.wait(2.0)
+    cache.invalidate("instruments")
+    cache.get_or_fetch("instruments", {}, lambda: "v2")
+    release.set()
+    cache.close()
+
+    stats = cache.stats()["instruments"]
+    assert (stats.refreshes, stats.discarded) == (0, 1)
+    clock.now = 24
+    assert cache.get_or_fetch("instruments", {}, lambda: "v3") == "v2"
+    cache.close()
+    assert cache.get_or_fetch("instruments", {}, lambda: "miss") == "v3"
@@ -0,0 +1,227 @@
+"""Unit tests for multi-endpoint routing, circuit breaking and failover."""
+import threading
+import time
+
+import pytest
+
+from hotstuff import EndpointRouter, HedgingPolicy, HttpTransportOptions
+from hotstuff.exceptions import HotstuffAPIError, HotstuffConnectionError
+from hotstuff.transports import HttpTransport
+
+A = "https://a.example/"
+B = "https://b.example/"
+
+
+class _Probe:
+    """Probe stub whose outcome per URL can be flipped by the test."""
+
+    def __init__(self):
+        self.healthy = set()
+        self.calls = []
+        self.ok = threading.Event()
+
+    def __call__(self, url):
+        self.calls.append(url)
+        if url not in self.healthy:
+            raise OSError("unreachable")
+        self.ok.set()
+
+
+@pytest.fixture
+def probe():
+    return _Probe()
+
+
+@pytest.fixture
+def router(probe):
+    router = EndpointRouter({"api": [A, B]}, failure_threshold=2, probe=probe, probe_interval=0.01)
+    yield router
+    router.close()
+
+
+def test_routes_to_lowest_ewma_latency(router):
+    """The endpoint with the better latency score wins."""
+    router.record_success(A, 0.050)
+    router.record_success(B, 0.010)
+    assert router.select("api") == B
+
+    for _ in range(10):
+        router.record_success(B, 0.200)
+    assert router.select("api") == A
+    assert [h.url for h in router.health("api")] == [A, B]
+
+
+def test_unscored_endpoints_are_tried_first(router):
+    """A new endpoint is measured before scores decide."""
+    router.record_success(A, 0.001)
+    assert router.select("api") == B
+
+
+def test_circuit_opens_and_background_probe_restores(router, probe):
+    """Consecutive failures eject an endpoint until a probe succeeds."""
+    router.record_success(A, 0.001)
+    router.record_success(B, 0.050)
+    router.record_failure(A)
+    assert router.select("api") == A
+    router.record_failure(A)
+
+    assert router.select("api") == B
+    assert router.health("api")[0].state == "open"
+
+    probe.healthy.add(A)
+    assert probe.ok.wait(2.0)
+    for _ in range(100):
+        if router.select("api") == A:
+            break
+        time.sleep(0.01)
+    assert router.select("api") == A
+    health = {h.url: h for h in router.health()}
+    assert (health[A].state, health[A].ejections) == ("closed", 1)
+
+
+def test_all_ejected_still_routes_somewhere(router):
+    """With every endpoint ejected, the one due to be probed soonest is used."""
+    for url in (A, B):
+        router.record_failure(url)
+        router.record_failure(url)
+    assert router.select("api") in (A, B)
+
+
+def _transport(router, outcomes):
+    transport = HttpTransport(HttpTransportOptions(router=router))
+    calls = []
+
+    def _send_to(base_url, endpoint, payload, method="POST"):
+        calls.append(base_url)
+        outcome = outcomes.get(base_url)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return {"from": base_url}
+
+    transport._send_to = _send_to
+    return transport, calls
+
+
+def test_info_requests_fail_over_to_next_endpoint(router):
+    """A connection error on an info request is retried on another host."""
+    router.record_success(A, 0.001)
+    router.record_success(B, 0.050)
+    transport, calls = _transport(router, {A: HotstuffConnectionError("down")})
+
+    assert transport.request("info", {"method": "ticker", "params": {}}) == {"from": B}
+    assert calls == [A, B]
+
+
+def test_exchange_actions_do_not_fail_over(router):
+    """An exchange action is never replayed on another host."""
+    router.record_success(A, 0.001)
+    router.record_success(B, 0.050)
+    transport, calls = _transport(router, {A: HotstuffConnectionError("down")})
+
+    with pytest.raises(HotstuffConnectionError):
+        transport.request("exchange", {"action": {"type": "1301", "data": {}}})
+    assert calls == [A]
+
+
+def test_client_errors_do_not_count_against_health(router):
+    """4xx responses are the caller's fault; 5xx count as endpoint failures."""
+    transport, _ = _transport(router, {A: HotstuffAPIError("bad", status_code=400)})
+    router.record_success(B, 1.0)
+    for _ in range(3):
+        with pytest.raises(HotstuffAPIError):
+            transport.request("info", {"method": "ticker", "params": {}})
+    assert {h.url: h.failures for h in router.health()}[A] == 0
+
+
+def test_hedge_goes_to_a_different_endpoint(router):
+    """The hedged attempt avoids the host the slow primary is waiting on."""
+    router.record_success(A, 0.001)
+    router.record_success(B, 0.050)
+    hedging = HedgingPolicy(initial_delay=0.01)
+    transport = HttpTransport(HttpTransportOptions(router=router, hedging=hedging))
+    calls = []
+
+    def _send_to(base_url, endpoint, payload, method="POST"):
+        calls.append(base_url)
+        if base_url == A:
+            time.sleep(0.2)
+        return {"from": base_url}
+
+    transport._send_to = _send_to
+    try:
+        assert transport.request("info", {"method": "ticker", "params": {}}) == {"from": B}
+        assert calls == [A, B]
+    finally:
+        hedging.close()
+
+
+class _FakeWebSocket:
+    sock = None
+
+    def __init__(self):
+        self.closed = threading.Event()
+
+    def recv(self):
+        self.closed.wait(1.0)
+        return None
+
+    def close(self):
+        self.closed.set()
+
+
+def test_websocket_connect_skips_failing_endpoint(monkeypatch, probe):
+    """WebSocket (re)connects pick the next endpoint once one is ejected."""
+    from hotstuff import WebSocketTransport, WebSocketTransportOptions
+    from hotstuff.transports import websocket as ws_module
+
+    ws_a, ws_b = "wss://a.example/ws", "wss://b.example/ws"
+    connected = []
+
+    def _create_connection(url, timeout=None, socket=None):
+        if url == ws_a:
+            raise ConnectionRefusedError("down")
+        connected.append(url)
+        return _FakeWebSocket()
+
+    monkeypatch.setattr(ws_module.websocket, "create_connection", _create_connection)
+    router = EndpointRouter({"ws": [ws_a, ws_b]}, failure_threshold=1, probe=probe)
+    transport = WebSocketTransport(WebSocketTransportOptions(auto_connect=False, keep_alive={}, router=router))
+    monkeypatch.setattr(transport, "_create_ipv4_socket", lambda url: None)
+    try:
+        router.record_success(ws_b, 0.5)
+        with pytest.raises(Exception, match="Failed to connect"):
+            transport.connect()
+        transport.connect()
+        assert connected == [ws_b]
+        assert router.health("ws")[-1].state == "open"
+    finally:
+        transport.disconnect()
+        router.close()
+
+
+def test_websocket_reconnect_leaves_the_dropped_endpoint(monkeypatch, probe):
+    """An unexpected disconnect counts against the host and reconnects elsewhere."""
+    from hotstuff import WebSocketTransport, WebSocketTransportOptions
+    from hotstuff.transports import websocket as ws_module
+
+    ws_a, ws_b = "wss://a.example/ws", "wss://b.example/ws"
+    connected = []
+
+    def _create_connection(url, timeout=None, socket=None):
+        connected.append(url)
+        return _FakeWebSocket()
+
+    monkeypatch.setattr(ws_module.websocket, "create_connection", _create_connection)
+    router = EndpointRouter({"ws": [ws_a, ws_b]}, failure_threshold=3, probe=probe)
+    transport = WebSocketTransport(WebSocketTransportOptions(auto_connect=False, keep_alive={}, router=router))
+    monkeypatch.setattr(transport, "_create_ipv4_socket", lambda url: None)
+    try:
+        router.record_success(ws_a, 0.001)
+        router.record_success(ws_b, 0.5)
+        transport.connect()
+        transport._reconnect()
+        assert connected == [ws_a, ws_b]
+        assert {h.url: h.failures for h in router.health("ws")}[ws_a] == 1
+    finally:
+        transport.disconnect()
+        router.close()
@@ -0,0 +1,137 @@
+"""Unit tests for single-flight coalescing of concurrent info requests."""
+import threading
+
+import pytest
+
+from hotstuff import InfoClient, ResponseCache, SingleFlight, TickerParams, InstrumentsParams
+
+
+class _BlockingTransport:
+    """Stub transport that holds every request until released."""
+
+    def __init__(self, fail: bool = False):
+        self.requests = []
+        self.release = threading.Event()
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def request(self, endpoint, payload, signal=None):
+        with self._lock:
+            self.requests.append(payload)
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("boom")
+        return {"symbol": payload["params"]["symbol"], "version": len(self.requests)}
+
+
+def _run_concurrently(client, params_list):
+    results = [None] * len(params_list)
+    errors = [None] * len(params_list)
+
+    def _worker(i, params):
+        try:
+            results[i] = client.ticker(params)
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=_worker, args=(i, p)) for i, p in enumerate(params_list)]
+    for t in threads:
+        t.start()
+    return threads, results, errors
+
+
+def _wait_for_waiters(flight, method, count):
+    for _ in range(500):
+        stats = flight.stats().get(method)
+        if stats is not None and stats.requests >= count:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("threads never reached the single-flight layer")
+
+
+def test_concurrent_duplicates_share_one_request():
+    """N identical in-flight calls send one request and all get its result."""
+    flight = SingleFlight()
+    client = InfoClient(single_flight=flight)
+    client.transport = _BlockingTransport()
+
+    threads, results, errors = _run_concurrently(client, [TickerParams(symbol="BTC-PERP")] * 10)
+    _wait_for_waiters(flight, "ticker", 10)
+    assert flight.in_flight() == 1
+    client.transport.release.set()
+    for t in threads:
+        t.join()
+
+    assert errors == [None] * 10
+    assert len(client.transport.requests) == 1
+    assert all(r is results[0] for r in results)
+    stats = flight.stats()["ticker"]
+    assert (stats.requests, stats.coalesced, stats.sent) == (10, 9, 1)
+    assert stats.coalesce_rate == pytest.approx(0.9)
+    assert flight.in_flight() == 0
+
+
+def test_different_params_are_not_coalesced():
+    """Only requests with identical canonical params share a flight."""
+    flight = SingleFlight()
+    client = InfoClient(single_flight=flight)
+    client.transport = _BlockingTransport()
+
+    params = [TickerParams(symbol="BTC-PERP"), TickerParams(symbol="ETH-PERP")] * 3
+    threads, results, _ = _run_concurrently(client, params)
+    _wait_for_waiters(flight, "ticker", 6)
+    client.transport.release.set()
+    for t in threads:
+        t.join()
+
+    assert len(client.transport.requests) == 2
+    assert {r["symbol"] for r in results[0::2]} == {"BTC-PERP"}
+    assert {r["symbol"] for r in results[1::2]} == {"ETH-PERP"}
+    assert flight.stats()["ticker"].coalesced == 4
+
+
+def test_errors_propagate_to_every_waiter():
+    """A failing leader raises the same exception in all coalesced callers."""
+    flight = SingleFlight()
+    client = InfoClient(single_flight=flight)
+    client.transport = _BlockingTransport(fail=True)
+
+    threads, _, errors = _run_concurrently(client, [TickerParams(symbol="BTC-PERP")] * 4)
+    _wait_for_waiters(flight, "ticker", 4)
+    client.transport.release.set()
+    for t in threads:
+        t.join()
+
+    assert len(client.transport.requests) == 1
+    assert all(isinstance(e, RuntimeError) for e in errors)
+    assert flight.stats()["ticker"].errors == 1
+
+
+def test_sequential_calls_are_not_deduplicated():
+    """Completed requests are forgotten, so later calls fetch fresh data."""
+    flight = SingleFlight()
+    client = InfoClient(single_flight=flight)
+    client.transport = _BlockingTransport()
+    client.transport.release.set()
+
+    first = client.ticker(TickerParams(symbol="BTC-PERP"))
+    second = client.ticker(TickerParams(symbol="BTC-PERP"))
+
+    assert (first["version"], second["version"]) == (1, 2)
+    assert flight.stats()["ticker"].coalesced == 0
+
+
+def test_method_filter_and_cache_composition():
+    """Unlisted methods bypass the layer; cache misses go through it."""
+    flight = SingleFlight(methods=["instruments"])
+    client = InfoClient(single_flight=flight, cache=ResponseCache())
+    client.transport = _BlockingTransport()
+    client.transport.release.set()
+    client.transport.request = lambda endpoint, payload, signal=None: {"ok": True}
+
+    client.ticker(TickerParams(symbol="BTC-PERP"))
+    client.instruments(InstrumentsParams(type="perps"))
+    client.instruments(InstrumentsParams(type="perps"))
+
+    assert "ticker" not in flight.stats()
+    assert flight.stats()["instruments"].requests == 1
@@ -0,0 +1,131 @@
+"""Unit tests for the tick-to-trade tracer."""
+import json
+import queue
+import threading
+import time
+
+from eth_account import Account
+
+from hotstuff import (
+    ExchangeClient,
+    HttpTransportOptions,
+    MetricsRegistry,
+    PlaceOrderParams,
+    TickToTradeTracer,
+    UnitOrder,
+    WebSocketTransport,
+    WebSocketTransportOptions,
+    triggered_by,
+)
+from hotstuff.transports import HttpTransport
+from hotstuff.types import SubscriptionData
+from hotstuff.utils.tick_to_trade import HOPS, current_trigger
+
+
+def _order_params():
+    return PlaceOrderParams(
+        orders=[UnitOrder(instrumentId=1, side="b", positionSide="BOTH", price="100", size="1", tif="GTC",
+                          ro=False, po=False, cloid="c1", triggerPx=None, isMarket=False, tpsl="", grouping="")],
+        expiresAfter=int(time.time() * 1000) + 10_000,
+    )
+
+
+def _client(http_server, tracer):
+    client = ExchangeClient(wallet=Account.create(), tick_to_trade=tracer)
+    base = f"http://127.0.0.1:{http_server.server_address[1]}/"
+    client.transport = HttpTransport(HttpTransportOptions(server={"mainnet": {"api": base}}))
+    return client
+
+
+class _FrameSocket:
+    """Fake socket yielding queued frames."""
+    connected = True
+
+    def __init__(self):
+        self.frames = queue.Queue()
+
+    def recv(self):
+        try:
+            return self.frames.get(timeout=0.05)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.connected = False
+
+
+def test_order_from_callback_records_every_hop(http_server):
+    """A frame that triggers an order yields one sample spanning recv to ack."""
+    registry = MetricsRegistry()
+    tracer = TickToTradeTracer(registry)
+    client = _client(http_server, tracer)
+    acks = []
+
+    transport = WebSocketTransport(WebSocketTransportOptions(auto_connect=False))
+    transport.subscriptions["s1"] = type("Sub", (), {"channel": "bbo@BTC-PERP"})()
+    transport.subscription_callbacks["s1"] = lambda event: acks.append(client.place_order(_order_params()))
+    transport.ws = _FrameSocket()
+    transport._running = True
+    receiver = threading.Thread(target=transport._receive_messages, daemon=True)
+    receiver.start()
+    try:
+        transport.ws.frames.put(json.dumps({
+            "jsonrpc": "2.0", "method": "subscription",
+            "params": {"channel": "bbo@BTC-PERP", "data": {"timestamp": int(time.time() * 1000) - 5}},
+        }))
+        for _ in range(200):
+            if acks:
+                break
+            time.sleep(0.01)
+    finally:
+        transport._running = False
+        receiver.join(1.0)
+        client.transport.close()
+
+    assert acks == [{"ok": True}]
+    sample = tracer.recent()[-1]
+    assert (sample.channel, sample.action) == ("bbo@BTC-PERP", "placeOrder")
+    assert set(sample.hops) == set(HOPS)
+    assert all(v >= 0 for v in sample.hops.values())
+    assert sample.hops["recv"] >= 4_000_000
+    assert sample.total_ns >= sum(v for hop, v in sample.hops.items() if hop != "recv")
+    assert tracer.summary()["total"]["count"] == 1
+    assert 'hotstuff_tick_to_trade_seconds_count{hop="ack"} 1' in registry.exposition()
+
+
+def test_actions_outside_a_callback_are_not_traced(http_server):
+    """Without a triggering event nothing is recorded and no timing is attached."""
+    tracer = TickToTradeTracer()
+    client = _client(http_server, tracer)
+    try:
+        assert client.place_order(_order_params()) == {"ok": True}
+    finally:
+        client.transport.close()
+
+    assert tracer.recent() == []
+    assert client.last_timing is None
+
+
+def test_triggered_by_links_work_handed_to_another_thread():
+    """Strategies running on their own thread link events explicitly."""
+    tracer = TickToTradeTracer()
+    client = ExchangeClient(wallet=Account.create(), tick_to_trade=tracer)
+    now = time.monotonic_ns()
+    event = SubscriptionData(channel="fills@0xabc", data={}, timestamp=time.time(),
+                             recv_ns=now, decoded_ns=now + 10, dispatched_ns=now + 20)
+
+    def _worker():
+        with triggered_by(event):
+            client._execute_action({"action": "placeOrder", "params": {"orders": [], "expiresAfter": 0}},
+                                   execute=False)
+        assert current_trigger() is None
+
+    worker = threading.Thread(target=_worker)
+    worker.start()
+    worker.join()
+
+    sample = tracer.recent()[-1]
+    assert sample.hops["decode"] == 10 and sample.hops["dispatch"] == 10
+    assert {"strategy", "sign"} <= set(sample.hops)
+    assert "send" not in sample.hops and sample.total_ns is None
+    assert current_trigger() is None
@@ -0,0 +1,92 @@
+"""Unit tests for the local transaction index."""
+from hotstuff import BlockCrawler, TransactionIndex
+from hotstuff.methods.info.explorer import BlockDetailsResponse, BlockTransaction
+from hotstuff.utils import tx_type_name
+
+ALICE = "0xAbC0000000000000000000000000000000000001"
+BOB = "0xabc0000000000000000000000000000000000002"
+
+
+def _block(height, txs):
+    return BlockDetailsResponse(
+        block_height=height,
+        block_hash=f"0xb{height}",
+        parent_hash=f"0xb{height - 1}",
+        change_log_hash="0x0",
+        timestamp=height * 1000,
+        tx_count=len(txs),
+        created_at=height * 1000,
+        transactions=[
+            BlockTransaction(
+                tx_hash=f"0xt{height}-{i}",
+                account=account,
+                block_height=height,
+                block_hash=f"0xb{height}",
+                tx_type=tx_type,
+                success=True,
+                timestamp=height * 1000,
+                created_at=height * 1000,
+            )
+            for i, (account, tx_type) in enumerate(txs)
+        ],
+    )
+
+
+def _index():
+    index = TransactionIndex()
+    index.add_blocks(
+        _block(h, [(ALICE, 1301), (BOB, 1302), (ALICE, 1302 if h % 2 else 1301)])
+        for h in range(1, 101)
+    )
+    return index
+
+
+def test_query_by_account_type_and_height_range():
+    """Account + tx_type + range queries combine posting lists correctly."""
+    index = _index()
+
+    results = index.query(account=ALICE.lower(), tx_type="placeOrder", start_height=10, end_height=19)
+
+    # Every block has one placeOrder from Alice, plus one more on even heights.
+    assert len(results) == 15
+    assert all(r.tx_type == 1301 and r.account == ALICE.lower() for r in results)
+    assert [r.block_height for r in results] == sorted(r.block_height for r in results)
+    assert index.count(tx_type=1302) == 150
+    assert index.count(account=BOB, tx_type=1301) == 0
+
+
+def test_duplicate_and_out_of_order_ingestion():
+    """Replayed transactions are ignored and late rows still match range filters."""
+    index = _index()
+    late = _block(5, [(BOB, 1311)])
+    late.transactions[0].tx_hash = "0xlate"
+
+    assert index.add_block(_block(3, [(ALICE, 1301)])) == 0
+    assert index.add_block(late) == 1
+    assert [t.tx_hash for t in index.query(account=BOB, start_height=5, end_height=5)] == ["0xt5-1", "0xlate"]
+
+
+def test_decode_tx_type_names_and_subscription_listener():
+    """tx_type codes map back to EXCHANGE_OP_CODES names."""
+    index = TransactionIndex()
+    listener = index.listener()
+    listener(type("Event", (), {"data": [
+        {"tx_hash": "0x1", "account": ALICE, "block_height": 1, "block_hash": "0xb1",
+         "tx_type": 1311, "success": False, "timestamp": 1, "created_at": 1},
+    ]})())
+
+    assert tx_type_name(1301) == "placeOrder"
+    assert tx_type_name(9999) is None
+    assert index.tx_type_counts() == {"cancelAll": 1}
+    assert index.get("0x1").success is False
+
+
+def test_index_from_crawler_output():
+    """The index accepts BlockCrawler output directly."""
+    from tests.test_crawler import _StubInfo
+
+    index = TransactionIndex()
+    index.add_blocks(BlockCrawler(_StubInfo(head=20)).crawl(start_height=1))
+
+    assert len(index) == 20
+    assert index.count(tx_type="placeOrder", start_height=11) == 10
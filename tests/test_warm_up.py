@@ -0,0 +1,97 @@
+"""Unit tests for HttpTransport / ExchangeClient connection warm-up."""
+import threading
+import time
+
+import pytest
+import requests
+from eth_account import Account
+
+from hotstuff import ExchangeClient, HttpTransportOptions
+from hotstuff.transports import HttpTransport
+
+
+def _transport(server, **options):
+    base = f"http://127.0.0.1:{server.server_address[1]}/"
+    return HttpTransport(HttpTransportOptions(server={"mainnet": {"api": base, "rpc": base}}, **options))
+
+
+def test_warm_up_opens_pooled_connections(http_server):
+    """warm_up leaves N live connections that later requests reuse."""
+    transport = _transport(http_server, warm_connections=3)
+    try:
+        timings = transport.warm_up(roles=("api",))
+        assert list(timings) == [transport.server["mainnet"]["api"]]
+        assert http_server.connections == 3
+
+        for _ in range(3):
+            transport.request("info", {"method": "ticker", "params": {}})
+        assert http_server.connections == 3
+    finally:
+        transport.close()
+
+
+def test_warm_up_failures_are_logged_not_raised():
+    """An unreachable host does not make warm_up raise."""
+    transport = HttpTransport(HttpTransportOptions(server={"mainnet": {"api": "http://127.0.0.1:1/"}}, timeout=0.5))
+    try:
+        assert "http://127.0.0.1:1/" in transport.warm_up(1, roles=("api",))
+    finally:
+        transport.close()
+
+
+def test_failed_open_still_releases_the_other_connections():
+    """If one streamed GET fails, the responses that did open are closed."""
+    transport = _transport(type("Server", (), {"server_address": ("127.0.0.1", 1)})())
+    opened, calls, lock = [], [], threading.Lock()
+
+    class _Response:
+        content = b""
+
+        def close(self):
+            opened.remove(self)
+
+    class _Session:
+        def get(self, url, **kwargs):
+            with lock:
+                calls.append(url)
+                first = len(calls) == 1
+            if first:
+                raise requests.ConnectionError("refused")
+            response = _Response()
+            opened.append(response)
+            return response
+
+    transport._get_session = _Session
+    try:
+        with pytest.raises(requests.ConnectionError):
+            transport._open_connections("http://127.0.0.1:1/", 4)
+        assert len(calls) == 4 and opened == []
+    finally:
+        transport.close()
+
+
+def test_keep_warm_refreshes_connections(http_server):
+    """The keep-warm thread keeps touching the pool until stopped."""
+    transport = _transport(http_server, warm_connections=1)
+    try:
+        transport.start_keep_warm(interval=0.01, roles=("api",))
+        for _ in range(200):
+            if http_server.connections:
+                break
+            time.sleep(0.01)
+        assert http_server.connections >= 1
+    finally:
+        transport.close()
+    assert transport._keep_warm_thread is None
+
+
+def test_exchange_client_warm_up_covers_transport_and_signing(http_server):
+    """ExchangeClient.warm_up warms the api host and the signing path."""
+    client = ExchangeClient(wallet=Account.create())
+    client.transport = _transport(http_server, warm_connections=2)
+    try:
+        timings = client.warm_up()
+        assert "signing" in timings
+        assert http_server.connections == 2
+    finally:
+        client.transport.close()